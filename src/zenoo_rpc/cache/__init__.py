@@ -6,8 +6,9 @@ in-memory and Redis backend support for high-performance data caching.
 """
 
 from .manager import CacheManager
-from .backends import MemoryCache, RedisCache
-from .strategies import TTLCache, LRUCache, LFUCache
+from .entities import EntityCache
+from .backends import MemoryCache, RedisCache, TieredCache
+from .strategies import TTLCache, LRUCache, LFUCache, TinyLFUCache
 from .decorators import cached, cache_result, invalidate_cache
 from .keys import CacheKey, make_cache_key
 from .exceptions import CacheError, CacheBackendError, CacheKeyError
@@ -15,13 +16,16 @@ from .exceptions import CacheError, CacheBackendError, CacheKeyError
 __all__ = [
     # Core caching
     "CacheManager",
+    "EntityCache",
     # Backends
     "MemoryCache",
     "RedisCache",
+    "TieredCache",
     # Strategies
     "TTLCache",
     "LRUCache",
     "LFUCache",
+    "TinyLFUCache",
     # Decorators
     "cached",
     "cache_result",
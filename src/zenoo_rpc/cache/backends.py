@@ -6,11 +6,29 @@ in-memory and Redis implementations with async support.
 """
 
 import asyncio
+import fnmatch
+import heapq
 import json
 import pickle  # nosec B403
+import sys
+import threading
 import time
+import uuid
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import (
+    Any,
+    Awaitable,
+    Callable,
+    Dict,
+    Iterable,
+    List,
+    Mapping,
+    Optional,
+    Sequence,
+    Set,
+    Tuple,
+    Union,
+)
 from collections import OrderedDict
 import logging
 
@@ -19,18 +37,68 @@ from .exceptions import (
     CacheSerializationError,
     CacheConnectionError,
 )
-from .keys import CacheKey, validate_cache_key
+from .keys import CacheKey, key_tags, validate_cache_key
 
 logger = logging.getLogger(__name__)
 
+_MISSING = object()
+
+# Adds members (ARGV[2..]) to tag sets (KEYS) and keeps every set alive at
+# least as long as its longest-lived member: ARGV[1] is the TTL of the
+# members in milliseconds, 0 if they do not expire
+_ADD_TAG_MEMBERS_SCRIPT = """
+local ttl = tonumber(ARGV[1])
+for _, tag in ipairs(KEYS) do
+    local current = redis.call('PTTL', tag)
+    redis.call('SADD', tag, unpack(ARGV, 2))
+    if ttl == 0 then
+        if current >= 0 then
+            redis.call('PERSIST', tag)
+        end
+    elseif current == -2 or (current >= 0 and current < ttl) then
+        redis.call('PEXPIRE', tag, ttl)
+    end
+end
+return 0
+"""
+
+# Deletes keys and removes them from their tag sets. KEYS holds, for each
+# key, the key, the set of tags it was set with and its prefix tag sets;
+# ARGV[1] is the prefix of tag set keys and ARGV[2..] the number of prefix
+# tag sets of each key.
+_DELETE_KEYS_SCRIPT = """
+local index = 1
+local deleted = 0
+for i = 2, #ARGV do
+    local key, tags_key = KEYS[index], KEYS[index + 1]
+    local last = index + 1 + tonumber(ARGV[i])
+    for _, tag in ipairs(redis.call('SMEMBERS', tags_key)) do
+        redis.call('SREM', ARGV[1] .. tag, key)
+    end
+    for j = index + 2, last do
+        redis.call('SREM', KEYS[j], key)
+    end
+    deleted = deleted + redis.call('UNLINK', key)
+    redis.call('UNLINK', tags_key)
+    index = last + 1
+end
+return deleted
+"""
+
 
 class CacheBackend(ABC):
     """Abstract base class for cache backends.
 
     This class defines the interface that all cache backends
     must implement for consistent caching behavior.
+
+    Backends with ``supports_tags`` index keys under tags passed to
+    ``set(..., tags=...)`` and under their prefix tags (see
+    ``keys.key_tags``), and implement ``invalidate_tags``.
     """
 
+    supports_tags = False
+
     @abstractmethod
     async def get(self, key: Union[str, CacheKey]) -> Optional[Any]:
         """Get a value from the cache.
@@ -101,6 +169,226 @@ class CacheBackend(ABC):
         """
         pass
 
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """Delete the values registered under any of the tags.
+
+        Backends without ``supports_tags`` register no value under tags, so
+        the default implementation deletes nothing.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Keys that were deleted
+        """
+        return []
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from the cache.
+
+        The default implementation calls ``get`` for each key.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values by key, None for keys not found
+        """
+        return {key: await self.get(key) for key in map(validate_cache_key, keys)}
+
+    async def set_many(
+        self,
+        items: Mapping[Union[str, CacheKey], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Set several values in the cache.
+
+        The default implementation calls ``set`` for each value.
+
+        Args:
+            items: Values to cache by key
+            ttl: Time to live in seconds
+            tags: Tags to register every key under
+
+        Returns:
+            Keys whose value could not be stored
+        """
+        failed = []
+        for key, value in items.items():
+            if tags:
+                result = await self.set(key, value, ttl, tags=tags)
+            else:
+                result = await self.set(key, value, ttl)
+            if not result:
+                failed.append(validate_cache_key(key))
+        return failed
+
+    async def delete_many(self, keys: Iterable[Union[str, CacheKey]]) -> int:
+        """Delete several values from the cache.
+
+        The default implementation calls ``delete`` for each key.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        deleted = 0
+        for key in keys:
+            deleted += await self.delete(key)
+        return deleted
+
+
+def estimate_size(value: Any, sample: int = 64) -> int:
+    """Estimate the memory held by a value, in bytes.
+
+    Dicts, lists, tuples and sets are walked recursively and objects
+    shared between them are counted once. Lists and tuples longer than
+    ``sample`` are estimated from evenly spaced items, which keeps large
+    ``search_read`` results cheap to measure.
+
+    Args:
+        value: Value to measure
+        sample: Number of items measured in long sequences
+
+    Returns:
+        Approximate size in bytes
+    """
+    return _estimate_size(value, set(), sample)
+
+
+def _estimate_size(value: Any, seen: Set[int], sample: int) -> int:
+    if id(value) in seen:
+        return 0
+    seen.add(id(value))
+
+    size = sys.getsizeof(value)
+    if isinstance(value, dict):
+        for key, item in value.items():
+            size += _estimate_size(key, seen, sample)
+            size += _estimate_size(item, seen, sample)
+    elif isinstance(value, (list, tuple)) and len(value) > sample:
+        step = len(value) / sample
+        sampled = sum(
+            _estimate_size(value[int(i * step)], seen, sample) for i in range(sample)
+        )
+        size += sampled * len(value) // sample
+    elif isinstance(value, (list, tuple, set, frozenset)):
+        for item in value:
+            size += _estimate_size(item, seen, sample)
+    return size
+
+
+class _Shard:
+    """One partition of a MemoryCache, with its own lock.
+
+    Values are kept in LRU order, expiry deadlines in a min-heap with lazy
+    deletion: heap entries whose deadline no longer matches ``expiry`` are
+    skipped when popped. With a memory budget, ``sizes`` holds the
+    estimated size of each value and ``bytes_used`` their sum.
+    """
+
+    __slots__ = (
+        "data",
+        "expiry",
+        "heap",
+        "sizes",
+        "bytes_used",
+        "tags",
+        "key_tags",
+        "lock",
+    )
+
+    def __init__(self) -> None:
+        self.data: OrderedDict[str, Any] = OrderedDict()
+        self.expiry: Dict[str, float] = {}
+        self.heap: List[Tuple[float, str]] = []
+        self.sizes: Dict[str, int] = {}
+        self.bytes_used = 0
+        # Tag index: keys by tag, and tags given to set() by key
+        self.tags: Dict[str, Set[str]] = {}
+        self.key_tags: Dict[str, Tuple[str, ...]] = {}
+        self.lock = threading.Lock()
+
+    def index(self, key: str, tags: Tuple[str, ...]) -> None:
+        """Register a key under its prefix tags and the given tags."""
+        if self.key_tags.get(key, ()) != tags:
+            self.unindex(key)
+            if tags:
+                self.key_tags[key] = tags
+
+        for tag in (*key_tags(key), *tags):
+            self.tags.setdefault(tag, set()).add(key)
+
+    def unindex(self, key: str) -> None:
+        """Remove a key from the tag index."""
+        for tag in (*key_tags(key), *self.key_tags.pop(key, ())):
+            keys = self.tags.get(tag)
+            if keys is not None:
+                keys.discard(key)
+                if not keys:
+                    del self.tags[tag]
+
+    def store(
+        self,
+        key: str,
+        value: Any,
+        deadline: Optional[float],
+        tags: Tuple[str, ...],
+        size: Optional[int],
+    ) -> None:
+        """Insert or replace a value as the most recently used."""
+        data = self.data
+        existed = key in data
+        if existed:
+            data.move_to_end(key)
+
+        data[key] = value
+        self.expire(key, deadline)
+        if not existed or self.key_tags.get(key, ()) != tags:
+            self.index(key, tags)
+        if size is not None:
+            self.bytes_used += size - self.sizes.get(key, 0)
+            self.sizes[key] = size
+
+    def discard(self, key: str) -> bool:
+        """Remove a key, its expiry and its tags."""
+        if self.data.pop(key, _MISSING) is _MISSING:
+            return False
+
+        self.expiry.pop(key, None)
+        self.bytes_used -= self.sizes.pop(key, 0)
+        self.unindex(key)
+        return True
+
+    def expire(self, key: str, deadline: Optional[float]) -> None:
+        """Set or clear the expiry deadline of a key."""
+        if deadline is None:
+            self.expiry.pop(key, None)
+            return
+
+        self.expiry[key] = deadline
+        heapq.heappush(self.heap, (deadline, key))
+        if len(self.heap) > 2 * len(self.expiry) + 64:
+            # Drop the stale entries left by overwritten and deleted keys
+            self.heap = [(d, k) for k, d in self.expiry.items()]
+            heapq.heapify(self.heap)
+
+    def remove_expired(self, now: float) -> int:
+        """Remove the keys whose deadline has passed."""
+        removed = 0
+        heap = self.heap
+        while heap and heap[0][0] <= now:
+            deadline, key = heapq.heappop(heap)
+            if self.expiry.get(key) == deadline:
+                self.discard(key)
+                removed += 1
+        return removed
+
 
 class MemoryCache(CacheBackend):
     """In-memory cache backend with TTL and LRU support.
@@ -108,23 +396,44 @@ class MemoryCache(CacheBackend):
     This backend stores data in memory with optional TTL
     and LRU eviction policies for memory management.
 
+    Keys are spread over shards by hash, each holding its share of
+    ``max_size`` with its own lock, so writers on different shards do not
+    contend and LRU eviction is per shard. Cache hits do not take a lock.
+    Expired values are removed when read and by a periodic sweep that only
+    visits the expired deadlines of each shard.
+
+    With ``max_bytes``, the size of each value is estimated when it is set
+    and least recently used values are evicted to keep the total under the
+    budget, whatever the number of entries. Values larger than
+    ``max_entry_bytes`` are not cached.
+
     Features:
     - TTL (Time To Live) support
     - LRU (Least Recently Used) eviction
-    - Thread-safe operations
-    - Memory usage tracking
+    - Tag index for invalidation
+    - Thread-safe operations with lock striping
+    - Memory budget in bytes
 
     Example:
-        >>> cache = MemoryCache(max_size=1000, default_ttl=300)
+        >>> cache = MemoryCache(max_size=100000, default_ttl=300, shards=16)
         >>> await cache.set("key1", "value1", ttl=60)
         >>> value = await cache.get("key1")
+        >>>
+        >>> # Bound memory rather than entries
+        >>> cache = MemoryCache(max_size=100000, max_bytes=256 * 1024 * 1024)
     """
 
+    supports_tags = True
+
     def __init__(
         self,
         max_size: int = 1000,
         default_ttl: Optional[int] = None,
         cleanup_interval: int = 60,
+        shards: Optional[int] = None,
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        sizeof: Optional[Callable[[Any], int]] = None,
     ):
         """Initialize memory cache.
 
@@ -132,24 +441,49 @@ class MemoryCache(CacheBackend):
             max_size: Maximum number of items to store
             default_ttl: Default TTL in seconds
             cleanup_interval: Cleanup interval in seconds
+            shards: Number of shards (None for one shard per 1024 items,
+                up to 16, so small caches keep an exact LRU order)
+            max_bytes: Memory budget in bytes (None for no budget)
+            max_entry_bytes: Largest value accepted with a budget, in bytes
+                (None for the budget of one shard)
+            sizeof: Function estimating the size of a value in bytes
+                (defaults to ``estimate_size``)
         """
+        if shards is None:
+            shards = max(1, min(16, max_size // 1024))
+        if shards < 1:
+            raise ValueError("shards must be at least 1")
+        if max_bytes is not None and max_bytes < 1:
+            raise ValueError("max_bytes must be positive")
+
         self.max_size = max_size
         self.default_ttl = default_ttl
         self.cleanup_interval = cleanup_interval
+        self.max_bytes = max_bytes
+        self.sizeof = sizeof or estimate_size
 
         # Storage
-        self._data: OrderedDict[str, Any] = OrderedDict()
-        self._expiry: Dict[str, float] = {}
+        self._shards = [_Shard() for _ in range(shards)]
+        self._shard_size = max(1, -(-max_size // shards))
+        self._shard_bytes: Optional[int] = None
+        self.max_entry_bytes: Optional[int] = None
+        if max_bytes is not None:
+            self._shard_bytes = -(-max_bytes // shards)
+            self.max_entry_bytes = min(
+                max_entry_bytes or self._shard_bytes, self._shard_bytes
+            )
 
         # Statistics
         self._hits = 0
         self._misses = 0
         self._sets = 0
         self._deletes = 0
+        self._evictions = 0
+        self._evicted_bytes = 0
+        self._rejected = 0
 
         # Cleanup task
         self._cleanup_task: Optional[asyncio.Task] = None
-        self._lock = asyncio.Lock()
 
         # Start cleanup task
         self._start_cleanup_task()
@@ -185,129 +519,288 @@ class MemoryCache(CacheBackend):
                 logger.error(f"Memory cache cleanup error: {e}")
 
     async def _remove_expired(self):
-        """Remove expired items from cache."""
-        async with self._lock:
-            current_time = time.time()
-            expired_keys = [
-                key
-                for key, expiry in self._expiry.items()
-                if expiry <= current_time
-            ]
-
-            for key in expired_keys:
-                self._data.pop(key, None)
-                self._expiry.pop(key, None)
-
-            if expired_keys:
-                logger.debug(
-                    f"Memory cache: Removed {len(expired_keys)} expired items"
-                )
-
-    async def _evict_lru(self):
-        """Evict least recently used items if cache is full."""
-        while len(self._data) >= self.max_size:
-            # Remove oldest item (LRU)
-            oldest_key = next(iter(self._data))
-            self._data.pop(oldest_key)
-            self._expiry.pop(oldest_key, None)
+        """Remove expired items from cache, one shard at a time."""
+        removed = 0
+        for shard in self._shards:
+            with shard.lock:
+                removed += shard.remove_expired(time.time())
+            # Let other tasks run between shards
+            await asyncio.sleep(0)
+
+        if removed:
+            logger.debug(f"Memory cache: Removed {removed} expired items")
+
+    def _shard(self, key: str) -> _Shard:
+        """Get the shard holding a key."""
+        shards = self._shards
+        if len(shards) == 1:
+            return shards[0]
+        return shards[hash(key) % len(shards)]
+
+    def _by_shard(self, keys: Iterable[str]) -> Dict[_Shard, List[str]]:
+        """Group keys by the shard holding them."""
+        if len(self._shards) == 1:
+            return {self._shards[0]: list(keys)}
+
+        groups: Dict[_Shard, List[str]] = {}
+        for key in keys:
+            groups.setdefault(self._shard(key), []).append(key)
+        return groups
+
+    def keys(self) -> List[str]:
+        """Get the keys currently stored, including expired ones."""
+        return [key for shard in self._shards for key in list(shard.data)]
 
     async def get(self, key: Union[str, CacheKey]) -> Optional[Any]:
         """Get a value from the memory cache."""
         key_str = validate_cache_key(key)
+        shard = self._shard(key_str)
 
-        async with self._lock:
-            # Check if key exists
-            if key_str not in self._data:
-                self._misses += 1
-                return None
-
-            # Check if expired
-            if key_str in self._expiry:
-                if time.time() > self._expiry[key_str]:
-                    # Remove expired item
-                    self._data.pop(key_str)
-                    self._expiry.pop(key_str)
-                    self._misses += 1
-                    return None
+        value = shard.data.get(key_str, _MISSING)
+        if value is _MISSING:
+            self._misses += 1
+            return None
 
-            # Move to end (mark as recently used)
-            value = self._data.pop(key_str)
-            self._data[key_str] = value
+        # Check if expired
+        deadline = shard.expiry.get(key_str)
+        if deadline is not None and time.time() > deadline:
+            with shard.lock:
+                if shard.expiry.get(key_str) == deadline:
+                    shard.discard(key_str)
+            self._misses += 1
+            return None
 
-            self._hits += 1
-            return value
+        # Mark as recently used
+        try:
+            shard.data.move_to_end(key_str)
+        except KeyError:
+            # Deleted concurrently from another thread
+            pass
+
+        self._hits += 1
+        return value
 
     async def set(
-        self, key: Union[str, CacheKey], value: Any, ttl: Optional[int] = None
+        self,
+        key: Union[str, CacheKey],
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         """Set a value in the memory cache."""
         key_str = validate_cache_key(key)
+        shard = self._shard(key_str)
+        effective_ttl = ttl or self.default_ttl
+        deadline = time.time() + effective_ttl if effective_ttl else None
+        tags = tuple(dict.fromkeys(tags)) if tags else ()
+
+        size = None
+        if self._shard_bytes is not None:
+            # Measured outside the lock, the value is not shared yet
+            size = self.sizeof(value)
+            if size > self.max_entry_bytes:
+                with shard.lock:
+                    # Do not keep serving the previous value
+                    shard.discard(key_str)
+                self._rejected += 1
+                logger.debug(
+                    f"Memory cache: Rejected {key_str} ({size} bytes > "
+                    f"{self.max_entry_bytes} bytes)"
+                )
+                return False
 
-        async with self._lock:
-            # Evict if necessary
-            await self._evict_lru()
-
-            # Set value
-            self._data[key_str] = value
-
-            # Set expiry
-            effective_ttl = ttl or self.default_ttl
-            if effective_ttl:
-                self._expiry[key_str] = time.time() + effective_ttl
-            elif key_str in self._expiry:
-                # Remove expiry if no TTL
-                del self._expiry[key_str]
-
-            self._sets += 1
-            return True
+        with shard.lock:
+            shard.store(key_str, value, deadline, tags, size)
+            self._evict(shard)
+
+        self._sets += 1
+        return True
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values, taking the lock of each shard once."""
+        keys = [validate_cache_key(key) for key in keys]
+        values: Dict[str, Optional[Any]] = dict.fromkeys(keys)
+        now = time.time()
+
+        hits = 0
+        for shard, shard_keys in self._by_shard(keys).items():
+            data = shard.data
+            with shard.lock:
+                for key in shard_keys:
+                    value = data.get(key, _MISSING)
+                    if value is _MISSING:
+                        continue
+
+                    deadline = shard.expiry.get(key)
+                    if deadline is not None and now > deadline:
+                        shard.discard(key)
+                        continue
+
+                    data.move_to_end(key)
+                    values[key] = value
+                    hits += 1
+
+        self._hits += hits
+        self._misses += len(keys) - hits
+        return values
+
+    async def set_many(
+        self,
+        items: Mapping[Union[str, CacheKey], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Set several values, taking the lock of each shard once."""
+        items = {validate_cache_key(key): value for key, value in items.items()}
+        effective_ttl = ttl or self.default_ttl
+        deadline = time.time() + effective_ttl if effective_ttl else None
+        tags = tuple(dict.fromkeys(tags)) if tags else ()
+
+        sizes: Dict[str, int] = {}
+        rejected: List[str] = []
+        if self._shard_bytes is not None:
+            # Measured outside the locks, the values are not shared yet
+            for key, value in items.items():
+                size = self.sizeof(value)
+                if size > self.max_entry_bytes:
+                    rejected.append(key)
+                else:
+                    sizes[key] = size
+
+        for shard, shard_keys in self._by_shard(items).items():
+            with shard.lock:
+                for key in shard_keys:
+                    if key in sizes or self._shard_bytes is None:
+                        shard.store(key, items[key], deadline, tags, sizes.get(key))
+                    else:
+                        # Do not keep serving the previous value
+                        shard.discard(key)
+                self._evict(shard)
+
+        self._sets += len(items) - len(rejected)
+        self._rejected += len(rejected)
+        return rejected
+
+    def _evict(self, shard: _Shard) -> None:
+        """Evict least recently used items until the shard fits its limits.
+
+        The item just set is the most recently used and fits the budget on
+        its own, so it is never evicted.
+        """
+        data = shard.data
+        budget = self._shard_bytes
+        while len(data) > self._shard_size or (
+            budget is not None and shard.bytes_used > budget
+        ):
+            oldest = next(iter(data))
+            self._evicted_bytes += shard.sizes.get(oldest, 0)
+            shard.discard(oldest)
+            self._evictions += 1
 
     async def delete(self, key: Union[str, CacheKey]) -> bool:
         """Delete a value from the memory cache."""
         key_str = validate_cache_key(key)
+        shard = self._shard(key_str)
 
-        async with self._lock:
-            existed = key_str in self._data
-            self._data.pop(key_str, None)
-            self._expiry.pop(key_str, None)
+        with shard.lock:
+            existed = shard.discard(key_str)
 
-            if existed:
-                self._deletes += 1
+        if existed:
+            self._deletes += 1
+        return existed
+
+    async def delete_many(self, keys: Iterable[Union[str, CacheKey]]) -> int:
+        """Delete several values, taking the lock of each shard once."""
+        keys = [validate_cache_key(key) for key in keys]
+
+        deleted = 0
+        for shard, shard_keys in self._by_shard(keys).items():
+            with shard.lock:
+                deleted += sum(shard.discard(key) for key in shard_keys)
 
-            return existed
+        self._deletes += deleted
+        return deleted
 
     async def exists(self, key: Union[str, CacheKey]) -> bool:
-        """Check if a key exists in the memory cache."""
-        value = await self.get(key)
-        return value is not None
+        """Check if a key exists in the memory cache.
+
+        Unlike ``get``, this does not change the LRU order or statistics.
+        """
+        key_str = validate_cache_key(key)
+        shard = self._shard(key_str)
+
+        if key_str not in shard.data:
+            return False
+        deadline = shard.expiry.get(key_str)
+        return deadline is None or time.time() <= deadline
 
     async def clear(self) -> bool:
         """Clear all cached values."""
-        async with self._lock:
-            self._data.clear()
-            self._expiry.clear()
-            return True
+        for shard in self._shards:
+            with shard.lock:
+                shard.data.clear()
+                shard.expiry.clear()
+                shard.heap.clear()
+                shard.sizes.clear()
+                shard.bytes_used = 0
+                shard.tags.clear()
+                shard.key_tags.clear()
+        return True
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """Delete the values registered under any of the tags.
+
+        Only the matching keys are visited, through the tag index of each
+        shard.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Keys that were deleted
+        """
+        tags = list(tags)
+        deleted: List[str] = []
+        for shard in self._shards:
+            with shard.lock:
+                keys = set()
+                for tag in tags:
+                    keys.update(shard.tags.get(tag, ()))
+                for key in keys:
+                    shard.discard(key)
+            deleted.extend(keys)
+
+        self._deletes += len(deleted)
+        return deleted
 
     async def get_stats(self) -> Dict[str, Any]:
         """Get memory cache statistics."""
-        async with self._lock:
-            total_requests = self._hits + self._misses
-            hit_rate = (
-                (self._hits / total_requests * 100)
-                if total_requests > 0
-                else 0
-            )
+        total_requests = self._hits + self._misses
+        hit_rate = (
+            (self._hits / total_requests * 100)
+            if total_requests > 0
+            else 0
+        )
 
-            return {
-                "backend": "memory",
-                "size": len(self._data),
-                "max_size": self.max_size,
-                "hits": self._hits,
-                "misses": self._misses,
-                "hit_rate": round(hit_rate, 2),
-                "sets": self._sets,
-                "deletes": self._deletes,
-                "expired_items": len(self._expiry),
-            }
+        return {
+            "backend": "memory",
+            "size": sum(len(shard.data) for shard in self._shards),
+            "max_size": self.max_size,
+            "shards": len(self._shards),
+            "hits": self._hits,
+            "misses": self._misses,
+            "hit_rate": round(hit_rate, 2),
+            "sets": self._sets,
+            "deletes": self._deletes,
+            "expired_items": sum(len(shard.expiry) for shard in self._shards),
+            "evictions": self._evictions,
+            "evicted_bytes": self._evicted_bytes,
+            "rejected": self._rejected,
+            "bytes_used": sum(shard.bytes_used for shard in self._shards),
+            "max_bytes": self.max_bytes,
+        }
 
 
 class RedisCache(CacheBackend):
@@ -324,6 +817,8 @@ class RedisCache(CacheBackend):
     - Comprehensive metrics and observability
     - Graceful shutdown and resource cleanup
     - Transaction-aware cache invalidation
+    - Tag sets for invalidation with batched ``UNLINK``
+    - Bulk operations with ``MGET`` and pipelined writes
     - Fallback mechanisms for high availability
 
     Example:
@@ -332,8 +827,20 @@ class RedisCache(CacheBackend):
         >>> await cache.set("key1", {"data": "value"}, ttl=300)
         >>> value = await cache.get("key1")
         >>> await cache.close()  # Graceful shutdown
+
+    Tags are stored as Redis sets of keys under ``{namespace}:tag:{tag}``.
+    A tag set expires with its longest-lived member, or never if a member
+    has no TTL. Deleted values are removed from their tag sets, using the
+    tags passed to ``set`` recorded under ``{namespace}:keytags:{key}``.
+    Members of expired values are otherwise only removed when their tag
+    is invalidated, which deletes the set.
     """
 
+    supports_tags = True
+    unlink_batch_size = 500
+    # Keys per MGET call and per pipeline of the bulk operations
+    batch_size = 1000
+
     def __init__(
         self,
         url: str = "redis://localhost:6379/0",
@@ -574,6 +1081,75 @@ class RedisCache(CacheBackend):
         """Create namespaced key."""
         return f"{self.namespace}:{key}"
 
+    def _make_tag_key(self, tag: str) -> str:
+        """Create the key of the set holding the keys of a tag."""
+        return f"{self.namespace}:tag:{tag}"
+
+    def _make_key_tags_key(self, key: str) -> str:
+        """Create the key of the set holding the tags a key was set with."""
+        return f"{self.namespace}:keytags:{key}"
+
+    def _record_key_tags(
+        self, pipe: Any, keys: List[str], tags: Sequence[str], ttl: Optional[int]
+    ) -> None:
+        """Queue recording the tags passed to ``set`` for keys.
+
+        Deletions read them to remove the keys from these tag sets; prefix
+        tags are derived from the keys instead.
+        """
+        tags_keys = [self._make_key_tags_key(key) for key in keys]
+        pipe.delete(*tags_keys)
+        if tags:
+            for tags_key in tags_keys:
+                pipe.sadd(tags_key, *tags)
+                if ttl:
+                    pipe.expire(tags_key, ttl)
+
+    async def _delete_keys(self, keys: List[str]) -> int:
+        """Delete keys and remove them from their tag sets.
+
+        Sends one script call per batch of keys.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Number of keys that existed
+        """
+        deleted = 0
+        for start in range(0, len(keys), self.batch_size):
+            script_keys: List[str] = []
+            counts: List[int] = []
+            for key in keys[start : start + self.batch_size]:
+                tag_keys = [self._make_tag_key(tag) for tag in key_tags(key)]
+                script_keys.extend(
+                    (self._make_key(key), self._make_key_tags_key(key), *tag_keys)
+                )
+                counts.append(len(tag_keys))
+
+            deleted += await self.redis.eval(
+                _DELETE_KEYS_SCRIPT,
+                len(script_keys),
+                *script_keys,
+                self._make_tag_key(""),
+                *counts,
+            )
+        return deleted
+
+    def _add_tag_members(
+        self, pipe: Any, tags: Iterable[str], redis_keys: List[str], ttl: Optional[int]
+    ) -> None:
+        """Queue adding keys to tag sets, extending the TTL of the sets."""
+        tag_keys = [self._make_tag_key(tag) for tag in tags]
+        if tag_keys:
+            pipe.eval(
+                _ADD_TAG_MEMBERS_SCRIPT,
+                len(tag_keys),
+                *tag_keys,
+                int(ttl * 1000) if ttl else 0,
+                *redis_keys,
+            )
+
     def _serialize(self, value: Any) -> bytes:
         """Serialize value for storage."""
         try:
@@ -675,28 +1251,38 @@ class RedisCache(CacheBackend):
             return None
 
     async def _fallback_set(
-        self, key: str, value: Any, ttl: Optional[int] = None
+        self,
+        key: str,
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         """Set in fallback cache when Redis is unavailable."""
         if not self.enable_fallback or not self._fallback_cache:
             return False
 
         try:
-            return await self._fallback_cache.set(key, value, ttl)
+            return await self._fallback_cache.set(key, value, ttl, tags=tags)
         except Exception as e:
             logger.error(f"Fallback cache set error: {e}")
             return False
 
     async def set(
-        self, key: Union[str, CacheKey], value: Any, ttl: Optional[int] = None
+        self,
+        key: Union[str, CacheKey],
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         """Enhanced set with circuit breaker, retry, and fallback."""
         self._total_operations += 1
         key_str = validate_cache_key(key)
+        custom_tags = list(dict.fromkeys(tags or ()))
+        tags = list(dict.fromkeys((*key_tags(key_str), *custom_tags)))
 
         # Check circuit breaker
         if not await self._check_circuit_breaker():
-            return await self._fallback_set(key_str, value, ttl)
+            return await self._fallback_set(key_str, value, ttl, tags)
 
         # Try Redis with retry
         for attempt in range(self.retry_attempts):
@@ -705,10 +1291,15 @@ class RedisCache(CacheBackend):
                 redis_key = self._make_key(key_str)
                 data = self._serialize(value)
 
+                # The value and its tag memberships are sent in one round trip
+                pipe = self.redis.pipeline()
                 if ttl:
-                    await self.redis.setex(redis_key, ttl, data)
+                    pipe.setex(redis_key, ttl, data)
                 else:
-                    await self.redis.set(redis_key, data)
+                    pipe.set(redis_key, data)
+                self._add_tag_members(pipe, tags, [redis_key], ttl)
+                self._record_key_tags(pipe, [key_str], custom_tags, ttl)
+                await pipe.execute()
 
                 self._sets += 1
                 await self._record_success()
@@ -737,16 +1328,158 @@ class RedisCache(CacheBackend):
                 )
 
                 # Try fallback on final failure
-                return await self._fallback_set(key_str, value, ttl)
+                return await self._fallback_set(key_str, value, ttl, tags)
+
+    async def _retry(self, operation: Callable[[], Awaitable[Any]], name: str) -> Any:
+        """Run a Redis operation with the retry policy of ``get`` and ``set``.
+
+        Args:
+            operation: Coroutine function sending the commands
+            name: Operation name for the logs
+
+        Returns:
+            Result of the operation
+
+        Raises:
+            Exception: Error of the last attempt
+        """
+        for attempt in range(self.retry_attempts):
+            try:
+                await self._ensure_connected()
+                result = await operation()
+                await self._record_success()
+                return result
+
+            except Exception as e:
+                self._errors += 1
+                await self._record_failure()
+
+                if attempt == self.retry_attempts - 1:
+                    logger.error(
+                        f"Redis cache {name} error after {self.retry_attempts} "
+                        f"attempts: {e}"
+                    )
+                    raise
+
+                # Exponential backoff with jitter
+                delay = min(
+                    self.retry_backoff_base * (2**attempt),
+                    self.retry_backoff_max,
+                )
+                jitter = delay * 0.1 * (0.5 - asyncio.get_event_loop().time() % 1)
+                await asyncio.sleep(delay + jitter)
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values with ``MGET``, one round trip per batch."""
+        self._total_operations += 1
+        keys = list(dict.fromkeys(validate_cache_key(key) for key in keys))
+        if not keys:
+            return {}
+
+        if not await self._check_circuit_breaker():
+            return await self._fallback_get_many(keys)
+
+        async def mget() -> List[Optional[Any]]:
+            values = []
+            for start in range(0, len(keys), self.batch_size):
+                batch = keys[start : start + self.batch_size]
+                data = await self.redis.mget(*map(self._make_key, batch))
+                values.extend(
+                    None if item is None else self._deserialize(item) for item in data
+                )
+            return values
+
+        try:
+            values = await self._retry(mget, "get_many")
+        except Exception:
+            return await self._fallback_get_many(keys)
+
+        hits = sum(value is not None for value in values)
+        self._hits += hits
+        self._misses += len(keys) - hits
+        return dict(zip(keys, values))
+
+    async def _fallback_get_many(self, keys: List[str]) -> Dict[str, Optional[Any]]:
+        """Get several values from the fallback cache."""
+        if not self.enable_fallback or not self._fallback_cache:
+            return dict.fromkeys(keys)
+
+        values = await self._fallback_cache.get_many(keys)
+        self._fallback_hits += sum(value is not None for value in values.values())
+        return values
+
+    async def set_many(
+        self,
+        items: Mapping[Union[str, CacheKey], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Set several values with pipelined ``SET``, one round trip per batch.
+
+        Tag memberships are added with one script call per tag and batch.
+        """
+        self._total_operations += 1
+        items = {validate_cache_key(key): value for key, value in items.items()}
+        tags = tuple(dict.fromkeys(tags or ()))
+        if not items:
+            return []
+
+        if not await self._check_circuit_breaker():
+            return await self._fallback_set_many(items, ttl, tags)
+
+        keys = list(items)
+
+        async def pipeline() -> None:
+            for start in range(0, len(keys), self.batch_size):
+                pipe = self.redis.pipeline()
+                members: Dict[str, List[str]] = {}
+                for key in keys[start : start + self.batch_size]:
+                    redis_key = self._make_key(key)
+                    data = self._serialize(items[key])
+                    if ttl:
+                        pipe.setex(redis_key, ttl, data)
+                    else:
+                        pipe.set(redis_key, data)
+                    for tag in dict.fromkeys((*key_tags(key), *tags)):
+                        members.setdefault(tag, []).append(redis_key)
+
+                for tag, redis_keys in members.items():
+                    self._add_tag_members(pipe, [tag], redis_keys, ttl)
+                self._record_key_tags(
+                    pipe, keys[start : start + self.batch_size], tags, ttl
+                )
+                await pipe.execute()
+
+        try:
+            await self._retry(pipeline, "set_many")
+        except Exception:
+            return await self._fallback_set_many(items, ttl, tags)
+
+        self._sets += len(items)
+        return []
+
+    async def _fallback_set_many(
+        self, items: Dict[str, Any], ttl: Optional[int], tags: Tuple[str, ...]
+    ) -> List[str]:
+        """Set several values in the fallback cache."""
+        if not self.enable_fallback or not self._fallback_cache:
+            return list(items)
+
+        try:
+            return await self._fallback_cache.set_many(items, ttl, tags=tags)
+        except Exception as e:
+            logger.error(f"Fallback cache set error: {e}")
+            return list(items)
 
     async def delete(self, key: Union[str, CacheKey]) -> bool:
         """Delete a value from Redis cache."""
         await self._ensure_connected()
         key_str = validate_cache_key(key)
-        redis_key = self._make_key(key_str)
 
         try:
-            result = await self.redis.delete(redis_key)
+            result = await self._delete_keys([key_str])
             if result > 0:
                 self._deletes += 1
                 return True
@@ -757,6 +1490,21 @@ class RedisCache(CacheBackend):
             logger.error(f"Redis cache delete error: {e}")
             raise CacheBackendError(f"Failed to delete from Redis: {e}")  # nosec B608
 
+    async def delete_many(self, keys: Iterable[Union[str, CacheKey]]) -> int:
+        """Delete several values, with one script call per batch of keys."""
+        await self._ensure_connected()
+        keys = list(dict.fromkeys(validate_cache_key(key) for key in keys))
+
+        try:
+            deleted = await self._delete_keys(keys)
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Redis cache delete error: {e}")
+            raise CacheBackendError(f"Failed to delete from Redis: {e}") from e
+
+        self._deletes += deleted
+        return deleted
+
     async def exists(self, key: Union[str, CacheKey]) -> bool:
         """Check if a key exists in Redis cache."""
         await self._ensure_connected()
@@ -772,6 +1520,159 @@ class RedisCache(CacheBackend):
             logger.error(f"Redis cache exists error: {e}")
             raise CacheBackendError(f"Failed to check existence in Redis: {e}")
 
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """Delete the values registered under any of the tags.
+
+        The keys are read from the tag sets with one ``SUNION`` and deleted
+        in batches, which also removes them from their other tag sets. The
+        tag sets are then deleted with ``UNLINK``.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Keys that were registered under the tags
+        """
+        tags = list(tags)
+        keys: List[str] = []
+        if self._fallback_cache:
+            keys.extend(await self._fallback_cache.invalidate_tags(tags))
+        if not tags:
+            return keys
+
+        await self._ensure_connected()
+        tag_keys = [self._make_tag_key(tag) for tag in tags]
+
+        prefix_length = len(self.namespace) + 1
+        try:
+            members = await self.redis.sunion(*tag_keys)
+            deleted = sorted(
+                (member.decode("utf-8") if isinstance(member, bytes) else member)[
+                    prefix_length:
+                ]
+                for member in members
+            )
+            await self._delete_keys(deleted)
+            await self._unlink(tag_keys)
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Redis cache tag invalidation error: {e}")
+            raise CacheBackendError(f"Failed to invalidate Redis tags: {e}") from e
+
+        self._deletes += len(deleted)
+        keys.extend(deleted)
+        return list(dict.fromkeys(keys))
+
+    async def delete_pattern(self, pattern: str) -> List[str]:
+        """Delete the values whose key matches a pattern.
+
+        Keys are found with ``SCAN`` and deleted with batched ``UNLINK``.
+        Prefer ``invalidate_tags`` for prefix patterns.
+
+        Args:
+            pattern: Key pattern with wildcards
+
+        Returns:
+            Keys that were deleted
+        """
+        await self._ensure_connected()
+
+        try:
+            redis_keys = [
+                key.decode("utf-8") if isinstance(key, bytes) else key
+                async for key in self.redis.scan_iter(match=self._make_key(pattern))
+            ]
+            await self._unlink(redis_keys)
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Redis cache pattern delete error: {e}")
+            raise CacheBackendError(f"Failed to delete Redis keys: {e}") from e
+
+        prefix_length = len(self.namespace) + 1
+        self._deletes += len(redis_keys)
+        return [redis_key[prefix_length:] for redis_key in redis_keys]
+
+    async def _unlink(self, redis_keys: List[str]) -> None:
+        """Delete keys in batches, reclaiming memory in the background."""
+        for start in range(0, len(redis_keys), self.unlink_batch_size):
+            await self.redis.unlink(
+                *redis_keys[start : start + self.unlink_batch_size]
+            )
+
+    async def publish(self, channel: str, message: Dict[str, Any]) -> int:
+        """Publish a JSON message on a channel of the namespace.
+
+        Args:
+            channel: Channel name, prefixed with the namespace
+            message: JSON serializable message
+
+        Returns:
+            Number of subscribers that received the message
+        """
+        await self._ensure_connected()
+
+        try:
+            return await self.redis.publish(
+                self._make_key(channel), json.dumps(message, default=str)
+            )
+        except Exception as e:
+            self._errors += 1
+            logger.error(f"Redis cache publish error: {e}")
+            raise CacheBackendError(f"Failed to publish on Redis: {e}") from e
+
+    async def subscribe(
+        self,
+        channel: str,
+        callback: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> asyncio.Task:
+        """Call a coroutine function with each message of a channel.
+
+        The subscription is active when this method returns. Messages are
+        read by a task that ends with an error if the connection is lost;
+        cancel it to unsubscribe.
+
+        Args:
+            channel: Channel name, prefixed with the namespace
+            callback: Coroutine function called with each decoded message
+
+        Returns:
+            Task reading the messages
+        """
+        await self._ensure_connected()
+
+        pubsub = self.redis.pubsub()
+        try:
+            await pubsub.subscribe(self._make_key(channel))
+        except Exception as e:
+            self._errors += 1
+            raise CacheConnectionError(f"Redis subscribe failed: {e}") from e
+
+        return asyncio.create_task(self._read_messages(pubsub, callback))
+
+    async def _read_messages(
+        self,
+        pubsub: Any,
+        callback: Callable[[Dict[str, Any]], Awaitable[None]],
+    ) -> None:
+        """Dispatch the messages of a subscription until it is closed."""
+        try:
+            async for message in pubsub.listen():
+                if message.get("type") != "message":
+                    continue
+
+                data = message["data"]
+                try:
+                    if isinstance(data, bytes):
+                        data = data.decode("utf-8")
+                    await callback(json.loads(data))
+                except Exception as e:
+                    logger.error(f"Redis cache message error: {e}")
+        finally:
+            try:
+                await pubsub.reset()
+            except Exception as e:
+                logger.debug(f"Redis cache unsubscribe error: {e}")
+
     async def clear(self) -> bool:
         """Clear all cached values in namespace."""
         await self._ensure_connected()
@@ -850,3 +1751,386 @@ class RedisCache(CacheBackend):
                 pass  # nosec B110 - Ignore errors getting Redis info
 
         return stats
+
+
+class TieredCache(CacheBackend):
+    """Two-tier cache: a per-process memory cache in front of a shared one.
+
+    Reads are served from L1, a ``MemoryCache`` in this process, and fall
+    back to L2, usually a ``RedisCache`` shared by all worker processes;
+    values found in L2 are promoted to L1. Writes go to both tiers.
+
+    When L2 supports publish/subscribe, writes, deletions and
+    invalidations are broadcast on a channel of its namespace and every
+    other process drops the matching L1 entries as soon as the message
+    arrives. If the subscription is lost, L1 is cleared and bypassed until
+    it is restored, since messages may have been missed. L1 entries also
+    expire after ``l1_ttl`` seconds, which bounds their staleness in any
+    case.
+
+    Example:
+        >>> l2 = RedisCache(url="redis://localhost:6379/0")
+        >>> cache = TieredCache(l2, l1=MemoryCache(max_size=10000), l1_ttl=60)
+        >>> await cache.connect()
+        >>> await cache.set("key1", {"data": "value"}, ttl=300)
+        >>> value = await cache.get("key1")  # Served from L1
+    """
+
+    def __init__(
+        self,
+        l2: CacheBackend,
+        l1: Optional[MemoryCache] = None,
+        l1_ttl: int = 60,
+        channel: str = "invalidations",
+        resubscribe_delay: float = 1.0,
+    ):
+        """Initialize tiered cache.
+
+        Args:
+            l2: Shared cache backend
+            l1: Per-process memory cache (defaults to 1000 entries)
+            l1_ttl: Longest time an entry stays in L1, in seconds. Values
+                promoted from L2 always expire after it, since their
+                remaining TTL in L2 is unknown.
+            channel: Name of the invalidation channel
+            resubscribe_delay: Delay between subscription attempts after
+                the subscription was lost, in seconds
+
+        Raises:
+            ValueError: If l1_ttl is not positive
+        """
+        if l1_ttl is None or l1_ttl <= 0:
+            raise ValueError("l1_ttl must be positive")
+
+        self.l1 = l1 if l1 is not None else MemoryCache(max_size=1000)
+        self.l2 = l2
+        self.l1_ttl = l1_ttl
+        self.channel = channel
+        self.resubscribe_delay = resubscribe_delay
+        self.supports_tags = l2.supports_tags
+
+        # Identifies the messages published by this process
+        self.node_id = uuid.uuid4().hex
+
+        # Without publish/subscribe, only l1_ttl bounds staleness
+        self._broadcast = hasattr(l2, "publish") and hasattr(l2, "subscribe")
+        self._subscribed = False
+        self._listener: Optional[asyncio.Task] = None
+
+        # Incremented by each write and invalidation, so that a value read
+        # from L2 before a change is not promoted
+        self._generation = 0
+
+        # Statistics
+        self._l1_hits = 0
+        self._l2_hits = 0
+        self._misses = 0
+        self._published = 0
+        self._received = 0
+
+    @property
+    def _use_l1(self) -> bool:
+        return self._subscribed or not self._broadcast
+
+    async def connect(self) -> None:
+        """Connect L2 and subscribe to the invalidation channel."""
+        await self.l1.connect()
+        if hasattr(self.l2, "connect"):
+            await self.l2.connect()
+
+        if self._broadcast and self._listener is None:
+            subscription = await self.l2.subscribe(self.channel, self._on_message)
+            self._subscribed = True
+            self._listener = asyncio.create_task(self._listen(subscription))
+
+    async def close(self) -> None:
+        """Unsubscribe and close both tiers."""
+        if self._listener is not None:
+            self._listener.cancel()
+            try:
+                await self._listener
+            except asyncio.CancelledError:
+                pass
+            self._listener = None
+        self._subscribed = False
+
+        await self.l1.close()
+        if hasattr(self.l2, "close"):
+            await self.l2.close()
+
+    async def _listen(self, subscription: asyncio.Task) -> None:
+        """Keep the invalidation channel subscribed."""
+        while True:
+            try:
+                await subscription
+            except asyncio.CancelledError:
+                subscription.cancel()
+                raise
+            except Exception as e:
+                logger.warning(f"Tiered cache subscription lost: {e}")
+
+            # Invalidations may be missed until the channel is subscribed
+            self._subscribed = False
+            await self.l1.clear()
+
+            while True:
+                await asyncio.sleep(self.resubscribe_delay)
+                try:
+                    subscription = await self.l2.subscribe(
+                        self.channel, self._on_message
+                    )
+                    break
+                except Exception as e:
+                    logger.debug(f"Tiered cache resubscribe error: {e}")
+
+            await self.l1.clear()
+            self._subscribed = True
+
+    async def _on_message(self, message: Dict[str, Any]) -> None:
+        """Apply an invalidation published by another process."""
+        if message.get("origin") == self.node_id:
+            return
+
+        self._received += 1
+        self._generation += 1
+        if message.get("clear"):
+            await self.l1.clear()
+            return
+
+        if message.get("keys"):
+            await self.l1.delete_many(message["keys"])
+        if message.get("tags"):
+            await self.l1.invalidate_tags(message["tags"])
+        if message.get("pattern"):
+            await self._delete_l1_pattern(message["pattern"])
+
+    async def _publish(self, **message: Any) -> None:
+        """Broadcast an invalidation to the other processes."""
+        if not self._broadcast:
+            return
+
+        try:
+            await self.l2.publish(self.channel, {"origin": self.node_id, **message})
+            self._published += 1
+        except Exception as e:
+            # The other processes will drop the entry after l1_ttl
+            logger.error(f"Tiered cache publish error: {e}")
+
+    def _l1_expiry(self, ttl: Optional[int]) -> int:
+        """Get the TTL of an L1 entry."""
+        return min(ttl, self.l1_ttl) if ttl else self.l1_ttl
+
+    async def get(self, key: Union[str, CacheKey]) -> Optional[Any]:
+        """Get a value from L1, or from L2 and promote it to L1."""
+        key_str = validate_cache_key(key)
+
+        use_l1 = self._use_l1
+        if use_l1:
+            value = await self.l1.get(key_str)
+            if value is not None:
+                self._l1_hits += 1
+                return value
+
+        generation = self._generation
+        value = await self.l2.get(key_str)
+        if value is None:
+            self._misses += 1
+            return None
+
+        self._l2_hits += 1
+        if use_l1 and self._use_l1 and generation == self._generation:
+            await self.l1.set(key_str, value, self.l1_ttl)
+        return value
+
+    async def set(
+        self,
+        key: Union[str, CacheKey],
+        value: Any,
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Set a value in both tiers and invalidate it in other processes."""
+        key_str = validate_cache_key(key)
+        self._generation += 1
+
+        if tags and self.supports_tags:
+            result = await self.l2.set(key_str, value, ttl, tags=tags)
+        else:
+            result = await self.l2.set(key_str, value, ttl)
+
+        if result and self._use_l1:
+            await self.l1.set(key_str, value, self._l1_expiry(ttl), tags=tags)
+        else:
+            await self.l1.delete(key_str)
+
+        await self._publish(keys=[key_str])
+        return result
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from L1, then the others from L2 at once."""
+        keys = list(dict.fromkeys(validate_cache_key(key) for key in keys))
+        values: Dict[str, Optional[Any]] = dict.fromkeys(keys)
+
+        use_l1 = self._use_l1
+        missing = keys
+        if use_l1:
+            values.update(await self.l1.get_many(keys))
+            missing = [key for key in keys if values[key] is None]
+            self._l1_hits += len(keys) - len(missing)
+        if not missing:
+            return values
+
+        generation = self._generation
+        found = {
+            key: value
+            for key, value in (await self.l2.get_many(missing)).items()
+            if value is not None
+        }
+        values.update(found)
+        self._l2_hits += len(found)
+        self._misses += len(missing) - len(found)
+
+        if found and use_l1 and self._use_l1 and generation == self._generation:
+            await self.l1.set_many(found, self.l1_ttl)
+        return values
+
+    async def set_many(
+        self,
+        items: Mapping[Union[str, CacheKey], Any],
+        ttl: Optional[int] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> List[str]:
+        """Set several values in both tiers with one invalidation message."""
+        items = {validate_cache_key(key): value for key, value in items.items()}
+        tags = list(tags or ())
+        self._generation += 1
+
+        if tags and self.supports_tags:
+            failed = await self.l2.set_many(items, ttl, tags=tags)
+        else:
+            failed = await self.l2.set_many(items, ttl)
+
+        if self._use_l1:
+            rejected = set(failed)
+            stored = {key: value for key, value in items.items() if key not in rejected}
+            await self.l1.set_many(stored, self._l1_expiry(ttl), tags=tags)
+            await self.l1.delete_many(failed)
+        else:
+            await self.l1.delete_many(items)
+
+        await self._publish(keys=list(items))
+        return failed
+
+    async def delete(self, key: Union[str, CacheKey]) -> bool:
+        """Delete a value from both tiers and from other processes."""
+        key_str = validate_cache_key(key)
+        self._generation += 1
+
+        deleted = await self.l2.delete(key_str)
+        await self.l1.delete(key_str)
+
+        await self._publish(keys=[key_str])
+        return deleted
+
+    async def delete_many(self, keys: Iterable[Union[str, CacheKey]]) -> int:
+        """Delete several values with one invalidation message."""
+        keys = list(dict.fromkeys(validate_cache_key(key) for key in keys))
+        self._generation += 1
+
+        deleted = await self.l2.delete_many(keys)
+        await self.l1.delete_many(keys)
+
+        await self._publish(keys=keys)
+        return deleted
+
+    async def exists(self, key: Union[str, CacheKey]) -> bool:
+        """Check if a key exists in L1 or L2."""
+        key_str = validate_cache_key(key)
+        if self._use_l1 and await self.l1.exists(key_str):
+            return True
+        return await self.l2.exists(key_str)
+
+    async def clear(self) -> bool:
+        """Clear both tiers in all processes."""
+        self._generation += 1
+        result = await self.l2.clear()
+        await self.l1.clear()
+
+        await self._publish(clear=True)
+        return result
+
+    async def invalidate_tags(self, tags: Iterable[str]) -> List[str]:
+        """Delete the values registered under any of the tags.
+
+        Values promoted from L2 are not registered under the tags given to
+        ``set()`` in L1, so the keys deleted from L2 are broadcast with the
+        tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Keys that were deleted
+        """
+        tags = list(tags)
+        self._generation += 1
+        keys = await self.l2.invalidate_tags(tags)
+
+        await self.l1.delete_many(keys)
+        keys.extend(await self.l1.invalidate_tags(tags))
+
+        await self._publish(keys=keys, tags=tags)
+        return list(dict.fromkeys(keys))
+
+    async def delete_pattern(self, pattern: str) -> List[str]:
+        """Delete the values whose key matches a pattern.
+
+        Args:
+            pattern: Key pattern with wildcards
+
+        Returns:
+            Keys that were deleted
+        """
+        self._generation += 1
+        keys: List[str] = []
+        if hasattr(self.l2, "delete_pattern"):
+            keys.extend(await self.l2.delete_pattern(pattern))
+        elif isinstance(self.l2, MemoryCache):
+            for key in fnmatch.filter(self.l2.keys(), pattern):
+                if await self.l2.delete(key):
+                    keys.append(key)
+
+        keys.extend(await self._delete_l1_pattern(pattern))
+
+        await self._publish(pattern=pattern)
+        return list(dict.fromkeys(keys))
+
+    async def _delete_l1_pattern(self, pattern: str) -> List[str]:
+        """Delete the L1 values whose key matches a pattern."""
+        keys = fnmatch.filter(self.l1.keys(), pattern)
+        await self.l1.delete_many(keys)
+        return keys
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get hit statistics of both tiers."""
+        total_requests = self._l1_hits + self._l2_hits + self._misses
+        hits = self._l1_hits + self._l2_hits
+
+        def rate(count: int) -> float:
+            return round(count / total_requests * 100, 2) if total_requests else 0
+
+        return {
+            "backend": "tiered",
+            "l1_hits": self._l1_hits,
+            "l2_hits": self._l2_hits,
+            "misses": self._misses,
+            "hit_rate": rate(hits),
+            "l1_hit_rate": rate(self._l1_hits),
+            "subscribed": self._subscribed,
+            "invalidations_published": self._published,
+            "invalidations_received": self._received,
+            "l1": await self.l1.get_stats(),
+            "l2": await self.l2.get_stats(),
+        }
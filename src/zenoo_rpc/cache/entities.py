@@ -0,0 +1,234 @@
+"""
+Normalized entity cache for OdooFlow.
+
+This module stores query results in normalized form: every record is
+cached once per (model, id) as a fragment of field values, and every
+query only stores the ordered list of its record ids. Results are
+assembled from the fragments, and records whose fragment is missing or
+lacks requested fields are read again in one batched call. Fragments are
+read and written with the bulk operations of the cache manager, in one
+round trip to Redis.
+
+Records are shared by all cached queries returning them, which saves
+memory, and a write only invalidates the fragments of the records it
+modified instead of all cached queries of the model. Fragments hold the
+values read without a context; queries with a context (language,
+timezone, companies...) are not normalized.
+
+Example:
+    >>> entities = EntityCache(cache_manager)
+    >>> await entities.put_query(key, "res.partner", rows, ["name"], ttl=300)
+    >>> rows = await entities.get_query(key, "res.partner", ["name"], fetch)
+"""
+
+from typing import Any, Awaitable, Callable, Dict, Iterable, List, Optional
+
+Fetch = Callable[[List[int]], Awaitable[List[Dict[str, Any]]]]
+
+
+class EntityCache:
+    """Normalized cache of records and query id lists.
+
+    Fragments are stored under ``record:{model}:{id}`` as the values of the
+    fields read so far, with a ``complete`` flag for records read with all
+    fields. Query entries only hold record ids.
+
+    Args:
+        cache_manager: Cache manager storing fragments and query entries
+        ttl: Default time to live of fragments in seconds
+    """
+
+    def __init__(self, cache_manager: Any, ttl: Optional[int] = None):
+        self.cache_manager = cache_manager
+        self.ttl = ttl
+
+    @staticmethod
+    def is_used_by(cache_manager: Any) -> bool:
+        """Check whether record fragments were stored in a cache manager.
+
+        Args:
+            cache_manager: Cache manager
+
+        Returns:
+            True if this process stored fragments in the cache manager
+        """
+        return bool(getattr(cache_manager, "__dict__", {}).get("_entity_cache_used"))
+
+    @staticmethod
+    def record_key(model: str, record_id: int) -> str:
+        """Get the cache key of a record fragment.
+
+        Args:
+            model: Name of the Odoo model
+            record_id: Record id
+
+        Returns:
+            Cache key string
+        """
+        return f"record:{model}:{record_id}"
+
+    async def get_query(
+        self,
+        key: str,
+        model: str,
+        fields: Optional[List[str]],
+        fetch: Fetch,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Get the cached result of a query.
+
+        Args:
+            key: Cache key of the query
+            model: Name of the Odoo model
+            fields: Fields of the query (None for all fields)
+            fetch: Coroutine function reading records by ids, used for
+                records missing from the cache
+
+        Returns:
+            Records in query order, or None if the query is not cached
+        """
+        entry = await self.cache_manager.get(key)
+        if not isinstance(entry, dict) or "ids" not in entry:
+            return None
+
+        ids = entry["ids"]
+        rows = await self.get_records(model, ids, fields, fetch)
+        return [rows[record_id] for record_id in ids if record_id in rows]
+
+    async def put_query(
+        self,
+        key: str,
+        model: str,
+        rows: List[Dict[str, Any]],
+        fields: Optional[List[str]],
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Cache the result of a query.
+
+        Args:
+            key: Cache key of the query
+            model: Name of the Odoo model
+            rows: Records returned by the query
+            fields: Fields of the query (None for all fields)
+            ttl: Time to live in seconds
+        """
+        ttl = ttl if ttl is not None else self.ttl
+        await self.put_records(model, rows, fields, ttl=ttl)
+        await self.cache_manager.set(key, {"ids": [row["id"] for row in rows]}, ttl=ttl)
+
+    async def get_records(
+        self,
+        model: str,
+        ids: List[int],
+        fields: Optional[List[str]],
+        fetch: Fetch,
+    ) -> Dict[int, Dict[str, Any]]:
+        """Get records from their fragments, reading the missing ones.
+
+        Args:
+            model: Name of the Odoo model
+            ids: Record ids
+            fields: Fields to return (None for all fields)
+            fetch: Coroutine function reading records by ids
+
+        Returns:
+            Records by id; ids that could not be read are omitted
+        """
+        keys = [self.record_key(model, record_id) for record_id in ids]
+        fragments = await self.cache_manager.get_many(keys)
+
+        rows: Dict[int, Dict[str, Any]] = {}
+        partial: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+        for record_id, key in zip(ids, keys):
+            fragment = fragments.get(key)
+            if not isinstance(fragment, dict):
+                missing.append(record_id)
+            elif _covers(fragment, fields):
+                rows[record_id] = _project(fragment, fields)
+            else:
+                partial[record_id] = fragment
+                missing.append(record_id)
+
+        if missing:
+            fetched = await fetch(missing)
+            await self.put_records(model, fetched, fields, partial)
+            for row in fetched:
+                rows[row["id"]] = row
+
+        return rows
+
+    async def put_records(
+        self,
+        model: str,
+        rows: Iterable[Dict[str, Any]],
+        fields: Optional[List[str]],
+        existing: Optional[Dict[int, Dict[str, Any]]] = None,
+        ttl: Optional[int] = None,
+    ) -> None:
+        """Store record fragments, merged with their cached fragments.
+
+        Args:
+            model: Name of the Odoo model
+            rows: Records including ``id``
+            fields: Fields the records were read with (None for all fields)
+            existing: Cached fragments of the records, by id
+            ttl: Time to live in seconds
+        """
+        existing = existing or {}
+        ttl = ttl if ttl is not None else self.ttl
+
+        fragments: Dict[str, Dict[str, Any]] = {}
+        for row in rows:
+            fragment = existing.get(row["id"])
+            if fragment is None or fields is None:
+                values = dict(row)
+                complete = fields is None
+            else:
+                values = {**fragment["values"], **row}
+                complete = fragment["complete"]
+
+            fragments[self.record_key(model, row["id"])] = {
+                "values": values,
+                "complete": complete,
+            }
+
+        if fragments:
+            self.cache_manager.__dict__["_entity_cache_used"] = True
+            await self.cache_manager.set_many(fragments, ttl=ttl)
+
+    async def invalidate_records(self, model: str, ids: Iterable[int]) -> None:
+        """Drop the fragments of modified records.
+
+        Args:
+            model: Name of the Odoo model
+            ids: Record ids
+        """
+        await self.cache_manager.delete_many(
+            [self.record_key(model, record_id) for record_id in ids]
+        )
+
+    async def invalidate_model(self, model: str) -> int:
+        """Drop the fragments of all records of a model.
+
+        Args:
+            model: Name of the Odoo model
+
+        Returns:
+            Number of fragments dropped
+        """
+        return await self.cache_manager.invalidate_pattern(f"record:{model}:*")
+
+
+def _covers(fragment: Dict[str, Any], fields: Optional[List[str]]) -> bool:
+    """Check whether a fragment holds the requested fields."""
+    if fragment["complete"]:
+        return True
+    return fields is not None and all(name in fragment["values"] for name in fields)
+
+
+def _project(fragment: Dict[str, Any], fields: Optional[List[str]]) -> Dict[str, Any]:
+    """Get the requested fields of a fragment, like ``search_read``."""
+    values = fragment["values"]
+    if fields is None:
+        return dict(values)
+    return {name: values[name] for name in ("id", *fields) if name in values}
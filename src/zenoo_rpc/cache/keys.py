@@ -333,3 +333,48 @@ def parse_cache_key(key: str) -> Dict[str, str]:
         components["extra"] = ":".join(parts[3:])
 
     return components
+
+
+def key_tags(key: str) -> List[str]:
+    """Get the prefix tags a cache key is indexed under.
+
+    A key ``a:b:c`` is indexed under ``a:*`` and ``a:b:*``, the patterns
+    used to invalidate a model or a query family, so that these patterns
+    can be invalidated without scanning every key.
+
+    Args:
+        key: Cache key string
+
+    Returns:
+        Prefix tags of the key
+
+    Example:
+        >>> key_tags("query:res.partner:a1b2c3d4")
+        ['query:*', 'query:res.partner:*']
+    """
+    first, sep, rest = key.partition(":")
+    if not sep:
+        return []
+    second, sep, _ = rest.partition(":")
+    if not sep:
+        return [f"{first}:*"]
+    return [f"{first}:*", f"{first}:{second}:*"]
+
+
+def pattern_tag(pattern: str) -> Optional[str]:
+    """Get the prefix tag matching exactly the keys of a pattern.
+
+    Args:
+        pattern: Key pattern with wildcards
+
+    Returns:
+        The tag if the pattern is ``a:*`` or ``a:b:*`` without other
+        wildcards, None otherwise
+    """
+    if not pattern.endswith(":*"):
+        return None
+
+    prefix = pattern[:-2]
+    if not prefix or prefix.count(":") > 1 or any(c in prefix for c in "*?[]"):
+        return None
+    return pattern
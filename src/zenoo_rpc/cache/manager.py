@@ -6,12 +6,19 @@ coordinating between different backends and strategies.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Union, Type
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union, Type
 import logging
 
-from .backends import CacheBackend, MemoryCache, RedisCache
-from .strategies import CacheStrategy, TTLCache, LRUCache, LFUCache
-from .keys import CacheKey, make_cache_key, make_model_cache_key, make_query_cache_key
+from .backends import CacheBackend, MemoryCache, RedisCache, TieredCache
+from .strategies import CacheStrategy, TTLCache, LRUCache, LFUCache, TinyLFUCache
+from .keys import (
+    CacheKey,
+    make_cache_key,
+    make_model_cache_key,
+    make_query_cache_key,
+    pattern_tag,
+    validate_cache_key,
+)
 from .exceptions import CacheError, CacheBackendError
 
 logger = logging.getLogger(__name__)
@@ -75,6 +82,9 @@ class CacheManager:
         max_size: int = 1000,
         default_ttl: Optional[int] = None,
         strategy: str = "ttl",
+        max_bytes: Optional[int] = None,
+        max_entry_bytes: Optional[int] = None,
+        shards: Optional[int] = None,
     ) -> None:
         """Setup in-memory cache backend.
 
@@ -82,11 +92,18 @@ class CacheManager:
             name: Backend name
             max_size: Maximum cache size
             default_ttl: Default TTL in seconds
-            strategy: Cache strategy ("ttl", "lru", "lfu")
+            strategy: Cache strategy ("ttl", "lru", "lfu", "tinylfu")
+            max_bytes: Memory budget in bytes (None for no budget)
+            max_entry_bytes: Largest value accepted with a budget, in bytes
+            shards: Number of shards (None for automatic)
         """
         # Create memory backend
         backend = MemoryCache(
-            max_size=max_size, default_ttl=default_ttl or self.config["default_ttl"]
+            max_size=max_size,
+            default_ttl=default_ttl or self.config["default_ttl"],
+            shards=shards,
+            max_bytes=max_bytes,
+            max_entry_bytes=max_entry_bytes,
         )
 
         # Create strategy
@@ -179,13 +196,64 @@ class CacheManager:
 
         logger.info(f"Setup Redis cache '{name}' with {strategy} strategy")
 
+    async def setup_tiered_cache(
+        self,
+        name: str = "tiered",
+        url: str = "redis://localhost:6379/0",
+        namespace: str = None,
+        serializer: str = "json",
+        strategy: str = "ttl",
+        l1_max_size: int = 1000,
+        l1_max_bytes: Optional[int] = None,
+        l1_ttl: int = 60,
+        **kwargs
+    ) -> None:
+        """Setup a memory cache in front of a shared Redis cache.
+
+        Each process reads from its own memory cache (L1) before Redis
+        (L2), and invalidations are broadcast to the other processes over
+        Redis publish/subscribe.
+
+        Args:
+            name: Backend name
+            url: Redis connection URL
+            namespace: Cache namespace
+            serializer: Serialization method
+            strategy: Cache strategy
+            l1_max_size: Maximum number of values in the memory cache
+            l1_max_bytes: Memory budget of the memory cache in bytes
+            l1_ttl: Longest time a value stays in the memory cache, in
+                seconds
+            **kwargs: Additional Redis backend parameters
+        """
+        l2 = RedisCache(
+            url=url,
+            namespace=namespace or self.config["namespace"],
+            serializer=serializer,
+            **kwargs
+        )
+        l1 = MemoryCache(max_size=l1_max_size, max_bytes=l1_max_bytes)
+        backend = TieredCache(l2, l1=l1, l1_ttl=l1_ttl)
+
+        # Connect to Redis and subscribe to invalidations
+        await backend.connect()
+
+        # Create strategy
+        cache_strategy = self._create_strategy(strategy, backend)
+
+        # Register
+        self.backends[name] = backend
+        self.strategies[name] = cache_strategy
+
+        logger.info(f"Setup tiered cache '{name}' with {strategy} strategy")
+
     def _create_strategy(
         self, strategy_type: str, backend: CacheBackend, **kwargs
     ) -> CacheStrategy:
         """Create a cache strategy instance.
 
         Args:
-            strategy_type: Strategy type ("ttl", "lru", "lfu")
+            strategy_type: Strategy type ("ttl", "lru", "lfu", "tinylfu")
             backend: Cache backend
             **kwargs: Strategy-specific arguments
 
@@ -201,6 +269,8 @@ class CacheManager:
             return LRUCache(backend, max_size=kwargs.get("max_size", 1000))
         elif strategy_type == "lfu":
             return LFUCache(backend, max_size=kwargs.get("max_size", 1000))
+        elif strategy_type == "tinylfu":
+            return TinyLFUCache(backend, max_size=kwargs.get("max_size", 1000))
         else:
             raise CacheError(f"Unknown cache strategy: {strategy_type}")
 
@@ -247,6 +317,7 @@ class CacheManager:
         value: Any,
         ttl: Optional[int] = None,
         backend: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
     ) -> bool:
         """Set a value in cache.
 
@@ -255,6 +326,7 @@ class CacheManager:
             value: Value to cache
             ttl: Time to live in seconds
             backend: Backend name (uses default if None)
+            tags: Tags to register the key under, for ``invalidate_tags``
 
         Returns:
             True if successful
@@ -271,6 +343,8 @@ class CacheManager:
 
         try:
             self.stats["total_sets"] += 1
+            if tags:
+                return await strategy.set(key, value, ttl=ttl, tags=tags)
             return await strategy.set(key, value, ttl=ttl)
 
         except Exception as e:
@@ -306,6 +380,120 @@ class CacheManager:
             logger.error(f"Cache delete error: {e}")
             return False
 
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]], backend: Optional[str] = None
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from cache in one backend call.
+
+        Redis reads the values with ``MGET`` and the memory cache takes the
+        lock of each shard once.
+
+        Args:
+            keys: Cache keys
+            backend: Backend name (uses default if None)
+
+        Returns:
+            Values by key, None for keys not found
+
+        Example:
+            >>> await cache_manager.get_many(["partner:1", "partner:2"])
+            {'partner:1': {...}, 'partner:2': None}
+        """
+        keys = [validate_cache_key(key) for key in keys]
+        if not self.config["enabled"]:
+            return dict.fromkeys(keys)
+
+        backend_name = backend or self.default_backend
+        strategy = self.strategies.get(backend_name)
+
+        if not strategy:
+            logger.warning(f"Cache backend '{backend_name}' not found")
+            return dict.fromkeys(keys)
+
+        try:
+            values = await strategy.get_many(keys)
+        except Exception as e:
+            logger.error(f"Cache get_many error: {e}")
+            return dict.fromkeys(keys)
+
+        hits = sum(value is not None for value in values.values())
+        self.stats["total_gets"] += len(values)
+        self.stats["total_hits"] += hits
+        self.stats["total_misses"] += len(values) - hits
+        return values
+
+    async def set_many(
+        self,
+        items: Mapping[Union[str, CacheKey], Any],
+        ttl: Optional[int] = None,
+        backend: Optional[str] = None,
+        tags: Optional[Iterable[str]] = None,
+    ) -> bool:
+        """Set several values in cache in one backend call.
+
+        Redis sends the values in one pipeline of ``SET`` commands.
+
+        Args:
+            items: Values to cache by key
+            ttl: Time to live in seconds
+            backend: Backend name (uses default if None)
+            tags: Tags to register every key under, for ``invalidate_tags``
+
+        Returns:
+            True if all values were stored
+        """
+        if not self.config["enabled"]:
+            return False
+
+        backend_name = backend or self.default_backend
+        strategy = self.strategies.get(backend_name)
+
+        if not strategy:
+            logger.warning(f"Cache backend '{backend_name}' not found")
+            return False
+
+        try:
+            self.stats["total_sets"] += len(items)
+            if tags:
+                failed = await strategy.set_many(items, ttl=ttl, tags=tags)
+            else:
+                failed = await strategy.set_many(items, ttl=ttl)
+            return not failed
+
+        except Exception as e:
+            logger.error(f"Cache set_many error: {e}")
+            return False
+
+    async def delete_many(
+        self, keys: Iterable[Union[str, CacheKey]], backend: Optional[str] = None
+    ) -> int:
+        """Delete several values from cache in one backend call.
+
+        Args:
+            keys: Cache keys
+            backend: Backend name (uses default if None)
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        if not self.config["enabled"]:
+            return 0
+
+        backend_name = backend or self.default_backend
+        strategy = self.strategies.get(backend_name)
+
+        if not strategy:
+            return 0
+
+        try:
+            keys = list(keys)
+            self.stats["total_deletes"] += len(keys)
+            return await strategy.delete_many(keys)
+
+        except Exception as e:
+            logger.error(f"Cache delete_many error: {e}")
+            return 0
+
     async def exists(
         self, key: Union[str, CacheKey], backend: Optional[str] = None
     ) -> bool:
@@ -347,6 +535,11 @@ class CacheManager:
     ) -> int:
         """Invalidate cache keys matching a pattern.
 
+        Patterns of the form ``a:*`` or ``a:b:*``, such as the model and
+        query family patterns, are answered from the tag index of the
+        backend in time proportional to the number of matching keys.
+        Other patterns scan all keys.
+
         Args:
             pattern: Key pattern (supports wildcards)
             backend: Backend name (uses default if None)
@@ -365,16 +558,20 @@ class CacheManager:
             return 0
 
         try:
-            # For memory cache, we can iterate through keys
             backend = getattr(strategy, "backend", strategy)
 
-            # Check for MemoryCache with _data attribute
-            if hasattr(backend, "_data") and hasattr(backend._data, "keys"):
+            tag = pattern_tag(pattern)
+            if tag is not None and getattr(backend, "supports_tags", False):
+                return await strategy.invalidate_tags([tag])
+
+            # For memory cache, we can iterate through keys
+
+            if isinstance(backend, MemoryCache):
                 import fnmatch
 
                 keys_to_delete = []
 
-                for key in backend._data.keys():
+                for key in backend.keys():
                     if fnmatch.fnmatch(str(key), pattern):
                         keys_to_delete.append(key)
 
@@ -399,12 +596,12 @@ class CacheManager:
                 return len(keys_to_delete)
 
             # For Redis cache, use SCAN with pattern
-            elif hasattr(strategy, "redis"):
-                count = 0
-                async for key in strategy.redis.scan_iter(match=pattern):
-                    await strategy.delete(key)
-                    count += 1
-                return count
+            elif hasattr(backend, "delete_pattern"):
+                keys = await backend.delete_pattern(pattern)
+                if backend is not strategy:
+                    for key in keys:
+                        strategy._forget(key)
+                return len(keys)
 
             else:
                 logger.warning(
@@ -416,9 +613,52 @@ class CacheManager:
             logger.error(f"Pattern invalidation error: {e}")
             return 0
 
+    async def invalidate_tags(
+        self, tags: Iterable[str], backend: Optional[str] = None
+    ) -> int:
+        """Invalidate cache entries registered under any of the tags.
+
+        Keys are registered under the tags given to ``set()`` and under
+        their prefix tags (``a:*`` and ``a:b:*`` for a key ``a:b:c``).
+
+        Args:
+            tags: Tags to invalidate
+            backend: Backend name (uses default if None)
+
+        Returns:
+            Number of keys invalidated
+
+        Example:
+            >>> await cache_manager.set(key, report, tags=["res.partner:42"])
+            >>> await cache_manager.invalidate_tags(["res.partner:42"])
+            1
+        """
+        if not self.config["enabled"]:
+            return 0
+
+        backend_name = backend or self.default_backend
+        strategy = self.strategies.get(backend_name)
+
+        if not strategy:
+            logger.warning(f"Cache backend '{backend_name}' not found")
+            return 0
+
+        if not getattr(getattr(strategy, "backend", None), "supports_tags", False):
+            logger.warning(f"Tags are not supported by backend '{backend_name}'")
+            return 0
+
+        try:
+            return await strategy.invalidate_tags(tags)
+        except Exception as e:
+            logger.error(f"Tag invalidation error: {e}")
+            return 0
+
     async def invalidate_model(self, model: str, backend: Optional[str] = None) -> int:
         """Invalidate all cache entries for a model.
 
+        This covers keys built with ``make_cache_key``, query results
+        (``query:{model}:*``) and normalized records (``record:{model}:*``).
+
         Args:
             model: Odoo model name
             backend: Backend name (uses default if None)
@@ -426,8 +666,10 @@ class CacheManager:
         Returns:
             Number of keys invalidated
         """
-        pattern = f"{model}:*"
-        return await self.invalidate_pattern(pattern, backend)
+        count = 0
+        for pattern in (f"{model}:*", f"query:{model}:*", f"record:{model}:*"):
+            count += await self.invalidate_pattern(pattern, backend)
+        return count
 
     async def get_stats(self, backend: Optional[str] = None) -> Dict[str, Any]:
         """Get cache statistics.
@@ -2,12 +2,13 @@
 Cache strategies for OdooFlow.
 
 This module provides different caching strategies including
-TTL (Time To Live), LRU (Least Recently Used), and LFU (Least Frequently Used).
+TTL (Time To Live), LRU (Least Recently Used), LFU (Least Frequently Used)
+and W-TinyLFU (frequency-based admission in front of a segmented LRU).
 """
 
 import time
 from abc import ABC, abstractmethod
-from typing import Any, Dict, Optional, Union
+from typing import Any, Dict, Iterable, List, Mapping, Optional, Union
 from collections import OrderedDict, defaultdict
 
 from .backends import CacheBackend
@@ -55,6 +56,75 @@ class CacheStrategy(ABC):
         """Get cache statistics."""
         pass
 
+    async def invalidate_tags(self, tags: Iterable[str]) -> int:
+        """Delete the values registered under any of the tags.
+
+        Args:
+            tags: Tags to invalidate
+
+        Returns:
+            Number of keys deleted
+        """
+        keys = await self.backend.invalidate_tags(tags)
+        for key in keys:
+            self._forget(key)
+        return len(keys)
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values with one backend call.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Values by key, None for keys not found
+        """
+        values = await self.backend.get_many(keys)
+        for key, value in values.items():
+            if value is None:
+                self._forget(key)
+        return values
+
+    async def set_many(
+        self, items: Mapping[Union[str, CacheKey], Any], **kwargs
+    ) -> List[str]:
+        """Set several values with one backend call.
+
+        Args:
+            items: Values to cache by key
+            **kwargs: Backend arguments such as ``ttl`` and ``tags``
+
+        Returns:
+            Keys whose value could not be stored
+        """
+        failed = await self.backend.set_many(items, **kwargs)
+        for key in failed:
+            self._forget(key)
+        return failed
+
+    async def delete_many(self, keys: Iterable[Union[str, CacheKey]]) -> int:
+        """Delete several values with one backend call.
+
+        Args:
+            keys: Cache keys
+
+        Returns:
+            Number of keys that existed and were deleted
+        """
+        keys = [validate_cache_key(key) for key in keys]
+        for key in keys:
+            self._forget(key)
+        return await self.backend.delete_many(keys)
+
+    def _forget(self, key: str) -> None:  # noqa: B027
+        """Stop tracking a key deleted by the backend.
+
+        A no-op by default, for strategies that keep no per-key state.
+        """
+        ...
+
 
 class TTLCache(CacheStrategy):
     """Time To Live (TTL) cache strategy.
@@ -151,7 +221,46 @@ class TTLCache(CacheStrategy):
             self._expiry_times[key_str] = time.time() + effective_ttl
 
         # Use backend's TTL if supported, otherwise track manually
-        return await self.backend.set(key, value, ttl=effective_ttl)
+        result = await self.backend.set(key, value, ttl=effective_ttl, **kwargs)
+        if not result:
+            # Rejected values are not kept by the backend
+            self._forget(key_str)
+        return result
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from TTL cache."""
+        keys = [validate_cache_key(key) for key in keys]
+        current_time = time.time()
+        expired = [
+            key
+            for key in keys
+            if self._expiry_times.get(key, current_time) < current_time
+        ]
+        if expired:
+            await self.delete_many(expired)
+
+        await self._cleanup_expired()
+
+        values = await super().get_many(key for key in keys if key not in expired)
+        return {key: values.get(key) for key in keys}
+
+    async def set_many(
+        self,
+        items: Mapping[Union[str, CacheKey], Any],
+        ttl: Optional[int] = None,
+        **kwargs,
+    ) -> List[str]:
+        """Set several values in TTL cache."""
+        effective_ttl = ttl or self.default_ttl
+
+        if effective_ttl:
+            expiry = time.time() + effective_ttl
+            for key in items:
+                self._expiry_times[validate_cache_key(key)] = expiry
+
+        return await super().set_many(items, ttl=effective_ttl, **kwargs)
 
     async def delete(self, key: Union[str, CacheKey]) -> bool:
         """Delete a value from TTL cache."""
@@ -162,6 +271,9 @@ class TTLCache(CacheStrategy):
 
         return await self.backend.delete(key)
 
+    def _forget(self, key: str) -> None:
+        self._expiry_times.pop(key, None)
+
     async def clear(self) -> bool:
         """Clear all cached values."""
         self._expiry_times.clear()
@@ -262,9 +374,35 @@ class LRUCache(CacheStrategy):
 
             # Evict if necessary
             await self._evict_lru()
+        else:
+            self._forget(key_str)
 
         return result
 
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from LRU cache."""
+        values = await super().get_many(keys)
+        for key, value in values.items():
+            if value is not None:
+                await self._update_access(key)
+        return values
+
+    async def set_many(
+        self, items: Mapping[Union[str, CacheKey], Any], **kwargs
+    ) -> List[str]:
+        """Set several values in LRU cache."""
+        failed = await super().set_many(items, **kwargs)
+
+        rejected = set(failed)
+        for key in map(validate_cache_key, items):
+            if key not in rejected:
+                await self._update_access(key)
+        await self._evict_lru()
+
+        return failed
+
     async def delete(self, key: Union[str, CacheKey]) -> bool:
         """Delete a value from LRU cache."""
         key_str = validate_cache_key(key)
@@ -274,6 +412,9 @@ class LRUCache(CacheStrategy):
 
         return await self.backend.delete(key)
 
+    def _forget(self, key: str) -> None:
+        self._access_order.pop(key, None)
+
     async def clear(self) -> bool:
         """Clear all cached values."""
         self._access_order.clear()
@@ -391,9 +532,35 @@ class LFUCache(CacheStrategy):
 
             # Evict if necessary
             await self._evict_lfu()
+        else:
+            self._forget(key_str)
 
         return result
 
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from LFU cache."""
+        values = await super().get_many(keys)
+        for key, value in values.items():
+            if value is not None:
+                await self._update_frequency(key)
+        return values
+
+    async def set_many(
+        self, items: Mapping[Union[str, CacheKey], Any], **kwargs
+    ) -> List[str]:
+        """Set several values in LFU cache."""
+        failed = await super().set_many(items, **kwargs)
+
+        rejected = set(failed)
+        for key in map(validate_cache_key, items):
+            if key not in rejected and key not in self._frequencies:
+                self._frequencies[key] = 1
+        await self._evict_lfu()
+
+        return failed
+
     async def delete(self, key: Union[str, CacheKey]) -> bool:
         """Delete a value from LFU cache."""
         key_str = validate_cache_key(key)
@@ -403,6 +570,9 @@ class LFUCache(CacheStrategy):
 
         return await self.backend.delete(key)
 
+    def _forget(self, key: str) -> None:
+        self._frequencies.pop(key, None)
+
     async def clear(self) -> bool:
         """Clear all cached values."""
         self._frequencies.clear()
@@ -432,3 +602,283 @@ class LFUCache(CacheStrategy):
         )
 
         return backend_stats
+
+
+# Halves every counter of a sketch row in one bytes.translate() call
+_HALVE = bytes(count >> 1 for count in range(256))
+
+_MASK64 = (1 << 64) - 1
+
+
+def _mix64(value: int) -> int:
+    """Scramble an integer into 64 well distributed bits (splitmix64)."""
+    value = (value * 0x9E3779B97F4A7C15) & _MASK64
+    value = ((value ^ (value >> 30)) * 0xBF58476D1CE4E5B9) & _MASK64
+    value = ((value ^ (value >> 27)) * 0x94D049BB133111EB) & _MASK64
+    return value ^ (value >> 31)
+
+
+class CountMinSketch:
+    """Approximate access frequencies in fixed memory.
+
+    Each key maps to one counter per row, chosen by multiplicative hashing
+    with a different seed per row, and its frequency is the smallest of
+    them. Increments only raise the smallest counters (conservative
+    update), which limits the error caused by collisions. Counters
+    saturate at 15 and are all halved after ``sample_size`` increments, so
+    the sketch follows recent popularity.
+
+    Example:
+        >>> sketch = CountMinSketch(1000)
+        >>> sketch.increment("res.partner:1")
+        >>> sketch.estimate("res.partner:1")
+        1
+    """
+
+    max_count = 15
+
+    def __init__(self, width: int, depth: int = 4, sample_size: Optional[int] = None):
+        """Initialize the sketch.
+
+        Args:
+            width: Number of counters per row, rounded up to a power of two
+            depth: Number of rows
+            sample_size: Increments between two halvings (defaults to ten
+                times the width)
+        """
+        bits = max(4, (max(width, 1) - 1).bit_length())
+        self.width = 1 << bits
+        self.depth = depth
+        self.sample_size = sample_size or 10 * self.width
+        self.additions = 0
+        self._shift = 64 - bits
+        self._seeds = [_mix64(row + 1) | 1 for row in range(depth)]
+        self._rows = [bytearray(self.width) for _ in range(depth)]
+
+    def _indexes(self, key: str) -> List[int]:
+        # The high bits of the product depend on every bit of the hash, so
+        # keys colliding in one row rarely collide in the others
+        h = hash(key) & _MASK64
+        return [((h * seed) & _MASK64) >> self._shift for seed in self._seeds]
+
+    def increment(self, key: str) -> None:
+        """Record an access to a key."""
+        cells = list(zip(self._rows, self._indexes(key)))
+        count = min(row[index] for row, index in cells)
+        if count >= self.max_count:
+            return
+
+        for row, index in cells:
+            if row[index] == count:
+                row[index] = count + 1
+
+        self.additions += 1
+        if self.additions >= self.sample_size:
+            self.reset()
+
+    def estimate(self, key: str) -> int:
+        """Get the estimated access frequency of a key."""
+        return min(row[index] for row, index in zip(self._rows, self._indexes(key)))
+
+    def reset(self) -> None:
+        """Halve all counters, aging the recorded frequencies."""
+        for row in self._rows:
+            row[:] = row.translate(_HALVE)
+        self.additions //= 2
+
+
+class TinyLFUCache(CacheStrategy):
+    """Window TinyLFU (W-TinyLFU) cache strategy.
+
+    New entries go to a small LRU window. Entries leaving the window
+    compete for a place in the main cache with its eviction victim, and
+    only the more frequently accessed of the two is kept, according to a
+    count-min sketch of recent accesses. The main cache is a segmented
+    LRU: entries hit again move from the probation segment to the
+    protected one. Every operation is O(1).
+
+    One-off accesses, such as a large export, only churn the window and
+    the probation segment, so they do not flush frequently used entries.
+
+    Features:
+    - Frequency-based admission with a count-min sketch
+    - Window LRU for recency bursts
+    - Segmented main LRU (probation and protected)
+    - Periodic aging of frequencies
+
+    Example:
+        >>> cache = TinyLFUCache(backend, max_size=10000)
+        >>> await cache.set("key1", "value1")
+        >>> value = await cache.get("key1")  # Counted by the sketch
+    """
+
+    def __init__(
+        self,
+        backend: CacheBackend,
+        max_size: int = 1000,
+        window_ratio: float = 0.01,
+        protected_ratio: float = 0.8,
+    ):
+        """Initialize W-TinyLFU cache strategy.
+
+        Args:
+            backend: Cache backend
+            max_size: Maximum number of items
+            window_ratio: Share of ``max_size`` used by the window LRU
+            protected_ratio: Share of the main cache used by the protected
+                segment
+        """
+        super().__init__(backend)
+        self.max_size = max_size
+        self.window_size = max(1, int(max_size * window_ratio))
+        self.main_size = max(1, max_size - self.window_size)
+        self.protected_size = int(self.main_size * protected_ratio)
+        # Four counters per entry, aged every ten accesses per entry
+        self.sketch = CountMinSketch(4 * max_size, sample_size=10 * max_size)
+
+        # Tracked keys of each segment, in LRU order
+        self._window: OrderedDict[str, None] = OrderedDict()
+        self._probation: OrderedDict[str, None] = OrderedDict()
+        self._protected: OrderedDict[str, None] = OrderedDict()
+
+        self._admitted = 0
+        self._rejected = 0
+
+    def _on_hit(self, key: str) -> bool:
+        """Update the segments of a tracked key that was accessed.
+
+        Returns:
+            False if the key is not tracked
+        """
+        if key in self._window:
+            self._window.move_to_end(key)
+        elif key in self._protected:
+            self._protected.move_to_end(key)
+        elif key in self._probation:
+            del self._probation[key]
+            self._protected[key] = None
+            if len(self._protected) > self.protected_size:
+                demoted, _ = self._protected.popitem(last=False)
+                self._probation[demoted] = None
+        else:
+            return False
+        return True
+
+    async def _admit(self, candidate: str) -> None:
+        """Move a key leaving the window to the main cache, or drop it."""
+        if len(self._probation) + len(self._protected) < self.main_size:
+            self._probation[candidate] = None
+            return
+
+        segment = self._probation or self._protected
+        victim = next(iter(segment))
+        if self.sketch.estimate(candidate) > self.sketch.estimate(victim):
+            del segment[victim]
+            self._probation[candidate] = None
+            self._admitted += 1
+            await self.backend.delete(victim)
+        else:
+            self._rejected += 1
+            await self.backend.delete(candidate)
+
+    async def get(self, key: Union[str, CacheKey]) -> Optional[Any]:
+        """Get a value from W-TinyLFU cache."""
+        key_str = validate_cache_key(key)
+
+        # Misses count too, so that popular keys are admitted once set
+        self.sketch.increment(key_str)
+        value = await self.backend.get(key)
+
+        if value is not None:
+            self._on_hit(key_str)
+        else:
+            # Expired or evicted by the backend
+            self._forget(key_str)
+
+        return value
+
+    async def set(self, key: Union[str, CacheKey], value: Any, **kwargs) -> bool:
+        """Set a value in W-TinyLFU cache."""
+        key_str = validate_cache_key(key)
+
+        result = await self.backend.set(key, value, **kwargs)
+        if not result:
+            self._forget(key_str)
+            return result
+
+        await self._track(key_str)
+        return result
+
+    async def _track(self, key: str) -> None:
+        """Record a stored key, admitting the window LRU if it overflows."""
+        if not self._on_hit(key):
+            self._window[key] = None
+            if len(self._window) > self.window_size:
+                candidate, _ = self._window.popitem(last=False)
+                await self._admit(candidate)
+
+    async def get_many(
+        self, keys: Iterable[Union[str, CacheKey]]
+    ) -> Dict[str, Optional[Any]]:
+        """Get several values from W-TinyLFU cache."""
+        keys = [validate_cache_key(key) for key in keys]
+        for key in keys:
+            self.sketch.increment(key)
+
+        values = await super().get_many(keys)
+        for key, value in values.items():
+            if value is not None:
+                self._on_hit(key)
+        return values
+
+    async def set_many(
+        self, items: Mapping[Union[str, CacheKey], Any], **kwargs
+    ) -> List[str]:
+        """Set several values in W-TinyLFU cache."""
+        failed = await super().set_many(items, **kwargs)
+
+        rejected = set(failed)
+        for key in map(validate_cache_key, items):
+            if key not in rejected:
+                await self._track(key)
+
+        return failed
+
+    async def delete(self, key: Union[str, CacheKey]) -> bool:
+        """Delete a value from W-TinyLFU cache."""
+        key_str = validate_cache_key(key)
+        self._forget(key_str)
+        return await self.backend.delete(key)
+
+    def _forget(self, key: str) -> None:
+        self._window.pop(key, None)
+        self._probation.pop(key, None)
+        self._protected.pop(key, None)
+
+    async def clear(self) -> bool:
+        """Clear all cached values."""
+        self._window.clear()
+        self._probation.clear()
+        self._protected.clear()
+        return await self.backend.clear()
+
+    async def get_stats(self) -> Dict[str, Any]:
+        """Get W-TinyLFU cache statistics."""
+        backend_stats = await self.backend.get_stats()
+
+        current_size = len(self._window) + len(self._probation) + len(self._protected)
+        backend_stats.update(
+            {
+                "strategy": "tinylfu",
+                "max_size": self.max_size,
+                "current_size": current_size,
+                "utilization": round(current_size / self.max_size * 100, 2),
+                "window_size": len(self._window),
+                "probation_size": len(self._probation),
+                "protected_size": len(self._protected),
+                "admitted": self._admitted,
+                "rejected": self._rejected,
+            }
+        )
+
+        return backend_stats
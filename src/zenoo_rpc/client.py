@@ -6,9 +6,17 @@ through the Zenoo-RPC library. It combines transport, session management,
 and high-level API features with zen-like simplicity.
 """
 
+import asyncio
 from typing import Any, Dict, List, Optional, Type, TypeVar, TYPE_CHECKING, Union
 
-from .exceptions import AuthenticationError, ZenooError
+from .cache.entities import EntityCache
+from .exceptions import (
+    AuthenticationError,
+    ConnectionError,
+    RequestTimeoutError,
+    ZenooError,
+)
+from .models.identity_map import IdentityMap
 from .transport import AsyncTransport, SessionManager
 
 if TYPE_CHECKING:
@@ -19,9 +27,39 @@ if TYPE_CHECKING:
     from .cache.manager import CacheManager
     from .batch.manager import BatchManager
     from .ai.core.ai_assistant import AIAssistant
+    from .sync.replica import LocalReplica
+    from .query.profiler import FieldProfiler
 
 T = TypeVar("T")
 
+# Model methods that never modify records
+_READ_ONLY_METHODS = frozenset(
+    {
+        "check_access_rights",
+        "check_access_rule",
+        "default_get",
+        "exists",
+        "fields_get",
+        "fields_view_get",
+        "get_views",
+        "load_views",
+        "name_get",
+        "name_search",
+        "onchange",
+        "read",
+        "read_group",
+        "read_progress_bar",
+        "search",
+        "search_count",
+        "search_fetch",
+        "search_read",
+        "web_name_search",
+        "web_read",
+        "web_read_group",
+        "web_search_read",
+    }
+)
+
 
 class ZenooClient:
     """Main async client for Zenoo-RPC.
@@ -108,6 +146,15 @@ class ZenooClient:
         self.batch_manager: Optional["BatchManager"] = None
         self._fallback_manager = None
 
+        # Records known to this client, invalidated on writes
+        self.identity_map = IdentityMap()
+
+        # Local read replica of reference models - initialized lazily
+        self.replica: Optional[LocalReplica] = None
+
+        # Field access profiler for automatic projection - initialized lazily
+        self.field_profiler: Optional[FieldProfiler] = None
+
         # AI features - initialized lazily
         self.ai: Optional["AIAssistant"] = None
 
@@ -263,9 +310,91 @@ class ZenooClient:
                 params["args"].append({"context": call_context})
 
         # Make the RPC call
-        result = await self._transport.json_rpc_call("object", "execute_kw", params)
+        rejected = False
+        try:
+            result = await self._transport.json_rpc_call("object", "execute_kw", params)
+        except ZenooError as e:
+            # The server rolled the call back unless the response was lost
+            rejected = not isinstance(e, (ConnectionError, RequestTimeoutError))
+            raise
+        finally:
+            # Drop local copies of records the call may have modified
+            if not rejected and method not in _READ_ONLY_METHODS:
+                self._invalidate_identity_map(model, method, args)
+                if self.replica is not None:
+                    self.replica.mark_stale(model)
+                if self.cache_manager is not None and EntityCache.is_used_by(
+                    self.cache_manager
+                ):
+                    await self._invalidate_cached_records(model, method, args)
+
         return result.get("result")
 
+    def _invalidate_identity_map(
+        self, model: str, method: str, args: List[Any]
+    ) -> None:
+        """Drop records a model method may have modified from the identity map.
+
+        Methods called on record ids (``write``, ``unlink``, actions) drop
+        those records; other modifying calls drop the whole model. Calls the
+        server rejected drop nothing, but calls whose response was lost
+        (timeouts, dropped connections) may have been committed, so they
+        are treated as successful.
+
+        Args:
+            model: Name of the Odoo model
+            method: Method name that was called
+            args: Positional arguments of the call
+        """
+        if method == "create":
+            return
+
+        ids = self._target_ids(args)
+        if ids is not None:
+            self.identity_map.invalidate(model, ids)
+        else:
+            self.identity_map.invalidate(model)
+
+    async def _invalidate_cached_records(
+        self, model: str, method: str, args: List[Any]
+    ) -> None:
+        """Drop records a model method may have modified from the entity cache.
+
+        Works like ``_invalidate_identity_map`` for the normalized records
+        cached by ``QuerySet.cache(normalized=True)``.
+
+        Args:
+            model: Name of the Odoo model
+            method: Method name that was called
+            args: Positional arguments of the call
+        """
+        if method == "create":
+            return
+
+        entities = EntityCache(self.cache_manager)
+        ids = self._target_ids(args)
+        if ids is not None:
+            await entities.invalidate_records(model, ids)
+        else:
+            await entities.invalidate_model(model)
+
+    @staticmethod
+    def _target_ids(args: List[Any]) -> Optional[List[int]]:
+        """Get the record ids a model method was called on.
+
+        Args:
+            args: Positional arguments of the call
+
+        Returns:
+            Record ids, or None if the call does not target ids
+        """
+        ids = args[0] if args else None
+        if isinstance(ids, int):
+            return [ids]
+        if isinstance(ids, list) and all(isinstance(i, int) for i in ids):
+            return ids
+        return None
+
     async def execute(
         self,
         model: str,
@@ -360,33 +489,83 @@ class ZenooClient:
         ids: List[int],
         fields: Optional[List[str]] = None,
         context: Optional[Dict[str, Any]] = None,
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+        use_identity_map: bool = False,
     ) -> List[Dict[str, Any]]:
         """Read records by IDs.
 
+        Duplicate ids are read once, in chunks of ``chunk_size`` with up to
+        ``concurrency`` calls in flight, so large id lists stay within
+        request size limits.
+
+        With ``use_identity_map``, records already known to the client's
+        identity map with all requested fields are not read again, and the
+        records read are added to it. The identity map only sees writes
+        made through this client, so only enable it for data that other
+        users do not modify concurrently. It is not used without specific
+        fields or with a context.
+
         Args:
             model: Name of the Odoo model
             ids: List of record IDs to read
             fields: List of field names to read (None for all fields)
             context: Optional context for the operation
+            chunk_size: Maximum number of ids per ``read`` call
+            concurrency: Maximum number of concurrent ``read`` calls
+            use_identity_map: Whether to reuse records known to the
+                identity map
 
         Returns:
-            List of record data dictionaries
+            List of record data dictionaries, in the order of ``ids``
 
         Raises:
             AuthenticationError: If not authenticated
             ZenooError: If the server returns an error
         """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        ids = list(dict.fromkeys(ids))
         kwargs = {}
         if fields:
             kwargs["fields"] = fields
 
-        return await self.execute_kw(
-            model,
-            "read",
-            [ids],
-            kwargs,
-            context=context,
-        )
+        # Without fields, cached records may lack some of the model fields
+        use_identity_map = use_identity_map and bool(fields) and not context
+        found: Dict[int, Dict[str, Any]] = {}
+        missing = ids
+        if use_identity_map:
+            found, missing = self.identity_map.get_many(model, ids, fields)
+            if not missing:
+                return [found[record_id] for record_id in ids]
+        generation = self.identity_map.generation(model)
+
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def read_chunk(chunk: List[int]) -> List[Dict[str, Any]]:
+            async with semaphore:
+                return await self.execute_kw(
+                    model,
+                    "read",
+                    [chunk],
+                    kwargs,
+                    context=context,
+                )
+
+        chunks = [
+            missing[i : i + chunk_size] for i in range(0, len(missing), chunk_size)
+        ]
+        results = await asyncio.gather(*(read_chunk(chunk) for chunk in chunks))
+        for records in results:
+            for record in records or []:
+                found[record["id"]] = record
+            if use_identity_map:
+                self.identity_map.put_many(model, records or [], generation)
+
+        return [found[record_id] for record_id in ids if record_id in found]
 
     async def get_model_fields(
         self,
@@ -594,6 +773,9 @@ class ZenooClient:
         if self.cache_manager is not None:
             await self.cache_manager.close()
 
+        if self.replica is not None:
+            await self.replica.close()
+
         # Close transport and clear session
         await self._transport.close()
         self._session.clear()
@@ -723,6 +905,72 @@ class ZenooClient:
 
         return self.cache_manager
 
+    async def setup_replica(
+        self,
+        path: str,
+        models: Optional[Dict[str, Optional[float]]] = None,
+        max_staleness: float = 300.0,
+        page_size: int = 1000,
+    ) -> "LocalReplica":
+        """Setup a local SQLite read replica of reference models.
+
+        Queries on replicated models are answered locally when their domain
+        can be translated to SQL. Models are synced incrementally once they
+        are older than their staleness bound, and marked stale when this
+        client modifies them.
+
+        Args:
+            path: Path of the SQLite database file
+            models: Mapping of model names to staleness bounds in seconds
+                (None uses ``max_staleness``)
+            max_staleness: Default staleness bound in seconds
+            page_size: Number of records fetched per sync RPC call
+
+        Returns:
+            LocalReplica instance
+        """
+        if self.replica is None:
+            from .sync.replica import LocalReplica
+
+            self.replica = LocalReplica(
+                self, path, max_staleness=max_staleness, page_size=page_size
+            )
+
+        for model, staleness in (models or {}).items():
+            self.replica.register(model, max_staleness=staleness)
+
+        return self.replica
+
+    async def setup_field_profiler(
+        self, auto_only: bool = False, warmup: int = 1
+    ) -> "FieldProfiler":
+        """Setup automatic field projection for queries of this client.
+
+        Queries record which fields are read on their results, per call
+        site, and later executions only request those fields (see
+        ``QuerySet.auto_only``). Reading a field a projected query did not
+        fetch raises ``FieldNotLoadedError``, so only enable ``auto_only``
+        for all queries when the code reading their results is covered by
+        the warmup executions.
+
+        Args:
+            auto_only: Whether all queries are profiled, rather than only
+                those calling ``auto_only()``
+            warmup: Number of executions of a call site that fetch all
+                fields before its queries are projected
+
+        Returns:
+            FieldProfiler instance
+        """
+        if self.field_profiler is None:
+            from .query.profiler import FieldProfiler
+
+            self.field_profiler = FieldProfiler(auto_only=auto_only, warmup=warmup)
+        else:
+            self.field_profiler.auto_only = auto_only
+
+        return self.field_profiler
+
     async def setup_batch_manager(
         self,
         max_chunk_size: int = 100,
@@ -14,6 +14,7 @@ from .base import (
     RequestTimeoutError,
     MethodNotFoundError,
     InternalError,
+    FieldNotLoadedError,
 )
 
 from .mapping import map_jsonrpc_error
@@ -30,5 +31,6 @@ __all__ = [
     "TimeoutError",
     "MethodNotFoundError",
     "InternalError",
+    "FieldNotLoadedError",
     "map_jsonrpc_error",
 ]
@@ -113,3 +113,22 @@ class InternalError(ZenooError):
     ):
         super().__init__(message, context)
         self.server_traceback = server_traceback
+
+
+class FieldNotLoadedError(ZenooError):
+    """Raised when reading a field that a query did not fetch.
+
+    Queries projected by the field profiler (see ``QuerySet.auto_only``)
+    only fetch the fields previously read at their call site. Attribute
+    access cannot await, so other fields must be loaded explicitly with
+    ``await record.fetch_missing(...)``.
+    """
+
+    def __init__(
+        self,
+        message: str,
+        field: Optional[str] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ):
+        super().__init__(message, context)
+        self.field = field
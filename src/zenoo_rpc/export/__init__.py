@@ -0,0 +1,43 @@
+"""
+Streaming export of Odoo records to files for Zenoo RPC.
+
+This module pages through query results with keyset pagination and appends
+every page to a Parquet, CSV or NDJSON file, so exports of millions of
+records run in bounded memory. Parquet output requires ``pyarrow``
+(``pip install zenoo-rpc[arrow]``).
+
+Example:
+    >>> from zenoo_rpc.export import export_queryset
+    >>> await export_queryset(
+    ...     client.model(ResPartner).filter(is_company=True),
+    ...     "companies.parquet",
+    ...     workers=4,
+    ... )
+
+    Or from the command line:
+
+    $ zenoo-export res.partner companies.parquet \\
+        --domain '[["is_company", "=", true]]' --workers 4
+"""
+
+from .pipeline import ExportResult, export_model, export_queryset
+from .writers import (
+    CsvExportWriter,
+    ExportWriter,
+    NdjsonExportWriter,
+    ParquetExportWriter,
+    create_writer,
+    infer_format,
+)
+
+__all__ = [
+    "ExportResult",
+    "export_model",
+    "export_queryset",
+    "ExportWriter",
+    "ParquetExportWriter",
+    "CsvExportWriter",
+    "NdjsonExportWriter",
+    "create_writer",
+    "infer_format",
+]
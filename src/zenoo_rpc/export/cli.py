@@ -0,0 +1,192 @@
+#!/usr/bin/env python3
+"""
+CLI tool for streaming Odoo records to Parquet, CSV or NDJSON files.
+
+Usage:
+    zenoo-export MODEL OUTPUT [options]
+    python -m zenoo_rpc.export.cli MODEL OUTPUT [options]
+
+    # Export all customers to Parquet with 4 concurrent readers
+    zenoo-export res.partner partners.parquet \\
+        --domain '[["customer_rank", ">", 0]]' \\
+        --fields name,email,country_id --workers 4
+
+    # Export to CSV using connection settings from the environment
+    export ODOO_URL=http://localhost:8069 ODOO_DATABASE=prod
+    export ODOO_USERNAME=admin ODOO_PASSWORD=admin
+    zenoo-export sale.order orders.csv --page-size 5000
+"""
+
+import argparse
+import asyncio
+import json
+import logging
+import os
+import sys
+from typing import List, Optional
+
+from ..client import ZenooClient
+from ..exceptions import ZenooError
+from .pipeline import ExportResult, export_model
+from .writers import WRITERS
+
+
+def parse_domain(value: str) -> list:
+    """Parse a JSON encoded Odoo domain."""
+    try:
+        domain = json.loads(value)
+    except json.JSONDecodeError as e:
+        raise argparse.ArgumentTypeError(f"Invalid JSON domain: {e}") from e
+
+    if not isinstance(domain, list):
+        raise argparse.ArgumentTypeError("The domain must be a JSON list")
+    return domain
+
+
+def build_parser() -> argparse.ArgumentParser:
+    """Create the argument parser of the export CLI."""
+    parser = argparse.ArgumentParser(
+        prog="zenoo-export",
+        description="Stream Odoo records to Parquet, CSV or NDJSON files",
+        formatter_class=argparse.RawDescriptionHelpFormatter,
+        epilog="""
+Environment Variables:
+  ODOO_URL             Odoo server URL
+  ODOO_DATABASE        Odoo database name
+  ODOO_USERNAME        Odoo username
+  ODOO_PASSWORD        Odoo password
+  ODOO_API_KEY         Odoo API key (used instead of the password)
+        """,
+    )
+
+    parser.add_argument("model", help="Odoo model name (e.g. res.partner)")
+    parser.add_argument("output", help="Output file path")
+
+    # Query
+    parser.add_argument(
+        "--domain",
+        "-d",
+        type=parse_domain,
+        default=[],
+        help="Odoo domain as a JSON list (default: all records)",
+    )
+    parser.add_argument(
+        "--fields",
+        "-f",
+        help="Comma-separated fields to export (default: all fields)",
+    )
+    parser.add_argument(
+        "--format",
+        choices=sorted(WRITERS),
+        help="Output format (default: inferred from the output file name)",
+    )
+
+    # Throughput
+    parser.add_argument(
+        "--page-size",
+        type=int,
+        default=1000,
+        help="Records fetched per RPC call (default: 1000)",
+    )
+    parser.add_argument(
+        "--workers",
+        "-w",
+        type=int,
+        default=1,
+        help="Concurrent id-range readers (default: 1)",
+    )
+    parser.add_argument(
+        "--queue-size",
+        type=int,
+        default=4,
+        help="Fetched pages buffered ahead of the writer (default: 4)",
+    )
+
+    # Odoo connection
+    parser.add_argument("--url", default=os.getenv("ODOO_URL"), help="Odoo URL")
+    parser.add_argument(
+        "--database", default=os.getenv("ODOO_DATABASE"), help="Odoo database"
+    )
+    parser.add_argument(
+        "--username", default=os.getenv("ODOO_USERNAME"), help="Odoo username"
+    )
+    parser.add_argument(
+        "--password", default=os.getenv("ODOO_PASSWORD"), help="Odoo password"
+    )
+    parser.add_argument(
+        "--api-key", default=os.getenv("ODOO_API_KEY"), help="Odoo API key"
+    )
+
+    parser.add_argument(
+        "--quiet", "-q", action="store_true", help="Do not report progress"
+    )
+
+    return parser
+
+
+async def run_export(args: argparse.Namespace) -> ExportResult:
+    """Connect to Odoo and run the export described by the arguments."""
+    fields = [name.strip() for name in args.fields.split(",")] if args.fields else None
+
+    def report(rows: int) -> None:
+        print(f"\r{rows} records exported", end="", file=sys.stderr, flush=True)
+
+    async with ZenooClient(args.url) as client:
+        if args.api_key:
+            await client.login_with_api_key(args.database, args.username, args.api_key)
+        else:
+            await client.login(args.database, args.username, args.password)
+
+        return await export_model(
+            client,
+            args.model,
+            args.output,
+            domain=args.domain,
+            fields=fields,
+            format=args.format,
+            page_size=args.page_size,
+            workers=args.workers,
+            queue_size=args.queue_size,
+            progress_callback=None if args.quiet else report,
+        )
+
+
+def main(argv: Optional[List[str]] = None) -> None:
+    """Main CLI entry point."""
+    parser = build_parser()
+    args = parser.parse_args(argv)
+
+    missing = [
+        option
+        for option in ("url", "database", "username")
+        if not getattr(args, option)
+    ]
+    if not args.password and not args.api_key:
+        missing.append("password")
+    if missing:
+        parser.error(
+            "missing connection settings: "
+            + ", ".join(f"--{option.replace('_', '-')}" for option in missing)
+        )
+
+    logging.basicConfig(level=logging.WARNING if args.quiet else logging.INFO)
+
+    try:
+        result = asyncio.run(run_export(args))
+    except (ZenooError, ValueError, OSError) as e:
+        print(f"\nExport failed: {e}", file=sys.stderr)
+        sys.exit(1)
+    except KeyboardInterrupt:
+        print("\nExport interrupted", file=sys.stderr)
+        sys.exit(130)
+
+    if not args.quiet:
+        print(
+            f"\nExported {result.rows} records in {result.pages} pages to "
+            f"{result.path} ({result.rows_per_second:.0f} records/s)",
+            file=sys.stderr,
+        )
+
+
+if __name__ == "__main__":
+    main()
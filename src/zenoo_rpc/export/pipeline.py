@@ -0,0 +1,211 @@
+"""
+Streaming export pipeline.
+
+Pages of records are fetched with keyset pagination (optionally by several
+concurrent id-range readers) and handed to a file writer through a bounded
+queue. Writing runs in a worker thread, so the next page is fetched while
+the previous one is written, and the queue bound stops fetching when the
+disk falls behind. Memory use is bounded by ``page_size * queue_size``
+records regardless of the size of the export.
+"""
+
+import asyncio
+import logging
+import os
+import time
+from dataclasses import dataclass
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .writers import create_writer, infer_format
+
+logger = logging.getLogger(__name__)
+
+
+@dataclass
+class ExportResult:
+    """Summary of a finished export."""
+
+    path: str
+    format: str
+    rows: int
+    pages: int
+    duration: float
+
+    @property
+    def rows_per_second(self) -> float:
+        """Export throughput in records per second."""
+        return self.rows / self.duration if self.duration else 0.0
+
+
+async def export_queryset(
+    queryset: Any,
+    path: str,
+    format: Optional[str] = None,
+    page_size: int = 1000,
+    workers: int = 1,
+    queue_size: int = 4,
+    progress_callback: Optional[Callable[[int], None]] = None,
+    **writer_options: Any,
+) -> ExportResult:
+    """Stream the records of a QuerySet into a file.
+
+    The file is written under a temporary ``.part`` name and moved into
+    place once the export completes, so readers never see partial files.
+
+    Args:
+        queryset: QuerySet selecting the records and fields to export
+        path: Path of the output file
+        format: ``parquet``, ``csv`` or ``ndjson`` (None infers it from path)
+        page_size: Number of records fetched per RPC call
+        workers: Number of concurrent id-range readers. With more than one
+            reader, pages are written in arrival order and limit, offset and
+            ordering of the QuerySet are ignored.
+        queue_size: Maximum number of fetched pages waiting to be written
+        progress_callback: Called with the total number of written records
+            after every page
+        **writer_options: Format specific writer options (e.g. Parquet
+            ``compression``)
+
+    Returns:
+        ExportResult with row and page counts
+
+    Example:
+        >>> result = await export_queryset(
+        ...     client.model(SaleOrder).filter(state="sale").only(
+        ...         "name", "partner_id", "amount_total", "date_order"
+        ...     ),
+        ...     "sale_orders.parquet",
+        ...     page_size=5000,
+        ...     workers=4,
+        ... )
+        >>> result.rows
+        1250000
+    """
+    if page_size < 1:
+        raise ValueError("page_size must be at least 1")
+    if queue_size < 1:
+        raise ValueError("queue_size must be at least 1")
+
+    format = format or infer_format(path)
+    temp_path = f"{path}.part"
+    loop = asyncio.get_running_loop()
+    start = time.perf_counter()
+
+    writer = create_writer(
+        format,
+        temp_path,
+        await queryset._get_field_types(),
+        queryset._fields,
+        **writer_options,
+    )
+
+    if workers > 1:
+        pages = queryset._parallel_pages(workers, page_size, ordered=False)
+    else:
+        pages = queryset._iter_result_pages(page_size)
+
+    queue: asyncio.Queue = asyncio.Queue(maxsize=queue_size)
+    done = object()
+
+    async def fetch() -> None:
+        try:
+            async for page in pages:
+                await queue.put(page)
+            await queue.put(done)
+        except Exception as e:
+            await queue.put(e)
+
+    fetcher = asyncio.create_task(fetch())
+    page_count = 0
+
+    try:
+        while True:
+            item = await queue.get()
+            if item is done:
+                break
+            if isinstance(item, Exception):
+                raise item
+
+            await loop.run_in_executor(None, writer.write_page, item)
+            page_count += 1
+            if progress_callback:
+                progress_callback(writer.rows_written)
+
+        await loop.run_in_executor(None, writer.close)
+        os.replace(temp_path, path)
+    except BaseException:
+        if not fetcher.done():
+            fetcher.cancel()
+        await asyncio.gather(fetcher, return_exceptions=True)
+        await loop.run_in_executor(None, _discard, writer, temp_path)
+        raise
+
+    result = ExportResult(
+        path=path,
+        format=format,
+        rows=writer.rows_written,
+        pages=page_count,
+        duration=time.perf_counter() - start,
+    )
+    logger.info(
+        f"Exported {result.rows} records to {path} in {result.duration:.1f}s "
+        f"({result.rows_per_second:.0f} records/s)"
+    )
+    return result
+
+
+async def export_model(
+    client: Any,
+    model_name: str,
+    path: str,
+    domain: Optional[List[Any]] = None,
+    fields: Optional[Sequence[str]] = None,
+    context: Optional[Dict[str, Any]] = None,
+    **options: Any,
+) -> ExportResult:
+    """Stream the records of an Odoo model into a file.
+
+    Args:
+        client: Authenticated ZenooClient
+        model_name: Name of the Odoo model (e.g. "res.partner")
+        path: Path of the output file
+        domain: Odoo domain selecting the records
+        fields: Fields to export (None exports all fields)
+        context: Context of the search_read calls
+        **options: Options of ``export_queryset``
+
+    Returns:
+        ExportResult with row and page counts
+
+    Example:
+        >>> await export_model(
+        ...     client,
+        ...     "res.partner",
+        ...     "partners.csv",
+        ...     domain=[("customer_rank", ">", 0)],
+        ...     fields=["name", "email", "country_id"],
+        ... )
+    """
+    from ..query.builder import QuerySet
+
+    model_class = await client.get_or_create_model(model_name)
+    queryset = QuerySet(
+        model_class,
+        client,
+        domain=list(domain or []),
+        fields=list(fields) if fields else None,
+        context=context,
+    )
+    return await export_queryset(queryset, path, **options)
+
+
+def _discard(writer: Any, temp_path: str) -> None:
+    """Close a failed export and remove its partial file."""
+    try:
+        writer.close()
+    except Exception:
+        pass
+    try:
+        os.remove(temp_path)
+    except OSError:
+        pass
@@ -0,0 +1,324 @@
+"""
+File writers for streaming exports.
+
+Each writer appends pages of ``search_read`` results to a file on disk as
+they arrive: Parquet row groups, CSV rows or NDJSON lines. All formats use
+the same column layout as ``QuerySet.to_arrow()``: many2one ``[id, name]``
+pairs are split into ``<field>`` and ``<field>_name`` columns, and Odoo
+``False`` values become nulls except in boolean columns.
+"""
+
+import csv
+import json
+from abc import ABC, abstractmethod
+from typing import IO, Any, Dict, List, Optional, Sequence, Tuple
+
+from ..query.columnar import (
+    MANY2ONE_NAME_SUFFIX,
+    _infer_odoo_type,
+    check_column_names,
+)
+
+
+class ExportWriter(ABC):
+    """Base class of export file writers.
+
+    Writers are synchronous; the export pipeline calls them from a worker
+    thread so that fetching the next page overlaps with writing.
+    """
+
+    #: Format name used by ``create_writer``
+    format: str = ""
+
+    def __init__(
+        self,
+        path: str,
+        field_types: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Initialize the writer.
+
+        Args:
+            path: Path of the output file
+            field_types: Mapping of field names to Odoo field types
+            fields: Fields to export (None uses the fields of the first page)
+        """
+        self.path = path
+        self.field_types = dict(field_types or {})
+        self.fields = list(fields) if fields else None
+        self.rows_written = 0
+
+    @abstractmethod
+    def write_page(self, page: List[Dict[str, Any]]) -> int:
+        """Append a page of records to the file.
+
+        Args:
+            page: Record dictionaries as returned by ``search_read``
+
+        Returns:
+            Number of records written
+        """
+
+    @abstractmethod
+    def close(self) -> None:
+        """Flush and close the file."""
+
+
+class _RowFlattener:
+    """Flatten records into rows with the columnar export layout."""
+
+    def __init__(
+        self, field_types: Dict[str, str], fields: Optional[Sequence[str]]
+    ) -> None:
+        self.field_types = field_types
+        self.fields = fields
+        self.columns: Optional[List[str]] = None
+        self.column_types: List[str] = []
+        self._kinds: List[Tuple[str, str]] = []
+
+    def resolve(self, page: List[Dict[str, Any]]) -> List[str]:
+        """Fix the output columns from the field types and a page."""
+        fields = self.fields
+        if fields is None:
+            fields = list(page[0].keys()) if page else []
+        fields = ["id"] + [name for name in fields if name != "id"]
+
+        columns = []
+        column_types = []
+        kinds = []
+        for name in fields:
+            odoo_type = self.field_types.get(name)
+            if odoo_type is None:
+                odoo_type = _infer_odoo_type([record.get(name) for record in page])
+
+            if odoo_type == "many2one":
+                kind = "many2one"
+                columns.extend([name, name + MANY2ONE_NAME_SUFFIX])
+                column_types.extend(["many2one", "char"])
+            else:
+                if odoo_type == "boolean":
+                    kind = "boolean"
+                elif odoo_type in ("one2many", "many2many"):
+                    kind = "x2many"
+                else:
+                    kind = "value"
+                columns.append(name)
+                column_types.append(odoo_type)
+            kinds.append((name, kind))
+
+        check_column_names(columns)
+        self.columns = columns
+        self.column_types = column_types
+        self._kinds = kinds
+        return columns
+
+    def rows(self, page: List[Dict[str, Any]]) -> List[List[Any]]:
+        """Flatten a page of records into rows of column values."""
+        if self.columns is None:
+            self.resolve(page)
+
+        rows = []
+        for record in page:
+            row: List[Any] = []
+            for name, kind in self._kinds:
+                value = record.get(name)
+                if kind == "many2one":
+                    if isinstance(value, (list, tuple)):
+                        row.append(value[0])
+                        row.append(value[1] if len(value) > 1 else None)
+                    else:
+                        row.append(None if value is False else value)
+                        row.append(None)
+                elif kind == "x2many":
+                    row.append(value or [])
+                elif kind == "boolean" or value is not False:
+                    row.append(value)
+                else:
+                    row.append(None)
+            rows.append(row)
+        return rows
+
+
+class ParquetExportWriter(ExportWriter):
+    """Write pages as Parquet row groups, one row group per page.
+
+    Requires ``pyarrow``.
+    """
+
+    format = "parquet"
+
+    def __init__(
+        self,
+        path: str,
+        field_types: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+        compression: str = "snappy",
+    ):
+        """Initialize the writer.
+
+        Args:
+            path: Path of the output file
+            field_types: Mapping of field names to Odoo field types
+            fields: Fields to export (None uses the fields of the first page)
+            compression: Parquet compression codec
+        """
+        from ..query.columnar import ArrowBatchBuilder
+
+        super().__init__(path, field_types, fields)
+        self.compression = compression
+        self._builder = ArrowBatchBuilder(self.field_types, self.fields)
+        self._writer = None
+
+    def write_page(self, page: List[Dict[str, Any]]) -> int:
+        batch = self._builder.build(page)
+        if self._writer is None:
+            self._writer = self._open(batch.schema)
+
+        self._writer.write_batch(batch)
+        self.rows_written += batch.num_rows
+        return batch.num_rows
+
+    def close(self) -> None:
+        if self._writer is None:
+            self._writer = self._open(self._builder.empty_table().schema)
+        self._writer.close()
+
+    def _open(self, schema: Any) -> Any:
+        import pyarrow.parquet as pq
+
+        return pq.ParquetWriter(self.path, schema, compression=self.compression)
+
+
+class CsvExportWriter(ExportWriter):
+    """Write pages as CSV rows with a header line.
+
+    Nulls are written as empty cells and x2many id lists as JSON arrays.
+    """
+
+    format = "csv"
+
+    def __init__(
+        self,
+        path: str,
+        field_types: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(path, field_types, fields)
+        self._flattener = _RowFlattener(self.field_types, self.fields)
+        self._file: IO[str] = open(path, "w", newline="", encoding="utf-8")
+        self._writer = csv.writer(self._file)
+
+    def write_page(self, page: List[Dict[str, Any]]) -> int:
+        if self._flattener.columns is None:
+            self._writer.writerow(self._flattener.resolve(page))
+
+        rows = self._flattener.rows(page)
+        for row in rows:
+            for index, value in enumerate(row):
+                if isinstance(value, list):
+                    row[index] = json.dumps(value)
+        self._writer.writerows(rows)
+        self.rows_written += len(rows)
+        return len(rows)
+
+    def close(self) -> None:
+        if self._flattener.columns is None:
+            self._writer.writerow(self._flattener.resolve([]))
+        self._file.close()
+
+
+class NdjsonExportWriter(ExportWriter):
+    """Write pages as newline-delimited JSON objects, one per record."""
+
+    format = "ndjson"
+
+    def __init__(
+        self,
+        path: str,
+        field_types: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        super().__init__(path, field_types, fields)
+        self._flattener = _RowFlattener(self.field_types, self.fields)
+        self._file: IO[str] = open(path, "w", encoding="utf-8")
+
+    def write_page(self, page: List[Dict[str, Any]]) -> int:
+        rows = self._flattener.rows(page)
+        columns = self._flattener.columns
+        self._file.write(
+            "".join(
+                json.dumps(dict(zip(columns, row)), ensure_ascii=False) + "\n"
+                for row in rows
+            )
+        )
+        self.rows_written += len(rows)
+        return len(rows)
+
+    def close(self) -> None:
+        self._file.close()
+
+
+WRITERS = {
+    writer.format: writer
+    for writer in (ParquetExportWriter, CsvExportWriter, NdjsonExportWriter)
+}
+
+_EXTENSIONS = {
+    ".parquet": "parquet",
+    ".pq": "parquet",
+    ".csv": "csv",
+    ".ndjson": "ndjson",
+    ".jsonl": "ndjson",
+}
+
+
+def infer_format(path: str) -> str:
+    """Infer the export format from a file name.
+
+    Args:
+        path: Path of the output file
+
+    Returns:
+        Format name
+
+    Raises:
+        ValueError: If the extension is not recognized
+    """
+    for extension, format in _EXTENSIONS.items():
+        if path.lower().endswith(extension):
+            return format
+    raise ValueError(
+        f"Cannot infer export format from '{path}', "
+        f"use one of: {', '.join(sorted(WRITERS))}"
+    )
+
+
+def create_writer(
+    format: str,
+    path: str,
+    field_types: Optional[Dict[str, str]] = None,
+    fields: Optional[Sequence[str]] = None,
+    **options: Any,
+) -> ExportWriter:
+    """Create a writer for an export format.
+
+    Args:
+        format: Format name (``parquet``, ``csv`` or ``ndjson``)
+        path: Path of the output file
+        field_types: Mapping of field names to Odoo field types
+        fields: Fields to export
+        **options: Format specific writer options
+
+    Returns:
+        ExportWriter instance
+
+    Raises:
+        ValueError: If the format is unknown
+    """
+    writer_class = WRITERS.get(format)
+    if writer_class is None:
+        raise ValueError(
+            f"Unknown export format '{format}', "
+            f"use one of: {', '.join(sorted(WRITERS))}"
+        )
+    return writer_class(path, field_types, fields, **options)
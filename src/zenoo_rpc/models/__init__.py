@@ -16,7 +16,8 @@ from .fields import (
     DateTimeField,
 )
 from .registry import ModelRegistry, register_model, get_model_class
-from .relationships import LazyRelationship, RelationshipManager
+from .relationships import LazyRelationship, RelationshipLoader, RelationshipManager
+from .identity_map import IdentityMap
 
 __all__ = [
     # Base classes
@@ -36,5 +37,7 @@ __all__ = [
     "get_model_class",
     # Relationships
     "LazyRelationship",
+    "RelationshipLoader",
     "RelationshipManager",
+    "IdentityMap",
 ]
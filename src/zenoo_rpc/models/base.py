@@ -5,8 +5,22 @@ This module provides the foundation for type-safe Odoo record handling
 using Pydantic models with ORM-like capabilities.
 """
 
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, ClassVar
+import copy
+from typing import (
+    Any,
+    Callable,
+    Dict,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+    ClassVar,
+    get_args,
+    get_origin,
+)
 from datetime import date, datetime
+from weakref import WeakKeyDictionary
 from pydantic import BaseModel, Field, ConfigDict, model_validator, field_validator
 from pydantic.fields import FieldInfo
 
@@ -81,6 +95,118 @@ class OdooModelMeta(type(BaseModel)):
                         setattr(model_class, field_name, descriptor)
 
 
+# OdooModel fields that are not Odoo fields
+_NON_ODOO_FIELDS = frozenset({"client", "loaded_fields", "relationship_manager"})
+
+# Per-class value converters and required fields, built on first use
+_VALUE_CONVERTERS: "WeakKeyDictionary[type, Dict[bool, Dict[str, Any]]]" = (
+    WeakKeyDictionary()
+)
+_REQUIRED_FIELDS: "WeakKeyDictionary[type, frozenset]" = WeakKeyDictionary()
+_FIELD_DEFAULTS: "WeakKeyDictionary[type, tuple]" = WeakKeyDictionary()
+
+# Default values that can be shared between instances
+_IMMUTABLE_DEFAULTS = (type(None), bool, int, float, str, bytes, tuple, frozenset)
+
+
+def _collect_field_defaults(model_class: type) -> tuple:
+    """Split the defaults of the optional fields of a model class.
+
+    Args:
+        model_class: Pydantic model class
+
+    Returns:
+        Tuple of shareable default values by field name and a list of
+        (field name, factory) pairs for defaults created per instance
+    """
+    static_defaults: Dict[str, Any] = {}
+    factories: List[tuple] = []
+
+    for name, field_info in model_class.model_fields.items():
+        if field_info.is_required():
+            continue
+        if field_info.default_factory is not None:
+            factories.append((name, field_info.default_factory))
+        elif isinstance(field_info.default, _IMMUTABLE_DEFAULTS):
+            static_defaults[name] = field_info.default
+        else:
+            factories.append(
+                (name, lambda default=field_info.default: copy.deepcopy(default))
+            )
+
+    return static_defaults, factories
+
+
+def _build_value_converter(
+    field_info: FieldInfo, parse: bool
+) -> Optional[Callable[[Any], Any]]:
+    """Build the function converting an Odoo value for one model field.
+
+    Args:
+        field_info: Pydantic field information
+        parse: Whether to also parse date and datetime strings
+
+    Returns:
+        Converter function, or None if values are used as is
+    """
+    extra = field_info.json_schema_extra
+    odoo_type = extra.get("odoo_type") if isinstance(extra, dict) else None
+
+    if odoo_type == "many2one":
+
+        def convert_many2one(value: Any) -> Any:
+            if value is False:
+                return None
+            if isinstance(value, (list, tuple)) and value:
+                return value[0]
+            return value
+
+        return convert_many2one
+
+    if odoo_type in ("one2many", "many2many"):
+        return lambda value: [] if value is False or value is None else value
+
+    annotation = field_info.annotation
+    optional = False
+    if get_origin(annotation) is Union:
+        args = [arg for arg in get_args(annotation) if arg is not type(None)]
+        optional = len(args) < len(get_args(annotation))
+        annotation = args[0] if len(args) == 1 else None
+
+    if annotation is bool:
+        return None
+
+    # Undeclared relational fields still arrive as [id, name] pairs
+    collapse_pairs = annotation is not None and get_origin(annotation) not in (
+        list,
+        List,
+        tuple,
+        set,
+    )
+    parser = None
+    if parse and annotation is datetime:
+        parser = datetime.fromisoformat
+    elif parse and annotation is date:
+        parser = date.fromisoformat
+
+    def convert(value: Any) -> Any:
+        if value is False:
+            return None if optional else value
+        if parser is not None and isinstance(value, str):
+            return parser(value)
+        if (
+            collapse_pairs
+            and isinstance(value, list)
+            and len(value) == 2
+            and isinstance(value[0], int)
+            and isinstance(value[1], str)
+        ):
+            return value[0]
+        return value
+
+    return convert
+
+
 class OdooModel(BaseModel, metaclass=OdooModelMeta):
     """Base class for all Odoo models with Pydantic validation.
 
@@ -134,41 +260,173 @@ class OdooModel(BaseModel, metaclass=OdooModelMeta):
     @model_validator(mode='before')
     @classmethod
     def convert_odoo_values(cls, data: Any) -> Any:
-        """Convert Odoo's False values to None for optional fields."""
+        """Convert Odoo wire values to the types of the model fields.
+
+        Odoo returns ``False`` for empty values and ``[id, name]`` pairs for
+        many2one fields. The conversion of each field is derived once per
+        class from the field metadata (see ``_get_value_converters``).
+        """
         if not isinstance(data, dict):
             return data
 
-        # Get field annotations to determine which fields are optional strings
-        annotations = getattr(cls, '__annotations__', {})
+        converters = cls._get_value_converters(parse=False)
 
         converted_data = {}
         for key, value in data.items():
             # Skip special keys
-            if key in ('client', 'self'):
-                if key == 'client':
-                    converted_data[key] = value
-                continue
-
-            # Convert Odoo's False to None for optional string fields
-            if value is False and key in annotations:
-                field_type = annotations[key]
-                # Check if it's Optional[str] or similar
-                if hasattr(field_type, '__origin__') and field_type.__origin__ is Union:
-                    args = field_type.__args__
-                    if len(args) == 2 and type(None) in args and str in args:
-                        converted_data[key] = None
-                        continue
-
-            # Handle Many2One fields that return [id, name] tuples
-            if isinstance(value, list) and len(value) == 2 and isinstance(value[0], int):
-                # This is likely a Many2One field, just take the ID
-                converted_data[key] = value[0]
+            if key == 'self':
                 continue
 
-            converted_data[key] = value
+            converter = converters.get(key)
+            converted_data[key] = value if converter is None else converter(value)
 
         return converted_data
 
+    @classmethod
+    def _get_value_converters(
+        cls, parse: bool
+    ) -> Dict[str, Optional[Callable[[Any], Any]]]:
+        """Get the value converters of the Odoo fields of this class.
+
+        Args:
+            parse: Whether converters also parse date and datetime strings
+
+        Returns:
+            Dictionary of field names to converters (None when values are
+            used as is)
+        """
+        by_mode = _VALUE_CONVERTERS.get(cls)
+        if by_mode is None:
+            by_mode = _VALUE_CONVERTERS[cls] = {}
+
+        converters = by_mode.get(parse)
+        if converters is None:
+            converters = by_mode[parse] = {
+                name: _build_value_converter(field_info, parse)
+                for name, field_info in cls.model_fields.items()
+                if name not in _NON_ODOO_FIELDS
+            }
+            _REQUIRED_FIELDS[cls] = frozenset(
+                name
+                for name, field_info in cls.model_fields.items()
+                if field_info.is_required()
+            )
+        return converters
+
+    @classmethod
+    def from_odoo(
+        cls: Type[T],
+        data: Dict[str, Any],
+        client: Optional[Any] = None,
+        validate: bool = False,
+    ) -> T:
+        """Create an instance from a record returned by Odoo.
+
+        By default the record is trusted: values are converted with the
+        precompiled converters of the class and the instance is built
+        without Pydantic validation, which is several times faster for
+        large result sets. Records missing a required field are always
+        validated. Use ``validate=True`` to run full validation, or
+        ``revalidate()`` to validate a fast-path instance later.
+
+        Args:
+            data: Record values as returned by Odoo
+            client: OdooFlow client for lazy loading
+            validate: Whether to run full Pydantic validation
+
+        Returns:
+            Model instance
+
+        Example:
+            >>> record = {"id": 1, "name": "Acme", "parent_id": [3, "Group"]}
+            >>> partner = ResPartner.from_odoo(record, client=client)
+            >>> partner.__dict__["parent_id"]
+            3
+        """
+        converters = cls._get_value_converters(parse=True)
+        if validate or not _REQUIRED_FIELDS[cls].issubset(data):
+            data = dict(data)
+            if client is not None:
+                data["client"] = client
+            return cls(**data)
+
+        values = {}
+        for key, value in data.items():
+            if key in converters:
+                converter = converters[key]
+                values[key] = value if converter is None else converter(value)
+
+        instance = cls._construct(values)
+
+        state = instance.__dict__
+        state["_loaded_relationships"] = {}
+        state["loaded_fields"] = {key for key in data if key not in ("client", "self")}
+        if client is not None:
+            state["client"] = client
+            state["relationship_manager"] = RelationshipManager(instance, client)
+
+        return instance
+
+    @classmethod
+    def _construct(cls: Type[T], values: Dict[str, Any]) -> T:
+        """Create an instance from converted values without validation.
+
+        Equivalent to ``model_construct`` with the field defaults resolved
+        once per class instead of once per record.
+
+        Args:
+            values: Converted field values
+
+        Returns:
+            Model instance
+        """
+        if cls.__pydantic_post_init__ is not None:
+            return cls.model_construct(**values)
+
+        defaults = _FIELD_DEFAULTS.get(cls)
+        if defaults is None:
+            defaults = _FIELD_DEFAULTS[cls] = _collect_field_defaults(cls)
+        static_defaults, factories = defaults
+
+        state = dict(static_defaults)
+        for name, factory in factories:
+            if name not in values:
+                state[name] = factory()
+        state.update(values)
+
+        instance = cls.__new__(cls)
+        object.__setattr__(instance, "__dict__", state)
+        object.__setattr__(instance, "__pydantic_fields_set__", set(values))
+        object.__setattr__(instance, "__pydantic_extra__", None)
+        object.__setattr__(instance, "__pydantic_private__", None)
+        return instance
+
+    def revalidate(self: T) -> T:
+        """Validate the loaded field values of this instance.
+
+        Instances created by ``from_odoo`` without validation hold the
+        server values as is. This runs full Pydantic validation on them
+        and stores the validated values.
+
+        Returns:
+            This instance
+
+        Raises:
+            pydantic.ValidationError: If a loaded value is invalid
+        """
+        model_fields = type(self).model_fields
+        data = {
+            name: self.__dict__[name]
+            for name in self.loaded_fields | {"id"}
+            if name in model_fields and name not in _NON_ODOO_FIELDS
+        }
+
+        validated = type(self).model_validate(data)
+        for name in data:
+            self.__dict__[name] = validated.__dict__[name]
+
+        return self
+
     def __init__(self, **data: Any):
         """Initialize the model with data from Odoo."""
         # Extract client if provided
@@ -215,6 +473,16 @@ class OdooModel(BaseModel, metaclass=OdooModelMeta):
         """
         return cls.model_fields.get(field_name)
 
+    @classmethod
+    def get_required_fields(cls) -> frozenset:
+        """Get the fields that records must include to skip validation.
+
+        Returns:
+            Names of the required fields, including ``id``
+        """
+        cls._get_value_converters(parse=True)
+        return _REQUIRED_FIELDS[cls]
+
     @classmethod
     def get_relationship_fields(cls) -> Dict[str, FieldInfo]:
         """Get all relationship fields (Many2one, One2many, Many2many).
@@ -275,6 +543,32 @@ class OdooModel(BaseModel, metaclass=OdooModelMeta):
         """
         return self.loaded_fields.copy()
 
+    async def fetch_missing(self, *fields: str) -> None:
+        """Load fields that were not fetched with the record.
+
+        Records returned by a profiled query (see ``QuerySet.auto_only``)
+        load the fields for their whole result set in one read and add
+        them to the profile of the query.
+
+        Args:
+            *fields: Field names to load
+
+        Example:
+            >>> partner = await client.model(ResPartner).only("name").first()
+            >>> await partner.fetch_missing("email", "phone")
+        """
+        from ..query.profiler import load_fields
+
+        state = self.__dict__
+        tracker = state.get("_field_tracker")
+        if tracker is not None:
+            await tracker.load_missing(self, fields)
+        elif state.get("client") is not None:
+            odoo_fields = type(self)._get_value_converters(parse=True)
+            names = [name for name in fields if name in odoo_fields]
+            if names:
+                await load_fields(state["client"], type(self), [self], names)
+
     def to_odoo_dict(self, exclude_unset: bool = True) -> Dict[str, Any]:
         """Convert the model to a dictionary suitable for Odoo operations.
 
@@ -0,0 +1,306 @@
+"""
+Bounded identity map for Odoo records.
+
+This module provides a per-client identity map of (model, id) to record
+state. It lets relationship loading reuse records already fetched by the
+same client while keeping memory bounded and reads correct after writes.
+"""
+
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Dict, Iterable, List, Optional, Tuple
+
+RecordKey = Tuple[str, int]
+
+
+class _Entry:
+    """State of one record in the identity map."""
+
+    __slots__ = ("values", "instance_ref", "instance_fields", "stored_at")
+
+    def __init__(self, values: Dict[str, Any], stored_at: float):
+        self.values = values
+        self.instance_ref: Optional[weakref.ReferenceType] = None
+        self.instance_fields: frozenset = frozenset()
+        self.stored_at = stored_at
+
+
+class IdentityMap:
+    """Bounded map of (model, id) to record values and live instances.
+
+    Record values are kept in LRU order and the least recently used records
+    are evicted once ``max_size`` is exceeded. Model instances are only
+    referenced weakly, so they are reused while the application holds them
+    and garbage collected otherwise. Entries are invalidated by the client
+    on ``write``/``unlink`` and on transaction commit or rollback.
+
+    Example:
+        >>> identity_map = IdentityMap(max_size=5000, ttl=300)
+        >>> identity_map.put("res.partner", {"id": 1, "name": "Acme"})
+        >>> identity_map.get("res.partner", 1, ["name"])
+        {'id': 1, 'name': 'Acme'}
+        >>> identity_map.invalidate("res.partner", [1])
+    """
+
+    def __init__(self, max_size: int = 10000, ttl: Optional[float] = None):
+        """Initialize the identity map.
+
+        Args:
+            max_size: Maximum number of records kept
+            ttl: Optional lifetime of entries in seconds
+        """
+        if max_size < 1:
+            raise ValueError("max_size must be at least 1")
+
+        self.max_size = max_size
+        self.ttl = ttl
+        self._entries: OrderedDict[RecordKey, _Entry] = OrderedDict()
+        self._generations: Dict[str, int] = {}
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    @classmethod
+    def for_client(cls, client: Any) -> "IdentityMap":
+        """Get the identity map of a client, creating it if needed.
+
+        Args:
+            client: OdooFlow client
+
+        Returns:
+            IdentityMap instance
+        """
+        client_state = getattr(client, "__dict__", None)
+        if client_state is None:
+            return cls()
+
+        identity_map = client_state.get("identity_map")
+        if not isinstance(identity_map, IdentityMap):
+            identity_map = client_state["identity_map"] = cls()
+        return identity_map
+
+    def __len__(self) -> int:
+        return len(self._entries)
+
+    def __contains__(self, key: RecordKey) -> bool:
+        return self._get_entry(key) is not None
+
+    def get(
+        self, model: str, record_id: int, fields: Optional[Iterable[str]] = None
+    ) -> Optional[Dict[str, Any]]:
+        """Get the values of a record.
+
+        Args:
+            model: Name of the Odoo model
+            record_id: Record id
+            fields: Fields that must be present (None accepts any)
+
+        Returns:
+            Copy of the requested values, or None if not available
+        """
+        entry = self._get_entry((model, record_id))
+        if entry is None or not self._has_fields(entry.values, fields):
+            self.misses += 1
+            return None
+
+        self.hits += 1
+        if fields is None:
+            return dict(entry.values)
+        return {
+            name: entry.values[name] for name in ("id", *fields) if name in entry.values
+        }
+
+    def get_many(
+        self, model: str, ids: Iterable[int], fields: Optional[Iterable[str]] = None
+    ) -> Tuple[Dict[int, Dict[str, Any]], List[int]]:
+        """Get the values of several records.
+
+        Args:
+            model: Name of the Odoo model
+            ids: Record ids
+            fields: Fields that must be present (None accepts any)
+
+        Returns:
+            Tuple of found values by id and the list of missing ids
+        """
+        fields = tuple(fields) if fields is not None else None
+        found: Dict[int, Dict[str, Any]] = {}
+        missing: List[int] = []
+
+        for record_id in ids:
+            values = self.get(model, record_id, fields)
+            if values is None:
+                missing.append(record_id)
+            else:
+                found[record_id] = values
+
+        return found, missing
+
+    def generation(self, model: str) -> int:
+        """Get the invalidation generation of a model.
+
+        Readers take the generation before an RPC call and pass it to
+        ``put``, so results of reads racing with a write are not stored.
+
+        Args:
+            model: Name of the Odoo model
+
+        Returns:
+            Number of invalidations of the model so far
+        """
+        return self._generations.get(model, 0)
+
+    def put(
+        self, model: str, values: Dict[str, Any], generation: Optional[int] = None
+    ) -> None:
+        """Store record values, merging them with values already known.
+
+        Args:
+            model: Name of the Odoo model
+            values: Record values including ``id``
+            generation: Model generation taken before reading the values
+        """
+        record_id = values.get("id")
+        if not isinstance(record_id, int):
+            return
+        if generation is not None and generation != self.generation(model):
+            return
+
+        key = (model, record_id)
+        entry = self._get_entry(key)
+        if entry is None:
+            self._entries[key] = _Entry(dict(values), time.monotonic())
+            self._evict()
+        else:
+            # Instances built from older values are no longer reused
+            entry.values.update(values)
+            entry.instance_ref = None
+            entry.instance_fields = frozenset()
+
+    def put_many(
+        self,
+        model: str,
+        records: Iterable[Dict[str, Any]],
+        generation: Optional[int] = None,
+    ) -> None:
+        """Store values of several records.
+
+        Args:
+            model: Name of the Odoo model
+            records: Record values including ``id``
+            generation: Model generation taken before reading the values
+        """
+        for values in records:
+            self.put(model, values, generation)
+
+    def get_instance(
+        self, model: str, record_id: int, fields: Optional[Iterable[str]] = None
+    ) -> Optional[Any]:
+        """Get a live model instance of a record.
+
+        Args:
+            model: Name of the Odoo model
+            record_id: Record id
+            fields: Fields the instance must have been built with
+
+        Returns:
+            Model instance, or None if no live instance is known
+        """
+        entry = self._get_entry((model, record_id))
+        if entry is None or entry.instance_ref is None:
+            return None
+
+        if fields is not None and not entry.instance_fields.issuperset(fields):
+            return None
+
+        return entry.instance_ref()
+
+    def put_instance(self, model: str, instance: Any, fields: Iterable[str]) -> None:
+        """Register a live model instance of a stored record.
+
+        Args:
+            model: Name of the Odoo model
+            instance: Model instance
+            fields: Fields the instance was built with
+        """
+        entry = self._get_entry((model, getattr(instance, "id", None)))
+        if entry is None:
+            return
+
+        try:
+            entry.instance_ref = weakref.ref(instance)
+        except TypeError:
+            return
+        entry.instance_fields = frozenset(fields)
+
+    def invalidate(self, model: str, ids: Optional[Iterable[int]] = None) -> int:
+        """Drop records of a model.
+
+        Args:
+            model: Name of the Odoo model
+            ids: Record ids to drop (None drops the whole model)
+
+        Returns:
+            Number of records dropped
+        """
+        self._generations[model] = self.generation(model) + 1
+
+        if ids is None:
+            keys = [key for key in self._entries if key[0] == model]
+        else:
+            keys = [(model, record_id) for record_id in ids]
+
+        count = 0
+        for key in keys:
+            if self._entries.pop(key, None) is not None:
+                count += 1
+        return count
+
+    def clear(self) -> None:
+        """Drop all records."""
+        for model in {key[0] for key in self._entries}:
+            self._generations[model] = self.generation(model) + 1
+        self._entries.clear()
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get identity map statistics.
+
+        Returns:
+            Dictionary with size and hit statistics
+        """
+        total = self.hits + self.misses
+        return {
+            "size": len(self._entries),
+            "max_size": self.max_size,
+            "hits": self.hits,
+            "misses": self.misses,
+            "evictions": self.evictions,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    def _get_entry(self, key: RecordKey) -> Optional[_Entry]:
+        """Get a live entry and mark it as recently used."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+
+        if self.ttl is not None and time.monotonic() - entry.stored_at > self.ttl:
+            del self._entries[key]
+            return None
+
+        self._entries.move_to_end(key)
+        return entry
+
+    def _evict(self) -> None:
+        """Evict least recently used records beyond the size limit."""
+        while len(self._entries) > self.max_size:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    @staticmethod
+    def _has_fields(values: Dict[str, Any], fields: Optional[Iterable[str]]) -> bool:
+        """Check whether all requested fields are known."""
+        return fields is None or all(name in values for name in fields)
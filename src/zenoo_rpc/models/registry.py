@@ -224,6 +224,9 @@ class ModelRegistry:
                 model_name, "fields_get", [], {}
             )
 
+            if not isinstance(field_definitions, dict):
+                return {}
+
             # Cache the definitions
             self._field_cache[model_name] = field_definitions
 
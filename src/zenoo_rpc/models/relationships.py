@@ -6,12 +6,235 @@ Odoo models, including lazy loading and efficient data fetching.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, Callable, Awaitable
+import json
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import (
+    Any,
+    Awaitable,
+    Dict,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    TypeVar,
+    Union,
+)
 from weakref import WeakKeyDictionary
 
+from .identity_map import IdentityMap
+
 T = TypeVar("T")
 
 
+# Fields loaded for related records when the caller does not declare any
+DEFAULT_RELATION_FIELDS = ("id", "name", "display_name")
+
+_active_loader: ContextVar[Optional["RelationshipLoader"]] = ContextVar(
+    "zenoo_relationship_loader", default=None
+)
+
+
+class RelationshipLoader:
+    """DataLoader that coalesces relationship loads into batched reads.
+
+    Loads requested during the same event loop iteration are grouped by
+    (comodel, fields, context) and flushed on the next loop tick as one
+    ``search_read`` per group, split into chunks of ``max_batch_size`` ids.
+    Duplicate ids within a batch are fetched once.
+
+    Loaders are scoped per client and per event loop (see ``for_client``),
+    and a request can use its own isolated loader with ``scope()``. Records
+    already in the client's identity map are served from memory, and loaded
+    records are added to it. Loads with a context bypass the identity map,
+    since the context may change the values read (e.g. translations).
+
+    Example:
+        >>> loader = RelationshipLoader.for_client(client)
+        >>> records = await loader.load_many("res.partner", [1, 2], ["name"])
+        >>>
+        >>> # Isolate loads of a single request
+        >>> with RelationshipLoader(client).scope():
+        ...     company = await partner.parent_id
+    """
+
+    def __init__(self, client: Any, max_batch_size: int = 1000):
+        """Initialize the loader.
+
+        Args:
+            client: OdooFlow client for data fetching
+            max_batch_size: Maximum number of ids per read call
+        """
+        self.client = client
+        self.max_batch_size = max_batch_size
+        self._queue: Dict[
+            Tuple[str, Tuple[str, ...], str], Dict[int, asyncio.Future]
+        ] = {}
+        self._dispatch_scheduled = False
+
+    @classmethod
+    def for_client(cls, client: Any) -> "RelationshipLoader":
+        """Get the loader for a client in the running event loop.
+
+        A loader activated with ``scope()`` for the same client takes
+        precedence over the client's default loader.
+
+        Args:
+            client: OdooFlow client
+
+        Returns:
+            RelationshipLoader instance
+        """
+        active = _active_loader.get()
+        if active is not None and active.client is client:
+            return active
+
+        loop = asyncio.get_running_loop()
+        client_state = getattr(client, "__dict__", None)
+        if client_state is None:
+            return cls(client)
+
+        loaders = client_state.get("_relationship_loaders")
+        if not isinstance(loaders, WeakKeyDictionary):
+            loaders = WeakKeyDictionary()
+            client_state["_relationship_loaders"] = loaders
+
+        loader = loaders.get(loop)
+        if loader is None:
+            loader = loaders[loop] = cls(client)
+        return loader
+
+    @contextmanager
+    def scope(self) -> Iterator["RelationshipLoader"]:
+        """Use this loader for relationship loads in the current context.
+
+        Yields:
+            This loader
+        """
+        token = _active_loader.set(self)
+        try:
+            yield self
+        finally:
+            _active_loader.reset(token)
+
+    def load_many(
+        self,
+        model: str,
+        ids: List[int],
+        fields: Optional[List[str]] = None,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Awaitable[Dict[int, Dict[str, Any]]]:
+        """Queue ids for loading in the next batch.
+
+        The ids are queued immediately, so several calls made before
+        awaiting end up in the same batch.
+
+        Args:
+            model: Name of the Odoo model
+            ids: Record ids to load
+            fields: Fields to read (defaults to id, name and display_name)
+            context: Optional context for the read
+
+        Returns:
+            Awaitable resolving to a dictionary of found records by id
+        """
+        fields = tuple(fields or DEFAULT_RELATION_FIELDS)
+        if "id" not in fields:
+            fields = ("id",) + fields
+
+        loop = asyncio.get_running_loop()
+        found: Dict[int, Dict[str, Any]] = {}
+        if not context:
+            found, ids = IdentityMap.for_client(self.client).get_many(
+                model, ids, fields
+            )
+
+        futures = []
+        for record_id, record in found.items():
+            future = loop.create_future()
+            future.set_result(record)
+            futures.append((record_id, future))
+
+        if not ids:
+            return self._collect(futures)
+
+        key = (model, fields, self._freeze_context(context))
+        pending = self._queue.setdefault(key, {})
+
+        for record_id in ids:
+            future = pending.get(record_id)
+            if future is None:
+                future = pending[record_id] = loop.create_future()
+            futures.append((record_id, future))
+
+        if not self._dispatch_scheduled:
+            self._dispatch_scheduled = True
+            loop.call_soon(self._dispatch)
+
+        return self._collect(futures)
+
+    async def _collect(
+        self, futures: List[Tuple[int, asyncio.Future]]
+    ) -> Dict[int, Dict[str, Any]]:
+        """Wait for queued ids and collect the found records."""
+        records = {}
+        for record_id, future in futures:
+            record = await future
+            if record is not None:
+                records[record_id] = record
+        return records
+
+    def _dispatch(self) -> None:
+        """Start one batched read per queued group."""
+        self._dispatch_scheduled = False
+        queue, self._queue = self._queue, {}
+
+        for (model, fields, context_key), pending in queue.items():
+            ids = list(pending)
+            for i in range(0, len(ids), self.max_batch_size):
+                chunk = {rid: pending[rid] for rid in ids[i : i + self.max_batch_size]}
+                asyncio.ensure_future(
+                    self._load_batch(model, list(fields), context_key, chunk)
+                )
+
+    async def _load_batch(
+        self,
+        model: str,
+        fields: List[str],
+        context_key: str,
+        futures: Dict[int, asyncio.Future],
+    ) -> None:
+        """Read one batch and resolve its futures."""
+        identity_map = IdentityMap.for_client(self.client)
+        generation = identity_map.generation(model)
+
+        try:
+            records = await self.client.search_read(
+                model,
+                domain=[("id", "in", list(futures))],
+                fields=fields,
+                context=json.loads(context_key) or None,
+            )
+        except Exception as e:
+            for future in futures.values():
+                if not future.done():
+                    future.set_exception(e)
+            return
+
+        records_by_id = {record["id"]: record for record in records or []}
+        if context_key == "{}":
+            identity_map.put_many(model, records_by_id.values(), generation)
+
+        for record_id, future in futures.items():
+            if not future.done():
+                future.set_result(records_by_id.get(record_id))
+
+    @staticmethod
+    def _freeze_context(context: Optional[Dict[str, Any]]) -> str:
+        """Create a hashable batch key part from a context."""
+        return json.dumps(context or {}, sort_keys=True, default=str)
+
+
 class LazyRelationship:
     """Represents a lazy-loaded relationship field.
 
@@ -24,6 +247,8 @@ class LazyRelationship:
     - Caching of loaded data
     - Support for both single records and collections
     - Async loading with proper error handling
+    - Batched loading through the client's RelationshipLoader, including
+      the same field of sibling records from the same query result
 
     Example:
         >>> # This creates a lazy relationship
@@ -31,6 +256,9 @@ class LazyRelationship:
         >>>
         >>> # This triggers loading and returns the actual data
         >>> company = await partner.company_id  # Returns ResPartner instance
+        >>>
+        >>> # Declare which fields to load
+        >>> company = await partner.company_id.load(fields=["name", "vat"])
     """
 
     def __init__(
@@ -41,6 +269,8 @@ class LazyRelationship:
         relation_ids: Union[int, List[int], None],
         client: Any,
         is_collection: bool = False,
+        fields: Optional[List[str]] = None,
+        context: Optional[Dict[str, Any]] = None,
     ):
         """Initialize a lazy relationship.
 
@@ -51,6 +281,8 @@ class LazyRelationship:
             relation_ids: ID(s) of related records
             client: OdooFlow client for data fetching
             is_collection: Whether this is a collection (One2many/Many2many)
+            fields: Fields to load for related records
+            context: Optional context for loading related records
         """
         self.parent_record = parent_record
         self.field_name = field_name
@@ -58,153 +290,177 @@ class LazyRelationship:
         self.relation_ids = relation_ids
         self.client = client
         self.is_collection = is_collection
+        self.fields = fields
+        self.context = context
 
         # Cache for loaded data
         self._loaded_data: Optional[Any] = None
+        self._loaded_fields: Tuple[str, ...] = ()
         self._is_loaded = False
-        self._loading_task: Optional[asyncio.Task] = None
+        self._loading_task: Optional[asyncio.Future] = None
 
-        # N+1 prevention cache (class-level shared cache)
-        if not hasattr(LazyRelationship, "_prefetch_cache"):
-            LazyRelationship._prefetch_cache = {}
+    async def load(self, fields: Optional[List[str]] = None) -> Any:
+        """Load the relationship data from the server.
 
-        # Batch loading queue for N+1 prevention
-        if not hasattr(LazyRelationship, "_batch_queue"):
-            LazyRelationship._batch_queue = {}
-            LazyRelationship._batch_tasks = {}
+        If the relationship is already loaded without some of the requested
+        fields, it is read again with the loaded and the missing fields.
 
-    async def load(self) -> Any:
-        """Load the relationship data from the server.
+        Args:
+            fields: Fields to load for related records (defaults to the
+                fields given at creation, or id, name and display_name)
 
         Returns:
             The loaded record(s) or None if no data
         """
-        # Return cached data if already loaded
+        # Return cached data if already loaded with the requested fields
         if self._is_loaded:
-            return self._loaded_data
-
-        # Check prefetch cache first
-        cache_key = f"{self.relation_model}:{self.relation_ids}"
-        if cache_key in LazyRelationship._prefetch_cache:
-            self._loaded_data = LazyRelationship._prefetch_cache[cache_key]
-            self._is_loaded = True
-            return self._loaded_data
-
-        # If already loading, wait for the existing task
-        if self._loading_task and not self._loading_task.done():
-            return await self._loading_task
-
-        # Use batch loading for N+1 prevention
-        return await self._load_with_batching()
+            missing = self._missing_fields(fields)
+            if not missing:
+                return self._loaded_data
+            fields = list(self._loaded_fields) + missing
+            self._is_loaded = False
 
-    async def _load_with_batching(self) -> Any:
-        """Load data using batch loading to prevent N+1 queries."""
-        batch_key = f"{self.relation_model}:{self.field_name}"
+        # Use batch loading for N+1 prevention, served from the identity
+        # map when the records are already known
+        return await self._load_with_batching(fields)
 
-        # Add this relationship to the batch queue
-        if batch_key not in LazyRelationship._batch_queue:
-            LazyRelationship._batch_queue[batch_key] = []
+    async def _load_with_batching(self, fields: Optional[List[str]] = None) -> Any:
+        """Load data using the client's loader to prevent N+1 queries.
 
-        LazyRelationship._batch_queue[batch_key].append(self)
+        Unloaded relationships of the same field on sibling records (records
+        returned by the same query) are queued in the same batch, so
+        accessing the relationship record by record costs one read.
+        """
+        if not self.relation_ids:
+            self._set_loaded(None)
+            return self._loaded_data
 
-        # If batch task is already running, wait for it
-        if batch_key in LazyRelationship._batch_tasks:
-            task = LazyRelationship._batch_tasks[batch_key]
-            if not task.done():
-                await task
-                return self._loaded_data
+        loader = RelationshipLoader.for_client(self.client)
+        fields = fields or self.fields
 
-        # Start batch loading task
-        LazyRelationship._batch_tasks[batch_key] = asyncio.create_task(
-            self._execute_batch_load(batch_key)
-        )
+        # Queue this relationship first, then its siblings, in the same tick
+        task = self._start_loading(loader, fields)
+        for sibling in self._get_sibling_relationships(loader.max_batch_size):
+            sibling._start_loading(loader, fields)
 
-        await LazyRelationship._batch_tasks[batch_key]
+        await asyncio.shield(task)
         return self._loaded_data
 
-    async def _execute_batch_load(self, batch_key: str) -> None:
-        """Execute batch loading for all relationships in the queue."""
-        # Small delay to collect more relationships
-        await asyncio.sleep(0.001)
-
-        relationships = LazyRelationship._batch_queue.pop(batch_key, [])
-        if not relationships:
-            return
-
-        # Collect all IDs to load
-        all_ids = set()
-        for rel in relationships:
-            if rel.relation_ids:
-                if isinstance(rel.relation_ids, list):
-                    all_ids.update(rel.relation_ids)
-                else:
-                    all_ids.add(rel.relation_ids)
-
-        if not all_ids:
-            # Mark all as loaded with empty data
-            for rel in relationships:
-                rel._loaded_data = [] if rel.is_collection else None
-                rel._is_loaded = True
-            return
+    def _start_loading(
+        self, loader: RelationshipLoader, fields: Optional[List[str]]
+    ) -> asyncio.Future:
+        """Queue this relationship in the loader unless already loading."""
+        if self._loading_task is None or (
+            self._loading_task.done() and not self._is_loaded
+        ):
+            pending = loader.load_many(
+                self.relation_model, self._get_ids(), fields, self.context
+            )
+            self._loading_task = asyncio.ensure_future(self._resolve(pending, fields))
+        return self._loading_task
 
+    async def _resolve(
+        self,
+        pending: Awaitable[Dict[int, Dict[str, Any]]],
+        fields: Optional[List[str]] = None,
+    ) -> Any:
+        """Convert loaded records and mark the relationship as loaded."""
         try:
-            # Fetch all records in one query
-            records_data = await self.client.search_read(
-                model=self.relation_model,
-                domain=[("id", "in", list(all_ids))],
-                fields=["id", "name", "display_name"],
-            )
+            records_by_id = await pending
+        except Exception:
+            self._loading_task = None
+            raise
+
+        identity_map = IdentityMap.for_client(self.client)
+        instances = []
+        for record_id in self._get_ids():
+            record = records_by_id.get(record_id)
+            if record is None:
+                continue
+
+            # Reuse a live instance of the record when one is known
+            instance = None
+            if not self.context:
+                instance = identity_map.get_instance(
+                    self.relation_model, record_id, record
+                )
+            if instance is None:
+                instance = self._convert_to_model_instances([dict(record)])[0]
+                if not self.context:
+                    identity_map.put_instance(self.relation_model, instance, record)
+            instances.append(instance)
+
+        self._set_loaded(instances)
+        self._loaded_fields = tuple(fields or DEFAULT_RELATION_FIELDS)
+        return self._loaded_data
 
-            # Create lookup dictionary
-            records_by_id = {record["id"]: record for record in records_data}
+    def _missing_fields(self, fields: Optional[List[str]]) -> List[str]:
+        """Get requested fields that the loaded records were not read with."""
+        if not fields or not self._loaded_data:
+            return []
 
-            # Populate cache and set loaded data for each relationship
-            for rel in relationships:
-                if rel.relation_ids:
-                    if rel.is_collection:
-                        # Handle collections
-                        if isinstance(rel.relation_ids, list):
-                            raw_data = [
-                                records_by_id.get(rid)
-                                for rid in rel.relation_ids
-                                if rid in records_by_id
-                            ]
-                            # Convert to model instances
-                            rel._loaded_data = rel._convert_to_model_instances(raw_data)
-                        else:
-                            rel._loaded_data = []
-                    else:
-                        # Handle single records
-                        if isinstance(rel.relation_ids, list) and rel.relation_ids:
-                            raw_record = records_by_id.get(rel.relation_ids[0])
-                        else:
-                            raw_record = records_by_id.get(rel.relation_ids)
+        records = self._loaded_data if self.is_collection else [self._loaded_data]
+        missing = []
+        for field in fields:
+            for record in records:
+                loaded = getattr(record, "loaded_fields", None)
+                if loaded is None and isinstance(record, dict):
+                    loaded = record.keys()
+                if loaded is not None and field not in loaded:
+                    missing.append(field)
+                    break
+        return missing
+
+    def _set_loaded(self, instances: Optional[List[Any]]) -> None:
+        """Store loaded instances according to the relationship type."""
+        if self.is_collection:
+            self._loaded_data = instances or []
+        else:
+            self._loaded_data = instances[0] if instances else None
+        self._is_loaded = True
 
-                        # Convert to model instance
-                        if raw_record:
-                            instances = rel._convert_to_model_instances([raw_record])
-                            rel._loaded_data = instances[0] if instances else None
-                        else:
-                            rel._loaded_data = None
-                else:
-                    rel._loaded_data = [] if rel.is_collection else None
+    def _get_ids(self) -> List[int]:
+        """Get the related ids as a list."""
+        if not self.relation_ids:
+            return []
+        if isinstance(self.relation_ids, list):
+            if not self.is_collection:
+                return self.relation_ids[:1]
+            return self.relation_ids
+        return [self.relation_ids]
 
-                rel._is_loaded = True
+    def _get_sibling_relationships(self, limit: int) -> List["LazyRelationship"]:
+        """Get unloaded relationships of the same field on sibling records.
 
-                # Cache the result
-                cache_key = f"{rel.relation_model}:{rel.relation_ids}"
-                LazyRelationship._prefetch_cache[cache_key] = rel._loaded_data
+        Args:
+            limit: Maximum number of siblings to return
 
-        except Exception as e:
-            # Mark all as failed
-            for rel in relationships:
-                rel._loaded_data = [] if rel.is_collection else None
-                rel._is_loaded = True
-            raise e
+        Returns:
+            List of LazyRelationship instances
+        """
+        parent_state = getattr(self.parent_record, "__dict__", None) or {}
+        group = parent_state.get("_prefetch_group")
+        if not isinstance(group, list):
+            return []
 
-        finally:
-            # Clean up batch task
-            LazyRelationship._batch_tasks.pop(batch_key, None)
+        siblings = []
+        for ref in group:
+            sibling = ref()
+            if sibling is None or sibling is self.parent_record:
+                continue
+
+            relationship = getattr(sibling, self.field_name, None)
+            if (
+                isinstance(relationship, LazyRelationship)
+                and relationship.client is self.client
+                and not relationship._is_loaded
+                and relationship._loading_task is None
+            ):
+                siblings.append(relationship)
+                if len(siblings) >= limit:
+                    break
+
+        return siblings
 
     async def _fetch_data(self) -> Any:
         """Fetch the actual data from the server."""
@@ -282,7 +538,9 @@ class LazyRelationship:
             self._loading_task.cancel()
         self._loading_task = None
 
-    def _convert_to_model_instances(self, records_data: List[Dict[str, Any]]) -> List[Any]:
+    def _convert_to_model_instances(
+        self, records_data: List[Dict[str, Any]]
+    ) -> List[Any]:
         """Convert raw record data to model instances.
 
         Args:
@@ -297,6 +555,7 @@ class LazyRelationship:
         try:
             # Try to get the model class from registry
             from .registry import get_registry
+
             registry = get_registry()
 
             # Try to get registered model class
@@ -305,15 +564,8 @@ class LazyRelationship:
                 # Convert each record to model instance
                 instances = []
                 for record_data in records_data:
-                    # Add client reference for lazy loading
-                    record_data["client"] = self.client
-
-                    # Remove problematic 'self' key if present
-                    if "self" in record_data:
-                        record_data.pop("self", None)
-
-                    # Create model instance
-                    instance = model_class(**record_data)
+                    # Create model instance with client for lazy loading
+                    instance = model_class.from_odoo(record_data, client=self.client)
                     instances.append(instance)
 
                 return instances
@@ -321,7 +573,7 @@ class LazyRelationship:
                 # Fallback: return raw data if no model class found
                 return records_data
 
-        except Exception as e:
+        except Exception:
             # Fallback: return raw data on any error
             # This ensures lazy loading still works even if model conversion fails
             return records_data
@@ -6,8 +6,12 @@ and executing Odoo queries with type safety and performance optimization.
 """
 
 from .builder import QueryBuilder, QuerySet
+from .domain import DomainCompiler, compile_domain, is_empty_domain, normalize_domain
+from .evaluator import filtered_domain, matching_indices
 from .filters import FilterExpression, Q
 from .lazy import LazyLoader, LazyCollection
+from .profiler import FieldProfiler
+from .recordset import RecordSet, Row
 from .expressions import (
     Field,
     Equal,
@@ -32,9 +36,22 @@ __all__ = [
     # Filtering
     "FilterExpression",
     "Q",
+    # Domain compilation
+    "DomainCompiler",
+    "compile_domain",
+    "is_empty_domain",
+    "normalize_domain",
+    # Local domain evaluation
+    "filtered_domain",
+    "matching_indices",
+    # Automatic field projection
+    "FieldProfiler",
     # Lazy loading
     "LazyLoader",
     "LazyCollection",
+    # Columnar results
+    "RecordSet",
+    "Row",
     # Field expressions
     "Field",
     "Equal",
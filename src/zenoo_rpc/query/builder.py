@@ -8,13 +8,30 @@ and executing Odoo queries with performance optimization and lazy loading.
 import asyncio
 import hashlib
 import json
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, AsyncIterator
+import time
+import weakref
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    Iterable,
+    List,
+    Optional,
+    Type,
+    TypeVar,
+    Union,
+)
 from collections.abc import AsyncIterable
 
 from ..models.base import OdooModel
 from ..models.registry import get_model_class, get_registry
+from .domain import compile_domain, is_empty_domain
+from .evaluator import filtered_domain
 from .filters import FilterExpression, Q
 from .expressions import Expression
+from .profiler import FieldProfiler, FieldTracker, find_call_site
+from .recordset import RecordSet
+from ..cache.entities import EntityCache
 from ..cache.manager import CacheManager
 
 T = TypeVar("T", bound=OdooModel)
@@ -89,10 +106,33 @@ class QuerySet(AsyncIterable[T]):
         self._cache_ttl = 300  # 5 minutes default TTL
         self._cache_enabled = True
 
-        # Caching
+        # Cached results older than this are revalidated with write_date
+        self._cache_revalidate_after: Optional[int] = None
+        self._cache_checked_at: Optional[float] = None
+
+        # Cache records once and queries as id lists
+        self._cache_normalized = False
+
+        # Records are hydrated without Pydantic validation unless requested
+        self._validate = False
+
+        # Queries on replicated models are answered by the local replica
+        self._use_replica = True
+
+        # Fields are projected from observed access when enabled (None
+        # follows the client's field profiler)
+        self._auto_only: Optional[bool] = None
+        self._projected_fields: Optional[List[str]] = None
+
+        # Caching (raw records are only kept for refinable queries)
         self._result_cache: Optional[List[T]] = None
+        self._records_data: Optional[List[Dict[str, Any]]] = None
+        self._refinable = False
         self._count_cache: Optional[int] = None
 
+        # Records of an evaluated parent query and the domain refining them
+        self._superset: Optional[tuple] = None
+
         # Execution state
         self._executed = False
 
@@ -136,6 +176,64 @@ class QuerySet(AsyncIterable[T]):
 
         return self._clone(domain=new_domain)
 
+    def refine(self, *args: Union[Q, Expression], **kwargs: Any) -> "QuerySet[T]":
+        """Filter the records of an evaluated query locally.
+
+        Takes the same conditions as ``filter()``, but evaluates them
+        client-side over the records this QuerySet already fetched, without
+        querying the server. Local evaluation compares the fetched values
+        only: it does not re-apply ``active_test`` or record rules, and
+        matches many2one fields on their display name instead of a name
+        search. The records are only kept for queries made ``refinable()``
+        before they are evaluated. Conditions that cannot be evaluated
+        locally, and other queries or queries evaluated with limit or
+        offset, are sent to the server like ``filter()``.
+
+        Args:
+            *args: Q objects or Expression objects
+            **kwargs: Field-based filters
+
+        Returns:
+            New QuerySet with additional filters
+
+        Example:
+            >>> partners = ResPartner.objects.filter(is_company=True).refinable()
+            >>> await partners.all()
+            >>> french = partners.refine(country_id=75)  # no RPC
+        """
+        new_qs = self.filter(*args, **kwargs)
+
+        if self._limit is None and not self._offset and not self._select_related:
+            added_domain = new_qs._domain[len(self._domain) :]
+            if self._records_data is not None:
+                new_qs._superset = (self._records_data, added_domain)
+            elif self._superset is not None:
+                records, domain = self._superset
+                new_qs._superset = (records, domain + added_domain)
+
+        return new_qs
+
+    def refinable(self, enabled: bool = True) -> "QuerySet[T]":
+        """Keep the fetched records so that ``refine()`` can filter them.
+
+        Evaluated queries only keep their model instances by default.
+        Refinable queries also keep the records returned by the server,
+        which ``refine()`` evaluates locally.
+
+        Args:
+            enabled: Whether to keep the fetched records
+
+        Returns:
+            New QuerySet with the setting changed
+
+        Example:
+            >>> partners = client.model(ResPartner).refinable()
+            >>> companies = partners.refine(is_company=True)
+        """
+        new_qs = self._clone()
+        new_qs._refinable = enabled
+        return new_qs
+
     def exclude(self, *args: Union[Q, Expression], **kwargs: Any) -> "QuerySet[T]":
         """Exclude records matching the given conditions.
 
@@ -262,8 +360,14 @@ class QuerySet(AsyncIterable[T]):
         relationships and fetches related data in the same query to avoid
         additional database hits.
 
+        On Odoo 17+ the related records are expanded server-side through
+        ``web_search_read`` with a nested field ``specification``, so the
+        whole result comes back in a single round-trip. Older servers fall
+        back to one batched ``read`` per related model after the main query.
+
         Args:
-            *field_names: Names of related fields to fetch
+            *field_names: Names of related fields to fetch. Dotted paths
+                expand the first level server-side and prefetch the rest.
 
         Returns:
             New QuerySet with related fields selected
@@ -289,7 +393,8 @@ class QuerySet(AsyncIterable[T]):
         data in separate queries but caches the results to avoid N+1 queries.
 
         Args:
-            *field_names: Names of related fields to prefetch
+            *field_names: Names of related fields to prefetch. Dotted paths
+                such as ``order_line.product_id`` prefetch nested relations.
 
         Returns:
             New QuerySet with related fields marked for prefetching
@@ -298,6 +403,11 @@ class QuerySet(AsyncIterable[T]):
             >>> # Fetch partners and prefetch their children
             >>> partners = client.model(ResPartner).prefetch_related('child_ids').all()
             >>> # No additional queries when accessing partner.child_ids
+            >>>
+            >>> # Nested prefetch: one read for lines, one for products
+            >>> orders = await client.model(SaleOrder).prefetch_related(
+            ...     'order_line.product_id'
+            ... ).all()
         """
         new_qs = self._clone()
         if not hasattr(new_qs, "_prefetch_related"):
@@ -308,6 +418,74 @@ class QuerySet(AsyncIterable[T]):
         new_qs._prefetch_related.update(field_names)
         return new_qs
 
+    def validated(self, enabled: bool = True) -> "QuerySet[T]":
+        """Validate fetched records with Pydantic.
+
+        Records returned by the server are trusted by default and hydrated
+        through the fast path of ``OdooModel.from_odoo``. Enable validation
+        for queries whose data should be checked against the model types.
+
+        Args:
+            enabled: Whether to validate records
+
+        Returns:
+            New QuerySet with validation enabled or disabled
+
+        Example:
+            >>> partners = await client.model(ResPartner).validated().all()
+        """
+        new_qs = self._clone()
+        new_qs._validate = enabled
+        return new_qs
+
+    def using_replica(self, enabled: bool = True) -> "QuerySet[T]":
+        """Allow or prevent answering the query from the local replica.
+
+        Queries on models replicated with ``client.setup_replica()`` are
+        answered locally by default. Disable it for queries that must see
+        the current server state.
+
+        Args:
+            enabled: Whether the local replica may be used
+
+        Returns:
+            New QuerySet with the replica setting changed
+
+        Example:
+            >>> rate = await client.model(ResCurrency).using_replica(
+            ...     False
+            ... ).get(name="EUR")
+        """
+        new_qs = self._clone()
+        new_qs._use_replica = enabled
+        return new_qs
+
+    def auto_only(self, enabled: bool = True) -> "QuerySet[T]":
+        """Only fetch the fields the calling code actually reads.
+
+        The fields read on the returned records are profiled per call site
+        (source location and model). Once profiled, executions from the
+        same call site only request those fields. Reading a field that was
+        not fetched raises ``FieldNotLoadedError`` and adds it to the
+        profile; ``await record.fetch_missing(*fields)`` loads such fields
+        for the whole result set in one read. Queries restricted with
+        ``only()`` are not profiled.
+
+        Args:
+            enabled: Whether to project fields automatically
+
+        Returns:
+            New QuerySet with automatic projection enabled or disabled
+
+        Example:
+            >>> partners = await client.model(ResPartner).auto_only().all()
+            >>> names = [p.name for p in partners]
+            >>> await partners[0].fetch_missing("phone")
+        """
+        new_qs = self._clone()
+        new_qs._auto_only = enabled
+        return new_qs
+
     async def all(self) -> List[T]:
         """Execute the query and return all results.
 
@@ -317,8 +495,17 @@ class QuerySet(AsyncIterable[T]):
         if self._result_cache is not None:
             return self._result_cache
 
+        tracker = self._start_profiling()
+
         # Execute the query
         records_data = await self._execute_query()
+        if self._refinable:
+            self._records_data = records_data
+
+        # Separate records expanded server-side by select_related
+        related_data: Dict[str, Dict[int, Any]] = {}
+        if self._select_related:
+            records_data, related_data = self._split_related_records(records_data)
 
         # Convert to model instances
         results = []
@@ -326,6 +513,16 @@ class QuerySet(AsyncIterable[T]):
             instance = self._create_model_instance(record_data)
             results.append(instance)
 
+        # Let lazy relationships batch loads across the result set
+        self._set_prefetch_group(results)
+
+        if tracker is not None:
+            tracker.attach(results)
+
+        # Handle select_related
+        if self._select_related and results:
+            await self._handle_select_related(results, related_data)
+
         # Handle prefetch_related
         if self._prefetch_related and results:
             await self._handle_prefetch_related(results)
@@ -336,14 +533,77 @@ class QuerySet(AsyncIterable[T]):
 
         return results
 
-    async def first(self) -> Optional[T]:
+    def _set_prefetch_group(self, results: List[T]) -> None:
+        """Link records of one result set for batched relationship loading.
+
+        Each record gets a shared list of weak references to its siblings,
+        so loading a relationship on one record also queues the same field
+        of the others in a single read.
+
+        Args:
+            results: Model instances returned by the query
+        """
+        group = []
+        for instance in results:
+            try:
+                group.append(weakref.ref(instance))
+            except TypeError:
+                return
+
+        for instance in results:
+            instance._prefetch_group = group
+
+    def _start_profiling(self) -> Optional[FieldTracker]:
+        """Start profiling field access for an execution of the query.
+
+        Sets the fields projected from the profile of the call site.
+
+        Returns:
+            Tracker to attach to the returned records, or None if the
+            query is not profiled
+        """
+        enabled = self._auto_only
+        if enabled is None:
+            enabled = FieldProfiler.is_enabled_for(self.client)
+        if not enabled or self._fields:
+            return None
+
+        profiler = FieldProfiler.for_client(self.client)
+        self._projected_fields, tracker = profiler.start(
+            self.model_class,
+            self.client,
+            find_call_site(),
+            context=self._context or None,
+        )
+        return tracker
+
+    async def first(self, *fields: str) -> Optional[T]:
         """Get the first result or None.
 
+        Args:
+            *fields: Fields to fetch, in addition to the required fields of
+                the model (all fields, or those of ``only()``, if omitted)
+
         Returns:
             First model instance or None if no results
+
+        Example:
+            >>> partner = await client.model(ResPartner).filter(
+            ...     email="info@acme.test"
+            ... ).first("email")
         """
+        if self._result_cache is not None:
+            return self._result_cache[0] if self._result_cache else None
+
         # Create a limited query
-        limited_qs = self.limit(1)
+        if fields:
+            required = self.model_class.get_required_fields()
+            limited_qs = self._clone(
+                limit=1,
+                fields=[*fields, *sorted(required.difference(fields))],
+            )
+        else:
+            limited_qs = self.limit(1)
         results = await limited_qs.all()
         return results[0] if results else None
 
@@ -390,34 +650,357 @@ class QuerySet(AsyncIterable[T]):
 
         return results[0]
 
-    async def count(self) -> int:
+    async def in_bulk(
+        self, ids: Iterable[int], chunk_size: int = 1000, concurrency: int = 4
+    ) -> Dict[int, T]:
+        """Get matching records by id.
+
+        Duplicate ids are fetched once and ids are split into chunks of
+        ``chunk_size`` read concurrently, instead of a single ``id in`` domain
+        that can exceed request size limits. Without filters, records are
+        read through ``ZenooClient.read``, which reuses the identity map, and
+        with ``cache(normalized=True)`` they are first looked up in the
+        entity cache in one bulk read. Limit, offset and ordering of the
+        QuerySet are not applied.
+
+        Args:
+            ids: Record ids to fetch
+            chunk_size: Maximum number of ids per RPC call
+            concurrency: Maximum number of concurrent RPC calls
+
+        Returns:
+            Dictionary of ids to model instances, in the order of ``ids``.
+            Ids that do not exist or do not match the filters are omitted.
+
+        Example:
+            >>> partners = await client.model(ResPartner).in_bulk(partner_ids)
+            >>> partners[42].name
+            'Acme'
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        ids = list(dict.fromkeys(ids))
+        domain = self._compiled_domain()
+        if not ids or is_empty_domain(domain):
+            return {}
+
+        model_name = self.model_class.get_odoo_name()
+        if not domain:
+
+            async def read(missing: List[int]) -> List[Dict[str, Any]]:
+                return await self.client.read(
+                    model_name,
+                    missing,
+                    fields=self._fields,
+                    context=self._context or None,
+                    chunk_size=chunk_size,
+                    concurrency=concurrency,
+                )
+
+            if self._cache_enabled and self._cache_manager and self._normalizes_cache():
+                entities = EntityCache(self._cache_manager, ttl=self._cache_ttl)
+                cached = await entities.get_records(
+                    model_name, ids, list(self._fields or ()) or None, read
+                )
+                records = list(cached.values())
+            else:
+                records = await read(ids)
+        else:
+            kwargs: Dict[str, Any] = {"context": self._context.copy()}
+            if self._fields:
+                kwargs["fields"] = list(self._fields)
+
+            semaphore = asyncio.Semaphore(concurrency)
+
+            async def read_chunk(chunk: List[int]) -> List[Dict[str, Any]]:
+                async with semaphore:
+                    return await self.client.search_read(
+                        model_name, domain=[("id", "in", chunk), *domain], **kwargs
+                    )
+
+            pages = await asyncio.gather(
+                *(
+                    read_chunk(ids[i : i + chunk_size])
+                    for i in range(0, len(ids), chunk_size)
+                )
+            )
+            records = [record for page in pages for record in page or []]
+
+        records_by_id = {record["id"]: record for record in records or []}
+        results = {
+            record_id: self._create_model_instance(records_by_id[record_id])
+            for record_id in ids
+            if record_id in records_by_id
+        }
+        self._set_prefetch_group(list(results.values()))
+        return results
+
+    async def count(self, limit: Optional[int] = None) -> int:
         """Get the count of records matching the query.
 
+        Args:
+            limit: Stop counting at this number of records. Capped counts
+                only search up to ``limit`` ids, which is much cheaper on
+                large tables, e.g. to show "1000+" in pagination.
+
         Returns:
-            Number of matching records
+            Number of matching records, at most ``limit``
+
+        Example:
+            >>> total = await partners.count(limit=1000)
+            >>> label = f"{total}+" if total == 1000 else str(total)
         """
+        if limit is not None and limit < 1:
+            raise ValueError("limit must be at least 1")
+
         if self._count_cache is not None:
-            return self._count_cache
+            return self._count_cache if limit is None else min(self._count_cache, limit)
+
+        domain = self._compiled_domain()
+        if is_empty_domain(domain):
+            self._count_cache = 0
+            return 0
+
+        count = None
+        local_result = self._evaluate_superset()
+        if local_result is not None:
+            count = len(self._page(local_result))
+
+        replica = self._get_replica() if count is None else None
+        if replica is not None:
+            count = await replica.search_count(
+                self.model_class.get_odoo_name(), domain, self._context
+            )
+
+        if count is None and limit is not None:
+            ids = await self.client.execute_kw(
+                self.model_class.get_odoo_name(),
+                "search",
+                [domain],
+                {"limit": limit, "order": "id"},
+                context=self._context,
+            )
+            count = len(ids or [])
+            if count < limit:
+                # Fewer records than the cap is an exact count
+                self._count_cache = count
+            return count
 
         # Execute count query
-        count = await self.client.execute_kw(
-            self.model_class.get_odoo_name(),
-            "search_count",
-            [self._domain],
-            self._context,
-        )
+        if count is None:
+            count = await self.client.execute_kw(
+                self.model_class.get_odoo_name(),
+                "search_count",
+                [domain],
+                self._context,
+            )
 
         self._count_cache = count
-        return count
+        return count if limit is None else min(count, limit)
 
     async def exists(self) -> bool:
         """Check if any records match the query.
 
+        Only searches for one matching id instead of counting all records.
+
         Returns:
             True if at least one record exists, False otherwise
         """
-        count = await self.count()
-        return count > 0
+        if self._result_cache is not None:
+            return bool(self._result_cache)
+        if self._count_cache is not None:
+            return self._count_cache > 0
+
+        domain = self._compiled_domain()
+        if is_empty_domain(domain):
+            return False
+
+        local_result = self._evaluate_superset()
+        if local_result is not None:
+            return bool(self._page(local_result))
+
+        model_name = self.model_class.get_odoo_name()
+        kwargs: Dict[str, Any] = {"limit": 1}
+        if self._offset:
+            kwargs["offset"] = self._offset
+
+        replica = self._get_replica()
+        if replica is not None:
+            result = await replica.search_read(
+                model_name,
+                domain,
+                fields=["id"],
+                limit=1,
+                offset=self._offset,
+                context=self._context,
+            )
+            if result is not None:
+                return bool(result)
+
+        ids = await self.client.execute_kw(
+            model_name, "search", [domain], kwargs, context=self._context
+        )
+        return bool(ids)
+
+    async def update(
+        self,
+        values: Dict[str, Any],
+        *,
+        chunk_size: int = 1000,
+        concurrency: int = 4,
+    ) -> int:
+        """Update all matching records without fetching them.
+
+        Matching ids are searched page by page with keyset pagination on
+        ``id`` and written in chunks of ``chunk_size`` ids, with up to
+        ``concurrency`` ``write`` calls in flight. No model instances are
+        created and no access preflight reads are made. Cached queries of
+        the model are invalidated once, after the last chunk.
+
+        Args:
+            values: Field values to write
+            chunk_size: Number of records per ``search`` and ``write`` call
+            concurrency: Maximum number of concurrent ``write`` calls
+
+        Returns:
+            Number of matching records
+
+        Raises:
+            ValueError: If no values are given
+
+        Example:
+            >>> updated = await client.model(SaleOrder).filter(
+            ...     state="draft", date_order__lt="2024-01-01"
+            ... ).update({"state": "cancel"})
+        """
+        if not values:
+            raise ValueError("No values to update")
+        return await self._execute_in_chunks(
+            "write", [dict(values)], chunk_size, concurrency
+        )
+
+    async def delete(self, *, chunk_size: int = 1000, concurrency: int = 4) -> int:
+        """Delete all matching records without fetching them.
+
+        Works like ``update()``, with chunked concurrent ``unlink`` calls.
+
+        Args:
+            chunk_size: Number of records per ``search`` and ``unlink`` call
+            concurrency: Maximum number of concurrent ``unlink`` calls
+
+        Returns:
+            Number of matching records
+
+        Example:
+            >>> deleted = await client.model(MailMessage).filter(
+            ...     model="res.partner", res_id=42
+            ... ).delete()
+        """
+        return await self._execute_in_chunks("unlink", [], chunk_size, concurrency)
+
+    async def _execute_in_chunks(
+        self, method: str, args: List[Any], chunk_size: int, concurrency: int
+    ) -> int:
+        """Call a model method on the matching ids, chunk by chunk.
+
+        Each page of ids is dispatched as soon as it is found; the search
+        waits while ``concurrency`` calls are in flight.
+
+        Args:
+            method: Model method taking ids as first argument
+            args: Other positional arguments of the method
+            chunk_size: Number of ids per call
+            concurrency: Maximum number of concurrent calls
+
+        Returns:
+            Number of matching records
+        """
+        if chunk_size < 1:
+            raise ValueError("chunk_size must be at least 1")
+        if concurrency < 1:
+            raise ValueError("concurrency must be at least 1")
+
+        domain = self._compiled_domain()
+        if is_empty_domain(domain):
+            return 0
+
+        model_name = self.model_class.get_odoo_name()
+        semaphore = asyncio.Semaphore(concurrency)
+
+        async def call(chunk: List[int]) -> None:
+            try:
+                await self.client.execute_kw(
+                    model_name, method, [chunk, *args], context=self._context
+                )
+            finally:
+                semaphore.release()
+
+        count = 0
+        tasks: List[asyncio.Future] = []
+        try:
+            async for chunk in self._iter_id_pages(domain, chunk_size):
+                await semaphore.acquire()
+                if any(task.done() and task.exception() for task in tasks):
+                    semaphore.release()
+                    break
+                count += len(chunk)
+                tasks.append(asyncio.ensure_future(call(chunk)))
+            await asyncio.gather(*tasks)
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+            # Records may have changed even if a chunk failed
+            if tasks:
+                self._result_cache = None
+                self._records_data = None
+                self._count_cache = None
+                await self._invalidate_cache()
+
+        return count
+
+    async def _iter_id_pages(
+        self, domain: List[Any], page_size: int
+    ) -> AsyncIterator[List[int]]:
+        """Yield the ids of the matching records page by page.
+
+        Pages are searched with keyset pagination on ``id``, like the sync
+        engine, so every ``search`` stays cheap on large tables. Queries
+        with a limit or offset are searched at once.
+
+        Args:
+            domain: Compiled domain of the query
+            page_size: Number of ids per page
+
+        Yields:
+            Lists of record ids
+        """
+        if self._limit is not None or self._offset:
+            ids = await self._search_ids(domain)
+            for i in range(0, len(ids), page_size):
+                yield ids[i : i + page_size]
+            return
+
+        last_id = 0
+        while True:
+            page = await self.client.execute_kw(
+                self.model_class.get_odoo_name(),
+                "search",
+                [domain + [("id", ">", last_id)]],
+                {"limit": page_size, "order": "id asc"},
+                context=self._context,
+            )
+            if not page:
+                return
+            yield list(page)
+            if len(page) < page_size:
+                return
+            last_id = page[-1]
 
     async def values(self, *fields: str) -> List[Dict[str, Any]]:
         """Return dictionaries instead of model instances.
@@ -456,6 +1039,379 @@ class QuerySet(AsyncIterable[T]):
         else:
             return [tuple(record.get(field) for field in fields) for record in records]
 
+    async def as_recordset(self, page_size: int = 1000) -> RecordSet:
+        """Fetch matching records into a compact columnar RecordSet.
+
+        Records are stored column by column in arrays instead of one model
+        instance per record, which keeps large results small in memory.
+        Without limit, offset or ordering the records are fetched page by
+        page with keyset pagination; otherwise in a single query.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+
+        Returns:
+            RecordSet with the matching records
+
+        Example:
+            >>> products = await client.model(ProductProduct).only(
+            ...     "name", "list_price", "categ_id"
+            ... ).as_recordset()
+            >>> expensive = products.filter(list_price__gt=1000)
+        """
+        recordset = RecordSet(
+            self.model_class.get_odoo_name(), await self._get_field_types()
+        )
+
+        async for page in self._iter_result_pages(page_size):
+            recordset.extend(page)
+
+        return recordset
+
+    async def iter_arrow_batches(self, page_size: int = 1000) -> AsyncIterator[Any]:
+        """Stream matching records as Apache Arrow record batches.
+
+        Every ``search_read`` page is converted column by column into one
+        record batch, so only a single page of raw records is held in
+        memory at a time. Many2one fields are split into an id column and a
+        ``<field>_name`` column, and Odoo ``False`` values become nulls
+        (except in boolean columns). Requires ``pyarrow``.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+
+        Yields:
+            ``pyarrow.RecordBatch`` objects sharing one schema
+
+        Example:
+            >>> async for batch in client.model(SaleOrder).only(
+            ...     "name", "partner_id", "amount_total"
+            ... ).iter_arrow_batches(page_size=5000):
+            ...     writer.write_batch(batch)
+        """
+        from .columnar import ArrowBatchBuilder
+
+        builder = ArrowBatchBuilder(await self._get_field_types(), self._fields)
+        async for page in self._iter_result_pages(page_size):
+            yield builder.build(page)
+
+    async def to_arrow(self, page_size: int = 1000) -> Any:
+        """Fetch matching records into an Apache Arrow table.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+
+        Returns:
+            ``pyarrow.Table`` with one record batch per fetched page
+
+        Example:
+            >>> table = await client.model(ResPartner).only(
+            ...     "name", "country_id"
+            ... ).to_arrow()
+            >>> table.column_names
+            ['id', 'name', 'country_id', 'country_id_name']
+        """
+        from .columnar import ArrowBatchBuilder, pa
+
+        builder = ArrowBatchBuilder(await self._get_field_types(), self._fields)
+        batches = [
+            builder.build(page) async for page in self._iter_result_pages(page_size)
+        ]
+
+        if not batches:
+            return builder.empty_table()
+        return pa.Table.from_batches(batches)
+
+    async def to_pandas(self, page_size: int = 1000, **kwargs: Any) -> Any:
+        """Fetch matching records into a pandas DataFrame.
+
+        Records are converted through Arrow (see ``to_arrow``). Requires
+        ``pandas`` and ``pyarrow``.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+            **kwargs: Options passed to ``pyarrow.Table.to_pandas``
+
+        Returns:
+            ``pandas.DataFrame`` with the matching records
+
+        Example:
+            >>> df = await client.model(ProductProduct).only(
+            ...     "name", "list_price", "categ_id"
+            ... ).to_pandas()
+            >>> df.groupby("categ_id_name")["list_price"].mean()
+        """
+        from .columnar import require_pandas
+
+        require_pandas()
+        table = await self.to_arrow(page_size)
+        return table.to_pandas(**kwargs)
+
+    async def to_numpy(self, page_size: int = 1000) -> Dict[str, Any]:
+        """Fetch matching records into numpy arrays, one per column.
+
+        Records are converted through Arrow (see ``to_arrow``). Integer
+        columns containing nulls become float arrays with NaN. Requires
+        ``numpy`` and ``pyarrow``.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+
+        Returns:
+            Dictionary of column names to numpy arrays
+
+        Example:
+            >>> arrays = await client.model(ProductProduct).only(
+            ...     "list_price"
+            ... ).to_numpy()
+            >>> arrays["list_price"].sum()
+        """
+        from .columnar import require_numpy, table_to_numpy
+
+        require_numpy()
+        return table_to_numpy(await self.to_arrow(page_size))
+
+    async def _iter_result_pages(
+        self, page_size: int
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield pages of raw records for bulk export.
+
+        Without limit, offset or ordering the records are paged with keyset
+        pagination; otherwise they are fetched in a single query.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+
+        Yields:
+            Lists of record dictionaries
+        """
+        if self._limit is not None or self._offset or self._order:
+            page = await self._execute_query()
+            if page:
+                yield page
+        else:
+            async for page in self._iter_pages(page_size):
+                yield page
+
+    async def _get_field_types(self) -> Dict[str, str]:
+        """Get the Odoo field types of the model.
+
+        Server field definitions take precedence over the field metadata
+        declared on the model class.
+
+        Returns:
+            Dictionary of field names to Odoo field types
+        """
+        field_types = {}
+        for name, field_info in self.model_class.model_fields.items():
+            extra = getattr(field_info, "json_schema_extra", None)
+            if isinstance(extra, dict) and extra.get("odoo_type"):
+                field_types[name] = extra["odoo_type"]
+
+        definitions = await get_registry()._get_field_definitions(
+            self.model_class.get_odoo_name(), self.client
+        )
+        for name, definition in definitions.items():
+            if isinstance(definition, dict) and definition.get("type"):
+                field_types[name] = definition["type"]
+
+        return field_types
+
+    async def parallel_scan(
+        self, workers: int = 4, page_size: int = 1000, ordered: bool = False
+    ) -> AsyncIterator[T]:
+        """Scan all matching records with several concurrent readers.
+
+        The id space of the query is split into ``workers`` disjoint ranges
+        (bounded by the smallest and largest matching id) and every range is
+        paged through concurrently using keyset pagination on ``id``. This
+        lets full-model extractions use as many Odoo workers as are
+        available instead of a single sequential pager.
+
+        Limit, offset and ordering of the QuerySet are not applied; records
+        are always paged by ``id``.
+
+        Args:
+            workers: Number of concurrent id ranges to read
+            page_size: Number of records fetched per RPC call
+            ordered: If True, yield records in ascending id order. Otherwise
+                records are yielded as soon as any range returns a page.
+
+        Yields:
+            Model instances
+
+        Example:
+            >>> async for product in client.model(ProductProduct).filter(
+            ...     active=True
+            ... ).parallel_scan(workers=8):
+            ...     export(product)
+        """
+        async for page in self._parallel_pages(workers, page_size, ordered):
+            for record_data in page:
+                yield self._create_model_instance(record_data)
+
+    async def _parallel_pages(
+        self, workers: int, page_size: int, ordered: bool
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Yield raw record pages from concurrent id-range readers.
+
+        Args:
+            workers: Number of concurrent id ranges to read
+            page_size: Number of records fetched per RPC call
+            ordered: Whether pages must be yielded in ascending id order
+
+        Yields:
+            Lists of record dictionaries
+        """
+        if workers < 1:
+            raise ValueError("workers must be at least 1")
+        if page_size < 1:
+            raise ValueError("page_size must be at least 1")
+
+        ranges = await self._split_id_ranges(workers)
+        if not ranges:
+            return
+
+        # One bounded queue per range gives backpressure to fast readers and
+        # lets the ordered mode drain ranges one after another.
+        queues = [asyncio.Queue(maxsize=2) for _ in ranges] if ordered else None
+        shared_queue: asyncio.Queue = asyncio.Queue(maxsize=2 * len(ranges))
+        done = object()
+
+        async def reader(index: int, low: int, high: int) -> None:
+            queue = queues[index] if queues else shared_queue
+            try:
+                async for page in self._iter_pages(page_size, low, high):
+                    await queue.put(page)
+                await queue.put(done)
+            except Exception as e:
+                await queue.put(e)
+
+        tasks = [
+            asyncio.create_task(reader(index, low, high))
+            for index, (low, high) in enumerate(ranges)
+        ]
+
+        try:
+            if queues:
+                for queue in queues:
+                    while True:
+                        item = await queue.get()
+                        if item is done:
+                            break
+                        if isinstance(item, Exception):
+                            raise item
+                        yield item
+            else:
+                remaining = len(tasks)
+                while remaining:
+                    item = await shared_queue.get()
+                    if item is done:
+                        remaining -= 1
+                        continue
+                    if isinstance(item, Exception):
+                        raise item
+                    yield item
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+            await asyncio.gather(*tasks, return_exceptions=True)
+
+    async def _split_id_ranges(self, parts: int) -> List[tuple]:
+        """Split the matching id space into half-open ``[low, high)`` ranges.
+
+        Args:
+            parts: Maximum number of ranges to create
+
+        Returns:
+            List of (low, high) tuples, empty if nothing matches
+        """
+        domain = self._compiled_domain()
+        if is_empty_domain(domain):
+            return []
+
+        model_name = self.model_class.get_odoo_name()
+        lowest, highest = await asyncio.gather(
+            self.client.execute_kw(
+                model_name,
+                "search",
+                [domain],
+                {"limit": 1, "order": "id asc"},
+                context=self._context,
+            ),
+            self.client.execute_kw(
+                model_name,
+                "search",
+                [domain],
+                {"limit": 1, "order": "id desc"},
+                context=self._context,
+            ),
+        )
+
+        if not lowest or not highest:
+            return []
+
+        low, high = lowest[0], highest[0] + 1
+        parts = min(parts, high - low)
+        step = -(-(high - low) // parts)  # ceiling division
+
+        return [(start, min(start + step, high)) for start in range(low, high, step)]
+
+    async def _iter_pages(
+        self,
+        page_size: int,
+        low: Optional[int] = None,
+        high: Optional[int] = None,
+    ) -> AsyncIterator[List[Dict[str, Any]]]:
+        """Page through matching records using keyset pagination on ``id``.
+
+        Unlike offset pagination, each page is fetched with an ``id >``
+        condition so the server never has to skip over earlier rows.
+
+        Args:
+            page_size: Number of records fetched per RPC call
+            low: Optional inclusive lower id bound
+            high: Optional exclusive upper id bound
+
+        Yields:
+            Lists of record dictionaries in ascending id order
+        """
+        base_domain = self._compiled_domain()
+        if is_empty_domain(base_domain):
+            return
+        if low is not None:
+            base_domain.append(("id", ">=", low))
+        if high is not None:
+            base_domain.append(("id", "<", high))
+
+        fields = self._fields
+        if fields and "id" not in fields:
+            fields = ["id"] + list(fields)
+
+        last_id = None
+        while True:
+            domain = base_domain
+            if last_id is not None:
+                domain = base_domain + [("id", ">", last_id)]
+
+            page = await self.client.search_read(
+                self.model_class.get_odoo_name(),
+                domain=domain,
+                fields=fields,
+                limit=page_size,
+                order="id",
+                context=self._context.copy(),
+            )
+            if not page:
+                return
+
+            yield page
+
+            if len(page) < page_size:
+                return
+            last_id = page[-1]["id"]
+
     def __aiter__(self) -> AsyncIterator[T]:
         """Make the QuerySet async iterable."""
         return self._async_iterator()
@@ -493,6 +1449,17 @@ class QuerySet(AsyncIterable[T]):
         # Copy cache settings
         new_qs._cache_enabled = self._cache_enabled
         new_qs._cache_ttl = self._cache_ttl
+        new_qs._cache_revalidate_after = self._cache_revalidate_after
+        new_qs._cache_normalized = self._cache_normalized
+
+        new_qs._validate = self._validate
+        new_qs._use_replica = self._use_replica
+        new_qs._auto_only = self._auto_only
+        new_qs._refinable = self._refinable
+
+        # Paging a refinement does not change the records it refines
+        if not set(kwargs) - {"limit", "offset"}:
+            new_qs._superset = self._superset
 
         return new_qs
 
@@ -508,10 +1475,169 @@ class QuerySet(AsyncIterable[T]):
         # Use the prefetch manager to optimize relationship loading
         from .lazy import PrefetchManager
 
-        manager = PrefetchManager(self.client)
+        manager = PrefetchManager(self.client, validate=self._validate)
         await manager.prefetch_related(
-            instances, *self._prefetch_related, batch_size=100
+            instances, *self._prefetch_related, context=self._context or None
+        )
+
+    async def _handle_select_related(
+        self, instances: List[T], related_data: Dict[str, Dict[int, Any]]
+    ) -> None:
+        """Attach related records selected with select_related.
+
+        Records expanded server-side are converted and attached directly;
+        anything that was not expanded (older servers) is loaded with one
+        batched read per related model.
+
+        Args:
+            instances: List of model instances
+            related_data: Expanded related records by field and record index
+        """
+        from .lazy import PrefetchManager
+
+        manager = PrefetchManager(self.client, validate=self._validate)
+        context = self._context or None
+
+        to_prefetch = []
+        for field_name, nested in self._group_related_paths().items():
+            expanded = related_data.get(field_name)
+            relation = await manager._resolve_relation(self.model_class, field_name)
+            if expanded is None or relation is None:
+                to_prefetch.extend(
+                    [f"{field_name}.{rest}" for rest in nested] or [field_name]
+                )
+                continue
+
+            comodel, is_collection = relation
+            model_class = get_model_class(comodel)
+            loaded: Dict[int, Any] = {}
+            children: List[Any] = []
+
+            for index, instance in enumerate(instances):
+                values = expanded.get(index)
+                if values is None:
+                    values = []
+                elif not isinstance(values, list):
+                    values = [values]
+
+                related = []
+                for value in values:
+                    if value["id"] not in loaded:
+                        loaded[value["id"]] = manager._create_instance(
+                            model_class, value
+                        )
+                        children.append(loaded[value["id"]])
+                    related.append(loaded[value["id"]])
+
+                ids = [value["id"] for value in values]
+                manager._attach(
+                    instance, field_name, comodel, is_collection, ids, related
+                )
+
+            children = [child for child in children if not isinstance(child, dict)]
+            if nested and children:
+                await manager.prefetch_related(children, *nested, context=context)
+
+        if to_prefetch:
+            await manager.prefetch_related(instances, *to_prefetch, context=context)
+
+    def _group_related_paths(self) -> Dict[str, List[str]]:
+        """Group the select_related paths by their first field.
+
+        Returns:
+            Remaining nested paths by relationship field, so that paths
+            sharing a field such as ``partner_id.country_id`` and
+            ``partner_id.user_id`` expand it once with both nested fields
+        """
+        paths: Dict[str, List[str]] = {}
+        for path in sorted(self._select_related):
+            head, _, rest = path.partition(".")
+            nested = paths.setdefault(head, [])
+            if rest:
+                nested.append(rest)
+        return paths
+
+    def _split_related_records(self, records_data: List[Dict[str, Any]]) -> tuple:
+        """Separate server-side expanded relations from record data.
+
+        Expanded values (dictionaries returned for a field specification)
+        are replaced by their ids so the records validate as usual.
+
+        Args:
+            records_data: Raw record data from Odoo
+
+        Returns:
+            Tuple of (records, related data by field and record index)
+        """
+        heads = {path.partition(".")[0] for path in self._select_related}
+        related_data: Dict[str, Dict[int, Any]] = {}
+        records = []
+
+        for index, record_data in enumerate(records_data):
+            record = dict(record_data)
+            for field_name in heads:
+                value = record.get(field_name)
+                if isinstance(value, dict):
+                    record[field_name] = value.get("id")
+                elif (
+                    isinstance(value, list)
+                    and value
+                    and all(isinstance(item, dict) for item in value)
+                ):
+                    record[field_name] = [item.get("id") for item in value]
+                else:
+                    continue
+                related_data.setdefault(field_name, {})[index] = value
+            records.append(record)
+
+        return records, related_data
+
+    def _supports_specification(self) -> bool:
+        """Check whether the server supports web field specifications.
+
+        Returns:
+            True for Odoo 17 and later
+        """
+        version = getattr(self.client, "server_version", None)
+        if not isinstance(version, dict):
+            return False
+
+        version_info = version.get("server_version_info")
+        if not isinstance(version_info, (list, tuple)) or not version_info:
+            return False
+
+        # SaaS releases report e.g. "saas~17" as the major version
+        major = str(version_info[0]).rsplit("~", 1)[-1]
+        return major.isdigit() and int(major) >= 17
+
+    async def _build_specification(self) -> Dict[str, Any]:
+        """Build a web field specification including select_related fields.
+
+        Returns:
+            Nested field specification for ``web_search_read``
+        """
+        from .lazy import PrefetchManager
+
+        manager = PrefetchManager(self.client, validate=self._validate)
+
+        fields = self._requested_fields() or await manager._get_declared_fields(
+            self.model_class
         )
+        specification: Dict[str, Any] = {name: {} for name in fields}
+        specification.setdefault("id", {})
+
+        for field_name, nested in self._group_related_paths().items():
+            relation = await manager._resolve_relation(self.model_class, field_name)
+            if relation is None:
+                continue
+
+            comodel, _ = relation
+            related_fields = await manager._get_read_fields(comodel, nested)
+            specification[field_name] = {
+                "fields": {name: {} for name in related_fields}
+            }
+
+        return specification
 
     async def _execute_query(self) -> List[Dict[str, Any]]:
         """Execute the query and return raw data.
@@ -519,16 +1645,53 @@ class QuerySet(AsyncIterable[T]):
         Returns:
             List of record dictionaries from Odoo
         """
+        # Provably empty queries need no RPC
+        domain = self._compiled_domain()
+        if is_empty_domain(domain):
+            return []
+
+        # Refine the records of an evaluated parent query locally
+        local_result = self._evaluate_superset()
+        if local_result is not None:
+            return self._page(local_result)
+
+        # Answer from the local replica when possible
+        replica = self._get_replica()
+        if replica is not None:
+            result = await replica.search_read(
+                self.model_class.get_odoo_name(),
+                domain,
+                fields=self._requested_fields(),
+                order=self._order,
+                limit=self._limit,
+                offset=self._offset,
+                context=self._context,
+            )
+            if result is not None:
+                return result
+
         # Check cache first
         cached_result = await self._get_cached_result()
         if cached_result is not None:
             return cached_result
 
+        # Expand select_related server-side when supported
+        if self._select_related and self._supports_specification():
+            result = await self._execute_specification_query()
+            await self._set_cached_result(result)
+            return result
+
         # Prepare query parameters
         kwargs = {}
 
-        if self._fields:
-            kwargs["fields"] = self._fields
+        requested_fields = self._requested_fields()
+        if requested_fields:
+            fields = list(requested_fields)
+            for path in self._select_related:
+                field_name = path.partition(".")[0]
+                if field_name not in fields:
+                    fields.append(field_name)
+            kwargs["fields"] = fields
         if self._limit is not None:
             kwargs["limit"] = self._limit
         if self._offset:
@@ -542,7 +1705,7 @@ class QuerySet(AsyncIterable[T]):
 
         # Execute search_read for efficiency
         result = await self.client.search_read(
-            self.model_class.get_odoo_name(), domain=self._domain, **kwargs
+            self.model_class.get_odoo_name(), domain=domain, **kwargs
         )
 
         # Cache the result
@@ -550,6 +1713,89 @@ class QuerySet(AsyncIterable[T]):
 
         return result
 
+    def _evaluate_superset(self) -> Optional[List[Dict[str, Any]]]:
+        """Evaluate the query over the records of its parent query.
+
+        Returns:
+            Matching parent records, or None if the query has no evaluated
+            parent or its conditions cannot be evaluated locally
+        """
+        if self._superset is None:
+            return None
+
+        records, domain = self._superset
+        try:
+            return filtered_domain(records, domain)
+        except ValueError:
+            return None
+
+    def _page(self, records: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Apply the offset and limit of the query to locally evaluated records."""
+        end = None if self._limit is None else self._offset + self._limit
+        return records[self._offset : end]
+
+    def _requested_fields(self) -> Optional[List[str]]:
+        """Get the fields requested from the server.
+
+        Returns:
+            Fields selected with ``only()``, fields projected by the field
+            profiler, or None for all fields
+        """
+        return self._fields or self._projected_fields
+
+    def _compiled_domain(self) -> List[Any]:
+        """Get the simplified domain sent to the server.
+
+        Returns:
+            Compiled domain (see ``zenoo_rpc.query.domain``)
+        """
+        return compile_domain(self._domain)
+
+    def _get_replica(self) -> Optional[Any]:
+        """Get the local replica if it may answer this query.
+
+        Returns:
+            LocalReplica replicating the model, or None
+        """
+        if not self._use_replica or self._select_related:
+            return None
+
+        replica = getattr(self.client, "__dict__", {}).get("replica")
+        if replica is None:
+            return None
+        if not replica.is_registered(self.model_class.get_odoo_name()):
+            return None
+        return replica
+
+    async def _execute_specification_query(self) -> List[Dict[str, Any]]:
+        """Execute the query through ``web_search_read`` with a specification.
+
+        Returns:
+            List of record dictionaries with expanded related records
+        """
+        kwargs: Dict[str, Any] = {
+            "domain": self._compiled_domain(),
+            "specification": await self._build_specification(),
+        }
+        if self._limit is not None:
+            kwargs["limit"] = self._limit
+        if self._offset:
+            kwargs["offset"] = self._offset
+        if self._order:
+            kwargs["order"] = self._order
+
+        result = await self.client.execute_kw(
+            self.model_class.get_odoo_name(),
+            "web_search_read",
+            [],
+            kwargs,
+            context=self._context.copy(),
+        )
+
+        if isinstance(result, dict):
+            return result.get("records", [])
+        return result or []
+
     def _create_model_instance(self, record_data: Dict[str, Any]) -> T:
         """Create a model instance from record data.
 
@@ -559,15 +1805,9 @@ class QuerySet(AsyncIterable[T]):
         Returns:
             Model instance
         """
-        # Add client reference for lazy loading
-        record_data["client"] = self.client
-
-        # Remove problematic 'self' key if present
-        if "self" in record_data:
-            record_data.pop("self", None)
-
-        # Create the model instance
-        return self.model_class(**record_data)
+        return self.model_class.from_odoo(
+            record_data, client=self.client, validate=self._validate
+        )
 
     def __repr__(self) -> str:
         """String representation of the QuerySet."""
@@ -582,13 +1822,19 @@ class QuerySet(AsyncIterable[T]):
         """Generate a cache key for this query."""
         query_data = {
             "model": self.model_class.get_odoo_name(),
-            "domain": self._domain,
-            "fields": self._fields,
+            "domain": self._compiled_domain(),
+            "fields": self._requested_fields(),
             "limit": self._limit,
             "offset": self._offset,
             "order": self._order,
             "context": self._context,
         }
+        if self._select_related:
+            query_data["select_related"] = sorted(self._select_related)
+        if self._revalidates_cache():
+            query_data["revalidated"] = True
+        if self._normalizes_cache():
+            query_data["normalized"] = True
 
         # Create a hash of the query data
         query_str = json.dumps(query_data, sort_keys=True)
@@ -596,19 +1842,64 @@ class QuerySet(AsyncIterable[T]):
 
         return f"query:{self.model_class.get_odoo_name()}:{query_hash}"
 
-    def cache(self, ttl: Optional[int] = None, enabled: bool = True) -> "QuerySet[T]":
+    def cache(
+        self,
+        ttl: Optional[int] = None,
+        enabled: bool = True,
+        revalidate_after: Optional[int] = None,
+        normalized: bool = False,
+    ) -> "QuerySet[T]":
         """Configure caching for this query.
 
+        By default cached results are served until they expire. With
+        ``revalidate_after``, results older than that are checked against
+        the server first: one ``search`` for matching records written since
+        they were cached and one ``search_count``. Unchanged results are
+        reused, otherwise only new and modified records are read. Results
+        stay cached for ``ttl`` seconds, so ``ttl`` should be longer than
+        ``revalidate_after``.
+
+        Revalidation relies on ``write_date`` and assumes the client and
+        server clocks agree. Queries using ``select_related()`` are not
+        revalidated.
+
+        With ``normalized``, the query only caches its record ids and each
+        record is cached once for all queries (see
+        ``zenoo_rpc.cache.entities``). Records missing from the cache are
+        read again in one call, and writes made through the client only
+        invalidate the records they modify. Record membership is not
+        revalidated: a cached query keeps its ids until it expires or a
+        record of the model is created. Queries with a context are cached
+        like without ``normalized``, since the context may change the
+        values read.
+
         Args:
             ttl: Time to live in seconds (None for default)
             enabled: Whether to enable caching
+            revalidate_after: Age in seconds after which cached results are
+                revalidated (None to serve them until they expire)
+            normalized: Whether to cache records separately from queries
 
         Returns:
             QuerySet with caching configuration
+
+        Raises:
+            ValueError: If both ``revalidate_after`` and ``normalized`` are
+                given
+
+        Example:
+            >>> partners = await client.model(ResPartner).filter(
+            ...     is_company=True
+            ... ).cache(ttl=3600, revalidate_after=30).all()
         """
+        if revalidate_after is not None and normalized:
+            raise ValueError("Normalized cached results cannot be revalidated")
+
         new_qs = self._clone()
         new_qs._cache_ttl = ttl if ttl is not None else self._cache_ttl
         new_qs._cache_enabled = enabled
+        new_qs._cache_revalidate_after = revalidate_after
+        new_qs._cache_normalized = normalized
         return new_qs
 
     async def _get_cached_result(self) -> Optional[List[Dict[str, Any]]]:
@@ -617,7 +1908,28 @@ class QuerySet(AsyncIterable[T]):
             return None
 
         cache_key = self._generate_cache_key()
-        return await self._cache_manager.get(cache_key)
+        if self._normalizes_cache():
+            return await EntityCache(self._cache_manager).get_query(
+                cache_key,
+                self.model_class.get_odoo_name(),
+                self._requested_fields() or None,
+                self._read_records,
+            )
+        if not self._revalidates_cache():
+            return await self._cache_manager.get(cache_key)
+
+        # Writes made from now on are caught by the next revalidation
+        self._cache_checked_at = time.time()
+        entry = await self._cache_manager.get(cache_key)
+        if not isinstance(entry, dict) or "rows" not in entry:
+            return None
+
+        if self._cache_checked_at - entry["stored_at"] < self._cache_revalidate_after:
+            return entry["rows"]
+
+        rows = await self._revalidate_rows(entry["rows"], entry["stored_at"])
+        await self._set_cached_result(rows)
+        return rows
 
     async def _set_cached_result(self, result: List[Dict[str, Any]]) -> None:
         """Cache the query result."""
@@ -625,7 +1937,130 @@ class QuerySet(AsyncIterable[T]):
             return
 
         cache_key = self._generate_cache_key()
-        await self._cache_manager.set(cache_key, result, ttl=self._cache_ttl)
+        if self._normalizes_cache():
+            await EntityCache(self._cache_manager).put_query(
+                cache_key,
+                self.model_class.get_odoo_name(),
+                result,
+                self._requested_fields() or None,
+                ttl=self._cache_ttl,
+            )
+            return
+
+        value: Any = result
+        if self._revalidates_cache():
+            stored_at = self._cache_checked_at or time.time()
+            value = {"rows": result, "stored_at": stored_at}
+        await self._cache_manager.set(cache_key, value, ttl=self._cache_ttl)
+
+    def _normalizes_cache(self) -> bool:
+        """Check whether results of this query are cached normalized.
+
+        Fragments are shared by all queries, so queries with a context,
+        which may change the values read (language, timezone, companies),
+        use the plain query cache.
+        """
+        return self._cache_normalized and not self._select_related and not self._context
+
+    async def _read_records(self, ids: List[int]) -> List[Dict[str, Any]]:
+        """Read records of the query by ids, with the fields of the query.
+
+        Args:
+            ids: Record ids
+
+        Returns:
+            Record dictionaries
+        """
+        kwargs: Dict[str, Any] = {"context": self._context.copy()}
+        fields = self._requested_fields()
+        if fields:
+            kwargs["fields"] = list(fields)
+        records = await self.client.search_read(
+            self.model_class.get_odoo_name(), domain=[("id", "in", ids)], **kwargs
+        )
+        return records or []
+
+    def _revalidates_cache(self) -> bool:
+        """Check whether cached results of this query are revalidated."""
+        return self._cache_revalidate_after is not None and not self._select_related
+
+    async def _revalidate_rows(
+        self, rows: List[Dict[str, Any]], stored_at: float
+    ) -> List[Dict[str, Any]]:
+        """Bring cached query results up to date.
+
+        Args:
+            rows: Cached records
+            stored_at: Time at which the query producing them started
+
+        Returns:
+            Current records, reusing the cached values of unchanged ones
+        """
+        model_name = self.model_class.get_odoo_name()
+        domain = self._compiled_domain()
+        context = self._context.copy()
+
+        # write_date has a precision of one second
+        since = time.strftime("%Y-%m-%d %H:%M:%S", time.gmtime(stored_at))
+        changed_search = self.client.execute_kw(
+            model_name,
+            "search",
+            [[("write_date", ">=", since), *domain]],
+            context=context,
+        )
+
+        if self._limit is not None or self._offset:
+            changed, ids = await asyncio.gather(
+                changed_search, self._search_ids(domain)
+            )
+            cached_ids = [row["id"] for row in rows]
+            if ids == cached_ids and not set(changed).intersection(ids):
+                return rows
+        else:
+            changed, count = await asyncio.gather(
+                changed_search,
+                self.client.execute_kw(
+                    model_name, "search_count", [domain], context=context
+                ),
+            )
+            if not changed and count == len(rows):
+                return rows
+            ids = await self._search_ids(domain)
+
+        changed = set(changed)
+        records = {row["id"]: row for row in rows}
+        needed = [i for i in ids if i in changed or i not in records]
+        if needed:
+            fetched = await self._read_records(needed)
+            records.update((record["id"], record) for record in fetched)
+
+        return [records[i] for i in ids if i in records]
+
+    async def _search_ids(self, domain: List[Any]) -> List[int]:
+        """Get the ids of the matching records, with limit, offset and order.
+
+        Args:
+            domain: Compiled domain of the query
+
+        Returns:
+            Ordered record ids
+        """
+        kwargs: Dict[str, Any] = {}
+        if self._limit is not None:
+            kwargs["limit"] = self._limit
+        if self._offset:
+            kwargs["offset"] = self._offset
+        if self._order:
+            kwargs["order"] = self._order
+
+        ids = await self.client.execute_kw(
+            self.model_class.get_odoo_name(),
+            "search",
+            [domain],
+            kwargs,
+            context=self._context.copy(),
+        )
+        return list(ids or [])
 
     async def _invalidate_cache(self) -> None:
         """Invalidate cache for this model."""
@@ -725,6 +2160,21 @@ class QueryBuilder:
         """
         return await self.filter().get(*args, **filters)
 
+    async def in_bulk(
+        self, ids: Iterable[int], chunk_size: int = 1000, concurrency: int = 4
+    ) -> Dict[int, T]:
+        """Get records by id.
+
+        Args:
+            ids: Record ids to fetch
+            chunk_size: Maximum number of ids per RPC call
+            concurrency: Maximum number of concurrent RPC calls
+
+        Returns:
+            Dictionary of ids to model instances (see ``QuerySet.in_bulk``)
+        """
+        return await self.all().in_bulk(ids, chunk_size, concurrency)
+
     async def create(self, **values: Any) -> T:
         """Create a new record.
 
@@ -0,0 +1,307 @@
+"""
+Columnar export of query results.
+
+This module converts pages of ``search_read`` results straight into Apache
+Arrow record batches, column by column, without building model instances or
+normalized per-record dictionaries. It requires the optional ``pyarrow``
+dependency (``pip install zenoo-rpc[arrow]``).
+"""
+
+import importlib.util
+from typing import Any, Callable, Dict, List, Optional, Sequence, Tuple
+
+from .recordset import _infer_kind
+
+try:
+    import pyarrow as pa
+    import pyarrow.compute as pc
+
+    PYARROW_AVAILABLE = True
+except ImportError:
+    PYARROW_AVAILABLE = False
+
+try:
+    import numpy as np
+
+    NUMPY_AVAILABLE = True
+except ImportError:
+    NUMPY_AVAILABLE = False
+
+PANDAS_AVAILABLE = importlib.util.find_spec("pandas") is not None
+
+#: Suffix of the column holding the display name of a many2one field
+MANY2ONE_NAME_SUFFIX = "_name"
+
+_DATETIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+_DATE_FORMAT = "%Y-%m-%d"
+
+_INFERRED_TYPES = {
+    "bool": "boolean",
+    "int": "integer",
+    "float": "float",
+    "str": "char",
+    "many2one": "many2one",
+}
+
+
+def check_column_names(columns: Sequence[str]) -> None:
+    """Raise ValueError if flattened columns have the same name.
+
+    The ``<field>_name`` column of a many2one field collides with a real
+    field of that name, e.g. ``partner_id_name`` next to ``partner_id``.
+
+    Args:
+        columns: Output column names
+    """
+    seen = set()
+    for name in columns:
+        if name in seen:
+            raise ValueError(
+                f"Column '{name}' is both a field and the display name column "
+                f"of a many2one field; leave one of them out of the fields"
+            )
+        seen.add(name)
+
+
+def require_pyarrow() -> None:
+    """Raise ImportError if pyarrow is not installed."""
+    if not PYARROW_AVAILABLE:
+        raise ImportError(
+            "pyarrow is required for columnar export. "
+            "Install with: pip install zenoo-rpc[arrow]"
+        )
+
+
+def require_pandas() -> None:
+    """Raise ImportError if pandas or pyarrow is not installed."""
+    if not PANDAS_AVAILABLE:
+        raise ImportError(
+            "pandas is required for DataFrame export. "
+            "Install with: pip install zenoo-rpc[pandas]"
+        )
+    require_pyarrow()
+
+
+def require_numpy() -> None:
+    """Raise ImportError if numpy or pyarrow is not installed."""
+    if not NUMPY_AVAILABLE:
+        raise ImportError(
+            "numpy is required for array export. "
+            "Install with: pip install zenoo-rpc[arrow]"
+        )
+    require_pyarrow()
+
+
+def _without_false(values: List[Any]) -> List[Any]:
+    """Replace Odoo ``False`` placeholders by None."""
+    return [None if value is False else value for value in values]
+
+
+def _to_strings(values: List[Any]) -> "pa.Array":
+    """Convert values to a string array, stringifying non-string values."""
+    values = _without_false(values)
+    try:
+        return pa.array(values, pa.string())
+    except (pa.ArrowInvalid, pa.ArrowTypeError):
+        return pa.array(
+            [None if value is None else str(value) for value in values], pa.string()
+        )
+
+
+def _to_integers(values: List[Any]) -> List["pa.Array"]:
+    return [pa.array(_without_false(values), pa.int64())]
+
+
+def _to_floats(values: List[Any]) -> List["pa.Array"]:
+    return [pa.array(_without_false(values), pa.float64())]
+
+
+def _to_booleans(values: List[Any]) -> List["pa.Array"]:
+    return [pa.array(values, pa.bool_())]
+
+
+def _to_char(values: List[Any]) -> List["pa.Array"]:
+    return [_to_strings(values)]
+
+
+def _to_selection(values: List[Any]) -> List["pa.Array"]:
+    return [_to_strings(values).dictionary_encode()]
+
+
+def _to_datetimes(values: List[Any]) -> List["pa.Array"]:
+    strings = pa.array(_without_false(values), pa.string())
+    return [pc.strptime(strings, format=_DATETIME_FORMAT, unit="s")]
+
+
+def _to_dates(values: List[Any]) -> List["pa.Array"]:
+    strings = pa.array(_without_false(values), pa.string())
+    parsed = pc.strptime(strings, format=_DATE_FORMAT, unit="s")
+    return [parsed.cast(pa.date32())]
+
+
+def _to_many2one(values: List[Any]) -> List["pa.Array"]:
+    ids: List[Optional[int]] = []
+    names: List[Optional[str]] = []
+    for value in values:
+        if value is False or value is None:
+            ids.append(None)
+            names.append(None)
+        elif isinstance(value, (list, tuple)):
+            ids.append(value[0])
+            names.append(value[1] if len(value) > 1 else None)
+        else:
+            ids.append(value)
+            names.append(None)
+    return [pa.array(ids, pa.int64()), pa.array(names, pa.string())]
+
+
+def _to_x2many(values: List[Any]) -> List["pa.Array"]:
+    return [pa.array([value or [] for value in values], pa.list_(pa.int64()))]
+
+
+_Converter = Callable[[List[Any]], List["pa.Array"]]
+
+
+def _column_spec(name: str, odoo_type: str) -> Tuple[_Converter, List["pa.Field"]]:
+    """Get the converter and output fields of an Odoo field type."""
+    if odoo_type == "many2one":
+        return _to_many2one, [
+            pa.field(name, pa.int64()),
+            pa.field(name + MANY2ONE_NAME_SUFFIX, pa.string()),
+        ]
+    if odoo_type == "integer":
+        return _to_integers, [pa.field(name, pa.int64())]
+    if odoo_type in ("float", "monetary"):
+        return _to_floats, [pa.field(name, pa.float64())]
+    if odoo_type == "boolean":
+        return _to_booleans, [pa.field(name, pa.bool_())]
+    if odoo_type == "selection":
+        return _to_selection, [pa.field(name, pa.dictionary(pa.int32(), pa.string()))]
+    if odoo_type == "datetime":
+        return _to_datetimes, [pa.field(name, pa.timestamp("s"))]
+    if odoo_type == "date":
+        return _to_dates, [pa.field(name, pa.date32())]
+    if odoo_type in ("one2many", "many2many"):
+        return _to_x2many, [pa.field(name, pa.list_(pa.int64()))]
+    return _to_char, [pa.field(name, pa.string())]
+
+
+def _infer_odoo_type(values: List[Any]) -> str:
+    """Infer the Odoo type of an untyped column from its first value."""
+    for value in values:
+        kind = _infer_kind(value)
+        if kind is None:
+            continue
+        if kind == "object" and isinstance(value, list):
+            if all(isinstance(item, int) for item in value):
+                return "many2many"
+        return _INFERRED_TYPES.get(kind, "char")
+    return "char"
+
+
+class ArrowBatchBuilder:
+    """Build Arrow record batches from pages of ``search_read`` results.
+
+    Every page is converted column by column into typed Arrow arrays with a
+    schema fixed by the first page: many2one ``[id, name]`` pairs become an
+    ``int64`` id column and a ``<field>_name`` string column, selection
+    values are dictionary-encoded, dates and datetimes are parsed into
+    Arrow temporal types (naive UTC, as returned by Odoo), and x2many fields
+    become lists of ids. Odoo ``False`` becomes null, except in boolean
+    columns.
+
+    Example:
+        >>> builder = ArrowBatchBuilder({"partner_id": "many2one"})
+        >>> batch = builder.build([{"id": 1, "partner_id": [7, "Acme"]}])
+        >>> batch.schema.names
+        ['id', 'partner_id', 'partner_id_name']
+    """
+
+    def __init__(
+        self,
+        field_types: Optional[Dict[str, str]] = None,
+        fields: Optional[Sequence[str]] = None,
+    ):
+        """Initialize the builder.
+
+        Args:
+            field_types: Mapping of field names to Odoo field types
+            fields: Fields to export (None uses the fields of the first page)
+        """
+        require_pyarrow()
+
+        self.field_types = dict(field_types or {})
+        self.fields = self._with_id(fields) if fields else None
+        self._columns: Optional[List[Tuple[str, _Converter]]] = None
+        self._schema: Optional[pa.Schema] = None
+
+    @property
+    def schema(self) -> Optional["pa.Schema"]:
+        """Schema of the built batches, None until the first page is built."""
+        return self._schema
+
+    def build(self, page: List[Dict[str, Any]]) -> "pa.RecordBatch":
+        """Convert a page of records into a record batch.
+
+        Args:
+            page: Record dictionaries as returned by ``search_read``
+
+        Returns:
+            Arrow record batch
+        """
+        if self._columns is None:
+            self._resolve(page)
+
+        arrays: List[pa.Array] = []
+        for name, converter in self._columns:
+            arrays.extend(converter([record.get(name) for record in page]))
+
+        return pa.RecordBatch.from_arrays(arrays, schema=self._schema)
+
+    def empty_table(self) -> "pa.Table":
+        """Create an empty table with the schema of the builder.
+
+        Returns:
+            Arrow table without rows
+        """
+        if self._schema is None and self.fields is not None:
+            self._resolve([])
+        return pa.Table.from_batches([], schema=self._schema or pa.schema([]))
+
+    def _resolve(self, page: List[Dict[str, Any]]) -> None:
+        """Fix the columns and schema from the field types and a page."""
+        if self.fields is None:
+            self.fields = self._with_id(page[0].keys() if page else [])
+
+        columns = []
+        schema_fields = []
+        for name in self.fields:
+            odoo_type = self.field_types.get(name)
+            if odoo_type is None:
+                odoo_type = _infer_odoo_type([record.get(name) for record in page])
+
+            converter, output_fields = _column_spec(name, odoo_type)
+            columns.append((name, converter))
+            schema_fields.extend(output_fields)
+
+        check_column_names([field.name for field in schema_fields])
+        self._columns = columns
+        self._schema = pa.schema(schema_fields)
+
+    @staticmethod
+    def _with_id(fields: Sequence[str]) -> List[str]:
+        """Put ``id`` first in a list of field names."""
+        return ["id"] + [name for name in fields if name != "id"]
+
+
+def table_to_numpy(table: "pa.Table") -> Dict[str, "np.ndarray"]:
+    """Convert the columns of an Arrow table into numpy arrays.
+
+    Args:
+        table: Arrow table
+
+    Returns:
+        Dictionary of column names to numpy arrays
+    """
+    require_numpy()
+    return {name: table.column(name).to_numpy() for name in table.schema.names}
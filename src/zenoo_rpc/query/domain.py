@@ -0,0 +1,512 @@
+"""
+Domain compiler for Odoo search domains.
+
+``filter()``, ``Q`` objects and expressions simply concatenate domain
+lists, so chained queries accumulate redundant operators, repeated
+conditions and separate equality tests on one field. The compiler parses
+a domain into a tree and rewrites it before it is sent to the server:
+
+- nested ``&``/``|`` operators are flattened and repeated conditions
+  removed,
+- constant conditions are folded (``("id", "in", [])`` can never match,
+  ``("x", "=?", False)`` always matches),
+- ``f = a OR f = b`` becomes ``f in [a, b]`` and ``id in A AND id in B``
+  becomes a single ``id in`` list with the common ids.
+
+Domains that provably match no record compile to ``[FALSE_LEAF]``, which
+lets queries skip the RPC altogether. Compiled domains are memoized by
+their structure and value types, so repeated queries are only compiled
+once while ``0``, ``False`` and ``0.0`` stay distinct.
+
+Example:
+    >>> compile_domain([
+    ...     "|", ("state", "=", "draft"), ("state", "=", "sent"),
+    ...     ("active", "=", True), ("active", "=", True),
+    ... ])
+    [('state', 'in', ['draft', 'sent']), ('active', '=', True)]
+    >>> is_empty_domain([("id", "in", [1, 2]), ("id", "in", [3])])
+    True
+"""
+
+from collections import OrderedDict
+from typing import Any, Dict, Hashable, Iterator, List, Optional, Tuple
+
+TRUE_LEAF = (1, "=", 1)
+FALSE_LEAF = (0, "=", 1)
+
+_AND = "&"
+_OR = "|"
+_NOT = "!"
+_LEAF = "leaf"
+
+# Constant nodes of the parsed tree
+_TRUE = ("true",)
+_FALSE = ("false",)
+
+_OPERATOR_ALIASES = {"==": "=", "<>": "!="}
+
+
+class _Malformed(Exception):
+    """Raised when a domain cannot be parsed."""
+
+
+class DomainCompiler:
+    """Normalize, simplify and memoize Odoo domains.
+
+    Domains that cannot be parsed (unknown tokens or missing operands)
+    are returned unchanged, leaving the error to the server.
+
+    Example:
+        >>> compiler = DomainCompiler(max_size=512)
+        >>> compiler.compile([("id", "in", [])])
+        [(0, '=', 1)]
+        >>> compiler.get_stats()["misses"]
+        1
+    """
+
+    def __init__(self, max_size: int = 1024):
+        """Initialize the compiler.
+
+        Args:
+            max_size: Maximum number of memoized domains
+        """
+        self.max_size = max_size
+        self._memo: OrderedDict[Hashable, Tuple[Any, ...]] = OrderedDict()
+        self.hits = 0
+        self.misses = 0
+
+    def compile(self, domain: Optional[List[Any]]) -> List[Any]:
+        """Compile a domain into its simplified form.
+
+        Args:
+            domain: Odoo domain in prefix notation
+
+        Returns:
+            Equivalent domain; ``[]`` if it matches every record and
+            ``[FALSE_LEAF]`` if it matches none
+        """
+        if not domain:
+            return []
+
+        key = _key(domain)
+        try:
+            compiled = self._memo.get(key)
+        except TypeError:
+            # Unhashable values (e.g. dictionaries) are compiled every time
+            compiled = self._compile(domain)
+            return list(domain) if compiled is None else _thaw_terms(compiled)
+
+        if compiled is not None:
+            self.hits += 1
+            self._memo.move_to_end(key)
+            return _thaw_terms(compiled)
+
+        compiled = self._compile(domain)
+        if compiled is None:
+            return list(domain)
+
+        self.misses += 1
+        self._memo[key] = compiled
+        if len(self._memo) > self.max_size:
+            self._memo.popitem(last=False)
+        return _thaw_terms(compiled)
+
+    def clear(self) -> None:
+        """Forget all memoized domains."""
+        self._memo.clear()
+        self.hits = 0
+        self.misses = 0
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get memoization statistics.
+
+        Returns:
+            Dictionary with hits, misses and the number of memoized domains
+        """
+        return {"hits": self.hits, "misses": self.misses, "size": len(self._memo)}
+
+    def _compile(self, domain: List[Any]) -> Optional[Tuple[Any, ...]]:
+        """Compile a domain into terms with frozen leaf values.
+
+        Returns:
+            Compiled terms, or None if the domain cannot be parsed
+        """
+        try:
+            tree = _parse(domain)
+        except _Malformed:
+            return None
+
+        tree = _simplify(tree)
+        if tree is _TRUE:
+            return ()
+
+        output: List[Any] = []
+        _emit(tree, output, top=True)
+        return tuple(output)
+
+
+_default_compiler = DomainCompiler()
+
+
+def compile_domain(domain: Optional[List[Any]]) -> List[Any]:
+    """Compile a domain with the shared, memoizing compiler.
+
+    Args:
+        domain: Odoo domain in prefix notation
+
+    Returns:
+        Equivalent simplified domain (see ``DomainCompiler.compile``)
+    """
+    return _default_compiler.compile(domain)
+
+
+def is_empty_domain(domain: Optional[List[Any]]) -> bool:
+    """Check whether a domain provably matches no record.
+
+    Args:
+        domain: Odoo domain, compiled or not
+
+    Returns:
+        True if searching the domain is guaranteed to return nothing
+    """
+    compiled = compile_domain(domain)
+    return len(compiled) == 1 and tuple(compiled[0]) == FALSE_LEAF
+
+
+def normalize_domain(domain: List[Any]) -> List[Any]:
+    """Make the implicit AND between top-level terms explicit.
+
+    A normalized domain is a single expression, so it can be used as an
+    operand of ``|`` or ``!``.
+
+    Args:
+        domain: Odoo domain in prefix notation
+
+    Returns:
+        Domain with one leading ``&`` per additional top-level term
+
+    Example:
+        >>> normalize_domain([("a", "=", 1), "|", ("b", "=", 2), ("c", "=", 3)])
+        ['&', ('a', '=', 1), '|', ('b', '=', 2), ('c', '=', 3)]
+    """
+    operators = sum(1 for term in domain if term in (_AND, _OR))
+    leaves = sum(1 for term in domain if term not in (_AND, _OR, _NOT))
+    expressions = leaves - operators
+    if expressions <= 1:
+        return list(domain)
+    return [_AND] * (expressions - 1) + list(domain)
+
+
+def _freeze(value: Any) -> Any:
+    """Convert nested lists into tuples so that a domain can be hashed."""
+    if isinstance(value, (list, tuple)):
+        return tuple(_freeze(item) for item in value)
+    return value
+
+
+def _key(value: Any) -> Any:
+    """Build a hashable key telling apart values that compare equal.
+
+    ``0 == False == 0.0`` and ``1 == True``, but they are different
+    conditions in a domain, so scalars are keyed with their type.
+    """
+    if isinstance(value, (list, tuple)):
+        return tuple(_key(item) for item in value)
+    return (type(value), value)
+
+
+def _thaw(value: Any) -> Any:
+    """Convert frozen leaf values back into lists."""
+    if isinstance(value, tuple):
+        return [_thaw(item) for item in value]
+    return value
+
+
+def _thaw_terms(terms: Tuple[Any, ...]) -> List[Any]:
+    """Build a domain from compiled terms, with new lists for leaf values."""
+    return [
+        term if isinstance(term, str) else (term[0], term[1], _thaw(term[2]))
+        for term in terms
+    ]
+
+
+def _simplified_tree(domain: List[Any]) -> Tuple[Any, ...]:
+    """Parse and simplify a domain into a tree.
+
+    Raises:
+        ValueError: If the domain cannot be parsed
+    """
+    if not domain:
+        return _TRUE
+    try:
+        return _simplify(_parse(domain))
+    except _Malformed:
+        raise ValueError(f"Invalid domain: {domain!r}") from None
+
+
+def _parse(domain: List[Any]) -> Tuple[Any, ...]:
+    """Parse a prefix-notation domain into a tree.
+
+    Tokens are consumed from the right with an operand stack, so long
+    operator chains do not recurse. Chains of one operator are merged into
+    a single n-ary node while parsing.
+    """
+    stack: List[Tuple[Any, ...]] = []
+    for token in reversed(domain):
+        if token == _NOT:
+            if not stack:
+                raise _Malformed
+            stack.append((_NOT, stack.pop()))
+        elif token in (_AND, _OR):
+            if len(stack) < 2:
+                raise _Malformed
+            left, right = stack.pop(), stack.pop()
+            # Operand lists are owned by the parser and can be extended
+            children = left[1] if left[0] == token else [left]
+            if right[0] == token:
+                children.extend(right[1])
+            else:
+                children.append(right)
+            stack.append((token, children))
+        else:
+            stack.append(_parse_leaf(token))
+
+    # Top-level expressions are implicitly combined with AND
+    stack.reverse()
+    return stack[0] if len(stack) == 1 else (_AND, stack)
+
+
+def _parse_leaf(token: Any) -> Tuple[Any, ...]:
+    if not isinstance(token, (list, tuple)) or len(token) != 3:
+        raise _Malformed
+
+    field, operator, value = token
+    if tuple(token) == TRUE_LEAF:
+        return _TRUE
+    if tuple(token) == FALSE_LEAF:
+        return _FALSE
+    if not isinstance(field, str) or not isinstance(operator, str):
+        raise _Malformed
+
+    operator = operator.strip().lower()
+    operator = _OPERATOR_ALIASES.get(operator, operator)
+    return (_LEAF, (field, operator, _freeze(value)))
+
+
+def _simplify(node: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    kind = node[0]
+    if kind == _LEAF:
+        return _fold_leaf(node[1])
+    if kind == _NOT:
+        child = _simplify(node[1])
+        if child is _TRUE:
+            return _FALSE
+        if child is _FALSE:
+            return _TRUE
+        if child[0] == _NOT:
+            return child[1]
+        return (_NOT, child)
+    if kind in (_AND, _OR):
+        return _simplify_junction(kind, node[1])
+    return node
+
+
+def _fold_leaf(leaf: Tuple[str, str, Any]) -> Tuple[Any, ...]:
+    """Fold leaves whose result does not depend on the records."""
+    field, operator, value = leaf
+    if operator == "=?":
+        if value is False or value is None:
+            return _TRUE
+        operator = "="
+    elif operator in ("in", "not in") and isinstance(value, tuple):
+        if not value:
+            return _FALSE if operator == "in" else _TRUE
+        value = _unique(value)
+
+    return (_LEAF, (field, operator, value))
+
+
+def _simplify_junction(kind: str, operands: List[Any]) -> Tuple[Any, ...]:
+    """Flatten, fold and deduplicate the operands of an AND or OR node."""
+    absorbing, neutral = (_FALSE, _TRUE) if kind == _AND else (_TRUE, _FALSE)
+
+    children: List[Tuple[Any, ...]] = []
+    seen = set()
+    for child in _flatten(kind, operands):
+        if child is absorbing:
+            return absorbing
+        if child is neutral:
+            continue
+        try:
+            key = _key(child)
+            if key in seen:
+                continue
+            seen.add(key)
+        except TypeError:
+            pass
+        children.append(child)
+
+    if kind == _OR:
+        children = _merge_equalities(children)
+    else:
+        children = _intersect_ids(children)
+        if children is None:
+            return _FALSE
+
+    if not children:
+        return neutral
+    if len(children) == 1:
+        return children[0]
+    return (kind, tuple(children))
+
+
+def _flatten(kind: str, operands: List[Any]) -> Iterator[Tuple[Any, ...]]:
+    """Simplify operands, inlining nested nodes of the same kind."""
+    for operand in operands:
+        child = _simplify(operand)
+        if child[0] == kind:
+            # Operands of a simplified node are already simple and flat
+            yield from child[1]
+        else:
+            yield child
+
+
+def _merge_equalities(children: List[Tuple[Any, ...]]) -> List[Tuple[Any, ...]]:
+    """Merge ``f = a OR f = b OR f in [c]`` into ``f in [a, b, c]``.
+
+    Leaves comparing with ``False`` are kept apart: they test for unset
+    values, which ``in`` does not do consistently across Odoo versions.
+    """
+    merged: Dict[str, List[Any]] = {}
+    for child in children:
+        values = _equality_values(child)
+        if values is not None:
+            merged.setdefault(child[1][0], []).extend(values)
+
+    result = []
+    emitted = set()
+    for child in children:
+        values = _equality_values(child)
+        if values is None:
+            result.append(child)
+            continue
+
+        field = child[1][0]
+        if field in emitted:
+            continue
+        emitted.add(field)
+
+        field_values = _unique(tuple(merged[field]))
+        if len(field_values) == len(values):
+            result.append(child)
+        else:
+            result.append((_LEAF, (field, "in", field_values)))
+    return result
+
+
+def _intersect_ids(
+    children: List[Tuple[Any, ...]],
+) -> Optional[List[Tuple[Any, ...]]]:
+    """Merge ``id in A AND id in B`` into one ``id in`` leaf.
+
+    Only ``id`` is merged: for x2many fields, ``in`` means "contains any
+    of" and two such conditions are not equivalent to their intersection.
+
+    Returns:
+        The simplified operands, or None if no id can match
+    """
+    ids: Optional[Tuple[Any, ...]] = None
+    position = None
+    conditions = 0
+    for index, child in enumerate(children):
+        if child[0] != _LEAF or child[1][0] != "id":
+            continue
+        values = _equality_values(child)
+        if values is None:
+            continue
+
+        conditions += 1
+        if ids is None:
+            ids, position = values, index
+        else:
+            allowed = {_key(value) for value in values}
+            ids = tuple(value for value in ids if _key(value) in allowed)
+
+    if conditions < 2:
+        return children
+    if not ids:
+        return None
+
+    result = []
+    for index, child in enumerate(children):
+        if index == position:
+            result.append((_LEAF, ("id", "in", ids)))
+        elif not _is_id_equality(child):
+            result.append(child)
+    return result
+
+
+def _is_id_equality(child: Tuple[Any, ...]) -> bool:
+    return (
+        child[0] == _LEAF
+        and child[1][0] == "id"
+        and _equality_values(child) is not None
+    )
+
+
+def _equality_values(child: Tuple[Any, ...]) -> Optional[Tuple[Any, ...]]:
+    """Get the values of an ``=`` or ``in`` leaf, or None if not mergeable."""
+    if child[0] != _LEAF:
+        return None
+
+    _, operator, value = child[1]
+    if operator == "=":
+        values = (value,)
+    elif operator == "in" and isinstance(value, tuple):
+        values = value
+    else:
+        return None
+
+    for item in values:
+        if item is False or item is None or isinstance(item, tuple):
+            return None
+        try:
+            hash(item)
+        except TypeError:
+            return None
+    return values
+
+
+def _unique(values: Tuple[Any, ...]) -> Tuple[Any, ...]:
+    """Remove repeated values, keeping the first occurrences."""
+    unique: Dict[Any, Any] = {}
+    try:
+        for value in values:
+            unique.setdefault(_key(value), value)
+    except TypeError:
+        return values
+    return tuple(unique.values())
+
+
+def _emit(node: Tuple[Any, ...], output: List[Any], top: bool = False) -> None:
+    """Write a tree back in prefix notation.
+
+    Top-level AND operands are written without operators, relying on the
+    implicit AND of Odoo domains.
+    """
+    kind = node[0]
+    if node is _TRUE:
+        output.append(TRUE_LEAF)
+    elif node is _FALSE:
+        output.append(FALSE_LEAF)
+    elif kind == _LEAF:
+        output.append(node[1])
+    elif kind == _NOT:
+        output.append(_NOT)
+        _emit(node[1], output)
+    else:
+        children = node[1]
+        if not (top and kind == _AND):
+            output.extend([kind] * (len(children) - 1))
+        for child in children:
+            _emit(child, output)
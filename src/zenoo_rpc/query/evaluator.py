@@ -0,0 +1,290 @@
+"""
+Client-side evaluation of Odoo domains.
+
+This module runs Odoo domains (lists, ``Q`` objects or expressions)
+against records already held in memory: ``search_read`` dictionaries or a
+columnar RecordSet. Conditions are evaluated one column at a time over the
+positions still in play, so ``&`` only tests the records that passed the
+previous operands and ``|`` only those that did not match yet.
+
+Comparisons follow Odoo semantics: ``False`` means unset, many2one fields
+compare by related id (``ilike`` matches the display name), x2many fields
+match when any related id matches, and negative operators (``!=``,
+``not in``, ``not ilike``) also match unset values.
+
+Example:
+    >>> records = [
+    ...     {"id": 1, "name": "Acme", "country_id": [75, "France"]},
+    ...     {"id": 2, "name": "Globex", "country_id": False},
+    ... ]
+    >>> filtered_domain(records, [("country_id", "in", [75, 76])])
+    [{'id': 1, 'name': 'Acme', 'country_id': [75, 'France']}]
+"""
+
+import re
+from datetime import date, datetime
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from .domain import _AND, _FALSE, _LEAF, _NOT, _OR, _TRUE, _simplified_tree
+
+_LIKE_OPERATORS = ("like", "not like", "ilike", "not ilike", "=like", "=ilike")
+_NEGATIVE_OPERATORS = {
+    "!=": "=",
+    "not in": "in",
+    "not like": "like",
+    "not ilike": "ilike",
+}
+_COMPARISONS = {
+    "<": lambda a, b: a < b,
+    "<=": lambda a, b: a <= b,
+    ">": lambda a, b: a > b,
+    ">=": lambda a, b: a >= b,
+}
+
+
+class _Column:
+    """Values of one field, normalized for comparisons.
+
+    Unset values (``False`` or None) become None, many2one pairs their
+    related id and x2many id lists frozensets.
+    """
+
+    def __init__(self, name: str, values: Sequence[Any]):
+        self.name = name
+        self.kind = "scalar"
+        self.values = values
+        self.keys: List[Any] = []
+
+        for value in values:
+            if value is None or value is False:
+                self.keys.append(None)
+            elif isinstance(value, (list, tuple)):
+                if _is_many2one_pair(value):
+                    self.kind = "many2one"
+                    self.keys.append(value[0])
+                else:
+                    self.kind = "x2many"
+                    self.keys.append(frozenset(value))
+            else:
+                self.keys.append(value)
+
+    def texts(self) -> List[Optional[str]]:
+        """Values matched by ``like`` operators."""
+        if self.kind == "x2many":
+            raise ValueError(f"Pattern matching on x2many field '{self.name}'")
+        if self.kind == "many2one":
+            return [value[1] if value else None for value in self.values]
+        return [value if isinstance(value, str) else None for value in self.values]
+
+
+def _is_many2one_pair(value: Any) -> bool:
+    return (
+        len(value) == 2
+        and isinstance(value[0], int)
+        and not isinstance(value[0], bool)
+        and (value[1] is None or isinstance(value[1], str))
+    )
+
+
+def matching_indices(
+    domain: Any, get_values: Callable[[str], Sequence[Any]], length: int
+) -> List[int]:
+    """Get the positions of the records matching a domain.
+
+    Args:
+        domain: Odoo domain, ``Q`` object or expression
+        get_values: Function returning the values of a field for all
+            records, in ``search_read`` format
+        length: Number of records
+
+    Returns:
+        Ascending positions of the matching records
+
+    Raises:
+        ValueError: If the domain uses an unknown field or a condition that
+            cannot be evaluated locally (related paths, ``child_of``, name
+            matching on many2one fields...)
+    """
+    if hasattr(domain, "to_domain"):
+        domain = domain.to_domain()
+
+    columns: Dict[str, _Column] = {}
+
+    def get_column(name: str) -> _Column:
+        column = columns.get(name)
+        if column is None:
+            if "." in name:
+                raise ValueError(f"Related field paths are not supported: {name}")
+            column = columns[name] = _Column(name, get_values(name))
+        return column
+
+    return _select(_simplified_tree(list(domain)), list(range(length)), get_column)
+
+
+def filtered_domain(records: List[Dict[str, Any]], domain: Any) -> List[Dict[str, Any]]:
+    """Select the records matching a domain.
+
+    Args:
+        records: Record dictionaries as returned by ``search_read``
+        domain: Odoo domain, ``Q`` object or expression
+
+    Returns:
+        Matching records, in their original order
+
+    Raises:
+        ValueError: If the domain cannot be evaluated on the records
+    """
+
+    def get_values(name: str) -> List[Any]:
+        try:
+            return [record[name] for record in records]
+        except KeyError:
+            raise ValueError(f"Unknown field: {name}") from None
+
+    return [records[i] for i in matching_indices(domain, get_values, len(records))]
+
+
+def _select(
+    node: Any, candidates: List[int], get_column: Callable[[str], _Column]
+) -> List[int]:
+    """Get the candidates matching a domain tree, in ascending order."""
+    if not candidates or node is _TRUE:
+        return candidates
+    if node is _FALSE:
+        return []
+
+    kind = node[0]
+    if kind == _AND:
+        for child in node[1]:
+            candidates = _select(child, candidates, get_column)
+            if not candidates:
+                break
+        return candidates
+
+    if kind == _OR:
+        matched = set()
+        remaining = candidates
+        for child in node[1]:
+            matched.update(_select(child, remaining, get_column))
+            remaining = [i for i in remaining if i not in matched]
+            if not remaining:
+                break
+        return [i for i in candidates if i in matched]
+
+    if kind == _NOT:
+        excluded = set(_select(node[1], candidates, get_column))
+        return [i for i in candidates if i not in excluded]
+
+    if kind == _LEAF:
+        field, operator, value = node[1]
+        negative = _NEGATIVE_OPERATORS.get(operator)
+        if negative is not None:
+            excluded = set(_select_leaf(get_column(field), negative, value, candidates))
+            return [i for i in candidates if i not in excluded]
+        return _select_leaf(get_column(field), operator, value, candidates)
+
+    raise ValueError(f"Invalid domain node: {node!r}")
+
+
+def _select_leaf(
+    column: _Column, operator: str, value: Any, candidates: List[int]
+) -> List[int]:
+    """Get the candidates matching a positive condition."""
+    if operator in _LIKE_OPERATORS:
+        pattern = _like_pattern(operator, value)
+        texts = column.texts()
+        return [
+            i for i in candidates if texts[i] is not None and pattern.match(texts[i])
+        ]
+
+    keys = column.keys
+    if operator == "=":
+        test = _equality_test(column, value)
+    elif operator == "in":
+        test = _membership_test(column, value)
+    elif operator in _COMPARISONS:
+        test = _comparison_test(column, operator, value)
+    else:
+        raise ValueError(f"Unsupported operator for local evaluation: {operator}")
+
+    return [i for i in candidates if test(keys[i])]
+
+
+def _equality_test(column: _Column, value: Any) -> Callable[[Any], bool]:
+    if value is False or value is None:
+        return lambda key: key is None or key == frozenset()
+    _check_value(column, value)
+    if column.kind == "x2many":
+        return lambda key: key is not None and value in key
+    return lambda key: key is not None and key == value
+
+
+def _membership_test(column: _Column, values: Any) -> Callable[[Any], bool]:
+    if not isinstance(values, (list, tuple, set, frozenset)):
+        values = (values,)
+
+    accepts_unset = any(value is False or value is None for value in values)
+    for value in values:
+        if value is not False and value is not None:
+            _check_value(column, value)
+    try:
+        allowed = frozenset(values) - {False, None}
+    except TypeError as exc:
+        raise ValueError(f"Unhashable values in 'in' condition: {values!r}") from exc
+
+    if column.kind == "x2many":
+        return lambda key: (not allowed.isdisjoint(key) if key else accepts_unset)
+    return lambda key: accepts_unset if key is None else key in allowed
+
+
+def _comparison_test(
+    column: _Column, operator: str, value: Any
+) -> Callable[[Any], bool]:
+    if column.kind == "x2many":
+        raise ValueError(f"Comparison on x2many field '{column.name}'")
+    if value is False or value is None:
+        return lambda key: False
+
+    # Dates and datetimes are returned as strings by the server
+    if isinstance(value, datetime):
+        value = value.strftime("%Y-%m-%d %H:%M:%S")
+    elif isinstance(value, date):
+        value = value.strftime("%Y-%m-%d")
+
+    compare = _COMPARISONS[operator]
+
+    def test(key: Any) -> bool:
+        if key is None:
+            return False
+        try:
+            return compare(key, value)
+        except TypeError:
+            return False
+
+    return test
+
+
+def _check_value(column: _Column, value: Any) -> None:
+    """Reject values whose server-side meaning differs from equality."""
+    if column.kind == "many2one" and isinstance(value, str):
+        raise ValueError(
+            f"Name matching on many2one field '{column.name}' is not supported"
+        )
+
+
+def _like_pattern(operator: str, value: Any) -> "re.Pattern[str]":
+    """Translate a SQL ``LIKE`` pattern into a regular expression.
+
+    ``like``/``ilike`` match the value anywhere in the text, like Odoo
+    wrapping it in ``%``; ``=like``/``=ilike`` use the pattern as given.
+    """
+    pattern = str(value)
+    if operator in ("like", "ilike"):
+        pattern = f"%{pattern}%"
+
+    regex = "".join(
+        ".*" if char == "%" else "." if char == "_" else re.escape(char)
+        for char in pattern
+    )
+    flags = re.IGNORECASE | re.DOTALL if "ilike" in operator else re.DOTALL
+    return re.compile(f"{regex}\\Z", flags)
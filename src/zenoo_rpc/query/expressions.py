@@ -8,6 +8,8 @@ to build complex Odoo domain filters with a fluent interface.
 from typing import Any, List, Union, Tuple
 from abc import ABC, abstractmethod
 
+from .domain import normalize_domain
+
 
 class Expression(ABC):
     """Base class for all query expressions."""
@@ -265,10 +267,11 @@ class OrExpression(LogicalExpression):
         if len(self.expressions) <= 1:
             return self.expressions[0].to_domain() if self.expressions else []
 
-        domain = ["|"]  # OR operator
+        # OR operators, one per additional operand
+        domain = ["|"] * (len(self.expressions) - 1)
         for expr in self.expressions:
             expr_domain = expr.to_domain()
-            domain.extend(expr_domain)
+            domain.extend(normalize_domain(expr_domain))
         return domain
 
 
@@ -281,4 +284,4 @@ class NotExpression(Expression):
     def to_domain(self) -> List[Union[str, Tuple[str, str, Any]]]:
         """Convert to domain with NOT logic."""
         expr_domain = self.expression.to_domain()
-        return ["!"] + expr_domain  # NOT operator
+        return ["!"] + normalize_domain(expr_domain)  # NOT operator
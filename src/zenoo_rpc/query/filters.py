@@ -6,6 +6,7 @@ complex queries with a Django-like interface.
 """
 
 from typing import Any, Dict, List, Union, Tuple
+from .domain import normalize_domain
 from .expressions import Expression, Field
 
 
@@ -214,19 +215,19 @@ class Q:
             child_domains = []
             for child in self.children:
                 child_domain = child.to_domain()
-                child_domains.append(child_domain)
+                if child_domain:
+                    child_domains.append(child_domain)
 
             # Combine child domains based on connector
             if len(child_domains) == 1:
                 domain.extend(child_domains[0])
             elif len(child_domains) > 1:
                 if self.connector == "OR":
-                    # Add OR operators between domains
-                    combined_domain = []
-                    for i, child_domain in enumerate(child_domains):
-                        if i > 0:
-                            combined_domain.append("|")
-                        combined_domain.extend(child_domain)
+                    # Prefix notation: one "|" per additional operand, each
+                    # operand being a single expression
+                    combined_domain = ["|"] * (len(child_domains) - 1)
+                    for child_domain in child_domains:
+                        combined_domain.extend(normalize_domain(child_domain))
                     domain.extend(combined_domain)
                 else:  # AND
                     # Just concatenate domains (AND is implicit)
@@ -235,7 +236,7 @@ class Q:
 
         # Apply negation if needed
         if self.negated and domain:
-            domain = ["!"] + domain
+            domain = ["!"] + normalize_domain(domain)
 
         return domain
 
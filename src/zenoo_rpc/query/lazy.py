@@ -6,10 +6,27 @@ including lazy collections and deferred loading strategies.
 """
 
 import asyncio
-from typing import Any, Dict, List, Optional, Type, TypeVar, Union, AsyncIterator
+from typing import (
+    Any,
+    AsyncIterator,
+    Dict,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+)
 from collections.abc import AsyncIterable
 from weakref import WeakKeyDictionary
 
+from pydantic import ValidationError as PydanticValidationError
+
+from ..models.fields import RelationshipDescriptor
+from ..models.registry import get_model_class, get_registry
+from ..models.relationships import LazyRelationship
+
 T = TypeVar("T")
 
 
@@ -245,102 +262,356 @@ class PrefetchManager:
 
     This class helps optimize data loading by prefetching related
     data in batches to reduce the number of database queries.
+
+    Related records are grouped by (comodel, field set) so that every
+    group costs a single ``read`` call per chunk of ids, no matter how
+    many parent records or relationship fields point at it. Loaded
+    records are attached to their parents, so awaiting the relationship
+    afterwards does not hit the server. Nested paths such as
+    ``order_line.product_id`` are resolved level by level.
+
+    Example:
+        >>> manager = PrefetchManager(client)
+        >>> await manager.prefetch_related(
+        ...     orders, "partner_id", "order_line.product_id"
+        ... )
+        >>> partner = await orders[0].partner_id  # No RPC
     """
 
-    def __init__(self, client: Any):
+    # Attributes of OdooModel that are not Odoo fields
+    _NON_ODOO_FIELDS = frozenset({"client", "loaded_fields", "relationship_manager"})
+
+    def __init__(self, client: Any, validate: bool = False):
         """Initialize the prefetch manager.
 
         Args:
             client: OdooFlow client for data operations
+            validate: Whether to validate loaded records with Pydantic
         """
         self.client = client
+        self.validate = validate
         self._prefetch_cache: WeakKeyDictionary = WeakKeyDictionary()
 
     async def prefetch_related(
-        self, instances: List[Any], *field_names: str, batch_size: int = 100
+        self,
+        instances: List[Any],
+        *field_names: str,
+        batch_size: int = 1000,
+        context: Optional[Dict[str, Any]] = None,
     ) -> None:
         """Prefetch related fields for a list of instances.
 
         Args:
             instances: List of model instances
-            *field_names: Names of related fields to prefetch
-            batch_size: Number of instances to process in each batch
+            *field_names: Names of related fields to prefetch, optionally
+                dotted to follow nested relationships
+            batch_size: Maximum number of ids per read call
+            context: Optional context for the read calls
         """
         if not instances or not field_names:
             return
 
+        # Split paths into the field to load now and the nested remainder
+        paths: Dict[str, List[str]] = {}
+        for path in field_names:
+            head, _, rest = path.partition(".")
+            nested = paths.setdefault(head, [])
+            if rest:
+                nested.append(rest)
+
         # Group instances by model type
         model_groups: Dict[Type, List[Any]] = {}
         for instance in instances:
-            model_class = type(instance)
-            if model_class not in model_groups:
-                model_groups[model_class] = []
-            model_groups[model_class].append(instance)
-
-        # Process each model group
-        for model_class, model_instances in model_groups.items():
-            await self._prefetch_for_model(
-                model_class, model_instances, field_names, batch_size
+            model_groups.setdefault(type(instance), []).append(instance)
+
+        # Collect links and the ids required per (comodel, field set)
+        links: List[Tuple[Any, str, str, bool, List[int], Tuple]] = []
+        groups: Dict[Tuple[str, Tuple[str, ...]], Set[int]] = {}
+
+        for field_name, nested in paths.items():
+            for model_class, model_instances in model_groups.items():
+                relation = await self._resolve_relation(model_class, field_name)
+                if relation is None:
+                    continue
+
+                comodel, is_collection = relation
+                group_key = (comodel, await self._get_read_fields(comodel, nested))
+                group_ids = groups.setdefault(group_key, set())
+
+                for instance in model_instances:
+                    ids = self._get_related_ids(instance, field_name)
+                    group_ids.update(ids)
+                    links.append(
+                        (instance, field_name, comodel, is_collection, ids, group_key)
+                    )
+
+        # One read per (comodel, field set), chunked by batch size
+        loaded: Dict[Tuple[str, Tuple[str, ...]], Dict[int, Any]] = {}
+        for group_key, ids in groups.items():
+            comodel, read_fields = group_key
+            loaded[group_key] = await self._load_records(
+                comodel, sorted(ids), list(read_fields), batch_size, context
             )
 
-    async def _prefetch_for_model(
-        self,
-        model_class: Type,
-        instances: List[Any],
-        field_names: List[str],
-        batch_size: int,
-    ) -> None:
-        """Prefetch fields for instances of a specific model.
+        # Attach loaded records to their parents
+        children: Dict[str, Dict[int, Any]] = {}
+        for instance, field_name, comodel, is_collection, ids, group_key in links:
+            records = loaded.get(group_key, {})
+            related = [records[rid] for rid in ids if rid in records]
+            self._attach(instance, field_name, comodel, is_collection, ids, related)
+
+            field_children = children.setdefault(field_name, {})
+            for child in related:
+                if not isinstance(child, dict):
+                    field_children[id(child)] = child
+
+        # Resolve nested paths on the freshly loaded records
+        for field_name, nested in paths.items():
+            nested_instances = list(children.get(field_name, {}).values())
+            if nested and nested_instances:
+                await self.prefetch_related(
+                    nested_instances, *nested, batch_size=batch_size, context=context
+                )
+
+    async def _resolve_relation(
+        self, model_class: Type, field_name: str
+    ) -> Optional[Tuple[str, bool]]:
+        """Resolve the comodel of a relationship field.
+
+        Args:
+            model_class: The model class owning the field
+            field_name: Name of the relationship field
+
+        Returns:
+            Tuple of (comodel name, is collection), or None if the field is
+            not a relationship
+        """
+        descriptor = getattr(model_class, field_name, None)
+        if isinstance(descriptor, RelationshipDescriptor):
+            return descriptor.comodel_name, descriptor.is_collection
+
+        # Fall back to the server field definitions
+        get_odoo_name = getattr(model_class, "get_odoo_name", None)
+        if get_odoo_name is None:
+            return None
+
+        field_definitions = await self._get_field_definitions(get_odoo_name())
+        field_def = field_definitions.get(field_name) or {}
+        field_type = field_def.get("type")
+        if field_type in ("many2one", "one2many", "many2many") and field_def.get(
+            "relation"
+        ):
+            return field_def["relation"], field_type != "many2one"
+
+        return None
+
+    async def _get_read_fields(
+        self, comodel: str, nested: List[str]
+    ) -> Tuple[str, ...]:
+        """Determine the fields to read for a comodel.
+
+        Registered model classes read their declared fields (restricted to
+        the fields known by the server when available), other models read
+        a minimal set. Fields needed by nested paths are always included.
+
+        Args:
+            comodel: Name of the related Odoo model
+            nested: Remaining nested paths to resolve on the comodel
+
+        Returns:
+            Tuple of field names
+        """
+        model_class = get_model_class(comodel)
+        if model_class is not None:
+            fields = await self._get_declared_fields(model_class)
+        else:
+            fields = ["id", "name", "display_name"]
+
+        for path in nested:
+            fields.append(path.partition(".")[0])
+
+        if "id" not in fields:
+            fields.insert(0, "id")
+
+        return tuple(dict.fromkeys(fields))
+
+    async def _get_declared_fields(self, model_class: Type) -> List[str]:
+        """Get the Odoo fields declared on a model class.
+
+        Declared fields unknown to the server are dropped when the server
+        field definitions are available.
 
         Args:
             model_class: The model class
-            instances: List of instances of this model
-            field_names: Field names to prefetch
-            batch_size: Batch size for processing
+
+        Returns:
+            List of field names
         """
-        # Process in batches
-        for i in range(0, len(instances), batch_size):
-            batch = instances[i : i + batch_size]
+        fields = [
+            name
+            for name in model_class.model_fields
+            if name not in self._NON_ODOO_FIELDS
+        ]
+        field_definitions = await self._get_field_definitions(
+            model_class.get_odoo_name()
+        )
+        if field_definitions:
+            fields = [
+                name for name in fields if name == "id" or name in field_definitions
+            ]
+        return fields
+
+    async def _get_field_definitions(self, model_name: str) -> Dict[str, Any]:
+        """Get server field definitions from the registry cache.
 
-            # Get relationship fields info
-            relationship_fields = model_class.get_relationship_fields()
+        Args:
+            model_name: Name of the Odoo model
 
-            for field_name in field_names:
-                if field_name in relationship_fields:
-                    await self._prefetch_relationship_field(
-                        batch, field_name, relationship_fields[field_name]
-                    )
+        Returns:
+            Dictionary of field definitions, empty if unavailable
+        """
+        field_definitions = await get_registry()._get_field_definitions(
+            model_name, self.client
+        )
+        return field_definitions if isinstance(field_definitions, dict) else {}
 
-    async def _prefetch_relationship_field(
-        self, instances: List[Any], field_name: str, field_info: Any
-    ) -> None:
-        """Prefetch a specific relationship field.
+    def _get_related_ids(self, instance: Any, field_name: str) -> List[int]:
+        """Extract related record ids from an instance.
+
+        The raw value is read from the instance dict to bypass the lazy
+        relationship descriptor.
 
         Args:
-            instances: List of instances
+            instance: Model instance
             field_name: Name of the relationship field
-            field_info: Field information from the model
+
+        Returns:
+            List of related ids (empty if the field is not set)
         """
-        # Collect all related IDs
-        related_ids = set()
+        raw_value = getattr(instance, "__dict__", {}).get(field_name)
+
+        if isinstance(raw_value, bool) or not raw_value:
+            return []
+        if isinstance(raw_value, int):
+            return [raw_value]
+        if hasattr(raw_value, "id") and not isinstance(raw_value, (list, tuple)):
+            return [raw_value.id] if raw_value.id else []
+        if isinstance(raw_value, (list, tuple)):
+            # Many2one [id, name] pairs
+            if len(raw_value) == 2 and isinstance(raw_value[1], str):
+                return [raw_value[0]]
+            ids = []
+            for item in raw_value:
+                item_id = item[0] if isinstance(item, (list, tuple)) else item
+                item_id = getattr(item_id, "id", item_id)
+                if isinstance(item_id, int) and not isinstance(item_id, bool):
+                    ids.append(item_id)
+            return ids
+        return []
+
+    async def _load_records(
+        self,
+        comodel: str,
+        ids: List[int],
+        fields: List[str],
+        batch_size: int,
+        context: Optional[Dict[str, Any]],
+    ) -> Dict[int, Any]:
+        """Read related records in chunks and convert them to instances.
 
-        for instance in instances:
-            field_value = getattr(instance, field_name, None)
-            if field_value:
-                if isinstance(field_value, list):
-                    # One2many/Many2many
-                    related_ids.update(field_value)
-                else:
-                    # Many2one
-                    related_ids.add(field_value)
-
-        if not related_ids:
-            return
+        Args:
+            comodel: Name of the related Odoo model
+            ids: Ids to read
+            fields: Fields to read
+            batch_size: Maximum number of ids per read call
+            context: Optional context for the read calls
+
+        Returns:
+            Dictionary mapping ids to model instances (or raw dicts when no
+            model class is registered)
+        """
+        if not ids:
+            return {}
+
+        chunks = [ids[i : i + batch_size] for i in range(0, len(ids), batch_size)]
+        results = await asyncio.gather(
+            *(
+                self.client.read(comodel, chunk, fields, context=context)
+                for chunk in chunks
+            )
+        )
 
-        # Get the related model name from field info
-        # This would need to be implemented based on the field type
-        # For now, this is a placeholder
-        pass
+        model_class = get_model_class(comodel)
+        records: Dict[int, Any] = {}
+        for chunk_records in results:
+            if not isinstance(chunk_records, list):
+                continue
+            for record_data in chunk_records:
+                records[record_data["id"]] = self._create_instance(
+                    model_class, record_data
+                )
+
+        return records
+
+    def _create_instance(
+        self, model_class: Optional[Type], record_data: Dict[str, Any]
+    ) -> Any:
+        """Create a model instance from raw record data.
+
+        Args:
+            model_class: Registered model class, if any
+            record_data: Raw record data from Odoo
+
+        Returns:
+            Model instance, or the raw data if it cannot be converted
+        """
+        if model_class is None:
+            return record_data
+
+        try:
+            return model_class.from_odoo(
+                record_data, client=self.client, validate=self.validate
+            )
+        except (PydanticValidationError, ValueError):
+            return record_data
+
+    def _attach(
+        self,
+        instance: Any,
+        field_name: str,
+        comodel: str,
+        is_collection: bool,
+        ids: List[int],
+        related: List[Any],
+    ) -> None:
+        """Attach loaded records to a parent as a loaded relationship.
+
+        Args:
+            instance: Parent model instance
+            field_name: Name of the relationship field
+            comodel: Name of the related Odoo model
+            is_collection: Whether the relationship is a collection
+            ids: Related ids of the parent
+            related: Loaded related records
+        """
+        relationship = LazyRelationship(
+            parent_record=instance,
+            field_name=field_name,
+            relation_model=comodel,
+            relation_ids=ids if is_collection else (ids[0] if ids else None),
+            client=self.client,
+            is_collection=is_collection,
+        )
+        relationship._loaded_data = (
+            related if is_collection else (related[0] if related else None)
+        )
+        relationship._is_loaded = True
+
+        loaded_relationships = getattr(instance, "_loaded_relationships", None)
+        if loaded_relationships is None:
+            loaded_relationships = {}
+            instance._loaded_relationships = loaded_relationships
+        loaded_relationships[field_name] = relationship
 
     def clear_cache(self) -> None:
         """Clear the prefetch cache."""
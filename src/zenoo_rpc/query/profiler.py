@@ -0,0 +1,417 @@
+"""
+Automatic field projection for QuerySets.
+
+Queries without ``only()`` fetch every field of a model, including
+computed and binary fields that are expensive to compute and transfer.
+The field profiler records which fields the code actually reads on the
+records returned by each call site (source location and model). Once a
+call site has been profiled, its queries only request those fields.
+
+Only records hydrated by a profiled query report their field access.
+Their model class gets a tracking ``__getattribute__`` the first time one
+of its queries is profiled; records keep their class, and records of
+other queries only pay a dictionary lookup. Reading a field that a
+projected query did not fetch raises ``FieldNotLoadedError`` and widens
+the profile, so the next execution fetches it upfront. Attribute access
+cannot await, so such fields are loaded explicitly for the whole result
+set with ``await record.fetch_missing(...)``. Profiling is therefore
+opt-in, per query or per client.
+
+Example:
+    >>> await client.setup_field_profiler(auto_only=True)
+    >>> for _ in range(2):
+    ...     partners = await client.model(ResPartner).filter(
+    ...         is_company=True
+    ...     ).all()
+    ...     names = [p.name for p in partners]
+    >>> # The second execution only requested "id" and "name"
+"""
+
+import sys
+import threading
+from typing import Any, Dict, Iterable, List, Optional, Set, Tuple, Type
+from weakref import WeakKeyDictionary
+
+from ..exceptions import FieldNotLoadedError
+from ..models.identity_map import IdentityMap
+
+CallSite = Tuple[str, str, int]
+
+# Original __getattribute__ of the model classes reporting field access
+_TRACKED_CLASSES: "WeakKeyDictionary[type, Any]" = WeakKeyDictionary()
+_TRACKED_CLASSES_LOCK = threading.Lock()
+
+
+class FieldProfile:
+    """Fields read on the records returned by one call site."""
+
+    __slots__ = ("fields", "executions", "misses")
+
+    def __init__(self) -> None:
+        self.fields: Set[str] = set()
+        self.executions = 0
+        self.misses = 0
+
+
+class FieldTracker:
+    """Tracks field access on the records of one query execution.
+
+    The tracker is shared by all records of a result set. It adds the
+    fields read to the profile of the call site and, when the query was
+    projected, rejects fields that were not fetched.
+    """
+
+    __slots__ = (
+        "client",
+        "model_class",
+        "model",
+        "profile",
+        "odoo_fields",
+        "projected",
+        "context",
+    )
+
+    def __init__(
+        self,
+        client: Any,
+        model_class: Type[Any],
+        profile: FieldProfile,
+        odoo_fields: Iterable[str],
+        projected: bool,
+        context: Optional[Dict[str, Any]] = None,
+    ):
+        """Initialize the tracker.
+
+        Args:
+            client: OdooFlow client used to load missing fields
+            model_class: Model class of the query
+            profile: Profile of the call site
+            odoo_fields: Odoo fields of the model class
+            projected: Whether the query only fetched the profiled fields
+            context: Context of the query
+        """
+        self.client = client
+        self.model_class = model_class
+        self.model = model_class.get_odoo_name()
+        self.profile = profile
+        self.odoo_fields = frozenset(odoo_fields)
+        self.projected = projected
+        self.context = context
+
+    def attach(self, instances: List[Any]) -> None:
+        """Track field access on the records of a result set.
+
+        Args:
+            instances: Records hydrated by the profiled query
+        """
+        for model_class in {type(instance) for instance in instances}:
+            track_class(model_class)
+        for instance in instances:
+            instance.__dict__["_field_tracker"] = self
+
+    def record(self, instance: Any, name: str) -> None:
+        """Record the access to an attribute of a record.
+
+        Args:
+            instance: Record whose attribute is read
+            name: Attribute name
+
+        Raises:
+            FieldNotLoadedError: If the field was not fetched
+        """
+        if name not in self.odoo_fields:
+            return
+
+        self.profile.fields.add(name)
+        if self.projected and name not in instance.__dict__["loaded_fields"]:
+            self.profile.misses += 1
+            raise FieldNotLoadedError(
+                f"Field '{name}' of {self.model} was not fetched by this "
+                f"profiled query; load it with "
+                f"await record.fetch_missing('{name}'). Later executions of "
+                f"the query fetch it upfront.",
+                field=name,
+            )
+
+    async def load_missing(self, instance: Any, fields: Iterable[str]) -> None:
+        """Load fields that were not fetched, for the whole result set.
+
+        Values already known to the client's identity map are reused and
+        the other records are read in one call.
+
+        Args:
+            instance: Record whose fields are requested
+            fields: Field names
+        """
+        names = [name for name in fields if name in self.odoo_fields]
+        if not names:
+            return
+        self.profile.fields.update(names)
+        await load_fields(
+            self.client, self.model_class, _result_set(instance), names, self.context
+        )
+
+
+async def load_fields(
+    client: Any,
+    model_class: Type[Any],
+    instances: List[Any],
+    names: List[str],
+    context: Optional[Dict[str, Any]] = None,
+) -> None:
+    """Load fields on records that did not fetch them, in one read.
+
+    Values already known to the client's identity map are reused and the
+    other records are read in one call.
+
+    Args:
+        client: OdooFlow client
+        model_class: Model class of the records
+        instances: Records to complete
+        names: Odoo field names
+        context: Context of the read
+    """
+    pending = [
+        record
+        for record in instances
+        if not record.__dict__["loaded_fields"].issuperset(names)
+    ]
+    ids = [record.__dict__["id"] for record in pending]
+    if not ids:
+        return
+
+    model = model_class.get_odoo_name()
+    identity_map = IdentityMap.for_client(client)
+    found, missing = identity_map.get_many(model, ids, names)
+    if missing:
+        generation = identity_map.generation(model)
+        records = await client.execute_kw(
+            model, "read", [missing], {"fields": names}, context=context
+        )
+        for record in records or []:
+            found[record["id"]] = record
+        if not context:
+            identity_map.put_many(model, records or [], generation)
+
+    converters = model_class._get_value_converters(parse=True)
+    for record in pending:
+        state = record.__dict__
+        values = found.get(state["id"])
+        if values is None:
+            # Deleted or inaccessible records keep their default value
+            continue
+
+        for name in names:
+            if name not in values:
+                continue
+            converter = converters.get(name)
+            value = values[name]
+            state[name] = value if converter is None else converter(value)
+            state["loaded_fields"].add(name)
+            state.get("_loaded_relationships", {}).pop(name, None)
+
+
+def track_class(model_class: Type[Any]) -> None:
+    """Make a model class report the field access of tracked records.
+
+    Installs a ``__getattribute__`` that reports public attribute access
+    to the tracker stored in the ``_field_tracker`` attribute of a record.
+    Records without a tracker only pay the lookup of that attribute.
+
+    Args:
+        model_class: Model class
+    """
+    if model_class in _TRACKED_CLASSES:
+        return
+
+    with _TRACKED_CLASSES_LOCK:
+        if model_class in _TRACKED_CLASSES:
+            return
+
+        original = model_class.__getattribute__
+        _TRACKED_CLASSES[model_class] = original
+        if getattr(original, "_tracks_fields", False):
+            # Inherited from a tracked parent class
+            return
+
+        def __getattribute__(self: Any, name: str) -> Any:
+            if name[0] != "_":
+                tracker = object.__getattribute__(self, "__dict__").get(
+                    "_field_tracker"
+                )
+                if tracker is not None:
+                    tracker.record(self, name)
+            return original(self, name)
+
+        __getattribute__._tracks_fields = True
+        model_class.__getattribute__ = __getattribute__
+
+
+def _result_set(instance: Any) -> List[Any]:
+    """Get the live records of the result set of a record."""
+    group = instance.__dict__.get("_prefetch_group")
+    if not isinstance(group, list):
+        return [instance]
+
+    records = [record for record in (ref() for ref in group) if record is not None]
+    return records or [instance]
+
+
+class FieldProfiler:
+    """Per-call-site profiles of the fields read on query results.
+
+    Profiling is opt-in: queries use it when ``QuerySet.auto_only()`` is
+    called, or for all queries of a client configured with
+    ``client.setup_field_profiler(auto_only=True)``.
+
+    Example:
+        >>> profiler = FieldProfiler.for_client(client)
+        >>> partners = await client.model(ResPartner).auto_only().all()
+        >>> profiler.get_stats()["call_sites"]
+        1
+    """
+
+    def __init__(self, auto_only: bool = False, warmup: int = 1):
+        """Initialize the profiler.
+
+        Args:
+            auto_only: Whether queries are profiled by default
+            warmup: Number of executions of a call site that fetch all
+                fields before its queries are projected
+        """
+        if warmup < 1:
+            raise ValueError("warmup must be at least 1")
+
+        self.auto_only = auto_only
+        self.warmup = warmup
+        self._profiles: Dict[CallSite, FieldProfile] = {}
+        self._lock = threading.Lock()
+
+    @classmethod
+    def for_client(cls, client: Any) -> "FieldProfiler":
+        """Get the field profiler of a client, creating it if needed.
+
+        Args:
+            client: OdooFlow client
+
+        Returns:
+            FieldProfiler instance
+        """
+        client_state = getattr(client, "__dict__", None)
+        if client_state is None:
+            return cls()
+
+        profiler = client_state.get("field_profiler")
+        if not isinstance(profiler, FieldProfiler):
+            profiler = client_state["field_profiler"] = cls()
+        return profiler
+
+    @classmethod
+    def is_enabled_for(cls, client: Any) -> bool:
+        """Check whether a client profiles queries by default.
+
+        Args:
+            client: OdooFlow client
+
+        Returns:
+            True if the client has a profiler with ``auto_only`` enabled
+        """
+        profiler = getattr(client, "__dict__", {}).get("field_profiler")
+        return isinstance(profiler, FieldProfiler) and profiler.auto_only
+
+    def get_profile(self, model: str, call_site: Tuple[str, int]) -> FieldProfile:
+        """Get the profile of a call site, creating it if needed.
+
+        Args:
+            model: Name of the Odoo model
+            call_site: Source file and line of the query
+
+        Returns:
+            FieldProfile instance
+        """
+        key = (model, *call_site)
+        profile = self._profiles.get(key)
+        if profile is None:
+            with self._lock:
+                profile = self._profiles.setdefault(key, FieldProfile())
+        return profile
+
+    def start(
+        self,
+        model_class: Any,
+        client: Any,
+        call_site: Tuple[str, int],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Tuple[Optional[List[str]], FieldTracker]:
+        """Prepare one execution of a profiled query.
+
+        Args:
+            model_class: Model class of the query
+            client: OdooFlow client
+            call_site: Source file and line of the query
+            context: Context of the query
+
+        Returns:
+            Tuple of the fields to request (None for all fields) and the
+            tracker to attach to the returned records
+        """
+        model = model_class.get_odoo_name()
+        profile = self.get_profile(model, call_site)
+        profile.executions += 1
+
+        odoo_fields = model_class._get_value_converters(parse=True)
+        fields = None
+        if profile.executions > self.warmup:
+            # Required fields are always fetched so records are hydrated
+            # without validation
+            requested = profile.fields | model_class.get_required_fields()
+            fields = sorted(requested & set(odoo_fields))
+
+        tracker = FieldTracker(
+            client,
+            model_class,
+            profile,
+            odoo_fields,
+            projected=fields is not None,
+            context=context,
+        )
+        return fields, tracker
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get profiler statistics.
+
+        Returns:
+            Dictionary with the number of call sites, executions and missed
+            fields, and the profiled fields by call site
+        """
+        profiles = list(self._profiles.items())
+        return {
+            "call_sites": len(profiles),
+            "executions": sum(profile.executions for _, profile in profiles),
+            "misses": sum(profile.misses for _, profile in profiles),
+            "profiles": {
+                f"{model}@{filename}:{lineno}": sorted(profile.fields)
+                for (model, filename, lineno), profile in profiles
+            },
+        }
+
+    def reset(self) -> None:
+        """Forget all profiles."""
+        with self._lock:
+            self._profiles.clear()
+
+
+def find_call_site() -> Tuple[str, int]:
+    """Get the source location of the code calling into the library.
+
+    Returns:
+        Tuple of the file name and line number of the first frame outside
+        the ``zenoo_rpc`` package
+    """
+    frame = sys._getframe(1)
+    while frame is not None:
+        module = frame.f_globals.get("__name__", "")
+        if module != "zenoo_rpc" and not module.startswith("zenoo_rpc."):
+            return frame.f_code.co_filename, frame.f_lineno
+        frame = frame.f_back
+    return "<unknown>", 0
@@ -0,0 +1,716 @@
+"""
+Compact columnar container for large query results.
+
+This module provides RecordSet, which stores query results column by column
+in compact arrays instead of one model instance per record, with lightweight
+row views and client-side filtering and sorting over whole columns.
+"""
+
+import sys
+from array import array
+from typing import Any, Callable, Dict, Iterable, Iterator, List, Optional, Union
+
+# Column kinds by Odoo field type
+_KINDS_BY_ODOO_TYPE = {
+    "integer": "int",
+    "float": "float",
+    "monetary": "float",
+    "boolean": "bool",
+    "char": "str",
+    "text": "str",
+    "html": "str",
+    "date": "str",
+    "datetime": "str",
+    "selection": "selection",
+    "many2one": "many2one",
+}
+
+
+class _ColumnTypeError(TypeError):
+    """Raised when a value does not fit the storage of a column."""
+
+
+class _ObjectColumn:
+    """Column storing arbitrary Python values (Odoo ``False`` as None)."""
+
+    kind = "object"
+
+    def __init__(self) -> None:
+        self.values: List[Any] = []
+
+    def __len__(self) -> int:
+        return len(self.values)
+
+    def append(self, value: Any) -> None:
+        self.values.append(None if value is False else value)
+
+    def get(self, index: int) -> Any:
+        return self.values[index]
+
+    def to_list(self) -> List[Any]:
+        return list(self.values)
+
+    def keys(self) -> List[Any]:
+        """Values used for comparisons and sorting."""
+        return self.values
+
+    def take(self, indices: Iterable[int]) -> "_ObjectColumn":
+        column = self._empty()
+        values = self.values
+        column.values = [values[i] for i in indices]
+        return column
+
+    def nbytes(self) -> int:
+        return sys.getsizeof(self.values) + sum(
+            sys.getsizeof(v) for v in self.values if v is not None
+        )
+
+    def _empty(self) -> "_ObjectColumn":
+        return type(self)()
+
+
+class _StrColumn(_ObjectColumn):
+    """Column of strings."""
+
+    kind = "str"
+
+    def append(self, value: Any) -> None:
+        if value is not False and value is not None and not isinstance(value, str):
+            raise _ColumnTypeError(value)
+        self.values.append(None if value is False else value)
+
+
+class _ArrayColumn:
+    """Column of numbers or booleans backed by an ``array`` and a null mask."""
+
+    def __init__(self, kind: str) -> None:
+        self.kind = kind
+        self.data = array({"int": "q", "float": "d", "bool": "b"}[kind])
+        self.mask = bytearray()
+
+    def __len__(self) -> int:
+        return len(self.data)
+
+    def append(self, value: Any) -> None:
+        if value is None or (value is False and self.kind != "bool"):
+            self.data.append(0)
+            self.mask.append(1)
+            return
+
+        if self.kind == "bool":
+            if not isinstance(value, bool):
+                raise _ColumnTypeError(value)
+        elif self.kind == "int":
+            if isinstance(value, bool) or not isinstance(value, int):
+                raise _ColumnTypeError(value)
+        elif isinstance(value, bool) or not isinstance(value, (int, float)):
+            raise _ColumnTypeError(value)
+
+        try:
+            self.data.append(value)
+        except OverflowError as e:
+            raise _ColumnTypeError(value) from e
+        self.mask.append(0)
+
+    def get(self, index: int) -> Any:
+        if self.mask[index]:
+            return None
+        value = self.data[index]
+        return bool(value) if self.kind == "bool" else value
+
+    def to_list(self) -> List[Any]:
+        return self.keys()
+
+    def keys(self) -> List[Any]:
+        convert = bool if self.kind == "bool" else None
+        if not any(self.mask):
+            return [convert(v) for v in self.data] if convert else self.data.tolist()
+        return [
+            None if null else (convert(v) if convert else v)
+            for v, null in zip(self.data, self.mask)
+        ]
+
+    def take(self, indices: Iterable[int]) -> "_ArrayColumn":
+        column = _ArrayColumn(self.kind)
+        data, mask = self.data, self.mask
+        indices = list(indices)
+        column.data = array(data.typecode, [data[i] for i in indices])
+        column.mask = bytearray(mask[i] for i in indices)
+        return column
+
+    def nbytes(self) -> int:
+        return self.data.itemsize * len(self.data) + len(self.mask)
+
+
+class _SelectionColumn:
+    """Dictionary-encoded column for low-cardinality strings.
+
+    Each distinct string is stored once; rows hold integer codes.
+    """
+
+    kind = "selection"
+
+    def __init__(self) -> None:
+        self.codes = array("i")
+        self.categories: List[str] = []
+        self._index: Dict[str, int] = {}
+
+    def __len__(self) -> int:
+        return len(self.codes)
+
+    def append(self, value: Any) -> None:
+        if value is False or value is None:
+            self.codes.append(-1)
+            return
+        if not isinstance(value, str):
+            raise _ColumnTypeError(value)
+
+        code = self._index.get(value)
+        if code is None:
+            code = self._index[value] = len(self.categories)
+            self.categories.append(sys.intern(value))
+        self.codes.append(code)
+
+    def get(self, index: int) -> Any:
+        code = self.codes[index]
+        return None if code < 0 else self.categories[code]
+
+    def to_list(self) -> List[Any]:
+        return self.keys()
+
+    def keys(self) -> List[Any]:
+        categories = self.categories
+        return [None if code < 0 else categories[code] for code in self.codes]
+
+    def code(self, value: Any) -> Optional[int]:
+        """Get the code of a value, or None if it does not occur."""
+        return self._index.get(value)
+
+    def take(self, indices: Iterable[int]) -> "_SelectionColumn":
+        # Copy the categories, since appending to either column extends them
+        column = _SelectionColumn()
+        column.categories = list(self.categories)
+        column._index = dict(self._index)
+        codes = self.codes
+        column.codes = array("i", [codes[i] for i in indices])
+        return column
+
+    def nbytes(self) -> int:
+        return self.codes.itemsize * len(self.codes) + sum(
+            sys.getsizeof(c) for c in self.categories
+        )
+
+
+class _Many2oneColumn:
+    """Column of many2one ``[id, name]`` pairs.
+
+    Ids are kept in an ``array`` and display names are interned, since the
+    same related record usually appears on many rows.
+    """
+
+    kind = "many2one"
+
+    def __init__(self) -> None:
+        self.ids = array("q")
+        self.mask = bytearray()
+        self.names: List[Optional[str]] = []
+
+    def __len__(self) -> int:
+        return len(self.ids)
+
+    def append(self, value: Any) -> None:
+        if value is False or value is None:
+            self.ids.append(0)
+            self.mask.append(1)
+            self.names.append(None)
+            return
+
+        if isinstance(value, int) and not isinstance(value, bool):
+            record_id, name = value, None
+        elif (
+            isinstance(value, (list, tuple))
+            and len(value) == 2
+            and isinstance(value[0], int)
+            and isinstance(value[1], str)
+        ):
+            record_id, name = value[0], sys.intern(value[1])
+        else:
+            raise _ColumnTypeError(value)
+
+        self.ids.append(record_id)
+        self.mask.append(0)
+        self.names.append(name)
+
+    def get(self, index: int) -> Any:
+        if self.mask[index]:
+            return None
+        return (self.ids[index], self.names[index])
+
+    def to_list(self) -> List[Any]:
+        return [self.get(i) for i in range(len(self.ids))]
+
+    def keys(self) -> List[Any]:
+        """Related ids, as compared by Odoo domains."""
+        return [None if null else v for v, null in zip(self.ids, self.mask)]
+
+    def take(self, indices: Iterable[int]) -> "_Many2oneColumn":
+        column = _Many2oneColumn()
+        indices = list(indices)
+        column.ids = array("q", [self.ids[i] for i in indices])
+        column.mask = bytearray(self.mask[i] for i in indices)
+        column.names = [self.names[i] for i in indices]
+        return column
+
+    def nbytes(self) -> int:
+        return (
+            self.ids.itemsize * len(self.ids)
+            + len(self.mask)
+            + sys.getsizeof(self.names)
+        )
+
+
+class _PendingColumn(_ObjectColumn):
+    """Column whose kind is not known yet because all values were empty.
+
+    Odoo returns ``False`` both for empty values and for false booleans,
+    so values are kept as returned until the first other value shows
+    whether ``False`` meant null.
+    """
+
+    kind = "pending"
+
+    def append(self, value: Any) -> None:
+        if value is not None and value is not False:
+            raise _ColumnTypeError(value)
+        self.values.append(value)
+
+    def get(self, index: int) -> Any:
+        return self.values[index]
+
+    def keys(self) -> List[Any]:
+        return self.values
+
+
+def _make_column(kind: str) -> Any:
+    """Create an empty column of a kind."""
+    if kind in ("int", "float", "bool"):
+        return _ArrayColumn(kind)
+    if kind == "selection":
+        return _SelectionColumn()
+    if kind == "many2one":
+        return _Many2oneColumn()
+    if kind == "str":
+        return _StrColumn()
+    return _ObjectColumn()
+
+
+def _infer_kind(value: Any) -> Optional[str]:
+    """Infer the column kind of a value, or None if it is undecided."""
+    if value is None or value is False:
+        return None
+    if isinstance(value, bool):
+        return "bool"
+    if isinstance(value, int):
+        return "int"
+    if isinstance(value, float):
+        return "float"
+    if isinstance(value, str):
+        return "str"
+    if (
+        isinstance(value, list)
+        and len(value) == 2
+        and isinstance(value[0], int)
+        and isinstance(value[1], str)
+    ):
+        return "many2one"
+    return "object"
+
+
+class Row:
+    """Lightweight view of one record of a RecordSet.
+
+    Values are read from the columns on access. Many2one values are
+    ``(id, name)`` tuples and Odoo ``False`` values are None, except in
+    boolean columns.
+
+    Example:
+        >>> row = recordset[0]
+        >>> row.name, row["list_price"]
+        ('Desk', 120.0)
+    """
+
+    __slots__ = ("_recordset", "_index")
+
+    def __init__(self, recordset: "RecordSet", index: int):
+        self._recordset = recordset
+        self._index = index
+
+    def __getattr__(self, name: str) -> Any:
+        try:
+            column = self._recordset._columns[name]
+        except KeyError:
+            raise AttributeError(name) from None
+        return column.get(self._index)
+
+    def __getitem__(self, name: str) -> Any:
+        return self._recordset._columns[name].get(self._index)
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Get the values of the row as a dictionary."""
+        return {
+            name: column.get(self._index)
+            for name, column in self._recordset._columns.items()
+        }
+
+    def __eq__(self, other: Any) -> bool:
+        if isinstance(other, Row):
+            return self.to_dict() == other.to_dict()
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return f"Row({self.to_dict()!r})"
+
+
+class RecordSet:
+    """Columnar container for query results.
+
+    Records are stored column by column: integers, floats and booleans in
+    ``array`` buffers with a null mask, selection values dictionary-encoded,
+    many2one pairs as an id array plus interned names, and other values in
+    plain lists. Column kinds come from the server field types when known,
+    otherwise they are inferred from the values, falling back to plain lists
+    for mixed values.
+
+    Rows are only materialized as ``Row`` views on access. ``filter`` and
+    ``order_by`` work on whole columns and return new RecordSets.
+
+    Example:
+        >>> products = await client.model(ProductProduct).as_recordset()
+        >>> cheap = products.filter(list_price__lt=10, active=True)
+        >>> for row in cheap.order_by("-list_price")[:5]:
+        ...     print(row.name, row.list_price)
+    """
+
+    def __init__(
+        self,
+        model_name: str = "",
+        field_types: Optional[Dict[str, str]] = None,
+    ):
+        """Initialize an empty RecordSet.
+
+        Args:
+            model_name: Name of the Odoo model of the records
+            field_types: Optional Odoo field types by field name
+        """
+        self.model_name = model_name
+        self._field_types = field_types or {}
+        self._columns: Dict[str, Any] = {}
+        self._length = 0
+
+    @classmethod
+    def from_records(
+        cls,
+        records: Iterable[Dict[str, Any]],
+        model_name: str = "",
+        field_types: Optional[Dict[str, str]] = None,
+    ) -> "RecordSet":
+        """Create a RecordSet from record dictionaries.
+
+        Args:
+            records: Records as returned by ``search_read``
+            model_name: Name of the Odoo model of the records
+            field_types: Optional Odoo field types by field name
+
+        Returns:
+            RecordSet holding the records
+        """
+        recordset = cls(model_name, field_types)
+        recordset.extend(records)
+        return recordset
+
+    def extend(self, records: Iterable[Dict[str, Any]]) -> None:
+        """Append records to the RecordSet.
+
+        Args:
+            records: Records as returned by ``search_read``
+        """
+        for record in records:
+            for name, value in record.items():
+                column = self._columns.get(name)
+                if column is None:
+                    column = self._add_column(name, value)
+                try:
+                    column.append(value)
+                except _ColumnTypeError:
+                    self._promote(name, value)
+
+            self._length += 1
+
+            # Fields missing from this record are null
+            for column in self._columns.values():
+                if len(column) < self._length:
+                    column.append(None)
+
+    def _add_column(self, name: str, value: Any) -> Any:
+        """Create the column of a field, backfilling earlier rows."""
+        kind = _KINDS_BY_ODOO_TYPE.get(self._field_types.get(name, ""))
+        if kind is None:
+            kind = _infer_kind(value)
+
+        column = _make_column(kind) if kind else _PendingColumn()
+        for _ in range(self._length):
+            column.append(None)
+
+        self._columns[name] = column
+        return column
+
+    def _promote(self, name: str, value: Any) -> None:
+        """Replace a column by one that can store the value."""
+        column = self._columns[name]
+
+        if isinstance(column, _PendingColumn):
+            promoted = _make_column(_infer_kind(value) or "object")
+            for pending in column.values:
+                promoted.append(pending)
+        else:
+            promoted = _ObjectColumn()
+            if isinstance(column, _Many2oneColumn):
+                promoted.values = [
+                    None if pair is None else list(pair) for pair in column.to_list()
+                ]
+            else:
+                promoted.values = column.to_list()
+
+        promoted.append(value)
+        self._columns[name] = promoted
+
+    @property
+    def fields(self) -> List[str]:
+        """Names of the columns."""
+        return list(self._columns)
+
+    @property
+    def ids(self) -> List[int]:
+        """Record ids."""
+        return self.column("id")
+
+    def column(self, name: str) -> List[Any]:
+        """Get the values of a column as a list.
+
+        Args:
+            name: Field name
+
+        Returns:
+            List of values, many2one values as ``(id, name)`` tuples
+        """
+        return self._columns[name].to_list()
+
+    def __len__(self) -> int:
+        return self._length
+
+    def __iter__(self) -> Iterator[Row]:
+        for index in range(self._length):
+            yield Row(self, index)
+
+    def __getitem__(self, key: Union[int, slice]) -> Union[Row, "RecordSet"]:
+        if isinstance(key, slice):
+            return self._take(range(*key.indices(self._length)))
+
+        if key < 0:
+            key += self._length
+        if not 0 <= key < self._length:
+            raise IndexError("RecordSet index out of range")
+        return Row(self, key)
+
+    def to_records(self) -> List[Dict[str, Any]]:
+        """Get all records as dictionaries.
+
+        Returns:
+            List of record dictionaries
+        """
+        columns = [(name, column.to_list()) for name, column in self._columns.items()]
+        return [
+            {name: values[index] for name, values in columns}
+            for index in range(self._length)
+        ]
+
+    def filter(
+        self, predicate: Optional[Callable[[Row], bool]] = None, **lookups: Any
+    ) -> "RecordSet":
+        """Select records matching all conditions.
+
+        Lookups use the QuerySet syntax (``field__lookup=value``) and are
+        evaluated column by column. Many2one fields compare by related id.
+
+        Args:
+            predicate: Optional function called with each Row
+            **lookups: Field lookups such as ``list_price__lt=10``
+
+        Returns:
+            New RecordSet with the matching records
+
+        Raises:
+            ValueError: If a lookup or field is not supported
+
+        Example:
+            >>> recordset.filter(state__in=["sale", "done"], amount_total__gte=100)
+        """
+        selected: List[int] = list(range(self._length))
+
+        for lookup, value in lookups.items():
+            name, _, operator = lookup.partition("__")
+            column = self._columns.get(name)
+            if column is None:
+                raise ValueError(f"Unknown field: {name}")
+
+            keys = self._comparison_keys(column, operator or "exact", value)
+            if keys is None:
+                selected = []
+            else:
+                keys, value_key = keys
+                test = _make_test(operator or "exact", value_key)
+                selected = [i for i in selected if test(keys[i])]
+
+        if predicate is not None:
+            selected = [i for i in selected if predicate(Row(self, i))]
+
+        return self._take(selected)
+
+    def filtered_domain(self, domain: Any) -> "RecordSet":
+        """Select records matching an Odoo domain, without an RPC.
+
+        Args:
+            domain: Odoo domain, ``Q`` object or expression
+
+        Returns:
+            New RecordSet with the matching records
+
+        Raises:
+            ValueError: If the domain cannot be evaluated locally
+
+        Example:
+            >>> french = partners.filtered_domain(
+            ...     ["|", ("country_id", "=", 75), ("name", "ilike", "sarl")]
+            ... )
+        """
+        from .evaluator import matching_indices
+
+        def get_values(name: str) -> List[Any]:
+            if name not in self._columns:
+                raise ValueError(f"Unknown field: {name}")
+            return self.column(name)
+
+        return self._take(matching_indices(domain, get_values, self._length))
+
+    def _comparison_keys(self, column: Any, operator: str, value: Any) -> Any:
+        """Get comparable column values and the matching comparison value.
+
+        Selection columns compare integer codes for equality lookups, which
+        avoids decoding every row. Returns None if no row can match.
+        """
+        if isinstance(column, _SelectionColumn) and operator in ("exact", "in"):
+            if operator == "exact":
+                code = column.code(value)
+                if code is None:
+                    return None if value is not None else (column.codes, -1)
+                return column.codes, code
+
+            codes = {-1 if v is None else column.code(v) for v in value} - {None}
+            return column.codes, codes
+
+        return column.keys(), value
+
+    def order_by(self, *fields: str) -> "RecordSet":
+        """Sort records by one or more fields.
+
+        Prefix a field with ``-`` for descending order. Nulls sort last in
+        ascending and first in descending order, like PostgreSQL.
+
+        Args:
+            *fields: Field names, optionally prefixed with ``-``
+
+        Returns:
+            New sorted RecordSet
+
+        Example:
+            >>> recordset.order_by("-amount_total", "name")
+        """
+        indices = list(range(self._length))
+
+        # Stable sorts applied from the least significant key
+        for spec in reversed(fields):
+            descending = spec.startswith("-")
+            name = spec.lstrip("-")
+            if name not in self._columns:
+                raise ValueError(f"Unknown field: {name}")
+
+            keys = self._columns[name].keys()
+            indices.sort(
+                key=lambda i: (1, 0) if keys[i] is None else (0, keys[i]),
+                reverse=descending,
+            )
+
+        return self._take(indices)
+
+    def _take(self, indices: Iterable[int]) -> "RecordSet":
+        """Create a RecordSet with the records at the given positions."""
+        indices = list(indices)
+        recordset = RecordSet(self.model_name, self._field_types)
+        recordset._columns = {
+            name: column.take(indices) for name, column in self._columns.items()
+        }
+        recordset._length = len(indices)
+        return recordset
+
+    def memory_usage(self) -> int:
+        """Estimate the memory used by the columns in bytes.
+
+        Returns:
+            Approximate number of bytes
+        """
+        return sum(column.nbytes() for column in self._columns.values())
+
+    def __repr__(self) -> str:
+        return f"<RecordSet [{self._length} {self.model_name or 'records'}]>"
+
+
+def _make_test(operator: str, value: Any) -> Callable[[Any], bool]:
+    """Create the test of a lookup against a column value."""
+    if operator == "exact":
+        return lambda v: v == value
+    if operator == "ne":
+        return lambda v: v != value
+    if operator == "in":
+        values = set(value)
+        return lambda v: v in values
+    if operator == "not_in":
+        values = set(value)
+        return lambda v: v not in values
+    if operator == "isnull":
+        return lambda v: (v is None) == bool(value)
+    if operator == "isnotnull":
+        return lambda v: (v is not None) == bool(value)
+    if operator in ("gt", "gte", "lt", "lte"):
+        compare = {
+            "gt": lambda v: v > value,
+            "gte": lambda v: v >= value,
+            "lt": lambda v: v < value,
+            "lte": lambda v: v <= value,
+        }[operator]
+        return lambda v: v is not None and compare(v)
+
+    text = str(value).lower()
+    string_tests = {
+        "iexact": lambda v: v.lower() == text,
+        "contains": lambda v: text in v.lower(),
+        "icontains": lambda v: text in v.lower(),
+        "startswith": lambda v: v.lower().startswith(text),
+        "istartswith": lambda v: v.lower().startswith(text),
+        "endswith": lambda v: v.lower().endswith(text),
+        "iendswith": lambda v: v.lower().endswith(text),
+    }
+    if operator not in string_tests:
+        raise ValueError(f"Unsupported lookup: {operator}")
+
+    string_test = string_tests[operator]
+    return lambda v: isinstance(v, str) and string_test(v)
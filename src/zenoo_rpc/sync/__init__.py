@@ -0,0 +1,49 @@
+"""
+Incremental change-data-capture sync for Zenoo RPC.
+
+This module mirrors Odoo models into pluggable sinks (callbacks, NDJSON
+change logs or a local SQLite database). After the first full load, every
+run only reads records written since the stored ``write_date``/``id``
+watermark, and deletions are detected by periodically diffing id sets.
+``LocalReplica`` builds on it to answer queries on slow-changing models
+from a local SQLite database.
+
+Example:
+    >>> from zenoo_rpc.sync import JsonSyncStateStore, SQLiteSink, SyncEngine
+    >>>
+    >>> engine = SyncEngine(
+    ...     client, SQLiteSink("mirror.db"), JsonSyncStateStore("state.json")
+    ... )
+    >>> engine.track("res.partner", fields=["name", "email", "country_id"])
+    >>> await engine.sync()
+"""
+
+from .engine import SyncEngine, SyncResult, SyncSpec
+from .replica import LocalReplica, domain_to_sql, order_to_sql
+from .sinks import CallbackSink, NdjsonSink, SQLiteSink, SyncSink, table_name
+from .state import (
+    IdBitmap,
+    JsonSyncStateStore,
+    MemorySyncStateStore,
+    SyncState,
+    SyncStateStore,
+)
+
+__all__ = [
+    "SyncEngine",
+    "SyncResult",
+    "SyncSpec",
+    "LocalReplica",
+    "domain_to_sql",
+    "order_to_sql",
+    "SyncSink",
+    "CallbackSink",
+    "NdjsonSink",
+    "SQLiteSink",
+    "table_name",
+    "IdBitmap",
+    "SyncState",
+    "SyncStateStore",
+    "MemorySyncStateStore",
+    "JsonSyncStateStore",
+]
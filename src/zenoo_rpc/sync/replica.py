@@ -0,0 +1,578 @@
+"""
+Local SQLite read replica of slow-changing models.
+
+Registered models are mirrored into a local SQLite database by the
+incremental ``SyncEngine`` and refreshed once they are older than their
+staleness bound. Queries on those models whose domain and ordering can be
+translated to SQL are answered from the replica with ``search_read``-shaped
+results; any other query falls back to the server.
+"""
+
+import asyncio
+import datetime
+import json
+import logging
+import sqlite3
+import time
+from dataclasses import dataclass, field
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+from ..query.columnar import MANY2ONE_NAME_SUFFIX
+from .engine import SyncEngine, SyncResult
+from .sinks import SQLiteSink, table_name
+from .state import JsonSyncStateStore
+
+logger = logging.getLogger(__name__)
+
+_COMPARISONS = {"=", "!=", "<>", "<", "<=", ">", ">="}
+_X2MANY_TYPES = {"one2many", "many2many"}
+
+
+class _Untranslatable(Exception):
+    """Raised when a domain or ordering has no local SQL equivalent."""
+
+
+def _sql_value(value: Any) -> Any:
+    """Convert a domain value into the representation stored by the sink."""
+    if isinstance(value, bool):
+        return int(value)
+    if isinstance(value, datetime.datetime):
+        return value.strftime("%Y-%m-%d %H:%M:%S")
+    if isinstance(value, datetime.date):
+        return value.strftime("%Y-%m-%d")
+    if isinstance(value, (int, float, str)):
+        return value
+    raise _Untranslatable(f"Unsupported value {value!r}")
+
+
+def _escape_like(value: str) -> str:
+    return value.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_")
+
+
+def _translate_leaf(leaf: Sequence[Any], columns: Dict[str, str]) -> Tuple[str, list]:
+    """Translate one ``(field, operator, value)`` condition."""
+    if len(leaf) != 3:
+        raise _Untranslatable(f"Invalid condition {leaf!r}")
+
+    name, operator, value = leaf
+    if (name, operator, value) in ((1, "=", 1), (0, "=", 1)):
+        return ("1 = 1" if name else "1 = 0"), []
+    if not isinstance(name, str) or name not in columns:
+        raise _Untranslatable(f"Unknown field {name!r}")
+
+    field_type = columns[name]
+    if field_type in _X2MANY_TYPES:
+        raise _Untranslatable(f"x2many field {name!r}")
+
+    column = f'"{name}"'
+    operator = operator.lower()
+
+    if operator == "=?":
+        if value is None or value is False:
+            return "1 = 1", []
+        operator = "="
+
+    if operator in ("like", "ilike", "not like", "not ilike", "=ilike"):
+        if not isinstance(value, str) or operator in ("like", "not like"):
+            # SQLite LIKE is case-insensitive, so only ilike maps exactly
+            raise _Untranslatable(f"Unsupported operator {operator!r}")
+        if not value.isascii():
+            # SQLite LIKE only folds the case of ASCII letters
+            raise _Untranslatable(f"Non-ASCII pattern for {operator!r}")
+        if field_type == "many2one":
+            column = f'"{name}{MANY2ONE_NAME_SUFFIX}"'
+        pattern = value if operator == "=ilike" else f"%{_escape_like(value)}%"
+        escape = "" if operator == "=ilike" else " ESCAPE '\\'"
+        if operator == "not ilike":
+            return f"({column} IS NULL OR {column} NOT LIKE ?{escape})", [pattern]
+        return f"{column} LIKE ?{escape}", [pattern]
+
+    if operator in ("in", "not in"):
+        if not isinstance(value, (list, tuple, set)):
+            value = [value]
+        values = [item for item in value if item is not False and item is not None]
+        has_null = len(values) != len(value)
+        params = [_sql_value(item) for item in values]
+        placeholders = ", ".join("?" for _ in params)
+        if operator == "in":
+            parts = [f"{column} IN ({placeholders})"] if params else []
+            if has_null:
+                parts.append(f"{column} IS NULL")
+            return (f"({' OR '.join(parts)})" if parts else "1 = 0"), params
+        parts = [f"{column} IS NOT NULL"] if has_null else []
+        if params:
+            condition = f"{column} NOT IN ({placeholders})"
+            if not has_null:
+                condition = f"({condition} OR {column} IS NULL)"
+            parts.append(condition)
+        return (f"({' AND '.join(parts)})" if parts else "1 = 1"), params
+
+    if operator not in _COMPARISONS:
+        raise _Untranslatable(f"Unsupported operator {operator!r}")
+    if operator == "<>":
+        operator = "!="
+
+    if field_type == "many2one" and isinstance(value, (list, tuple)) and value:
+        value = value[0]
+
+    if value is False or value is None:
+        if operator == "=":
+            if field_type == "boolean":
+                return f"({column} = 0 OR {column} IS NULL)", []
+            return f"{column} IS NULL", []
+        if operator == "!=":
+            if field_type == "boolean":
+                return f"{column} = 1", []
+            return f"{column} IS NOT NULL", []
+        raise _Untranslatable(f"Comparison of {name!r} with False")
+
+    if field_type == "boolean" and operator in ("=", "!="):
+        if (operator == "=") == bool(value):
+            return f"{column} = 1", []
+        return f"({column} = 0 OR {column} IS NULL)", []
+
+    if field_type == "many2one" and isinstance(value, str):
+        raise _Untranslatable(f"Name search on {name!r}")
+
+    if operator == "!=":
+        return f"({column} != ? OR {column} IS NULL)", [_sql_value(value)]
+    return f"{column} {operator} ?", [_sql_value(value)]
+
+
+def domain_to_sql(
+    domain: Sequence[Any], columns: Dict[str, str]
+) -> Optional[Tuple[str, list]]:
+    """Translate an Odoo domain into a SQLite WHERE clause.
+
+    Supports the ``&``, ``|`` and ``!`` operators and conditions on stored
+    columns with comparison, ``in``/``not in``, ``ilike`` variants and
+    ``=?`` operators, with Odoo semantics for ``False`` (NULL) values.
+
+    Args:
+        domain: Odoo domain in prefix notation
+        columns: Mapping of replicated field names to Odoo field types
+
+    Returns:
+        Tuple of the SQL condition and its parameters, or None if the
+        domain cannot be evaluated locally
+
+    Example:
+        >>> domain_to_sql([("code", "in", ["VN", "FR"])], {"code": "char"})
+        ('("code" IN (?, ?))', ['VN', 'FR'])
+    """
+    position = 0
+
+    def parse() -> Tuple[str, list]:
+        nonlocal position
+        if position >= len(domain):
+            raise _Untranslatable("Incomplete domain")
+
+        term = domain[position]
+        position += 1
+        if term in ("&", "|"):
+            left, left_params = parse()
+            right, right_params = parse()
+            operator = "AND" if term == "&" else "OR"
+            return f"({left} {operator} {right})", left_params + right_params
+        if term == "!":
+            condition, params = parse()
+            # A negated condition matches rows where it is NULL, as in Odoo
+            return f"(NOT COALESCE({condition}, 0))", params
+        if isinstance(term, (list, tuple)):
+            return _translate_leaf(term, columns)
+        raise _Untranslatable(f"Invalid domain term {term!r}")
+
+    try:
+        conditions = []
+        params: list = []
+        while position < len(domain):
+            condition, condition_params = parse()
+            conditions.append(condition)
+            params.extend(condition_params)
+    except _Untranslatable as e:
+        logger.debug(f"Domain not evaluated locally: {e}")
+        return None
+
+    if not conditions:
+        return "1 = 1", []
+    return " AND ".join(conditions), params
+
+
+def order_to_sql(order: Optional[str], columns: Dict[str, str]) -> Optional[str]:
+    """Translate an Odoo order specification into a SQLite ORDER BY clause.
+
+    Nulls sort last in ascending and first in descending order, like in
+    PostgreSQL. Only scalar columns can be ordered locally.
+
+    Args:
+        order: Order specification such as ``"name asc, id desc"``
+        columns: Mapping of replicated field names to Odoo field types
+
+    Returns:
+        ORDER BY expression, or None if the ordering needs the server
+    """
+    terms = []
+    for part in (order or "id").split(","):
+        words = part.split()
+        if not words:
+            continue
+        if len(words) > 2 or words[0] not in columns:
+            return None
+
+        name = words[0]
+        if columns[name] in _X2MANY_TYPES or columns[name] == "many2one":
+            return None
+        direction = words[1].upper() if len(words) == 2 else "ASC"
+        if direction not in ("ASC", "DESC"):
+            return None
+
+        nulls = "DESC" if direction == "DESC" else "ASC"
+        terms.append(f'"{name}" IS NULL {nulls}, "{name}" {direction}')
+
+    return ", ".join(terms) if terms else None
+
+
+def _with_active_test(
+    domain: Sequence[Any], columns: Dict[str, str], context: Optional[Dict[str, Any]]
+) -> List[Any]:
+    """Add Odoo's implicit ``active = True`` condition to a domain.
+
+    Archived records are replicated too, so like the server they are only
+    returned when the domain mentions ``active`` or ``active_test`` is off.
+    """
+    domain = list(domain)
+    if "active" not in columns or not (context or {}).get("active_test", True):
+        return domain
+    for term in domain:
+        if isinstance(term, (list, tuple)) and term and term[0] == "active":
+            return domain
+    return domain + [("active", "=", True)]
+
+
+@dataclass
+class _ReplicaModel:
+    """Replication settings and state of one model."""
+
+    fields: Optional[List[str]]
+    max_staleness: float
+    refreshed_at: Optional[float] = None
+    columns: Optional[Dict[str, str]] = None
+    lock: asyncio.Lock = field(default_factory=asyncio.Lock)
+
+
+class LocalReplica:
+    """Local SQLite read replica of slow-changing Odoo models.
+
+    Example:
+        >>> replica = await client.setup_replica(
+        ...     "reference.db",
+        ...     models={"res.country": 3600, "res.currency": 300},
+        ... )
+        >>> # Answered locally, without an RPC call
+        >>> vietnam = await client.model(ResCountry).filter(code="VN").first()
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        path: str,
+        max_staleness: float = 300.0,
+        page_size: int = 1000,
+    ):
+        """Initialize the replica.
+
+        Args:
+            client: ZenooClient used to sync the replica
+            path: Path of the SQLite database file. Sync watermarks are kept
+                next to it in ``<path>.state.json``.
+            max_staleness: Default staleness bound of models in seconds
+            page_size: Number of records fetched per sync RPC call
+        """
+        self.client = client
+        self.path = path
+        self.max_staleness = max_staleness
+        self.sink = SQLiteSink(path)
+        self.engine = SyncEngine(
+            client,
+            self.sink,
+            JsonSyncStateStore(f"{path}.state.json"),
+            page_size=page_size,
+        )
+        self._models: Dict[str, _ReplicaModel] = {}
+        self._connection: Optional[sqlite3.Connection] = None
+
+        # Statistics
+        self.hits = 0
+        self.misses = 0
+        self.refreshes = 0
+
+    def register(
+        self,
+        model: str,
+        fields: Optional[List[str]] = None,
+        max_staleness: Optional[float] = None,
+        deletion_check_every: int = 1,
+    ) -> "LocalReplica":
+        """Replicate a model locally.
+
+        Args:
+            model: Name of the Odoo model
+            fields: Fields to replicate (None replicates all fields)
+            max_staleness: Seconds after which the model is refreshed before
+                it is queried (defaults to the replica setting)
+            deletion_check_every: Check for deleted records every N refreshes
+
+        Returns:
+            The replica, for chaining
+        """
+        self.engine.track(
+            model,
+            fields=fields,
+            context={"active_test": False},
+            deletion_check_every=deletion_check_every,
+        )
+        self._models[model] = _ReplicaModel(
+            fields=list(fields) if fields is not None else None,
+            max_staleness=(
+                self.max_staleness if max_staleness is None else max_staleness
+            ),
+        )
+        return self
+
+    def is_registered(self, model: str) -> bool:
+        """Check whether a model is replicated."""
+        return model in self._models
+
+    def mark_stale(self, model: str) -> None:
+        """Force a refresh of a model before its next local query.
+
+        Args:
+            model: Name of the Odoo model
+        """
+        entry = self._models.get(model)
+        if entry is not None:
+            entry.refreshed_at = None
+
+    async def refresh(
+        self, model: Optional[str] = None, force: bool = False
+    ) -> Dict[str, SyncResult]:
+        """Sync stale models (or all models when forced).
+
+        Args:
+            model: Only refresh this model
+            force: Refresh even if the staleness bound is not reached
+
+        Returns:
+            Dictionary of model names to sync results
+        """
+        models = [model] if model is not None else list(self._models)
+        results = {}
+        for name in models:
+            result = await self._refresh_model(name, force)
+            if result is not None:
+                results[name] = result
+        return results
+
+    async def search_read(
+        self,
+        model: str,
+        domain: Sequence[Any],
+        fields: Optional[Sequence[str]] = None,
+        order: Optional[str] = None,
+        limit: Optional[int] = None,
+        offset: int = 0,
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Optional[List[Dict[str, Any]]]:
+        """Run a ``search_read`` against the replica.
+
+        Records are ordered by id unless an order is given.
+
+        Args:
+            model: Name of the Odoo model
+            domain: Odoo domain
+            fields: Fields to return (None returns all replicated fields)
+            order: Order specification
+            limit: Maximum number of records
+            offset: Number of records to skip
+            context: Query context; only ``active_test`` is supported
+
+        Returns:
+            Records shaped like ``search_read`` results, or None if the query
+            cannot be answered locally
+        """
+        columns = await self._get_columns(model)
+        if columns is None:
+            return self._miss()
+
+        entry = self._models[model]
+        if fields:
+            fields = ["id"] + [name for name in fields if name != "id"]
+            if any(name not in columns for name in fields):
+                return self._miss()
+        elif entry.fields is not None:
+            # Only a subset of the fields is replicated
+            return self._miss()
+        else:
+            fields = list(columns)
+
+        if not self._supports_context(context):
+            return self._miss()
+
+        where = domain_to_sql(_with_active_test(domain, columns, context), columns)
+        order_by = order_to_sql(order, columns)
+        if where is None or order_by is None:
+            return self._miss()
+
+        select = []
+        for name in fields:
+            select.append(f'"{name}"')
+            if columns[name] == "many2one":
+                select.append(f'"{name}{MANY2ONE_NAME_SUFFIX}"')
+
+        condition, params = where
+        sql = (
+            f"SELECT {', '.join(select)} FROM \"{table_name(model)}\" "
+            f"WHERE {condition} ORDER BY {order_by}"
+        )
+        if limit is not None or offset:
+            sql += " LIMIT ? OFFSET ?"
+            params = params + [-1 if limit is None else limit, offset]
+
+        rows = self._execute(sql, params)
+        self.hits += 1
+        return [self._to_record(row, fields, columns) for row in rows]
+
+    async def search_count(
+        self,
+        model: str,
+        domain: Sequence[Any],
+        context: Optional[Dict[str, Any]] = None,
+    ) -> Optional[int]:
+        """Count matching records in the replica.
+
+        Args:
+            model: Name of the Odoo model
+            domain: Odoo domain
+            context: Query context; only ``active_test`` is supported
+
+        Returns:
+            Number of matching records, or None if the domain cannot be
+            evaluated locally
+        """
+        columns = await self._get_columns(model)
+        if columns is None or not self._supports_context(context):
+            return self._miss()
+
+        where = domain_to_sql(_with_active_test(domain, columns, context), columns)
+        if where is None:
+            return self._miss()
+
+        condition, params = where
+        rows = self._execute(
+            f'SELECT COUNT(*) FROM "{table_name(model)}" WHERE {condition}', params
+        )
+        self.hits += 1
+        return rows[0][0]
+
+    def get_stats(self) -> Dict[str, Any]:
+        """Get replica statistics.
+
+        Returns:
+            Dictionary with hit and refresh statistics
+        """
+        total = self.hits + self.misses
+        return {
+            "models": list(self._models),
+            "hits": self.hits,
+            "misses": self.misses,
+            "refreshes": self.refreshes,
+            "hit_rate": self.hits / total if total else 0.0,
+        }
+
+    async def close(self) -> None:
+        """Close the database connections."""
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
+        await self.sink.close()
+
+    async def _refresh_model(self, model: str, force: bool) -> Optional[SyncResult]:
+        """Sync a model if it is stale, once even with concurrent callers."""
+        entry = self._models[model]
+        if not force and self._is_fresh(entry):
+            return None
+
+        async with entry.lock:
+            if not force and self._is_fresh(entry):
+                return None
+            result = await self.engine.sync_model(model)
+            entry.refreshed_at = time.monotonic()
+            entry.columns = None
+            self.refreshes += 1
+            return result
+
+    @staticmethod
+    def _is_fresh(entry: _ReplicaModel) -> bool:
+        return (
+            entry.refreshed_at is not None
+            and time.monotonic() - entry.refreshed_at <= entry.max_staleness
+        )
+
+    async def _get_columns(self, model: str) -> Optional[Dict[str, str]]:
+        """Refresh a model if needed and get its replicated columns."""
+        entry = self._models.get(model)
+        if entry is None:
+            return None
+
+        await self._refresh_model(model, force=False)
+        if entry.columns is None:
+            table_columns = {
+                row[1]
+                for row in self._execute(f'PRAGMA table_info("{table_name(model)}")')
+            }
+            if not table_columns:
+                return None
+
+            field_types = await self.engine._get_field_types(model)
+            field_types["id"] = "integer"
+            entry.columns = {
+                name: field_type
+                for name, field_type in field_types.items()
+                if name in table_columns
+            }
+        return entry.columns
+
+    @staticmethod
+    def _supports_context(context: Optional[Dict[str, Any]]) -> bool:
+        """Check whether a query context does not change the results."""
+        return not context or set(context) <= {"active_test"}
+
+    def _execute(self, sql: str, params: Sequence[Any] = ()) -> List[tuple]:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+        return self._connection.execute(sql, params).fetchall()
+
+    def _miss(self) -> None:
+        self.misses += 1
+        return None
+
+    @staticmethod
+    def _to_record(
+        row: tuple, fields: List[str], columns: Dict[str, str]
+    ) -> Dict[str, Any]:
+        """Convert a replica row back into a ``search_read`` record."""
+        record = {}
+        values = iter(row)
+        for name in fields:
+            value = next(values)
+            field_type = columns[name]
+            if field_type == "many2one":
+                display_name = next(values)
+                record[name] = [value, display_name] if value is not None else False
+            elif field_type == "boolean":
+                record[name] = bool(value)
+            elif field_type in _X2MANY_TYPES:
+                record[name] = json.loads(value) if value else []
+            else:
+                record[name] = value if value is not None else False
+        return record
@@ -0,0 +1,291 @@
+"""
+Destinations of synced records.
+
+A sink receives the records changed since the previous sync as upserts and
+the ids of records that disappeared as deletions. Upserts may be delivered
+more than once (for example after an interrupted run), so sinks must apply
+them idempotently.
+"""
+
+import asyncio
+import inspect
+import json
+import os
+import sqlite3
+from abc import ABC, abstractmethod
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, List, Optional, Sequence
+
+from ..export.writers import _RowFlattener
+
+_SQLITE_TYPES = {
+    "integer": "INTEGER",
+    "many2one": "INTEGER",
+    "boolean": "INTEGER",
+    "float": "REAL",
+    "monetary": "REAL",
+}
+
+
+def table_name(model: str) -> str:
+    """Get the SQLite table name of an Odoo model (``res.partner`` ->
+    ``res_partner``)."""
+    return model.replace(".", "_")
+
+
+class SyncSink(ABC):
+    """Base class of sync destinations."""
+
+    async def prepare(  # noqa: B027
+        self, model: str, field_types: Dict[str, str], fields: Optional[List[str]]
+    ) -> None:
+        """Prepare the sink before records of a model are delivered.
+
+        Optional hook, a no-op by default since most sinks need no setup.
+
+        Args:
+            model: Name of the Odoo model
+            field_types: Mapping of field names to Odoo field types
+            fields: Synced fields (None if all fields are synced)
+        """
+        ...
+
+    @abstractmethod
+    async def upsert(self, model: str, records: List[Dict[str, Any]]) -> None:
+        """Insert or update records.
+
+        Args:
+            model: Name of the Odoo model
+            records: Record dictionaries as returned by ``search_read``
+        """
+
+    @abstractmethod
+    async def delete(self, model: str, ids: List[int]) -> None:
+        """Delete records that no longer exist on the server.
+
+        Args:
+            model: Name of the Odoo model
+            ids: Ids of the deleted records
+        """
+
+    async def close(self) -> None:  # noqa: B027
+        """Release the resources of the sink.
+
+        Optional hook, a no-op by default for sinks that hold no resources.
+        """
+        ...
+
+
+class CallbackSink(SyncSink):
+    """Sink forwarding changes to plain or async callables.
+
+    Example:
+        >>> async def on_upsert(model, records):
+        ...     await warehouse.merge(model, records)
+        >>> sink = CallbackSink(on_upsert, on_delete=warehouse.remove)
+    """
+
+    def __init__(
+        self,
+        on_upsert: Callable[[str, List[Dict[str, Any]]], Any],
+        on_delete: Optional[Callable[[str, List[int]], Any]] = None,
+    ):
+        """Initialize the sink.
+
+        Args:
+            on_upsert: Called with the model name and changed records
+            on_delete: Called with the model name and deleted ids
+        """
+        self.on_upsert = on_upsert
+        self.on_delete = on_delete
+
+    async def upsert(self, model: str, records: List[Dict[str, Any]]) -> None:
+        result = self.on_upsert(model, records)
+        if inspect.isawaitable(result):
+            await result
+
+    async def delete(self, model: str, ids: List[int]) -> None:
+        if self.on_delete is None:
+            return
+        result = self.on_delete(model, ids)
+        if inspect.isawaitable(result):
+            await result
+
+
+class NdjsonSink(SyncSink):
+    """Sink appending change events to one NDJSON file per model.
+
+    Every line is ``{"op": "upsert", "record": {...}}`` or
+    ``{"op": "delete", "id": ...}``, with records flattened like the
+    export formats (many2one ``<field>``/``<field>_name``, ``False`` as
+    null except for booleans).
+    """
+
+    def __init__(self, directory: str):
+        """Initialize the sink.
+
+        Args:
+            directory: Directory of the ``<model>.ndjson`` files
+        """
+        self.directory = directory
+        self._flatteners: Dict[str, _RowFlattener] = {}
+
+    async def prepare(
+        self, model: str, field_types: Dict[str, str], fields: Optional[List[str]]
+    ) -> None:
+        self._flatteners[model] = _RowFlattener(field_types, fields)
+
+    async def upsert(self, model: str, records: List[Dict[str, Any]]) -> None:
+        flattener = self._flatteners.setdefault(model, _RowFlattener({}, None))
+        rows = flattener.rows(records)
+        self._append(
+            model,
+            [
+                {"op": "upsert", "record": dict(zip(flattener.columns, row))}
+                for row in rows
+            ],
+        )
+
+    async def delete(self, model: str, ids: List[int]) -> None:
+        self._append(model, [{"op": "delete", "id": record_id} for record_id in ids])
+
+    def _append(self, model: str, events: List[Dict[str, Any]]) -> None:
+        os.makedirs(self.directory, exist_ok=True)
+        path = os.path.join(self.directory, f"{model}.ndjson")
+        with open(path, "a", encoding="utf-8") as f:
+            f.write(
+                "".join(
+                    json.dumps(event, ensure_ascii=False) + "\n" for event in events
+                )
+            )
+
+
+class SQLiteSink(SyncSink):
+    """Sink mirroring every model into a table of a local SQLite database.
+
+    Tables are named after the model (``res.partner`` -> ``res_partner``)
+    with ``id`` as primary key and one column per field, using the export
+    layout: many2one fields become ``<field>`` (id) and ``<field>_name``
+    columns, booleans are stored as 0/1, Odoo ``False`` as NULL and x2many
+    id lists as JSON arrays. Columns for new fields are added on the fly.
+
+    All database work runs on a dedicated thread, so syncing does not block
+    the event loop.
+
+    Example:
+        >>> sink = SQLiteSink("mirror.db")
+        >>> engine = SyncEngine(client, sink)
+    """
+
+    def __init__(self, path: str):
+        """Initialize the sink.
+
+        Args:
+            path: Path of the SQLite database file
+        """
+        self.path = path
+        self._flatteners: Dict[str, _RowFlattener] = {}
+        self._connection: Optional[sqlite3.Connection] = None
+        self._executor = ThreadPoolExecutor(max_workers=1)
+
+    async def prepare(
+        self, model: str, field_types: Dict[str, str], fields: Optional[List[str]]
+    ) -> None:
+        self._flatteners[model] = _RowFlattener(field_types, fields)
+
+    async def upsert(self, model: str, records: List[Dict[str, Any]]) -> None:
+        await self._run(self._upsert, model, records)
+
+    async def delete(self, model: str, ids: List[int]) -> None:
+        await self._run(self._delete, model, ids)
+
+    async def close(self) -> None:
+        await self._run(self._close)
+        self._executor.shutdown(wait=True)
+
+    async def _run(self, function: Callable, *args: Any) -> Any:
+        loop = asyncio.get_running_loop()
+        return await loop.run_in_executor(self._executor, function, *args)
+
+    def _connect(self) -> sqlite3.Connection:
+        if self._connection is None:
+            self._connection = sqlite3.connect(self.path)
+            self._connection.execute("PRAGMA journal_mode=WAL")
+        return self._connection
+
+    def _upsert(self, model: str, records: List[Dict[str, Any]]) -> None:
+        flattener = self._flatteners.setdefault(model, _RowFlattener({}, None))
+        rows = flattener.rows(records)
+        for row in rows:
+            for index, value in enumerate(row):
+                if isinstance(value, list):
+                    row[index] = json.dumps(value)
+
+        connection = self._connect()
+        table = table_name(model)
+        self._ensure_table(connection, table, flattener.columns, flattener.column_types)
+
+        columns = ", ".join(f'"{name}"' for name in flattener.columns)
+        placeholders = ", ".join("?" for _ in flattener.columns)
+        updates = ", ".join(
+            f'"{name}" = excluded."{name}"'
+            for name in flattener.columns
+            if name != "id"
+        )
+        conflict = f"DO UPDATE SET {updates}" if updates else "DO NOTHING"
+
+        with connection:
+            connection.executemany(
+                f'INSERT INTO "{table}" ({columns}) VALUES ({placeholders}) '
+                f"ON CONFLICT(id) {conflict}",
+                rows,
+            )
+
+    def _delete(self, model: str, ids: List[int]) -> None:
+        connection = self._connect()
+        table = table_name(model)
+        if not self._table_exists(connection, table):
+            return
+
+        with connection:
+            for start in range(0, len(ids), 500):
+                chunk = ids[start : start + 500]
+                placeholders = ", ".join("?" for _ in chunk)
+                connection.execute(
+                    f'DELETE FROM "{table}" WHERE id IN ({placeholders})', chunk
+                )
+
+    def _ensure_table(
+        self,
+        connection: sqlite3.Connection,
+        table: str,
+        columns: Sequence[str],
+        column_types: Sequence[str],
+    ) -> None:
+        connection.execute(
+            f'CREATE TABLE IF NOT EXISTS "{table}" (id INTEGER PRIMARY KEY)'
+        )
+        existing = {
+            row[1] for row in connection.execute(f'PRAGMA table_info("{table}")')
+        }
+        for name, odoo_type in zip(columns, column_types):
+            if name not in existing:
+                sql_type = _SQLITE_TYPES.get(odoo_type, "TEXT")
+                connection.execute(
+                    f'ALTER TABLE "{table}" ADD COLUMN "{name}" {sql_type}'
+                )
+
+    @staticmethod
+    def _table_exists(connection: sqlite3.Connection, table: str) -> bool:
+        return (
+            connection.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?",
+                (table,),
+            ).fetchone()
+            is not None
+        )
+
+    def _close(self) -> None:
+        if self._connection is not None:
+            self._connection.close()
+            self._connection = None
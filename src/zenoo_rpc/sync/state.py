@@ -0,0 +1,212 @@
+"""
+Sync state: watermarks and known record ids.
+
+The state of a synced model is its ``(write_date, id)`` watermark, which
+bounds the next incremental pull, and a compact bitmap of the record ids
+already delivered to the sink, which is diffed against the ids on the
+server to detect deletions.
+"""
+
+import base64
+import json
+import os
+import zlib
+from abc import ABC, abstractmethod
+from dataclasses import dataclass, field
+from typing import Any, Dict, Iterable, Iterator, Optional
+
+
+class IdBitmap:
+    """Compact set of non-negative record ids.
+
+    Ids are stored as bits of a ``bytearray`` (one bit per possible id), so
+    a million dense ids take about 125 KB, and far less once compressed
+    with ``to_bytes``. Set differences are computed on whole integers.
+
+    Example:
+        >>> known = IdBitmap([1, 2, 3, 5])
+        >>> list(known - IdBitmap([1, 3, 5]))
+        [2]
+    """
+
+    __slots__ = ("_bits",)
+
+    def __init__(self, ids: Iterable[int] = ()):
+        self._bits = bytearray()
+        self.update(ids)
+
+    def add(self, record_id: int) -> None:
+        """Add an id to the set."""
+        index = record_id >> 3
+        if index >= len(self._bits):
+            self._bits.extend(bytes(index - len(self._bits) + 1))
+        self._bits[index] |= 1 << (record_id & 7)
+
+    def update(self, ids: Iterable[int]) -> None:
+        """Add several ids to the set."""
+        for record_id in ids:
+            self.add(record_id)
+
+    def discard(self, record_id: int) -> None:
+        """Remove an id from the set if present."""
+        index = record_id >> 3
+        if index < len(self._bits):
+            self._bits[index] &= ~(1 << (record_id & 7)) & 0xFF
+
+    def __contains__(self, record_id: object) -> bool:
+        if not isinstance(record_id, int) or record_id < 0:
+            return False
+        index = record_id >> 3
+        return index < len(self._bits) and bool(
+            self._bits[index] >> (record_id & 7) & 1
+        )
+
+    def __iter__(self) -> Iterator[int]:
+        for index, byte in enumerate(self._bits):
+            if byte:
+                base = index << 3
+                for bit in range(8):
+                    if byte >> bit & 1:
+                        yield base + bit
+
+    def __len__(self) -> int:
+        return bin(int.from_bytes(self._bits, "little")).count("1")
+
+    def __sub__(self, other: "IdBitmap") -> "IdBitmap":
+        difference = int.from_bytes(self._bits, "little") & ~int.from_bytes(
+            other._bits, "little"
+        )
+        result = IdBitmap()
+        result._bits = bytearray(difference.to_bytes(len(self._bits), "little"))
+        return result
+
+    def __or__(self, other: "IdBitmap") -> "IdBitmap":
+        union = int.from_bytes(self._bits, "little") | int.from_bytes(
+            other._bits, "little"
+        )
+        result = IdBitmap()
+        size = max(len(self._bits), len(other._bits))
+        result._bits = bytearray(union.to_bytes(size, "little"))
+        return result
+
+    def __eq__(self, other: object) -> bool:
+        if not isinstance(other, IdBitmap):
+            return NotImplemented
+        return self._bits.rstrip(b"\0") == other._bits.rstrip(b"\0")
+
+    def to_bytes(self) -> bytes:
+        """Serialize the set into compressed bytes."""
+        return zlib.compress(bytes(self._bits.rstrip(b"\0")))
+
+    @classmethod
+    def from_bytes(cls, data: bytes) -> "IdBitmap":
+        """Deserialize a set created by ``to_bytes``."""
+        bitmap = cls()
+        bitmap._bits = bytearray(zlib.decompress(data))
+        return bitmap
+
+
+@dataclass
+class SyncState:
+    """Sync progress of one model.
+
+    ``write_date`` is None until the first full load has completed; while it
+    runs, ``last_id`` is the id cursor of the load and ``full_load_write_date``
+    the newest ``write_date`` on the server when the load started.
+    """
+
+    write_date: Optional[str] = None
+    last_id: int = 0
+    known_ids: IdBitmap = field(default_factory=IdBitmap)
+    runs_since_deletion_check: int = 0
+    full_load_write_date: Optional[str] = None
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Convert the state into JSON serializable values."""
+        return {
+            "write_date": self.write_date,
+            "last_id": self.last_id,
+            "known_ids": base64.b64encode(self.known_ids.to_bytes()).decode(),
+            "runs_since_deletion_check": self.runs_since_deletion_check,
+            "full_load_write_date": self.full_load_write_date,
+        }
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> "SyncState":
+        """Create a state from values returned by ``to_dict``."""
+        return cls(
+            write_date=data.get("write_date"),
+            last_id=data.get("last_id", 0),
+            known_ids=(
+                IdBitmap.from_bytes(base64.b64decode(data["known_ids"]))
+                if data.get("known_ids")
+                else IdBitmap()
+            ),
+            runs_since_deletion_check=data.get("runs_since_deletion_check", 0),
+            full_load_write_date=data.get("full_load_write_date"),
+        )
+
+
+class SyncStateStore(ABC):
+    """Persistent storage of sync states."""
+
+    @abstractmethod
+    async def load(self, model: str) -> Optional[SyncState]:
+        """Load the state of a model, or None if it was never synced."""
+
+    @abstractmethod
+    async def save(self, model: str, state: SyncState) -> None:
+        """Save the state of a model."""
+
+
+class MemorySyncStateStore(SyncStateStore):
+    """Sync state store kept in memory, for tests and one-off processes."""
+
+    def __init__(self) -> None:
+        self._states: Dict[str, Dict[str, Any]] = {}
+
+    async def load(self, model: str) -> Optional[SyncState]:
+        data = self._states.get(model)
+        return SyncState.from_dict(data) if data else None
+
+    async def save(self, model: str, state: SyncState) -> None:
+        self._states[model] = state.to_dict()
+
+
+class JsonSyncStateStore(SyncStateStore):
+    """Sync state store backed by a JSON file.
+
+    The file is rewritten atomically on every save, so an interrupted sync
+    resumes from the last page delivered to the sink.
+    """
+
+    def __init__(self, path: str):
+        """Initialize the store.
+
+        Args:
+            path: Path of the JSON state file
+        """
+        self.path = path
+        self._states: Optional[Dict[str, Dict[str, Any]]] = None
+
+    async def load(self, model: str) -> Optional[SyncState]:
+        data = self._read().get(model)
+        return SyncState.from_dict(data) if data else None
+
+    async def save(self, model: str, state: SyncState) -> None:
+        states = self._read()
+        states[model] = state.to_dict()
+
+        temp_path = f"{self.path}.tmp"
+        with open(temp_path, "w", encoding="utf-8") as f:
+            json.dump(states, f)
+        os.replace(temp_path, self.path)
+
+    def _read(self) -> Dict[str, Dict[str, Any]]:
+        if self._states is None:
+            try:
+                with open(self.path, encoding="utf-8") as f:
+                    self._states = json.load(f)
+            except FileNotFoundError:
+                self._states = {}
+        return self._states
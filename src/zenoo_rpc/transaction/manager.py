@@ -14,6 +14,7 @@ from contextlib import asynccontextmanager
 from dataclasses import dataclass, field
 import logging
 
+from ..models.identity_map import IdentityMap
 from .exceptions import (
     TransactionError,
     TransactionRollbackError,
@@ -992,6 +993,7 @@ class Transaction:
             await self._perform_commit()
 
             # Invalidate cache after successful commit
+            self._invalidate_identity_map()
             await self._invalidate_cache_on_commit()
 
             self.state = TransactionState.COMMITTED
@@ -1030,6 +1032,7 @@ class Transaction:
                     await child.rollback()
 
             # Rollback operations using compensating operations
+            self._invalidate_identity_map()
             await self._execute_rollback_operations(self.operations)
 
             # Clear operations after successful rollback
@@ -1115,6 +1118,16 @@ class Transaction:
                     f"Delete operation: {op.model} with {len(op.record_ids)} records"
                 )
 
+    def _invalidate_identity_map(self) -> None:
+        """Drop records touched by this transaction from the identity map."""
+        identity_map = getattr(self.client, "identity_map", None)
+        if not isinstance(identity_map, IdentityMap):
+            return
+
+        for operation in self.operations:
+            ids = operation.record_ids or operation.created_ids
+            identity_map.invalidate(operation.model, ids or None)
+
     async def _invalidate_cache_on_commit(self) -> None:
         """Invalidate cache entries after successful transaction commit."""
         try:
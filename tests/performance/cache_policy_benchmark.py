@@ -0,0 +1,64 @@
+"""
+Cache eviction policy benchmark.
+
+Compares the hit ratio of the LRU and TinyLFU strategies on a Zipf
+distributed workload of query keys interleaved with one-off scans, like
+exports reading every record once, which flush recency-based caches.
+
+Usage:
+    python tests/performance/cache_policy_benchmark.py [operations]
+"""
+
+import asyncio
+import random
+import sys
+from typing import List
+
+from zenoo_rpc.cache.backends import MemoryCache
+from zenoo_rpc.cache.strategies import LRUCache, TinyLFUCache
+
+CACHE_SIZE = 1_000
+KEY_COUNT = 20_000
+
+
+def workload(count: int) -> List[str]:
+    """Build a Zipf workload where every tenth block of keys is a scan."""
+    weights = [1 / rank for rank in range(1, KEY_COUNT + 1)]
+    keys = random.choices(range(KEY_COUNT), weights=weights, k=count)
+    trace = []
+    scan = 0
+    for position, key in enumerate(keys):
+        if position % 10_000 < 1_000:
+            scan += 1
+            trace.append(f"export:{scan}")
+        else:
+            trace.append(f"query:res.partner:{key}")
+    return trace
+
+
+async def hit_ratio(strategy, trace: List[str]) -> float:
+    """Replay a trace, caching every miss, and return the hit ratio."""
+    hits = 0
+    for key in trace:
+        if await strategy.get(key) is not None:
+            hits += 1
+        else:
+            await strategy.set(key, key)
+    return hits / len(trace)
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 200_000
+    trace = workload(count)
+
+    print(f"Hit ratio with {count:,} operations, cache size {CACHE_SIZE:,}")
+    for name, strategy_class in (("lru", LRUCache), ("tinylfu", TinyLFUCache)):
+        backend = MemoryCache(max_size=CACHE_SIZE * 2)
+        strategy = strategy_class(backend, max_size=CACHE_SIZE)
+        print(f"  {name:<10}{await hit_ratio(strategy, trace):>8.1%}")
+        await backend.close()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,70 @@
+"""
+Model hydration benchmark.
+
+Measures how many records per second are turned into model instances by
+the validated path (``ResPartner(**record)``) and by the trusted fast path
+(``ResPartner.from_odoo(record)``), using search_read-shaped partner rows.
+
+Usage:
+    python tests/performance/hydration_benchmark.py [rows]
+"""
+
+import sys
+import time
+from typing import Any, Callable, Dict, List
+
+from zenoo_rpc.models.common import ResPartner
+
+
+def make_rows(count: int) -> List[Dict[str, Any]]:
+    """Create partner rows as returned by search_read."""
+    return [
+        {
+            "id": i,
+            "name": f"Partner {i}",
+            "display_name": f"Partner {i}",
+            "email": f"partner{i}@example.com" if i % 3 else False,
+            "phone": False,
+            "is_company": i % 10 == 0,
+            "customer_rank": i % 5,
+            "parent_id": [i // 10 + 1, "Parent"] if i % 10 else False,
+            "country_id": [241, "Vietnam"],
+            "child_ids": [i * 2, i * 2 + 1] if i % 10 == 0 else [],
+            "create_date": "2025-01-15 08:30:00",
+            "write_date": "2025-06-01 12:00:00",
+        }
+        for i in range(1, count + 1)
+    ]
+
+
+def measure(
+    rows: List[Dict[str, Any]], hydrate: Callable[[Dict[str, Any]], Any]
+) -> float:
+    """Hydrate all rows and return the throughput in rows per second."""
+    start = time.perf_counter()
+    for row in rows:
+        hydrate(row)
+    return len(rows) / (time.perf_counter() - start)
+
+
+def main() -> None:
+    """Run the benchmark and print the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 50000
+    rows = make_rows(count)
+    client = object()
+
+    # Warm up converters and Pydantic validators
+    ResPartner.from_odoo(rows[0], client=client)
+    ResPartner(**rows[0], client=client)
+
+    validated = measure(rows, lambda row: ResPartner(**row, client=client))
+    fast = measure(rows, lambda row: ResPartner.from_odoo(row, client=client))
+
+    print(f"Hydrating {count} res.partner rows")
+    print(f"  validated (ResPartner(**row)):  {validated:>10,.0f} rows/s")
+    print(f"  fast path (from_odoo):          {fast:>10,.0f} rows/s")
+    print(f"  speedup:                        {fast / validated:>10.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,86 @@
+"""
+Memory cache microbenchmark.
+
+Measures the operations per second of ``MemoryCache`` for cache hits,
+misses, inserts with LRU eviction, inserts with a TTL and a 90/10
+read/write mix, with one shard and with sixteen shards, and the time of
+the periodic expiry sweep on a full cache where nothing has expired.
+
+Usage:
+    python tests/performance/memory_cache_benchmark.py [operations]
+"""
+
+import asyncio
+import random
+import sys
+import time
+from typing import Awaitable, Callable, List, Tuple
+
+from zenoo_rpc.cache.backends import MemoryCache
+
+
+async def measure(keys: List[str], operation: Callable[[str], Awaitable]) -> float:
+    """Run the operation on all keys and return the operations per second."""
+    start = time.perf_counter()
+    for key in keys:
+        await operation(key)
+    return len(keys) / (time.perf_counter() - start)
+
+
+async def run(count: int, shards: int) -> Tuple[List[float], float]:
+    """Run all scenarios on a fresh cache, returning the sweep time in ms."""
+    size = count // 2
+    cache = MemoryCache(max_size=size, shards=shards)
+    keys = [f"query:res.partner:{i}" for i in range(count)]
+    hot = random.choices(keys[:size], k=count)
+    mixed = random.choices(keys, k=count)
+
+    async def mixed_operation(key: str) -> None:
+        if random.random() < 0.9:
+            await cache.get(key)
+        else:
+            await cache.set(key, key)
+
+    results = [
+        await measure(keys, lambda key: cache.set(key, key)),
+        await measure(hot, cache.get),
+        await measure(keys[:size], cache.get),
+        await measure(hot, cache.exists),
+        await measure(keys, lambda key: cache.set(key, key, ttl=300)),
+        await measure(mixed, mixed_operation),
+    ]
+
+    start = time.perf_counter()
+    await cache._remove_expired()
+    sweep = (time.perf_counter() - start) * 1000
+
+    await cache.close()
+    return results, sweep
+
+
+async def main() -> None:
+    """Run the benchmark and print the results."""
+    count = int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000
+    scenarios = [
+        "set (with eviction)",
+        "get (hit)",
+        "get (miss)",
+        "exists",
+        "set with ttl",
+        "90% get / 10% set",
+    ]
+
+    single, single_sweep = await run(count, shards=1)
+    sharded, sharded_sweep = await run(count, shards=16)
+
+    print(
+        f"MemoryCache with {count:,} operations per scenario, max_size={count // 2:,}"
+    )
+    print(f"  {'scenario':<22}{'1 shard':>14}{'16 shards':>14}")
+    for name, one, many in zip(scenarios, single, sharded):
+        print(f"  {name:<22}{one:>10,.0f}/s  {many:>10,.0f}/s")
+    print(f"  {'expiry sweep':<22}{single_sweep:>11.2f}ms {sharded_sweep:>11.2f}ms")
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -16,8 +16,20 @@ from unittest.mock import AsyncMock, MagicMock, patch
 from typing import Any, Dict
 
 from zenoo_rpc.cache.manager import CacheManager
-from zenoo_rpc.cache.backends import MemoryCache, RedisCache, CacheBackend
-from zenoo_rpc.cache.strategies import TTLCache, LRUCache, LFUCache
+from zenoo_rpc.cache.backends import (
+    MemoryCache,
+    RedisCache,
+    TieredCache,
+    CacheBackend,
+    estimate_size,
+)
+from zenoo_rpc.cache.strategies import (
+    TTLCache,
+    LRUCache,
+    LFUCache,
+    CountMinSketch,
+    TinyLFUCache,
+)
 from zenoo_rpc.cache.keys import (
     CacheKey,
     make_cache_key,
@@ -198,6 +210,97 @@ class TestMemoryCache:
         assert stats["misses"] >= 1
 
 
+class TestShardedMemoryCache:
+    """Test the sharded memory cache internals."""
+
+    @pytest.mark.asyncio
+    async def test_exists_and_overwrite_keep_lru_order(self):
+        """exists() does not touch LRU order and overwrites do not evict."""
+        cache = MemoryCache(max_size=2)
+        await cache.set("key1", "value1")
+        await cache.set("key2", "value2")
+
+        assert await cache.exists("key1") is True
+        await cache.set("key2", "value2b")
+        await cache.set("key3", "value3")
+
+        assert await cache.get("key1") is None
+        assert await cache.get("key2") == "value2b"
+        stats = await cache.get_stats()
+        assert (stats["hits"], stats["misses"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_shards_split_capacity(self):
+        """Each shard holds its share of max_size."""
+        cache = MemoryCache(max_size=64, shards=4)
+        for i in range(200):
+            await cache.set(f"key{i}", i)
+
+        assert [len(shard.data) for shard in cache._shards] == [16] * 4
+        assert await cache.get("key199") == 199
+        assert (await cache.get_stats())["size"] == 64
+        assert len(cache.keys()) == 64
+
+    @pytest.mark.asyncio
+    async def test_expiry_heap(self):
+        """The sweep only removes keys whose current deadline has passed."""
+        cache = MemoryCache(max_size=100, shards=2)
+        for i in range(10):
+            await cache.set(f"key{i}", i, ttl=0.05)
+        await cache.set("key0", 0, ttl=60)
+        await cache.set("key1", 1)
+
+        await asyncio.sleep(0.1)
+        await cache._remove_expired()
+
+        assert sorted(cache.keys()) == ["key0", "key1"]
+        assert sum(len(shard.heap) for shard in cache._shards) == 1
+
+
+class TestMemoryBudget:
+    """Test the byte budget of the memory cache."""
+
+    @pytest.mark.asyncio
+    async def test_evicts_by_bytes(self):
+        """Large values evict least recently used ones to fit the budget."""
+        cache = MemoryCache(max_size=1000, max_bytes=1000, sizeof=len)
+        for i in range(5):
+            await cache.set(f"small{i}", "x" * 100)
+        await cache.get("small0")
+
+        assert await cache.set("large", "x" * 800) is True
+
+        assert sorted(cache.keys()) == ["large", "small0", "small4"]
+        stats = await cache.get_stats()
+        assert stats["bytes_used"] == 1000
+        assert (stats["evictions"], stats["evicted_bytes"]) == (3, 300)
+
+        await cache.delete("large")
+        assert (await cache.get_stats())["bytes_used"] == 200
+
+    @pytest.mark.asyncio
+    async def test_rejects_oversized_values(self):
+        """Values above max_entry_bytes are not cached and drop old ones."""
+        cache = MemoryCache(max_bytes=1000, max_entry_bytes=500, sizeof=len)
+        await cache.set("rows", "x" * 100)
+
+        assert await cache.set("rows", "x" * 501) is False
+
+        assert await cache.get("rows") is None
+        stats = await cache.get_stats()
+        assert (stats["rejected"], stats["bytes_used"]) == (1, 0)
+
+    def test_estimate_size(self):
+        """Sizes grow with the rows of search_read results."""
+        rows = [{"id": i, "name": f"Partner {i}"} for i in range(1000)]
+
+        small = estimate_size(rows[:10])
+        large = estimate_size(rows)
+
+        assert 50 * small < large < 200 * small
+        assert estimate_size([rows[0]] * 100) < estimate_size(rows[:100])
+
+
 class TestCacheStrategies:
     """Test cache strategies."""
 
@@ -273,6 +376,332 @@ class TestCacheStrategies:
         assert await strategy.get("lfu4") == "value4"  # Should exist
 
 
+class TestTinyLFU:
+    """Test the W-TinyLFU cache strategy."""
+
+    def test_count_min_sketch(self):
+        """Frequencies saturate at 15 and are halved by resets."""
+        sketch = CountMinSketch(100, sample_size=1000)
+        for _ in range(20):
+            sketch.increment("hot")
+        sketch.increment("cold")
+
+        assert sketch.estimate("hot") == 15
+        assert sketch.estimate("cold") == 1
+        assert sketch.estimate("unknown") == 0
+
+        sketch.reset()
+        assert (sketch.estimate("hot"), sketch.estimate("cold")) == (7, 0)
+
+    @pytest.mark.asyncio
+    async def test_segments(self):
+        """Entries hit in probation are promoted to the protected segment."""
+        cache = TinyLFUCache(MemoryCache(max_size=1000), max_size=10)
+        for i in range(10):
+            await cache.set(f"key{i}", i)
+
+        assert list(cache._window) == ["key9"]
+        assert len(cache._probation) == 9
+
+        await cache.get("key0")
+        assert "key0" in cache._protected
+
+        # The main cache is full: a key leaving the window needs to be
+        # more frequent than the probation victim
+        await cache.set("key10", 10)
+        assert await cache.get("key9") is None
+        assert (await cache.get_stats())["rejected"] == 1
+
+        for _ in range(2):
+            await cache.get("key11")
+        await cache.set("key11", 11)
+        await cache.set("key12", 12)
+        assert await cache.get("key11") == 11
+        assert await cache.get("key1") is None
+        assert (await cache.get_stats())["admitted"] == 1
+
+    @pytest.mark.asyncio
+    async def test_scan_does_not_flush_hot_entries(self):
+        """One-off keys do not evict frequently read ones, unlike LRU."""
+
+        async def hot_hits(strategy):
+            hot = [f"partner:{i}" for i in range(20)]
+            for _ in range(5):
+                for key in hot:
+                    if await strategy.get(key) is None:
+                        await strategy.set(key, key)
+            for i in range(300):
+                key = f"export:{i}"
+                if await strategy.get(key) is None:
+                    await strategy.set(key, key)
+            return sum([await strategy.get(key) is not None for key in hot])
+
+        backend_size = 10000
+        assert await hot_hits(TinyLFUCache(MemoryCache(backend_size), 100)) == 20
+        assert await hot_hits(LRUCache(MemoryCache(backend_size), 100)) == 0
+
+    @pytest.mark.asyncio
+    async def test_manager_strategy(self):
+        """The manager creates W-TinyLFU strategies by name."""
+        manager = CacheManager()
+        await manager.setup_memory_cache(max_size=100, strategy="tinylfu")
+
+        assert isinstance(manager.strategies["memory"], TinyLFUCache)
+        await manager.set("key", "value")
+        assert await manager.get("key") == "value"
+
+
+class PubSubMemoryCache(MemoryCache):
+    """Memory cache standing in for Redis, with an in-process channel."""
+
+    def __init__(self, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.subscribers = []
+        self.subscriptions = []
+
+    async def publish(self, channel, message):
+        for callback in list(self.subscribers):
+            await callback(message)
+        return len(self.subscribers)
+
+    async def subscribe(self, channel, callback):
+        self.subscribers.append(callback)
+        subscription = asyncio.get_running_loop().create_future()
+        self.subscriptions.append(subscription)
+        return subscription
+
+
+class TestTieredCache:
+    """Test the memory cache in front of a shared cache."""
+
+    @pytest.fixture
+    async def workers(self):
+        shared = PubSubMemoryCache(max_size=1000)
+        workers = [TieredCache(shared, resubscribe_delay=0) for _ in range(2)]
+        for worker in workers:
+            await worker.connect()
+        yield shared, workers
+        for worker in workers:
+            await worker.close()
+
+    @pytest.mark.asyncio
+    async def test_read_through_and_promotion(self, workers):
+        """Values read from L2 are promoted to L1."""
+        shared, (first, second) = workers
+        await first.set("partner:1", {"name": "Acme"}, ttl=300)
+
+        assert await second.get("partner:1") == {"name": "Acme"}
+        assert await second.get("partner:1") == {"name": "Acme"}
+        assert await second.get("partner:2") is None
+
+        stats = await second.get_stats()
+        assert (stats["l1_hits"], stats["l2_hits"], stats["misses"]) == (1, 1, 1)
+        assert await second.l1.exists("partner:1")
+
+    @pytest.mark.asyncio
+    async def test_invalidations_are_broadcast(self, workers):
+        """Writes and invalidations drop stale L1 entries in other workers."""
+        shared, (first, second) = workers
+        await first.set("partner:1", "old")
+        assert await second.get("partner:1") == "old"
+
+        await first.set("partner:1", "new")
+        assert await second.get("partner:1") == "new"
+
+        await first.delete("partner:1")
+        assert await second.get("partner:1") is None
+
+        await first.set("query:res.partner:a", [1], tags=["res.partner:1"])
+        await first.set("query:res.users:a", [2])
+        for key in ("query:res.partner:a", "query:res.users:a"):
+            await second.get(key)
+
+        await first.invalidate_tags(["res.partner:1"])
+        assert not await second.l1.exists("query:res.partner:a")
+        assert await second.l1.exists("query:res.users:a")
+
+        assert await first.delete_pattern("query:*") == ["query:res.users:a"]
+        assert second.l1.keys() == []
+        assert (await second.get_stats())["invalidations_received"] == 7
+
+    @pytest.mark.asyncio
+    async def test_lost_subscription(self, workers):
+        """L1 is cleared and bypassed until the channel is subscribed again."""
+        shared, (first, second) = workers
+        await first.set("partner:1", "old")
+        await second.get("partner:1")
+
+        shared.subscriptions[1].set_exception(ConnectionError("reset"))
+        await asyncio.sleep(0)
+        assert not (await second.get_stats())["subscribed"]
+        assert second.l1.keys() == []
+
+        await shared.set("partner:1", "new")
+        assert await second.get("partner:1") == "new"
+        assert second.l1.keys() == []
+
+        await asyncio.sleep(0.01)
+        assert (await second.get_stats())["subscribed"]
+        assert await second.get("partner:1") == "new"
+        assert second.l1.keys() == ["partner:1"]
+
+    @pytest.mark.asyncio
+    async def test_l1_ttl_is_required(self):
+        """Promoted values need an L1 expiry, so l1_ttl must be positive."""
+        for l1_ttl in (None, 0):
+            with pytest.raises(ValueError, match="l1_ttl"):
+                TieredCache(PubSubMemoryCache(), l1_ttl=l1_ttl)
+
+    @pytest.mark.asyncio
+    async def test_redis_publish_subscribe(self):
+        """Redis messages are JSON on a channel of the namespace."""
+        cache = RedisCache(namespace="test", enable_fallback=False)
+        cache.redis = MagicMock()
+        cache.redis.publish = AsyncMock(return_value=3)
+        cache._connected = True
+
+        assert await cache.publish("invalidations", {"keys": ["a"]}) == 3
+        cache.redis.publish.assert_awaited_once_with(
+            "test:invalidations", '{"keys": ["a"]}'
+        )
+
+        async def listen():
+            yield {"type": "subscribe", "data": 1}
+            yield {"type": "message", "data": b'{"keys": ["a"]}'}
+
+        pubsub = cache.redis.pubsub.return_value
+        pubsub.subscribe = AsyncMock()
+        pubsub.reset = AsyncMock()
+        pubsub.listen = listen
+
+        received = []
+
+        async def callback(message):
+            received.append(message)
+
+        await (await cache.subscribe("invalidations", callback))
+        pubsub.subscribe.assert_awaited_once_with("test:invalidations")
+        pubsub.reset.assert_awaited_once()
+        assert received == [{"keys": ["a"]}]
+
+
+class TestBulkOperations:
+    """Test get_many, set_many and delete_many."""
+
+    @pytest.mark.asyncio
+    async def test_memory_cache(self):
+        """Memory caches handle several keys per shard lock."""
+        cache = MemoryCache(max_size=100, shards=4, max_bytes=40000)
+
+        items = {f"record:res.partner:{i}": {"id": i} for i in range(10)}
+        items["record:res.partner:big"] = "x" * 20000
+        assert await cache.set_many(items, ttl=60) == ["record:res.partner:big"]
+
+        values = await cache.get_many(["record:res.partner:1", "missing"])
+        assert values == {"record:res.partner:1": {"id": 1}, "missing": None}
+        stats = await cache.get_stats()
+        assert (stats["hits"], stats["misses"], stats["rejected"]) == (1, 1, 1)
+
+        assert await cache.delete_many(["record:res.partner:1", "missing"]) == 1
+        assert await cache.invalidate_tags(["record:res.partner:*"]) != []
+        assert cache.keys() == []
+
+    @pytest.mark.asyncio
+    async def test_strategies_track_keys(self):
+        """Strategies keep their bookkeeping for bulk operations."""
+        lru = LRUCache(MemoryCache(max_size=100), max_size=2)
+        assert await lru.set_many({"a": 1, "b": 2, "c": 3}) == []
+        assert await lru.get_many(["a", "b", "c"]) == {"a": None, "b": 2, "c": 3}
+        assert list(lru._access_order) == ["b", "c"]
+
+        tinylfu = TinyLFUCache(MemoryCache(max_size=100), max_size=10)
+        await tinylfu.set_many({f"key{i}": i for i in range(3)})
+        assert await tinylfu.delete_many(["key0", "key1"]) == 2
+        assert (await tinylfu.get_stats())["current_size"] == 1
+
+        ttl = TTLCache(MemoryCache(max_size=100), default_ttl=60)
+        await ttl.set_many({"a": 1, "b": 2})
+        ttl._expiry_times["a"] = time.time() - 1
+        assert await ttl.get_many(["a", "b"]) == {"a": None, "b": 2}
+
+    @pytest.mark.asyncio
+    async def test_manager(self):
+        """The manager counts bulk operations in its statistics."""
+        manager = CacheManager()
+        await manager.setup_memory_cache(strategy="lru")
+
+        assert await manager.set_many({"a": 1, "b": 2}, ttl=60)
+        assert await manager.get_many(["a", "c"]) == {"a": 1, "c": None}
+        assert await manager.delete_many(["a", "b"]) == 2
+        assert manager.stats["total_sets"] == 2
+        assert (manager.stats["total_hits"], manager.stats["total_misses"]) == (1, 1)
+
+    @pytest.mark.asyncio
+    async def test_redis_round_trips(self):
+        """Redis uses one MGET, pipeline or script call per batch of keys."""
+        cache = RedisCache(namespace="test", enable_fallback=False)
+        cache.batch_size = 2
+        cache.redis = MagicMock()
+        cache._connected = True
+
+        pipe = cache.redis.pipeline.return_value
+        pipe.execute = AsyncMock()
+        items = {"record:res.partner:1": [1], "record:res.partner:2": [2]}
+        assert await cache.set_many(items, ttl=60) == []
+        assert pipe.setex.call_count == 2
+        assert pipe.execute.await_count == 1
+        assert [c.args[1:] for c in pipe.eval.call_args_list] == [
+            (
+                1,
+                "test:tag:record:*",
+                60000,
+                "test:record:res.partner:1",
+                "test:record:res.partner:2",
+            ),
+            (
+                1,
+                "test:tag:record:res.partner:*",
+                60000,
+                "test:record:res.partner:1",
+                "test:record:res.partner:2",
+            ),
+        ]
+
+        cache.redis.mget = AsyncMock(side_effect=[[b"[1]", None], [b"[3]"]])
+        values = await cache.get_many(["a", "b", "c"])
+        assert values == {"a": [1], "b": None, "c": [3]}
+        assert cache.redis.mget.call_args_list[1].args == ("test:c",)
+
+        cache.redis.eval = AsyncMock(side_effect=[2, 0])
+        assert await cache.delete_many(["a", "b", "c"]) == 2
+        assert cache.redis.eval.call_args_list[1].args[1:] == (
+            2,
+            "test:c",
+            "test:keytags:c",
+            "test:tag:",
+            0,
+        )
+
+    @pytest.mark.asyncio
+    async def test_tiered_cache(self):
+        """Tiered caches promote in bulk and publish one message per batch."""
+        shared = PubSubMemoryCache(max_size=1000)
+        first, second = TieredCache(shared), TieredCache(shared)
+        for worker in (first, second):
+            await worker.connect()
+
+        await first.set_many({"a": 1, "b": 2})
+        assert await second.get_many(["a", "b", "c"]) == {"a": 1, "b": 2, "c": None}
+        assert sorted(second.l1.keys()) == ["a", "b"]
+
+        await first.delete_many(["a", "b"])
+        assert second.l1.keys() == []
+        assert (await second.get_stats())["invalidations_received"] == 2
+
+        for worker in (first, second):
+            await worker.close()
+
+
 class TestCacheManager:
     """Test cache manager functionality."""
 
@@ -594,3 +1023,112 @@ class TestCacheIntegration:
         assert "total_size" in stats
         assert "total_hits" in stats
         assert "total_misses" in stats
+
+
+class TestTagInvalidation:
+    """Test tag-indexed cache invalidation."""
+
+    @pytest.mark.asyncio
+    async def test_pattern_invalidation_uses_tag_index(self):
+        """Model and query family patterns do not scan other keys."""
+        manager = CacheManager()
+        await manager.setup_memory_cache(max_size=100)
+        backend = manager.backends["memory"]
+
+        await manager.set("query:res.partner:a", [1])
+        await manager.set("query:res.partner:b", [2])
+        await manager.set("query:res.users:a", [3])
+        await manager.set("res.partner:search:c", [4])
+
+        with patch("fnmatch.fnmatch") as fnmatch:
+            assert await manager.invalidate_pattern("query:res.partner:*") == 2
+            fnmatch.assert_not_called()
+
+        assert await manager.get("query:res.partner:a") is None
+        assert await manager.get("query:res.users:a") == [3]
+        tags = backend._shards[0].tags
+        assert "query:res.partner:*" not in tags
+        assert tags["query:*"] == {"query:res.users:a"}
+
+        # Other patterns still scan keys
+        assert await manager.invalidate_pattern("*:res.users:?") == 1
+        assert await manager.invalidate_model("res.partner") == 1
+        assert tags == {}
+
+    @pytest.mark.asyncio
+    async def test_custom_tags(self):
+        """Keys can be registered under tags given to set()."""
+        manager = CacheManager()
+        await manager.setup_memory_cache(max_size=2, strategy="lru")
+        strategy = manager.strategies["memory"]
+
+        await manager.set("report:1", "a", tags=["res.partner:42"])
+        await manager.set("report:2", "b", tags=["res.partner:42", "res.partner:7"])
+
+        assert await manager.invalidate_tags(["res.partner:7"]) == 1
+        assert await manager.get("report:1") == "a"
+        assert "report:2" not in strategy._access_order
+
+        # Overwriting a key replaces its tags, eviction drops them
+        await manager.set("report:1", "a", tags=["res.partner:8"])
+        assert await manager.invalidate_tags(["res.partner:42"]) == 0
+        await manager.set("report:3", "c")
+        await manager.set("report:4", "d")
+        assert "res.partner:8" not in manager.backends["memory"]._shards[0].tags
+
+    @pytest.mark.asyncio
+    async def test_redis_tag_sets(self):
+        """Redis tags are sets, deleted keys are removed from them."""
+        cache = RedisCache(namespace="test", enable_fallback=False)
+        cache.unlink_batch_size = 2
+        cache.redis = MagicMock()
+        cache._connected = True
+
+        pipe = cache.redis.pipeline.return_value
+        pipe.execute = AsyncMock()
+        assert await cache.set("query:res.partner:a", [1], ttl=60, tags=["x"])
+        pipe.setex.assert_called_once()
+        # Tag sets are extended to the TTL of their members in the pipeline
+        pipe.eval.assert_called_once()
+        assert pipe.eval.call_args.args[1:] == (
+            3,
+            "test:tag:query:*",
+            "test:tag:query:res.partner:*",
+            "test:tag:x",
+            60000,
+            "test:query:res.partner:a",
+        )
+        # Only the tags passed to set() are recorded for deletions
+        pipe.delete.assert_called_once_with("test:keytags:query:res.partner:a")
+        pipe.sadd.assert_called_once_with("test:keytags:query:res.partner:a", "x")
+        pipe.expire.assert_called_once_with("test:keytags:query:res.partner:a", 60)
+        await cache.set("query:res.partner:b", [2])
+        assert pipe.eval.call_args.args[-2] == 0
+        pipe.sadd.assert_called_once()
+
+        # Deleting a key removes it from its recorded and prefix tag sets
+        cache.redis.eval = AsyncMock(return_value=1)
+        assert await cache.delete("query:res.partner:a")
+        assert cache.redis.eval.call_args.args[1:] == (
+            4,
+            "test:query:res.partner:a",
+            "test:keytags:query:res.partner:a",
+            "test:tag:query:*",
+            "test:tag:query:res.partner:*",
+            "test:tag:",
+            2,
+        )
+
+        cache.redis.sunion = AsyncMock(
+            return_value={b"test:query:res.partner:a", b"test:query:res.partner:b"}
+        )
+        cache.redis.eval = AsyncMock(return_value=2)
+        cache.redis.unlink = AsyncMock()
+        keys = await cache.invalidate_tags(["query:res.partner:*"])
+
+        assert keys == ["query:res.partner:a", "query:res.partner:b"]
+        assert cache.redis.eval.call_args.args[2:4] == (
+            "test:query:res.partner:a",
+            "test:keytags:query:res.partner:a",
+        )
+        cache.redis.unlink.assert_called_once_with("test:tag:query:res.partner:*")
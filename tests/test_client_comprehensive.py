@@ -247,6 +247,49 @@ class TestZenooClientComprehensive:
                 assert result == [{"id": 1, "name": "Test"}]
                 mock_transport_instance.json_rpc_call.assert_called_once()
 
+    @pytest.mark.asyncio
+    async def test_read_in_chunks(self):
+        """Test read deduplicates ids and reads records in chunks."""
+        client = ZenooClient("localhost")
+        client.execute_kw = AsyncMock(
+            side_effect=lambda model, method, args, kwargs, context=None: [
+                {"id": record_id, "name": f"Partner {record_id}"}
+                for record_id in args[0]
+            ]
+        )
+        client.identity_map.put("res.partner", {"id": 2, "name": "Cached"})
+
+        result = await client.read(
+            "res.partner", [3, 1, 3, 2, 5], fields=["name"], chunk_size=2
+        )
+
+        assert [record["id"] for record in result] == [3, 1, 2, 5]
+        assert result[2]["name"] == "Partner 2"
+        chunks = [c.args[2][0] for c in client.execute_kw.call_args_list]
+        assert chunks == [[3, 1], [2, 5]]
+
+    @pytest.mark.asyncio
+    async def test_read_with_identity_map(self):
+        """Test read only reuses identity map records when asked to."""
+        client = ZenooClient("localhost")
+        client.execute_kw = AsyncMock(
+            side_effect=lambda model, method, args, kwargs, context=None: [
+                {"id": record_id, "name": f"Partner {record_id}"}
+                for record_id in args[0]
+            ]
+        )
+        client.identity_map.put("res.partner", {"id": 2, "name": "Cached"})
+
+        result = await client.read(
+            "res.partner", [1, 2], fields=["name"], use_identity_map=True
+        )
+        assert [record["name"] for record in result] == ["Partner 1", "Cached"]
+        assert client.execute_kw.call_args.args[2] == [[1]]
+
+        # Records read are reused by later reads of the same fields
+        await client.read("res.partner", [1, 2], fields=["name"], use_identity_map=True)
+        assert client.execute_kw.call_count == 1
+
     @pytest.mark.asyncio
     async def test_search_count_method(self):
         """Test search_count method."""
@@ -0,0 +1,241 @@
+"""
+Tests for streaming exports to Parquet, CSV and NDJSON files.
+"""
+
+import csv
+import json
+from unittest.mock import AsyncMock, patch
+
+import pytest
+
+from zenoo_rpc.export import export_model, export_queryset, infer_format
+from zenoo_rpc.export.cli import main
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.models.registry import get_registry
+from zenoo_rpc.query.builder import QuerySet
+
+FIELD_TYPES = {
+    "name": {"type": "char"},
+    "is_company": {"type": "boolean"},
+    "parent_id": {"type": "many2one"},
+    "child_ids": {"type": "one2many"},
+}
+
+PAGES = [
+    [
+        {
+            "id": 1,
+            "name": "Acme",
+            "is_company": True,
+            "parent_id": False,
+            "child_ids": [2, 3],
+        },
+        {
+            "id": 2,
+            "name": False,
+            "is_company": False,
+            "parent_id": [1, "Acme"],
+            "child_ids": [],
+        },
+    ],
+    [{"id": 3, "name": "Bolt", "is_company": False, "parent_id": [1, "Acme"]}],
+]
+
+
+def make_client(pages=PAGES):
+    """Create a client returning the sample pages."""
+    client = AsyncMock()
+    client.cache_manager = None
+    client.execute_kw.return_value = FIELD_TYPES
+    client.search_read.side_effect = [list(page) for page in pages]
+    return client
+
+
+def make_queryset(client):
+    """Create a QuerySet of partners with the sample fields."""
+    return QuerySet(ResPartner, client).only(*FIELD_TYPES)
+
+
+@pytest.fixture(autouse=True)
+def fresh_field_definitions():
+    """Make queries read the field types of the mocked server."""
+    get_registry()._field_cache.pop("res.partner", None)
+    yield
+    get_registry()._field_cache.pop("res.partner", None)
+
+
+class TestExportQuerySet:
+    """Test cases for export_queryset."""
+
+    @pytest.mark.asyncio
+    async def test_csv_export(self, tmp_path):
+        """Pages are appended as CSV rows with split many2one columns."""
+        path = str(tmp_path / "partners.csv")
+        progress = []
+
+        result = await export_queryset(
+            make_queryset(make_client()),
+            path,
+            page_size=2,
+            progress_callback=progress.append,
+        )
+
+        with open(path, newline="") as f:
+            rows = list(csv.reader(f))
+
+        assert rows[0] == [
+            "id",
+            "name",
+            "is_company",
+            "parent_id",
+            "parent_id_name",
+            "child_ids",
+        ]
+        assert rows[1] == ["1", "Acme", "True", "", "", "[2, 3]"]
+        assert rows[2] == ["2", "", "False", "1", "Acme", "[]"]
+        assert (result.rows, result.pages, result.format) == (3, 2, "csv")
+        assert progress == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_export(self, tmp_path):
+        """Each record becomes one JSON line with False as null."""
+        path = str(tmp_path / "partners.jsonl")
+
+        await export_queryset(make_queryset(make_client()), path, page_size=2)
+
+        with open(path) as f:
+            records = [json.loads(line) for line in f]
+
+        assert [record["id"] for record in records] == [1, 2, 3]
+        assert records[1]["name"] is None
+        assert records[1]["is_company"] is False
+        assert records[2]["parent_id_name"] == "Acme"
+        assert records[2]["child_ids"] == []
+
+    @pytest.mark.asyncio
+    async def test_parquet_row_group_per_page(self, tmp_path):
+        """Every page is written as one Parquet row group."""
+        pq = pytest.importorskip("pyarrow.parquet")
+        path = str(tmp_path / "partners.parquet")
+
+        await export_queryset(make_queryset(make_client()), path, page_size=2)
+
+        parquet_file = pq.ParquetFile(path)
+        assert parquet_file.metadata.num_row_groups == 2
+        table = parquet_file.read()
+        assert table.column("parent_id").to_pylist() == [None, 1, 1]
+        assert table.column("name").to_pylist() == ["Acme", None, "Bolt"]
+
+    @pytest.mark.asyncio
+    async def test_failed_export_leaves_no_file(self, tmp_path):
+        """A failing RPC call removes the partial output."""
+        client = make_client()
+        client.search_read.side_effect = [PAGES[0], RuntimeError("timeout")]
+        path = tmp_path / "partners.csv"
+
+        with pytest.raises(RuntimeError):
+            await export_queryset(make_queryset(client), str(path), page_size=2)
+
+        assert list(tmp_path.iterdir()) == []
+
+    @pytest.mark.asyncio
+    async def test_parallel_export(self, tmp_path):
+        """Id-range readers feed the same writer."""
+        client = make_client()
+        client.execute_kw.side_effect = [FIELD_TYPES, [1], [3]]
+        client.search_read.side_effect = lambda *args, **kwargs: [
+            record
+            for page in PAGES
+            for record in page
+            if all(
+                record["id"] >= value if op == ">=" else record["id"] < value
+                for _, op, value in kwargs["domain"]
+            )
+        ]
+        path = str(tmp_path / "partners.ndjson")
+
+        result = await export_queryset(
+            make_queryset(client), path, page_size=10, workers=2
+        )
+
+        with open(path) as f:
+            ids = sorted(json.loads(line)["id"] for line in f)
+        assert ids == [1, 2, 3]
+        assert result.pages == 2
+
+    def test_infer_format(self):
+        """Formats are inferred from file extensions."""
+        assert infer_format("out/data.PARQUET") == "parquet"
+        assert infer_format("data.jsonl") == "ndjson"
+        with pytest.raises(ValueError):
+            infer_format("data.xlsx")
+
+
+class TestExportCli:
+    """Test the zenoo-export command line interface."""
+
+    @pytest.mark.asyncio
+    async def test_export_model(self, tmp_path):
+        """Models are looked up by name and queried with the domain."""
+        client = make_client()
+        client.get_or_create_model.return_value = ResPartner
+        path = str(tmp_path / "partners.csv")
+
+        result = await export_model(
+            client,
+            "res.partner",
+            path,
+            domain=[["is_company", "=", True]],
+            fields=list(FIELD_TYPES),
+            page_size=2,
+        )
+
+        assert result.rows == 3
+        domain = client.search_read.call_args_list[0].kwargs["domain"]
+        assert [list(term) for term in domain] == [["is_company", "=", True]]
+
+    def test_main(self, tmp_path):
+        """The CLI logs in and runs the export."""
+        client = AsyncMock()
+        client.__aenter__.return_value = client
+        path = str(tmp_path / "partners.csv")
+
+        with patch("zenoo_rpc.export.cli.ZenooClient", return_value=client), patch(
+            "zenoo_rpc.export.cli.export_model"
+        ) as export:
+            export.return_value.rows = 3
+            main(
+                [
+                    "res.partner",
+                    path,
+                    "--domain",
+                    '[["active", "=", true]]',
+                    "--fields",
+                    "name, email",
+                    "--url",
+                    "http://localhost:8069",
+                    "--database",
+                    "demo",
+                    "--username",
+                    "admin",
+                    "--password",
+                    "admin",
+                    "--workers",
+                    "4",
+                    "--quiet",
+                ]
+            )
+
+        client.login.assert_awaited_once_with("demo", "admin", "admin")
+        kwargs = export.call_args.kwargs
+        assert kwargs["domain"] == [["active", "=", True]]
+        assert kwargs["fields"] == ["name", "email"]
+        assert kwargs["workers"] == 4
+
+    def test_main_requires_connection_settings(self, monkeypatch):
+        """Missing connection settings are reported as usage errors."""
+        for name in ("ODOO_URL", "ODOO_DATABASE", "ODOO_PASSWORD", "ODOO_API_KEY"):
+            monkeypatch.delenv(name, raising=False)
+
+        with pytest.raises(SystemExit):
+            main(["res.partner", "out.csv", "--username", "admin"])
@@ -0,0 +1,164 @@
+"""
+Tests for the bounded identity map.
+"""
+
+import gc
+from unittest.mock import AsyncMock, MagicMock, patch
+
+import pytest
+
+from zenoo_rpc.client import ZenooClient
+from zenoo_rpc.exceptions import AccessError, RequestTimeoutError
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.models.identity_map import IdentityMap
+from zenoo_rpc.models.relationships import LazyRelationship
+from zenoo_rpc.transaction.manager import Transaction
+
+
+class TestIdentityMap:
+    """Test cases for IdentityMap."""
+
+    def test_get_requires_requested_fields(self):
+        """Records are only served when all requested fields are known."""
+        identity_map = IdentityMap()
+        identity_map.put("res.partner", {"id": 1, "name": "Acme"})
+        identity_map.put("res.partner", {"id": 1, "email": "a@example.com"})
+
+        assert identity_map.get("res.partner", 1, ["name", "email"]) == {
+            "id": 1,
+            "name": "Acme",
+            "email": "a@example.com",
+        }
+        assert identity_map.get("res.partner", 1, ["phone"]) is None
+
+        found, missing = identity_map.get_many("res.partner", [1, 2], ["name"])
+        assert list(found) == [1]
+        assert missing == [2]
+
+    def test_lru_eviction(self):
+        """The least recently used records are evicted beyond max_size."""
+        identity_map = IdentityMap(max_size=2)
+        identity_map.put("res.partner", {"id": 1})
+        identity_map.put("res.partner", {"id": 2})
+        identity_map.get("res.partner", 1)
+        identity_map.put("res.partner", {"id": 3})
+
+        assert ("res.partner", 1) in identity_map
+        assert ("res.partner", 2) not in identity_map
+        assert len(identity_map) == 2
+        assert identity_map.get_stats()["evictions"] == 1
+
+    def test_ttl_expiry(self):
+        """Entries older than the ttl are dropped."""
+        identity_map = IdentityMap(ttl=10)
+        with patch("zenoo_rpc.models.identity_map.time.monotonic", return_value=0):
+            identity_map.put("res.partner", {"id": 1})
+
+        with patch("zenoo_rpc.models.identity_map.time.monotonic", return_value=11):
+            assert identity_map.get("res.partner", 1) is None
+        assert len(identity_map) == 0
+
+    def test_invalidate_and_stale_reads(self):
+        """Invalidation drops records and rejects values read before it."""
+        identity_map = IdentityMap()
+        identity_map.put("res.partner", {"id": 1})
+        identity_map.put("res.partner", {"id": 2})
+        identity_map.put("res.country", {"id": 1})
+        generation = identity_map.generation("res.partner")
+
+        assert identity_map.invalidate("res.partner", [1]) == 1
+        assert ("res.partner", 2) in identity_map
+
+        identity_map.put("res.partner", {"id": 1}, generation)
+        assert ("res.partner", 1) not in identity_map
+
+        identity_map.invalidate("res.partner")
+        assert len(identity_map) == 1
+
+    def test_instances_are_weakly_referenced(self):
+        """Live instances are reused and released once unreferenced."""
+        identity_map = IdentityMap()
+        identity_map.put("res.partner", {"id": 1, "name": "Acme"})
+        partner = ResPartner(id=1, name="Acme")
+        identity_map.put_instance("res.partner", partner, ["id", "name"])
+
+        assert identity_map.get_instance("res.partner", 1, ["name"]) is partner
+        assert identity_map.get_instance("res.partner", 1, ["email"]) is None
+
+        del partner
+        gc.collect()
+        assert identity_map.get_instance("res.partner", 1) is None
+
+
+class TestIdentityMapIntegration:
+    """Test identity map use by relationships, client and transactions."""
+
+    @pytest.mark.asyncio
+    async def test_relationship_loads_hit_identity_map(self):
+        """A second load of the same record does not call the server."""
+        client = AsyncMock()
+        client.search_read.return_value = [
+            {"id": 7, "name": "Parent", "display_name": "Parent"}
+        ]
+
+        def relationship():
+            return LazyRelationship(None, "parent_id", "res.partner", 7, client)
+
+        first = await relationship().load()
+        second = await relationship().load()
+
+        assert client.search_read.call_count == 1
+        assert second is first
+
+        IdentityMap.for_client(client).invalidate("res.partner", [7])
+        await relationship().load()
+        assert client.search_read.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_client_invalidates_on_modifying_calls(self):
+        """Writes drop the affected records unless rejected, reads do not."""
+        with patch("zenoo_rpc.client.AsyncTransport") as mock_transport:
+            transport = AsyncMock()
+            mock_transport.return_value = transport
+            transport.json_rpc_call.return_value = {"result": True}
+
+            with patch("zenoo_rpc.client.SessionManager") as mock_session:
+                mock_session.return_value = MagicMock(is_authenticated=True)
+
+                client = ZenooClient("localhost")
+                for record_id in (1, 2, 3):
+                    client.identity_map.put("res.partner", {"id": record_id})
+
+                await client.execute_kw("res.partner", "read", [[1]])
+                await client.execute_kw("res.partner", "onchange", [[1], {}, [], {}])
+                assert len(client.identity_map) == 3
+
+                await client.execute_kw("res.partner", "write", [[1], {"name": "X"}])
+                assert ("res.partner", 1) not in client.identity_map
+
+                transport.json_rpc_call.side_effect = AccessError("denied")
+                with pytest.raises(AccessError):
+                    await client.execute_kw("res.partner", "unlink", [[2]])
+                assert ("res.partner", 2) in client.identity_map
+
+                # The server may have committed a call whose response was lost
+                transport.json_rpc_call.side_effect = RequestTimeoutError("timeout")
+                with pytest.raises(RequestTimeoutError):
+                    await client.execute_kw("res.partner", "unlink", [[2]])
+                assert ("res.partner", 2) not in client.identity_map
+
+    @pytest.mark.asyncio
+    async def test_transaction_invalidates_touched_records(self):
+        """Committing a transaction drops the records it modified."""
+        client = MagicMock()
+        client.cache_manager = None
+        client.identity_map = IdentityMap()
+        client.identity_map.put("res.partner", {"id": 1})
+        client.identity_map.put("res.partner", {"id": 2})
+
+        transaction = Transaction(client)
+        transaction.add_operation("update", "res.partner", record_ids=[1])
+        await transaction.commit()
+
+        assert ("res.partner", 1) not in client.identity_map
+        assert ("res.partner", 2) in client.identity_map
@@ -0,0 +1,121 @@
+"""
+Tests for fast-path model hydration with OdooModel.from_odoo.
+"""
+
+from datetime import datetime
+from typing import List, Optional
+from unittest.mock import AsyncMock
+
+import pytest
+from pydantic import ValidationError
+
+from zenoo_rpc.models.base import OdooModel
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.models.relationships import LazyRelationship
+from zenoo_rpc.query.builder import QuerySet
+
+RECORD = {
+    "id": 1,
+    "name": "Acme",
+    "email": False,
+    "is_company": False,
+    "parent_id": [3, "Group"],
+    "country_id": False,
+    "child_ids": [4, 5],
+    "create_date": "2025-01-15 08:30:00",
+    "unknown_field": "ignored",
+}
+
+
+class TestFromOdoo:
+    """Test cases for OdooModel.from_odoo."""
+
+    def test_fast_path_matches_validated_path(self):
+        """Both paths produce the same field values."""
+        client = AsyncMock()
+
+        fast = ResPartner.from_odoo(RECORD, client=client)
+        validated = ResPartner.from_odoo(RECORD, client=client, validate=True)
+
+        assert fast.model_dump() == validated.model_dump()
+        assert fast.__dict__["parent_id"] == 3
+        assert fast.__dict__["child_ids"] == [4, 5]
+        assert fast.email is None
+        assert fast.is_company is False
+        assert fast.create_date == datetime(2025, 1, 15, 8, 30)
+        assert fast.client is client
+        assert fast.relationship_manager is not None
+        assert "unknown_field" not in fast.__dict__
+        assert RECORD["parent_id"] == [3, "Group"]
+
+    def test_fast_path_skips_validation(self):
+        """Invalid values are kept until the instance is revalidated."""
+        partner = ResPartner.from_odoo({"id": 1, "name": "Acme", "customer_rank": "x"})
+
+        assert partner.customer_rank == "x"
+        with pytest.raises(ValidationError):
+            partner.revalidate()
+
+        partner = ResPartner.from_odoo({"id": 1, "name": "Acme", "customer_rank": "2"})
+        assert partner.revalidate().customer_rank == 2
+
+    def test_missing_required_fields_are_validated(self):
+        """Records without required fields take the validated path."""
+        with pytest.raises(ValidationError):
+            ResPartner.from_odoo({"id": 1})
+
+    def test_defaults_are_not_shared(self):
+        """Mutable defaults are created per instance."""
+        first = ResPartner.from_odoo({"id": 1, "name": "A"})
+        second = ResPartner.from_odoo({"id": 2, "name": "B"})
+
+        assert first.__dict__["child_ids"] == []
+        assert first.__dict__["child_ids"] is not second.__dict__["child_ids"]
+        assert first.loaded_fields == {"id", "name"}
+
+    def test_relationships_after_fast_path(self):
+        """Relationship fields of fast-path instances load lazily."""
+        partner = ResPartner.from_odoo(RECORD, client=AsyncMock())
+
+        assert isinstance(partner.parent_id, LazyRelationship)
+        assert partner.parent_id.relation_ids == 3
+
+
+class TestConvertOdooValues:
+    """Test the metadata-driven conversion of the validated path."""
+
+    def test_inherited_optional_fields(self):
+        """False becomes None for optional fields declared on a base class."""
+
+        class BaseThing(OdooModel):
+            description: Optional[str] = None
+            count: Optional[int] = None
+
+        class Thing(BaseThing):
+            tags: List[int] = []
+
+        thing = Thing(id=1, description=False, count=False, tags=[1, 2])
+
+        assert thing.description is None
+        assert thing.count is None
+        assert thing.tags == [1, 2]
+
+
+class TestQuerySetHydration:
+    """Test hydration options of QuerySet."""
+
+    @pytest.mark.asyncio
+    async def test_queries_use_fast_path_unless_validated(self):
+        """validated() opts a query into Pydantic validation."""
+        client = AsyncMock()
+        client.cache_manager = None
+        client.search_read.return_value = [
+            {"id": 1, "name": "Acme", "customer_rank": "3"}
+        ]
+
+        fast = await QuerySet(ResPartner, client).all()
+        validated = await QuerySet(ResPartner, client).validated().all()
+
+        assert fast[0].customer_rank == "3"
+        assert validated[0].customer_rank == 3
+        assert QuerySet(ResPartner, client).validated().filter(id=1)._validate
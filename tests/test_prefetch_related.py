@@ -0,0 +1,198 @@
+"""
+Tests for batched prefetch_related loading.
+"""
+
+from typing import Any, List, Optional, Union
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.base import OdooModel
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.models.fields import Many2OneField, One2ManyField
+from zenoo_rpc.models.registry import register_model
+from zenoo_rpc.models.relationships import LazyRelationship
+from zenoo_rpc.query.builder import QuerySet
+from zenoo_rpc.query.lazy import PrefetchManager
+
+
+@register_model("test.prefetch.order")
+class PrefetchOrder(OdooModel):
+    """Order model used by the prefetch tests."""
+
+    name: str
+    partner_id: Optional[Union[int, Any]] = Many2OneField(
+        "res.partner", description="Customer"
+    )
+    line_ids: List[Any] = One2ManyField(
+        "test.prefetch.line", "order_id", description="Lines"
+    )
+
+
+@register_model("test.prefetch.line")
+class PrefetchLine(OdooModel):
+    """Order line model used by the prefetch tests."""
+
+    name: str
+    product_id: Optional[Union[int, Any]] = Many2OneField(
+        "test.prefetch.product", description="Product"
+    )
+
+
+DATA = {
+    "res.partner": {
+        10: {"id": 10, "name": "Alpha"},
+        11: {"id": 11, "name": "Beta"},
+    },
+    "test.prefetch.line": {
+        100: {"id": 100, "name": "L1", "product_id": [500, "Chair"]},
+        101: {"id": 101, "name": "L2", "product_id": [501, "Desk"]},
+        102: {"id": 102, "name": "L3", "product_id": [500, "Chair"]},
+    },
+    "test.prefetch.product": {
+        500: {"id": 500, "name": "Chair", "display_name": "Chair"},
+        501: {"id": 501, "name": "Desk", "display_name": "Desk"},
+    },
+}
+
+
+def make_client():
+    """Create a mock client serving reads from DATA."""
+    client = AsyncMock()
+
+    async def read(model, ids, fields=None, context=None):
+        return [dict(DATA[model][i]) for i in ids if i in DATA[model]]
+
+    client.read.side_effect = read
+    client.execute_kw.return_value = {}
+    client.cache_manager = None
+    return client
+
+
+def make_orders(client):
+    """Create three orders sharing partners and lines."""
+    return [
+        PrefetchOrder(
+            id=1,
+            name="SO1",
+            partner_id=[10, "Alpha"],
+            line_ids=[100, 101],
+            client=client,
+        ),
+        PrefetchOrder(
+            id=2,
+            name="SO2",
+            partner_id=[11, "Beta"],
+            line_ids=[102],
+            client=client,
+        ),
+        PrefetchOrder(
+            id=3, name="SO3", partner_id=[10, "Alpha"], line_ids=[], client=client
+        ),
+    ]
+
+
+def read_calls(client, model):
+    """Return the read calls issued for a model."""
+    return [c for c in client.read.call_args_list if c.args[0] == model]
+
+
+class TestPrefetchManager:
+    """Test cases for PrefetchManager."""
+
+    @pytest.mark.asyncio
+    async def test_many2one_single_read_and_attached(self):
+        """Many2one targets are read once and attached to every parent."""
+        client = make_client()
+        orders = make_orders(client)
+
+        await PrefetchManager(client).prefetch_related(orders, "partner_id")
+
+        calls = read_calls(client, "res.partner")
+        assert len(calls) == 1
+        assert calls[0].args[1] == [10, 11]
+
+        client.read.reset_mock()
+        partner = await orders[0].partner_id
+        assert isinstance(partner, ResPartner)
+        assert partner.name == "Alpha"
+        assert (await orders[2].partner_id) is partner
+        client.read.assert_not_called()
+        client.search_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_one2many_collection(self):
+        """One2many targets keep the parent's id order."""
+        client = make_client()
+        orders = make_orders(client)
+
+        await PrefetchManager(client).prefetch_related(orders, "line_ids")
+
+        relationship = orders[0].line_ids
+        assert isinstance(relationship, LazyRelationship)
+        assert relationship.is_loaded()
+        lines = await relationship
+        assert [line.id for line in lines] == [100, 101]
+        assert await orders[2].line_ids == []
+
+    @pytest.mark.asyncio
+    async def test_nested_path(self):
+        """Nested paths load each level with one read per comodel."""
+        client = make_client()
+        orders = make_orders(client)
+
+        await PrefetchManager(client).prefetch_related(orders, "line_ids.product_id")
+
+        assert len(read_calls(client, "test.prefetch.line")) == 1
+        product_calls = read_calls(client, "test.prefetch.product")
+        assert len(product_calls) == 1
+        assert product_calls[0].args[1] == [500, 501]
+        # The nested field is always part of the parent read
+        assert "product_id" in read_calls(client, "test.prefetch.line")[0].args[2]
+
+        client.read.reset_mock()
+        lines = await orders[0].line_ids
+        product = await lines[1].product_id
+        assert product["name"] == "Desk"
+        client.read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_large_id_sets_are_chunked(self):
+        """Ids are split into chunks of batch_size per read."""
+        client = make_client()
+        orders = make_orders(client)
+
+        await PrefetchManager(client).prefetch_related(orders, "line_ids", batch_size=2)
+
+        calls = read_calls(client, "test.prefetch.line")
+        assert [c.args[1] for c in calls] == [[100, 101], [102]]
+
+    @pytest.mark.asyncio
+    async def test_unknown_field_is_ignored(self):
+        """Non-relational fields do not trigger reads."""
+        client = make_client()
+        orders = make_orders(client)
+
+        await PrefetchManager(client).prefetch_related(orders, "name")
+
+        client.read.assert_not_called()
+
+
+class TestQuerySetPrefetchRelated:
+    """Test prefetch_related integration with QuerySet."""
+
+    @pytest.mark.asyncio
+    async def test_all_prefetches_relationships(self):
+        """QuerySet.all() runs prefetching for the configured fields."""
+        client = make_client()
+        client.search_read.return_value = [
+            {"id": 1, "name": "SO1", "partner_id": [10, "Alpha"], "line_ids": []},
+            {"id": 2, "name": "SO2", "partner_id": [11, "Beta"], "line_ids": []},
+        ]
+
+        orders = (
+            await QuerySet(PrefetchOrder, client).prefetch_related("partner_id").all()
+        )
+
+        assert len(read_calls(client, "res.partner")) == 1
+        assert (await orders[1].partner_id).name == "Beta"
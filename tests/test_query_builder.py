@@ -2,6 +2,7 @@
 Tests for Zenoo-RPC query builder and fluent interface.
 """
 
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
@@ -279,16 +280,20 @@ class TestQuerySet:
         only_fields = self.queryset.only("name", "email")
         assert only_fields._fields == ["name", "email"]
 
-    def test_defer_method(self):
+    def test_defer_method(self, monkeypatch):
         """Test defer method for field exclusion."""
         # Mock model fields
-        ResPartner.model_fields = {
-            "id": None,
-            "name": None,
-            "email": None,
-            "phone": None,
-            "is_company": None,
-        }
+        monkeypatch.setattr(
+            ResPartner,
+            "model_fields",
+            {
+                "id": None,
+                "name": None,
+                "email": None,
+                "phone": None,
+                "is_company": None,
+            },
+        )
 
         deferred = self.queryset.defer("phone", "is_company")
         expected_fields = ["id", "name", "email"]
@@ -362,6 +367,54 @@ class TestQuerySet:
         )
         assert count == 42
 
+    @pytest.mark.asyncio
+    async def test_capped_count(self):
+        """Test count with a limit searches at most that many ids."""
+        self.mock_client.execute_kw.return_value = list(range(1, 101))
+
+        assert await self.queryset.count(limit=100) == 100
+        self.mock_client.execute_kw.assert_called_once_with(
+            "res.partner", "search", [[]], {"limit": 100, "order": "id"}, context={}
+        )
+
+        # Counts below the cap are exact and reused
+        self.mock_client.execute_kw.return_value = [1, 2]
+        queryset = self.queryset.filter(is_company=True)
+        assert await queryset.count(limit=100) == 2
+        assert await queryset.count() == 2
+        assert self.mock_client.execute_kw.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_exists_method(self):
+        """Test exists searches for a single id."""
+        self.mock_client.execute_kw.return_value = [7]
+
+        assert await self.queryset.filter(is_company=True).exists() is True
+        self.mock_client.execute_kw.assert_called_once_with(
+            "res.partner",
+            "search",
+            [[("is_company", "=", True)]],
+            {"limit": 1},
+            context={},
+        )
+
+        self.mock_client.execute_kw.return_value = []
+        assert await self.queryset.exists() is False
+
+    @pytest.mark.asyncio
+    async def test_first_with_fields(self):
+        """Test first only fetches the given and required fields."""
+        self.mock_client.search_read.return_value = [
+            {"id": 1, "name": "John Doe", "email": "john@example.com"}
+        ]
+
+        result = await self.queryset.first("email")
+
+        call_args = self.mock_client.search_read.call_args
+        assert call_args[1]["fields"] == ["email", "id", "name"]
+        assert call_args[1]["limit"] == 1
+        assert result.email == "john@example.com"
+
 
 class TestQueryBuilder:
     """Test cases for QueryBuilder."""
@@ -427,3 +480,147 @@ class TestQueryBuilder:
 
         assert isinstance(result, ResPartner)
         assert result.name == "New Partner"
+
+
+class TestBulkWrites:
+    """Test server-side update and delete of matching records."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+        self.in_flight = 0
+        self.max_in_flight = 0
+
+        async def execute_kw(model, method, args, kwargs=None, context=None):
+            if method == "search":
+                ids = list(range(1, 2501))
+                for leaf in args[0]:
+                    if leaf[:2] == ("id", ">"):
+                        ids = [i for i in ids if i > leaf[2]]
+                return ids[: kwargs.get("limit")]
+            self.in_flight += 1
+            self.max_in_flight = max(self.max_in_flight, self.in_flight)
+            await asyncio.sleep(0)
+            self.in_flight -= 1
+            return True
+
+        self.mock_client = AsyncMock()
+        self.mock_client.execute_kw.side_effect = execute_kw
+        self.mock_client.cache_manager = AsyncMock()
+        self.queryset = QuerySet(ResPartner, self.mock_client).filter(active=False)
+
+    def calls(self, method):
+        return [
+            call.args
+            for call in self.mock_client.execute_kw.call_args_list
+            if call.args[1] == method
+        ]
+
+    @pytest.mark.asyncio
+    async def test_update(self):
+        """Matching ids are written in concurrent chunks."""
+        updated = await self.queryset.update(
+            {"active": True}, chunk_size=1000, concurrency=2
+        )
+
+        assert updated == 2500
+        assert [args[2][0] for args in self.calls("search")] == [
+            [("active", "=", False), ("id", ">", 0)],
+            [("active", "=", False), ("id", ">", 1000)],
+            [("active", "=", False), ("id", ">", 2000)],
+        ]
+        assert all(
+            args[3] == {"limit": 1000, "order": "id asc"}
+            for args in self.calls("search")
+        )
+        writes = self.calls("write")
+        assert [len(args[2][0]) for args in writes] == [1000, 1000, 500]
+        assert all(args[2][1] == {"active": True} for args in writes)
+        assert self.max_in_flight == 2
+        self.mock_client.search_read.assert_not_called()
+        self.mock_client.cache_manager.invalidate_pattern.assert_awaited_once_with(
+            "query:res.partner:*"
+        )
+
+    @pytest.mark.asyncio
+    async def test_delete(self):
+        """Matching ids are unlinked in chunks."""
+        deleted = await self.queryset.delete(chunk_size=2000)
+
+        assert deleted == 2500
+        assert [args[2] for args in self.calls("unlink")] == [
+            [list(range(1, 2001))],
+            [list(range(2001, 2501))],
+        ]
+        self.mock_client.cache_manager.invalidate_pattern.assert_awaited_once()
+
+    @pytest.mark.asyncio
+    async def test_limited_query_is_searched_once(self):
+        """Queries with a limit search their ids in one call."""
+        deleted = await self.queryset.limit(1500).delete(chunk_size=1000)
+
+        assert deleted == 1500
+        assert self.calls("search") == [
+            ("res.partner", "search", [[("active", "=", False)]], {"limit": 1500})
+        ]
+        assert [len(args[2][0]) for args in self.calls("unlink")] == [1000, 500]
+
+    @pytest.mark.asyncio
+    async def test_nothing_to_do(self):
+        """Empty queries and updates without values make no writes."""
+        assert await self.queryset.filter(id__in=[]).delete() == 0
+        self.mock_client.execute_kw.assert_not_called()
+
+        with pytest.raises(ValueError):
+            await self.queryset.update({})
+
+
+class TestInBulk:
+    """Test fetching records by id."""
+
+    def setup_method(self):
+        """Set up test fixtures."""
+
+        def records(ids):
+            return [{"id": i, "name": f"Partner {i}"} for i in ids if i != 404]
+
+        async def read(model, ids, fields=None, context=None, **kwargs):
+            return records(reversed(ids))
+
+        async def search_read(model, domain=None, **kwargs):
+            return records(domain[0][2])
+
+        self.mock_client = AsyncMock()
+        self.mock_client.cache_manager = None
+        self.mock_client.read.side_effect = read
+        self.mock_client.search_read.side_effect = search_read
+
+    @pytest.mark.asyncio
+    async def test_in_bulk_reads_by_id(self):
+        """Unfiltered lookups go through the client's chunked read."""
+        builder = QueryBuilder(ResPartner, self.mock_client)
+
+        result = await builder.in_bulk([3, 1, 404, 3], chunk_size=500)
+
+        assert list(result) == [3, 1]
+        assert result[1].name == "Partner 1"
+        self.mock_client.read.assert_awaited_once()
+        assert self.mock_client.read.call_args.args[1] == [3, 1, 404]
+        assert self.mock_client.read.call_args.kwargs["chunk_size"] == 500
+
+    @pytest.mark.asyncio
+    async def test_in_bulk_with_filters(self):
+        """Filtered lookups send one search_read per chunk of ids."""
+        queryset = QuerySet(ResPartner, self.mock_client).filter(is_company=True)
+
+        result = await queryset.in_bulk(range(1, 6), chunk_size=2)
+
+        assert list(result) == [1, 2, 3, 4, 5]
+        domains = [
+            call.kwargs["domain"]
+            for call in self.mock_client.search_read.call_args_list
+        ]
+        assert domains == [
+            [("id", "in", [1, 2]), ("is_company", "=", True)],
+            [("id", "in", [3, 4]), ("is_company", "=", True)],
+            [("id", "in", [5]), ("is_company", "=", True)],
+        ]
@@ -5,11 +5,14 @@ Tests for query builder cache integration.
 import pytest
 from unittest.mock import AsyncMock, MagicMock
 
+from src.zenoo_rpc.client import ZenooClient
 from src.zenoo_rpc.query.builder import QuerySet, QueryBuilder
 from src.zenoo_rpc.models.common import ResPartner
+from src.zenoo_rpc.cache.entities import EntityCache
 from src.zenoo_rpc.cache.manager import CacheManager
 from src.zenoo_rpc.cache.backends import MemoryCache
 from src.zenoo_rpc.cache.strategies import TTLCache
+from src.zenoo_rpc.exceptions import ValidationError
 
 
 class TestQueryCache:
@@ -233,3 +236,218 @@ class TestQueryCache:
 
         # Should call database both times
         assert mock_client.search_read.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_cache_revalidation(self):
+        """Test stale cached results are revalidated with write_date."""
+        mock_client = AsyncMock()
+
+        memory_backend = MemoryCache()
+        ttl_strategy = TTLCache(memory_backend)
+        cache_manager = CacheManager()
+        cache_manager.add_backend("memory", memory_backend)
+        cache_manager.add_strategy("memory", ttl_strategy)
+        cache_manager.set_default_backend("memory")
+
+        mock_client.cache_manager = cache_manager
+
+        server = {
+            "changed": [],
+            "ids": [1, 2],
+            "records": {
+                1: {"id": 1, "name": "Partner 1"},
+                2: {"id": 2, "name": "Partner 2"},
+            },
+        }
+
+        async def execute_kw(model, method, args, kwargs=None, context=None):
+            if method == "search_count":
+                return len(server["ids"])
+            if args[0][0][0] == "write_date":
+                return server["changed"]
+            return server["ids"]
+
+        async def search_read(model, domain=None, **kwargs):
+            ids = domain[-1][2] if domain[-1][0] == "id" else server["ids"]
+            return [server["records"][i] for i in ids]
+
+        mock_client.execute_kw.side_effect = execute_kw
+        mock_client.search_read.side_effect = search_read
+
+        queryset = QuerySet(
+            ResPartner, mock_client, domain=[("is_company", "=", True)]
+        ).cache(ttl=3600, revalidate_after=30)
+        cache_key = queryset._generate_cache_key()
+
+        async def age_cache_entry():
+            entry = await cache_manager.get(cache_key)
+            entry["stored_at"] -= 60
+            await cache_manager.set(cache_key, entry, ttl=3600)
+
+        await queryset._execute_query()
+
+        # Fresh entries are served without revalidation
+        await queryset._execute_query()
+        mock_client.execute_kw.assert_not_called()
+
+        # Unchanged stale results are reused
+        await age_cache_entry()
+        result = await queryset._execute_query()
+        assert [row["name"] for row in result] == ["Partner 1", "Partner 2"]
+        assert mock_client.search_read.call_count == 1
+
+        # Only modified and new records are read
+        server["changed"] = [2, 3]
+        server["ids"] = [1, 2, 3]
+        server["records"][2] = {"id": 2, "name": "Renamed"}
+        server["records"][3] = {"id": 3, "name": "Partner 3"}
+        await age_cache_entry()
+
+        result = await queryset._execute_query()
+
+        assert [row["name"] for row in result] == ["Partner 1", "Renamed", "Partner 3"]
+        assert mock_client.search_read.call_args.kwargs["domain"] == [
+            ("id", "in", [2, 3])
+        ]
+        assert (await cache_manager.get(cache_key))["rows"] == result
+
+    @pytest.mark.asyncio
+    async def test_normalized_cache(self):
+        """Test queries share cached records and only read missing ones."""
+        mock_client = AsyncMock()
+
+        memory_backend = MemoryCache()
+        ttl_strategy = TTLCache(memory_backend)
+        cache_manager = CacheManager()
+        cache_manager.add_backend("memory", memory_backend)
+        cache_manager.add_strategy("memory", ttl_strategy)
+        cache_manager.set_default_backend("memory")
+
+        mock_client.cache_manager = cache_manager
+
+        records = {
+            1: {"id": 1, "name": "Partner 1", "email": "p1@test.com"},
+            2: {"id": 2, "name": "Partner 2", "email": "p2@test.com"},
+        }
+
+        async def search_read(model, domain=None, fields=None, **kwargs):
+            ids = domain[0][2] if domain and domain[0][0] == "id" else [1, 2]
+            return [{name: records[i][name] for name in ("id", *fields)} for i in ids]
+
+        mock_client.search_read.side_effect = search_read
+
+        companies = (
+            QuerySet(ResPartner, mock_client, domain=[("is_company", "=", True)])
+            .only("name", "email")
+            .cache(normalized=True)
+        )
+        await companies._execute_query()
+
+        # Records are stored once, queries as id lists
+        entry = await cache_manager.get(companies._generate_cache_key())
+        assert entry == {"ids": [1, 2]}
+        assert await cache_manager.get("record:res.partner:1") == {
+            "values": records[1],
+            "complete": False,
+        }
+
+        # Another query with a subset of the fields reuses the records
+        names = (
+            QuerySet(ResPartner, mock_client, domain=[("id", "<", 10)])
+            .only("name")
+            .cache(normalized=True)
+        )
+        await cache_manager.set(names._generate_cache_key(), {"ids": [2, 1]})
+        result = await names._execute_query()
+        assert result == [
+            {"id": 2, "name": "Partner 2"},
+            {"id": 1, "name": "Partner 1"},
+        ]
+        assert mock_client.search_read.call_count == 1
+
+        # Invalidated records are read again in one call
+        await cache_manager.delete("record:res.partner:2")
+        records[2]["email"] = "new@test.com"
+        result = await companies._execute_query()
+        assert result[1]["email"] == "new@test.com"
+        assert mock_client.search_read.call_args.kwargs["domain"] == [("id", "in", [2])]
+
+    @pytest.mark.asyncio
+    async def test_writes_invalidate_cached_records(self):
+        """Test writes through the client drop the records they modify."""
+        client = ZenooClient("localhost")
+        client._transport = AsyncMock()
+        transport = client._transport.json_rpc_call
+        transport.return_value = {"result": True}
+        client._session = MagicMock(is_authenticated=True, database="db", uid=1)
+        client._session.get_call_context.return_value = {}
+
+        client.cache_manager = CacheManager()
+        await client.cache_manager.setup_memory_cache()
+
+        # Nothing to invalidate before records are cached normalized
+        client.cache_manager.delete_many = AsyncMock(
+            wraps=client.cache_manager.delete_many
+        )
+        await client.execute_kw("res.partner", "write", [[1], {"name": "A"}])
+        client.cache_manager.delete_many.assert_not_called()
+
+        await EntityCache(client.cache_manager).put_records(
+            "res.partner", [{"id": 1}, {"id": 2}], None
+        )
+        transport.side_effect = ValidationError("rejected")
+        with pytest.raises(ValidationError):
+            await client.execute_kw("res.partner", "write", [[2], {"name": "B"}])
+        transport.side_effect = None
+
+        await client.execute_kw("res.partner", "write", [[1], {"name": "A"}])
+
+        assert await client.cache_manager.get("record:res.partner:1") is None
+        assert await client.cache_manager.get("record:res.partner:2") is not None
+
+    @pytest.mark.asyncio
+    async def test_queries_with_context_are_not_normalized(self):
+        """Test queries with a context do not share record fragments."""
+        mock_client = AsyncMock()
+        cache_manager = CacheManager()
+        await cache_manager.setup_memory_cache()
+        mock_client.cache_manager = cache_manager
+        mock_client.search_read.return_value = [{"id": 1, "name": "Partenaire"}]
+
+        partners = (
+            QuerySet(ResPartner, mock_client)
+            .with_context(lang="fr_FR")
+            .only("name")
+            .cache(normalized=True)
+        )
+        await partners._execute_query()
+
+        assert await cache_manager.get("record:res.partner:1") is None
+        assert await cache_manager.get(partners._generate_cache_key()) == [
+            {"id": 1, "name": "Partenaire"}
+        ]
+
+    @pytest.mark.asyncio
+    async def test_in_bulk_uses_normalized_cache(self):
+        """Test in_bulk reads cached records in bulk and only fetches others."""
+        mock_client = AsyncMock()
+        cache_manager = CacheManager()
+        await cache_manager.setup_memory_cache()
+        mock_client.cache_manager = cache_manager
+
+        async def read(model, ids, fields=None, **kwargs):
+            return [{"id": i, "name": f"Partner {i}"} for i in ids]
+
+        mock_client.read.side_effect = read
+
+        partners = QuerySet(ResPartner, mock_client).only("name").cache(normalized=True)
+        await partners.in_bulk([1, 2])
+        result = await partners.in_bulk([2, 3, 1])
+
+        assert [partner.name for partner in result.values()] == [
+            "Partner 2",
+            "Partner 3",
+            "Partner 1",
+        ]
+        assert mock_client.read.call_args.args[1] == [3]
+        assert cache_manager.stats["total_hits"] == 2
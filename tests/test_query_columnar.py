@@ -0,0 +1,196 @@
+"""
+Tests for columnar export of query results.
+"""
+
+import datetime
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.models.registry import get_registry
+from zenoo_rpc.query.builder import QuerySet
+
+pa = pytest.importorskip("pyarrow")
+
+from zenoo_rpc.query.columnar import ArrowBatchBuilder  # noqa: E402
+
+FIELD_TYPES = {
+    "name": {"type": "char"},
+    "is_company": {"type": "boolean"},
+    "customer_rank": {"type": "integer"},
+    "parent_id": {"type": "many2one"},
+    "type": {"type": "selection"},
+    "child_ids": {"type": "one2many"},
+    "create_date": {"type": "datetime"},
+    "date": {"type": "date"},
+}
+
+PAGES = [
+    [
+        {
+            "id": 1,
+            "name": "Acme",
+            "is_company": True,
+            "customer_rank": 3,
+            "parent_id": False,
+            "type": "contact",
+            "child_ids": [2],
+            "create_date": "2025-01-15 08:30:00",
+            "date": "2025-01-15",
+        },
+        {
+            "id": 2,
+            "name": False,
+            "is_company": False,
+            "customer_rank": False,
+            "parent_id": [1, "Acme"],
+            "type": "invoice",
+            "child_ids": [],
+            "create_date": False,
+            "date": False,
+        },
+    ],
+    [
+        {
+            "id": 3,
+            "name": "Bolt",
+            "is_company": False,
+            "customer_rank": 0,
+            "parent_id": [1, "Acme"],
+            "type": False,
+            "child_ids": False,
+            "create_date": "2025-02-01 00:00:00",
+            "date": "2025-02-01",
+        }
+    ],
+]
+
+FIELDS = list(FIELD_TYPES)
+
+
+def make_client():
+    """Create a client returning the sample pages."""
+    client = AsyncMock()
+    client.cache_manager = None
+    client.execute_kw.return_value = FIELD_TYPES
+    client.search_read.side_effect = [list(page) for page in PAGES]
+    return client
+
+
+class TestArrowBatchBuilder:
+    """Test cases for ArrowBatchBuilder."""
+
+    def test_types_and_nulls(self):
+        """Columns are typed from field types and False becomes null."""
+        builder = ArrowBatchBuilder(
+            {name: info["type"] for name, info in FIELD_TYPES.items()}, FIELDS
+        )
+        batch = builder.build(PAGES[0])
+
+        assert batch.schema.names == [
+            "id",
+            "name",
+            "is_company",
+            "customer_rank",
+            "parent_id",
+            "parent_id_name",
+            "type",
+            "child_ids",
+            "create_date",
+            "date",
+        ]
+        assert batch.column("name").to_pylist() == ["Acme", None]
+        assert batch.column("is_company").to_pylist() == [True, False]
+        assert batch.column("customer_rank").to_pylist() == [3, None]
+        assert batch.column("parent_id").to_pylist() == [None, 1]
+        assert batch.column("parent_id_name").to_pylist() == [None, "Acme"]
+        assert pa.types.is_dictionary(batch.schema.field("type").type)
+        assert batch.column("child_ids").to_pylist() == [[2], []]
+        assert batch.column("create_date").to_pylist() == [
+            datetime.datetime(2025, 1, 15, 8, 30),
+            None,
+        ]
+        assert batch.column("date").to_pylist() == [datetime.date(2025, 1, 15), None]
+
+    def test_untyped_fields_are_inferred(self):
+        """Fields without a known type are typed from their values."""
+        builder = ArrowBatchBuilder()
+        batch = builder.build(
+            [
+                {"id": 1, "email": False, "score": 1.5, "country_id": [5, "VN"]},
+                {"id": 2, "email": "a@b.c", "score": False, "country_id": False},
+            ]
+        )
+
+        assert builder.schema.field("score").type == pa.float64()
+        assert batch.column("email").to_pylist() == [None, "a@b.c"]
+        assert batch.column("country_id_name").to_pylist() == ["VN", None]
+
+    def test_display_name_column_collision(self):
+        """A field named like a many2one display name column is rejected."""
+        builder = ArrowBatchBuilder(
+            {"parent_id": "many2one", "parent_id_name": "char"},
+            ["parent_id", "parent_id_name"],
+        )
+
+        with pytest.raises(ValueError, match="parent_id_name"):
+            builder.build([])
+
+
+class TestQuerySetColumnarExport:
+    """Test QuerySet.to_arrow, to_pandas and to_numpy."""
+
+    @pytest.fixture(autouse=True)
+    def fresh_field_definitions(self):
+        """Make queries read the field types of the mocked server."""
+        get_registry()._field_cache.pop("res.partner", None)
+        yield
+        get_registry()._field_cache.pop("res.partner", None)
+
+    @pytest.mark.asyncio
+    async def test_to_arrow_streams_pages(self):
+        """Every page becomes one record batch of a single table."""
+        client = make_client()
+
+        table = await QuerySet(ResPartner, client).only(*FIELDS).to_arrow(page_size=2)
+
+        assert table.num_rows == 3
+        assert len(table.to_batches()) == 2
+        assert table.column("id").to_pylist() == [1, 2, 3]
+        assert table.column("parent_id").to_pylist() == [None, 1, 1]
+        assert table.column("type").to_pylist() == ["contact", "invoice", None]
+        assert client.search_read.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_empty_result(self):
+        """An empty result has the schema of the requested fields."""
+        client = make_client()
+        client.search_read.side_effect = [[]]
+
+        table = await QuerySet(ResPartner, client).only("parent_id").to_arrow()
+
+        assert table.num_rows == 0
+        assert table.schema.names == ["id", "parent_id", "parent_id_name"]
+
+    @pytest.mark.asyncio
+    async def test_to_pandas_and_to_numpy(self):
+        """DataFrames and numpy arrays are built from the Arrow table."""
+        pytest.importorskip("pandas")
+        np = pytest.importorskip("numpy")
+
+        df = (
+            await QuerySet(ResPartner, make_client())
+            .only(*FIELDS)
+            .to_pandas(page_size=2)
+        )
+        assert list(df["id"]) == [1, 2, 3]
+        assert df["parent_id_name"].isna().tolist() == [True, False, False]
+
+        arrays = (
+            await QuerySet(ResPartner, make_client())
+            .only(*FIELDS)
+            .to_numpy(page_size=2)
+        )
+        assert arrays["id"].dtype == np.int64
+        assert np.isnan(arrays["parent_id"][0])
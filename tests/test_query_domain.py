@@ -0,0 +1,230 @@
+"""
+Tests for the domain compiler.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.query.builder import QuerySet
+from zenoo_rpc.query.domain import (
+    FALSE_LEAF,
+    DomainCompiler,
+    compile_domain,
+    is_empty_domain,
+    normalize_domain,
+)
+from zenoo_rpc.query.expressions import Field, OrExpression
+from zenoo_rpc.query.filters import Q
+
+
+class TestDomainCompiler:
+    """Test cases for DomainCompiler."""
+
+    def test_flatten_and_deduplicate(self):
+        """Nested operators are flattened and repeated leaves removed."""
+        domain = [
+            "&",
+            ("active", "=", True),
+            "&",
+            ("is_company", "==", True),
+            ("active", "=", True),
+        ]
+        assert compile_domain(domain) == [
+            ("active", "=", True),
+            ("is_company", "=", True),
+        ]
+
+        domain = [
+            "|",
+            "|",
+            ("a", "<", 1),
+            ("b", "<", 1),
+            "|",
+            ("c", "<", 1),
+            ("a", "<", 1),
+        ]
+        assert compile_domain(domain) == [
+            "|",
+            "|",
+            ("a", "<", 1),
+            ("b", "<", 1),
+            ("c", "<", 1),
+        ]
+
+    def test_constant_folding(self):
+        """Conditions independent of the records are folded."""
+        assert compile_domain([("id", "in", [])]) == [FALSE_LEAF]
+        assert compile_domain([("id", "not in", []), ("name", "=?", False)]) == []
+        assert compile_domain(["|", ("id", "in", []), ("name", "=", "A")]) == [
+            ("name", "=", "A")
+        ]
+        assert compile_domain(["!", ("id", "not in", [])]) == [FALSE_LEAF]
+        assert compile_domain(["!", "!", ("name", "=", "A")]) == [("name", "=", "A")]
+        assert compile_domain([("name", "=?", "A")]) == [("name", "=", "A")]
+
+    def test_or_of_equalities(self):
+        """Equalities on one field are merged into ``in``."""
+        domain = (
+            Q(state="draft") | Q(state="sent") | Q(state__in=["sale", "draft"])
+        ).to_domain()
+        assert compile_domain(domain) == [("state", "in", ["draft", "sent", "sale"])]
+
+        # Unset values are kept as separate conditions
+        domain = ["|", ("country_id", "=", False), ("country_id", "=", 1)]
+        assert compile_domain(domain) == domain
+
+    def test_id_intersection(self):
+        """Conditions on ids are intersected."""
+        domain = [("id", "in", [1, 2, 3]), ("name", "!=", "A"), ("id", "in", [3, 2])]
+        assert compile_domain(domain) == [("id", "in", [2, 3]), ("name", "!=", "A")]
+        assert is_empty_domain([("id", "=", 1), ("id", "=", 2)])
+
+        # x2many fields mean "contains any", which cannot be intersected
+        domain = [("tag_ids", "in", [1]), ("tag_ids", "in", [2])]
+        assert compile_domain(domain) == domain
+
+    def test_nested_groups(self):
+        """Mixed operators keep their structure."""
+        domain = [
+            "|",
+            ("name", "ilike", "acme"),
+            "&",
+            ("is_company", "=", True),
+            "!",
+            ("country_id", "in", [1, 1, 2]),
+        ]
+        assert compile_domain(domain) == [
+            "|",
+            ("name", "ilike", "acme"),
+            "&",
+            ("is_company", "=", True),
+            "!",
+            ("country_id", "in", [1, 2]),
+        ]
+
+    def test_malformed_domains_are_unchanged(self):
+        """Domains that cannot be parsed are left to the server."""
+        assert compile_domain(["|", ("name", "=", "A")]) == ["|", ("name", "=", "A")]
+        assert compile_domain([("name", "=")]) == [("name", "=")]
+
+    def test_memoization(self):
+        """Structurally equal domains are compiled once."""
+        compiler = DomainCompiler(max_size=2)
+        compiler.compile([("name", "=", "A")])
+        result = compiler.compile([["name", "=", "A"]])
+        result.append(("id", "=", 1))
+
+        assert compiler.compile([("name", "=", "A")]) == [("name", "=", "A")]
+        assert compiler.get_stats() == {"hits": 2, "misses": 1, "size": 1}
+
+        compiler.compile([("name", "=", "B")])
+        compiler.compile([("name", "=", "C")])
+        assert compiler.get_stats()["size"] == 2
+
+        # Unhashable values are compiled without memoization
+        assert compiler.compile([("name", "=", {"a": 1})]) == [("name", "=", {"a": 1})]
+
+    def test_memoized_values_are_not_shared(self):
+        """Each call returns new lists for leaf values."""
+        compiler = DomainCompiler()
+        compiler.compile([("id", "in", [1, 2])])[0][2].append(3)
+
+        assert compiler.compile([("id", "in", [1, 2])]) == [("id", "in", [1, 2])]
+
+    def test_equal_values_of_different_types(self):
+        """0/False and 1/True are distinct conditions."""
+        compiler = DomainCompiler()
+        assert compiler.compile([("qty", "=", False)]) == [("qty", "=", False)]
+        assert compiler.compile([("qty", "=", 0)]) == [("qty", "=", 0)]
+        assert compiler.get_stats()["misses"] == 2
+
+        assert compiler.compile([("a", "=", 0), ("a", "=", False)]) == [
+            ("a", "=", 0),
+            ("a", "=", False),
+        ]
+        assert compiler.compile(["|", ("a", "=", 1), ("a", "=", True)]) == [
+            ("a", "in", [1, True])
+        ]
+
+
+class TestDomainBuilding:
+    """Test that Q objects and expressions build valid prefix domains."""
+
+    def test_normalize_domain(self):
+        """Implicit top-level AND becomes explicit."""
+        assert normalize_domain([("a", "=", 1)]) == [("a", "=", 1)]
+        assert normalize_domain([("a", "=", 1), "!", ("b", "=", 2)]) == [
+            "&",
+            ("a", "=", 1),
+            "!",
+            ("b", "=", 2),
+        ]
+
+    def test_q_operands(self):
+        """Operands with several conditions are grouped."""
+        domain = (Q(state="draft") | Q(state="sent", is_company=True)).to_domain()
+        assert domain == [
+            "|",
+            ("state", "=", "draft"),
+            "&",
+            ("state", "=", "sent"),
+            ("is_company", "=", True),
+        ]
+
+        domain = (~Q(active=True, is_company=True)).to_domain()
+        assert domain == ["!", "&", ("active", "=", True), ("is_company", "=", True)]
+
+    def test_expression_operands(self):
+        """OR of several expressions has one operator per operand."""
+        name, state = Field("name"), Field("state")
+        domain = OrExpression(
+            name == "A", state == "draft", (name == "B") & (state == "sent")
+        ).to_domain()
+        assert domain == [
+            "|",
+            "|",
+            ("name", "=", "A"),
+            ("state", "=", "draft"),
+            "&",
+            ("name", "=", "B"),
+            ("state", "=", "sent"),
+        ]
+
+
+class TestQuerySetDomainCompilation:
+    """Test compiled domains in QuerySet."""
+
+    @pytest.fixture
+    def client(self):
+        client = AsyncMock()
+        client.cache_manager = None
+        client.search_read.return_value = [{"id": 1, "name": "Acme"}]
+        client.execute_kw.return_value = 1
+        return client
+
+    @pytest.mark.asyncio
+    async def test_compiled_domain_is_sent(self, client):
+        """Chained filters are simplified before the RPC."""
+        queryset = (
+            QuerySet(ResPartner, client)
+            .filter(Q(name="Acme") | Q(name="Corp"))
+            .filter(is_company=True)
+            .filter(is_company=True)
+        )
+
+        await queryset.all()
+
+        domain = client.search_read.call_args.kwargs["domain"]
+        assert domain == [("name", "in", ["Acme", "Corp"]), ("is_company", "=", True)]
+
+    @pytest.mark.asyncio
+    async def test_empty_queries_skip_rpc(self, client):
+        """Provably empty queries return without calling the server."""
+        queryset = QuerySet(ResPartner, client).filter(id__in=[])
+
+        assert await queryset.all() == []
+        assert await queryset.count() == 0
+        client.search_read.assert_not_called()
+        client.execute_kw.assert_not_called()
@@ -0,0 +1,183 @@
+"""
+Tests for client-side domain evaluation.
+"""
+
+from datetime import date
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.query.builder import QuerySet
+from zenoo_rpc.query.evaluator import filtered_domain
+from zenoo_rpc.query.expressions import Field
+from zenoo_rpc.query.filters import Q
+from zenoo_rpc.query.recordset import RecordSet
+
+PARTNERS = [
+    {
+        "id": 1,
+        "name": "Acme SARL",
+        "country_id": [75, "France"],
+        "category_id": [1, 2],
+        "is_company": True,
+        "date": "2024-03-01",
+    },
+    {
+        "id": 2,
+        "name": "Globex",
+        "country_id": [233, "United States"],
+        "category_id": [],
+        "is_company": True,
+        "date": False,
+    },
+    {
+        "id": 3,
+        "name": "John Doe",
+        "country_id": False,
+        "category_id": [2],
+        "is_company": False,
+        "date": "2023-12-31",
+    },
+]
+
+
+def ids(records):
+    return [record["id"] for record in records]
+
+
+class TestFilteredDomain:
+    """Test cases for filtered_domain."""
+
+    def test_equality_and_unset_values(self):
+        """False matches unset values and many2one fields compare ids."""
+        assert ids(filtered_domain(PARTNERS, [("country_id", "=", 75)])) == [1]
+        assert ids(filtered_domain(PARTNERS, [("country_id", "=", False)])) == [3]
+        assert ids(filtered_domain(PARTNERS, [("country_id", "!=", 75)])) == [2, 3]
+        assert ids(filtered_domain(PARTNERS, [("is_company", "=", False)])) == [3]
+        assert ids(filtered_domain(PARTNERS, [("category_id", "=", False)])) == [2]
+
+    def test_membership(self):
+        """``in`` accepts False and matches any id of x2many fields."""
+        domain = [("country_id", "in", [233, False])]
+        assert ids(filtered_domain(PARTNERS, domain)) == [2, 3]
+        domain = [("category_id", "in", [2])]
+        assert ids(filtered_domain(PARTNERS, domain)) == [1, 3]
+        domain = [("country_id", "not in", [75])]
+        assert ids(filtered_domain(PARTNERS, domain)) == [2, 3]
+
+    def test_comparisons_and_patterns(self):
+        """Comparisons skip unset values; ilike matches display names."""
+        domain = [("date", ">=", date(2024, 1, 1))]
+        assert ids(filtered_domain(PARTNERS, domain)) == [1]
+        assert ids(filtered_domain(PARTNERS, [("name", "ilike", "sarl")])) == [1]
+        assert ids(filtered_domain(PARTNERS, [("name", "=like", "G_obex")])) == [2]
+        assert ids(filtered_domain(PARTNERS, [("country_id", "ilike", "unit")])) == [2]
+        assert ids(filtered_domain(PARTNERS, [("name", "not ilike", "o")])) == [1]
+
+    def test_logical_operators(self):
+        """Q objects and expressions with & | ! are evaluated."""
+        query = (Q(is_company=True) & ~Q(country_id=75)) | Q(name__icontains="john")
+        assert ids(filtered_domain(PARTNERS, query)) == [2, 3]
+
+        expression = (Field("id") > 1) & Field("name").startswith("glo")
+        assert ids(filtered_domain(PARTNERS, expression)) == [2]
+
+        assert filtered_domain(PARTNERS, [("id", "in", [])]) == []
+        assert filtered_domain(PARTNERS, []) == PARTNERS
+
+    def test_unsupported_conditions(self):
+        """Conditions without a local equivalent raise ValueError."""
+        for domain in (
+            [("country_id.code", "=", "FR")],
+            [("country_id", "=", "France")],
+            [("parent_id", "child_of", 1)],
+            [("email", "=", "a@b.c")],
+            [("category_id", "ilike", "vip")],
+        ):
+            with pytest.raises(ValueError):
+                filtered_domain(PARTNERS, domain)
+
+    def test_recordset(self):
+        """RecordSets are filtered column by column."""
+        recordset = RecordSet.from_records(PARTNERS, "res.partner")
+
+        result = recordset.filtered_domain(
+            ["|", ("country_id", "=", 233), ("category_id", "in", [1])]
+        )
+
+        assert result.ids == [1, 2]
+        assert result.column("country_id") == [(75, "France"), (233, "United States")]
+
+
+class TestQuerySetRefinement:
+    """Test QuerySets answered from an evaluated parent query."""
+
+    @pytest.fixture
+    def client(self):
+        client = AsyncMock()
+        client.cache_manager = None
+        client.search_read.return_value = [dict(record) for record in PARTNERS]
+        return client
+
+    @pytest.mark.asyncio
+    async def test_refinement_without_rpc(self, client):
+        """Refining an evaluated QuerySet does not query the server."""
+        partners = QuerySet(ResPartner, client).refinable()
+        await partners.all()
+
+        companies = partners.refine(is_company=True)
+        french = companies.refine(country_id=75)
+
+        assert [p.id for p in await companies.all()] == [1, 2]
+        assert [p.id for p in await french.all()] == [1]
+        assert await companies.count() == 2
+        assert (await companies.first()).id == 1
+        assert client.search_read.call_count == 1
+
+    @pytest.mark.asyncio
+    async def test_paged_refinement(self, client):
+        """Limit and offset apply to locally evaluated results."""
+        partners = QuerySet(ResPartner, client).refinable()
+        await partners.all()
+        companies = partners.refine(is_company=True)
+
+        assert await companies.limit(1).count() == 1
+        assert await companies.offset(1).count() == 1
+        assert not await companies.offset(2).exists()
+        assert [p.id for p in await companies.offset(1).all()] == [2]
+        assert client.search_read.call_count == 1
+        client.execute_kw.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_records_are_kept_only_when_refinable(self, client):
+        """Other queries do not keep the fetched records."""
+        partners = QuerySet(ResPartner, client)
+        await partners.all()
+        assert partners._records_data is None
+
+        await partners.refine(is_company=True).all()
+        assert client.search_read.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_filter_queries_the_server(self, client):
+        """filter() always queries the server, even on evaluated queries."""
+        partners = QuerySet(ResPartner, client)
+        await partners.all()
+
+        await partners.filter(is_company=True).all()
+        assert client.search_read.call_count == 2
+
+    @pytest.mark.asyncio
+    async def test_fallback_to_server(self, client):
+        """Unsupported or sliced refinements are sent to the server."""
+        partners = QuerySet(ResPartner, client).refinable()
+        await partners.all()
+
+        await partners.refine(country_id__name="France").all()
+        assert client.search_read.call_count == 2
+
+        limited = partners.limit(1)
+        await limited.all()
+        await limited.refine(is_company=True).all()
+        assert client.search_read.call_count == 4
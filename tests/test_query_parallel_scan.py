@@ -0,0 +1,119 @@
+"""
+Tests for QuerySet.parallel_scan sharded id-range reads.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.query.builder import QuerySet
+
+
+def make_client(ids):
+    """Create a mock client serving records with the given ids."""
+    client = AsyncMock()
+
+    def matches(record_id, domain):
+        for field, operator, value in domain:
+            if field != "id":
+                continue
+            if operator == ">=" and not record_id >= value:
+                return False
+            if operator == "<" and not record_id < value:
+                return False
+            if operator == ">" and not record_id > value:
+                return False
+        return True
+
+    async def execute_kw(model, method, args, kwargs=None, context=None):
+        assert method == "search"
+        ordered = sorted(ids, reverse=kwargs["order"] == "id desc")
+        return ordered[: kwargs["limit"]]
+
+    async def search_read(model, domain, fields=None, limit=None, order=None, **kw):
+        found = [i for i in sorted(ids) if matches(i, domain)]
+        return [{"id": i, "name": f"Partner {i}"} for i in found[:limit]]
+
+    client.execute_kw.side_effect = execute_kw
+    client.search_read.side_effect = search_read
+    return client
+
+
+class TestParallelScan:
+    """Test cases for parallel id-range scans."""
+
+    @pytest.mark.asyncio
+    async def test_ordered_scan_returns_all_records_in_id_order(self):
+        """Ordered scans yield every record exactly once by ascending id."""
+        ids = list(range(1, 101)) + [250, 900]
+        queryset = QuerySet(ResPartner, make_client(ids))
+
+        results = [
+            p.id
+            async for p in queryset.parallel_scan(workers=4, page_size=7, ordered=True)
+        ]
+
+        assert results == sorted(ids)
+
+    @pytest.mark.asyncio
+    async def test_unordered_scan_returns_all_records(self):
+        """Unordered scans yield every record exactly once."""
+        ids = list(range(10, 60))
+        queryset = QuerySet(ResPartner, make_client(ids))
+
+        results = [p.id async for p in queryset.parallel_scan(workers=3, page_size=5)]
+
+        assert sorted(results) == ids
+
+    @pytest.mark.asyncio
+    async def test_ranges_are_disjoint_and_cover_id_space(self):
+        """The id space is split into contiguous, non-overlapping ranges."""
+        queryset = QuerySet(ResPartner, make_client([5, 6, 50, 99]))
+
+        ranges = await queryset._split_id_ranges(4)
+
+        assert ranges[0][0] == 5
+        assert ranges[-1][1] == 100
+        for (_, high), (low, _) in zip(ranges, ranges[1:]):
+            assert high == low
+
+    @pytest.mark.asyncio
+    async def test_workers_capped_by_id_span(self):
+        """More workers than ids never produces empty ranges."""
+        queryset = QuerySet(ResPartner, make_client([1, 2]))
+
+        ranges = await queryset._split_id_ranges(8)
+
+        assert ranges == [(1, 2), (2, 3)]
+
+    @pytest.mark.asyncio
+    async def test_empty_result(self):
+        """Scanning an empty model yields nothing and reads no pages."""
+        client = make_client([])
+        queryset = QuerySet(ResPartner, client)
+
+        results = [p async for p in queryset.parallel_scan(workers=4)]
+
+        assert results == []
+        client.search_read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_reader_errors_propagate(self):
+        """Errors raised by a range reader surface to the consumer."""
+        client = make_client(list(range(1, 20)))
+        client.search_read.side_effect = RuntimeError("server down")
+        queryset = QuerySet(ResPartner, client)
+
+        with pytest.raises(RuntimeError, match="server down"):
+            async for _ in queryset.parallel_scan(workers=2):
+                pass
+
+    @pytest.mark.asyncio
+    async def test_invalid_workers(self):
+        """A worker count below one is rejected."""
+        queryset = QuerySet(ResPartner, make_client([1]))
+
+        with pytest.raises(ValueError):
+            async for _ in queryset.parallel_scan(workers=0):
+                pass
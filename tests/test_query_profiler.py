@@ -0,0 +1,133 @@
+"""
+Tests for automatic field projection.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.exceptions import FieldNotLoadedError
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.query.builder import QuerySet
+from zenoo_rpc.query.profiler import FieldProfiler
+
+PARTNERS = [
+    {"id": 1, "name": "Acme", "email": "info@acme.test", "phone": "+1 555"},
+    {"id": 2, "name": "Globex", "email": "info@globex.test", "phone": "+1 556"},
+]
+
+
+def requested_fields(client):
+    return client.search_read.call_args.kwargs.get("fields")
+
+
+class TestAutoOnly:
+    """Test cases for QuerySet.auto_only."""
+
+    @pytest.fixture
+    def client(self):
+        client = AsyncMock()
+        client.cache_manager = None
+
+        async def search_read(model, domain=None, fields=None, **kwargs):
+            return [
+                {
+                    name: value
+                    for name, value in record.items()
+                    if not fields or name == "id" or name in fields
+                }
+                for record in PARTNERS
+            ]
+
+        async def execute_kw(model, method, args, kwargs=None, context=None):
+            return [
+                {"id": record["id"], **{f: record[f] for f in kwargs["fields"]}}
+                for record in PARTNERS
+                if record["id"] in args[0]
+            ]
+
+        client.search_read.side_effect = search_read
+        client.execute_kw.side_effect = execute_kw
+        return client
+
+    async def run(self, client):
+        """Execute the same call site and read the partner names."""
+        partners = await QuerySet(ResPartner, client).auto_only().all()
+        return partners, [partner.name for partner in partners]
+
+    @pytest.mark.asyncio
+    async def test_warm_runs_request_observed_fields(self, client):
+        """The first run fetches all fields, later runs only those read."""
+        for _ in range(2):
+            partners, names = await self.run(client)
+            assert names == ["Acme", "Globex"]
+            if requested_fields(client) is None:
+                assert partners[0].email == "info@acme.test"
+
+        assert requested_fields(client) == ["email", "id", "name"]
+
+        stats = FieldProfiler.for_client(client).get_stats()
+        assert stats["call_sites"] == 1
+        assert stats["executions"] == 2
+
+    @pytest.mark.asyncio
+    async def test_missing_field_raises_and_widens_profile(self, client):
+        """Reading a field that was not fetched fails and is fetched next time."""
+        await self.run(client)
+        partners, _ = await self.run(client)
+        assert requested_fields(client) == ["id", "name"]
+
+        with pytest.raises(FieldNotLoadedError, match="fetch_missing"):
+            _ = partners[0].phone
+        client.execute_kw.assert_not_called()
+
+        # The profile now includes the missed field
+        await self.run(client)
+        assert requested_fields(client) == ["id", "name", "phone"]
+        assert FieldProfiler.for_client(client).get_stats()["misses"] == 1
+
+    @pytest.mark.asyncio
+    async def test_fetch_missing_loads_result_set_in_one_read(self, client):
+        """fetch_missing() reads the fields for all records of the result."""
+        await self.run(client)
+        partners, _ = await self.run(client)
+
+        await partners[0].fetch_missing("phone")
+        assert [partner.phone for partner in partners] == ["+1 555", "+1 556"]
+        client.execute_kw.assert_called_once()
+        assert client.execute_kw.call_args.args[2] == [[1, 2]]
+
+        await partners[1].fetch_missing("phone")
+        client.execute_kw.assert_called_once()
+
+    @pytest.mark.asyncio
+    async def test_only_profiled_results_are_tracked(self, client):
+        """Records keep their class and other queries are not tracked."""
+        await self.run(client)
+        partners, _ = await self.run(client)
+        assert type(partners[0]) is ResPartner
+
+        plain = await QuerySet(ResPartner, client).only("name").all()
+        assert plain[0].phone is None
+        assert FieldProfiler.for_client(client).get_stats()["misses"] == 0
+
+        await plain[0].fetch_missing("phone")
+        assert plain[0].phone == "+1 555"
+        assert plain[1].phone is None
+        assert client.execute_kw.call_args.args[2] == [[1]]
+
+    @pytest.mark.asyncio
+    async def test_opt_in(self, client):
+        """Queries are only profiled when enabled and not restricted."""
+        await QuerySet(ResPartner, client).all()
+        await QuerySet(ResPartner, client).all()
+        assert requested_fields(client) is None
+
+        for _ in range(2):
+            await QuerySet(ResPartner, client).only("name", "email").auto_only().all()
+        assert requested_fields(client) == ["name", "email"]
+
+        client.field_profiler = FieldProfiler(auto_only=True)
+        for _ in range(2):
+            await QuerySet(ResPartner, client).all()
+        assert requested_fields(client) == ["id", "name"]
@@ -0,0 +1,163 @@
+"""
+Tests for the columnar RecordSet container.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.query.builder import QuerySet
+from zenoo_rpc.query.recordset import RecordSet, Row
+
+RECORDS = [
+    {
+        "id": 1,
+        "name": "Desk",
+        "list_price": 120.0,
+        "active": True,
+        "state": "draft",
+        "categ_id": [7, "Furniture"],
+        "tag_ids": [1, 2],
+    },
+    {
+        "id": 2,
+        "name": "chair",
+        "list_price": False,
+        "active": False,
+        "state": "done",
+        "categ_id": False,
+        "tag_ids": [],
+    },
+    {
+        "id": 3,
+        "name": "Lamp",
+        "list_price": 35.5,
+        "active": True,
+        "state": "draft",
+        "categ_id": [8, "Lighting"],
+        "tag_ids": [2],
+    },
+]
+
+
+def make_recordset():
+    """Create a RecordSet of the sample records."""
+    return RecordSet.from_records(
+        RECORDS, "product.product", {"state": "selection", "list_price": "float"}
+    )
+
+
+class TestRecordSet:
+    """Test cases for RecordSet."""
+
+    def test_columns_and_rows(self):
+        """Values round-trip with False as None and many2one as tuples."""
+        recordset = make_recordset()
+
+        assert len(recordset) == 3
+        assert recordset.ids == [1, 2, 3]
+        assert recordset.column("list_price") == [120.0, None, 35.5]
+        assert recordset.column("active") == [True, False, True]
+        assert recordset.column("categ_id") == [(7, "Furniture"), None, (8, "Lighting")]
+        assert recordset.column("tag_ids") == [[1, 2], [], [2]]
+
+        row = recordset[0]
+        assert isinstance(row, Row)
+        assert row.name == "Desk"
+        assert row["state"] == "draft"
+        assert recordset[-1].id == 3
+        assert recordset.to_records()[1]["categ_id"] is None
+        with pytest.raises(AttributeError):
+            _ = row.missing
+
+    def test_compact_storage(self):
+        """Numbers use arrays and selection values are dictionary-encoded."""
+        recordset = make_recordset()
+
+        assert recordset._columns["id"].data.typecode == "q"
+        assert recordset._columns["list_price"].data.typecode == "d"
+        assert recordset._columns["state"].categories == ["draft", "done"]
+        assert recordset.memory_usage() > 0
+
+    def test_leading_false_values(self):
+        """Columns starting with False values pick their kind later."""
+        recordset = RecordSet.from_records(
+            [{"id": 1, "email": False, "flag": False}, {"id": 2, "email": "a@b.c"}]
+        )
+
+        assert recordset.column("email") == [None, "a@b.c"]
+        assert recordset.column("flag") == [False, None]
+
+    def test_mixed_values_fall_back_to_lists(self):
+        """Values of different types are kept in a plain column."""
+        recordset = RecordSet.from_records([{"id": 1, "x": 5}, {"id": 2, "x": "five"}])
+
+        assert recordset.column("x") == [5, "five"]
+
+    def test_filter(self):
+        """Lookups filter whole columns."""
+        recordset = make_recordset()
+
+        assert recordset.filter(state="draft").ids == [1, 3]
+        assert recordset.filter(state__in=["done", "cancel"]).ids == [2]
+        assert recordset.filter(state="cancel").ids == []
+        assert recordset.filter(categ_id=8).ids == [3]
+        assert recordset.filter(list_price__lt=100).ids == [3]
+        assert recordset.filter(name__icontains="CH").ids == [2]
+        assert recordset.filter(list_price__isnull=True).ids == [2]
+        assert recordset.filter(lambda row: row.id > 1, active=True).ids == [3]
+        with pytest.raises(ValueError):
+            recordset.filter(name__regex="x")
+
+        # Filtered selection columns do not share categories with the source
+        drafts = recordset.filter(state="draft")
+        drafts._columns["state"].append("cancel")
+        assert recordset._columns["state"].code("cancel") is None
+
+    def test_order_by(self):
+        """Sorting supports several keys and PostgreSQL null ordering."""
+        recordset = make_recordset()
+
+        assert recordset.order_by("list_price").ids == [3, 1, 2]
+        assert recordset.order_by("-list_price").ids == [2, 1, 3]
+        assert recordset.order_by("state", "-id").ids == [2, 3, 1]
+        assert recordset.order_by("-id")[:2].ids == [3, 2]
+
+
+class TestQuerySetAsRecordSet:
+    """Test QuerySet.as_recordset."""
+
+    @pytest.mark.asyncio
+    async def test_pages_are_appended(self):
+        """Records are fetched with keyset pages."""
+        client = AsyncMock()
+        client.cache_manager = None
+        client.execute_kw.return_value = {"name": {"type": "char"}}
+        client.search_read.side_effect = [
+            [{"id": 1, "name": "A"}, {"id": 2, "name": "B"}],
+            [{"id": 3, "name": "C"}],
+        ]
+
+        recordset = (
+            await QuerySet(ResPartner, client).only("name").as_recordset(page_size=2)
+        )
+
+        assert recordset.ids == [1, 2, 3]
+        assert recordset.model_name == "res.partner"
+        assert client.search_read.call_count == 2
+        assert client.search_read.call_args.kwargs["domain"] == [("id", ">", 2)]
+
+    @pytest.mark.asyncio
+    async def test_ordered_query_uses_single_call(self):
+        """Limit, offset and ordering are applied by the server."""
+        client = AsyncMock()
+        client.cache_manager = None
+        client.search_read.return_value = [{"id": 2, "name": "B"}]
+
+        recordset = (
+            await QuerySet(ResPartner, client).order_by("name").limit(1).as_recordset()
+        )
+
+        assert recordset.ids == [2]
+        assert client.search_read.call_args.kwargs["limit"] == 1
@@ -0,0 +1,178 @@
+"""
+Tests for batched relationship loading through RelationshipLoader.
+"""
+
+import asyncio
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResPartner
+from zenoo_rpc.models.relationships import LazyRelationship, RelationshipLoader
+from zenoo_rpc.query.builder import QuerySet
+
+
+def make_client():
+    """Create a mock client serving partner-like records by id."""
+    client = AsyncMock()
+    client.cache_manager = None
+
+    async def search_read(model, domain=None, fields=None, context=None, **kwargs):
+        ids = domain[0][2]
+        return [
+            {"id": i, "name": f"Record {i}", "display_name": f"Record {i}"}
+            for i in ids
+            if i < 1000
+        ]
+
+    client.search_read.side_effect = search_read
+    return client
+
+
+def make_relationship(client, relation_ids, is_collection=False, **kwargs):
+    """Create a lazy relationship on a detached parent."""
+    return LazyRelationship(
+        parent_record=None,
+        field_name="parent_id",
+        relation_model="res.partner",
+        relation_ids=relation_ids,
+        client=client,
+        is_collection=is_collection,
+        **kwargs,
+    )
+
+
+class TestRelationshipLoader:
+    """Test cases for RelationshipLoader."""
+
+    @pytest.mark.asyncio
+    async def test_concurrent_loads_are_coalesced(self):
+        """Loads started in the same tick share one read."""
+        client = make_client()
+
+        results = await asyncio.gather(
+            make_relationship(client, 1).load(),
+            make_relationship(client, 2).load(),
+            make_relationship(client, [2, 3], is_collection=True).load(),
+        )
+
+        assert client.search_read.call_count == 1
+        assert client.search_read.call_args.kwargs["domain"] == [
+            ("id", "in", [1, 2, 3])
+        ]
+        assert results[0].name == "Record 1"
+        assert [r.id for r in results[2]] == [2, 3]
+
+    @pytest.mark.asyncio
+    async def test_groups_by_model_and_fields(self):
+        """Different field sets are loaded in separate batches."""
+        client = make_client()
+
+        await asyncio.gather(
+            make_relationship(client, 1).load(),
+            make_relationship(client, 2).load(fields=["name", "email"]),
+        )
+
+        assert client.search_read.call_count == 2
+        field_sets = sorted(
+            c.kwargs["fields"] for c in client.search_read.call_args_list
+        )
+        assert field_sets == [
+            ["id", "name", "display_name"],
+            ["id", "name", "email"],
+        ]
+
+    @pytest.mark.asyncio
+    async def test_batches_are_chunked(self):
+        """Ids beyond max_batch_size are split into several reads."""
+        client = make_client()
+        loader = RelationshipLoader(client, max_batch_size=2)
+
+        records = await loader.load_many("res.partner", [1, 2, 3, 4, 5])
+
+        assert client.search_read.call_count == 3
+        assert sorted(records) == [1, 2, 3, 4, 5]
+
+    @pytest.mark.asyncio
+    async def test_missing_records(self):
+        """Ids the server does not return resolve to nothing."""
+        client = make_client()
+
+        assert await make_relationship(client, 1500).load() is None
+        assert await make_relationship(client, [1, 1500], True).load() != []
+
+    @pytest.mark.asyncio
+    async def test_errors_propagate_and_allow_retry(self):
+        """A failed batch fails its loads, which can be retried."""
+        client = make_client()
+        search_read = client.search_read.side_effect
+        client.search_read.side_effect = RuntimeError("server down")
+        relationship = make_relationship(client, 1)
+
+        with pytest.raises(RuntimeError, match="server down"):
+            await relationship.load()
+
+        client.search_read.side_effect = search_read
+        assert (await relationship.load()).id == 1
+
+    @pytest.mark.asyncio
+    async def test_loader_per_client_and_scope(self):
+        """Clients get their own loader unless a scoped one is active."""
+        client = make_client()
+        other_client = make_client()
+
+        loader = RelationshipLoader.for_client(client)
+        assert RelationshipLoader.for_client(client) is loader
+        assert RelationshipLoader.for_client(other_client) is not loader
+
+        scoped = RelationshipLoader(client)
+        with scoped.scope():
+            assert RelationshipLoader.for_client(client) is scoped
+            assert RelationshipLoader.for_client(other_client) is not scoped
+        assert RelationshipLoader.for_client(client) is loader
+
+    @pytest.mark.asyncio
+    async def test_sequential_access_on_query_results(self):
+        """Awaiting one record's relationship loads it for all siblings."""
+        client = make_client()
+        client.search_read.side_effect = None
+        client.search_read.return_value = [
+            {"id": i, "name": f"Partner {i}", "parent_id": [100 + i, "Parent"]}
+            for i in range(1, 6)
+        ]
+        partners = await QuerySet(ResPartner, client).all()
+
+        client.search_read.reset_mock()
+        client.search_read.side_effect = make_client().search_read.side_effect
+        parents = [await partner.parent_id for partner in partners]
+
+        assert client.search_read.call_count == 1
+        assert [p.id for p in parents] == [101, 102, 103, 104, 105]
+        assert all(isinstance(p, ResPartner) for p in parents)
+
+    @pytest.mark.asyncio
+    async def test_load_with_new_fields_reads_them(self):
+        """Loading a loaded relationship with more fields reads the missing ones."""
+        client = make_client()
+
+        async def search_read(model, domain=None, fields=None, context=None, **kw):
+            record = {"id": 1, "name": "Record 1", "display_name": "Record 1"}
+            record["email"] = "r1@test.com"
+            return [{name: record[name] for name in fields}]
+
+        client.search_read.side_effect = search_read
+        relationship = make_relationship(client, 1)
+
+        assert (await relationship.load()).name == "Record 1"
+        assert (await relationship.load(fields=["name"])).name == "Record 1"
+        assert client.search_read.call_count == 1
+
+        record = await relationship.load(fields=["email"])
+        assert record.email == "r1@test.com"
+        assert record.name == "Record 1"
+        assert client.search_read.call_args.kwargs["fields"] == [
+            "id",
+            "name",
+            "display_name",
+            "email",
+        ]
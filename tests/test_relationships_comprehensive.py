@@ -5,14 +5,13 @@ This test file focuses on testing scenarios and methods that are not covered
 in the basic test_relationships.py file to increase overall coverage.
 """
 
-import pytest
 import asyncio
-from unittest.mock import AsyncMock, MagicMock, patch
+from unittest.mock import AsyncMock, MagicMock
+
+import pytest
 
-from src.zenoo_rpc.models.relationships import (
-    LazyRelationship, 
-    RelationshipManager
-)
+from src.zenoo_rpc.models.identity_map import IdentityMap
+from src.zenoo_rpc.models.relationships import LazyRelationship, RelationshipManager
 
 
 class TestLazyRelationshipComprehensive:
@@ -124,29 +123,25 @@ class TestLazyRelationshipComprehensive:
         assert result == []
 
     @pytest.mark.asyncio
-    async def test_lazy_relationship_prefetch_cache(self):
-        """Test LazyRelationship prefetch cache functionality."""
+    async def test_lazy_relationship_identity_map(self):
+        """Test LazyRelationship loads known records from the identity map."""
         client = AsyncMock()
         parent_record = MagicMock()
 
-        # Clear any existing cache
-        if hasattr(LazyRelationship, '_prefetch_cache'):
-            LazyRelationship._prefetch_cache.clear()
-
         lazy_rel = LazyRelationship(
             parent_record=parent_record,
             field_name="company_id",
-            relation_model="res.company",
+            relation_model="test.cached.company",
             relation_ids=123,
             client=client,
             is_collection=False,
         )
 
-        # Manually populate prefetch cache
-        cache_key = f"{lazy_rel.relation_model}:{lazy_rel.relation_ids}"
-        LazyRelationship._prefetch_cache[cache_key] = {
-            "id": 123, "name": "Cached", "display_name": "Cached"
-        }
+        # Manually populate the client's identity map
+        IdentityMap.for_client(client).put(
+            "test.cached.company",
+            {"id": 123, "name": "Cached", "display_name": "Cached"},
+        )
 
         # Load should return cached data without calling client
         result = await lazy_rel.load()
@@ -163,9 +158,9 @@ class TestLazyRelationshipComprehensive:
         ]
 
         # Clear batch queues
-        if hasattr(LazyRelationship, '_batch_queue'):
+        if hasattr(LazyRelationship, "_batch_queue"):
             LazyRelationship._batch_queue.clear()
-        if hasattr(LazyRelationship, '_batch_tasks'):
+        if hasattr(LazyRelationship, "_batch_tasks"):
             LazyRelationship._batch_tasks.clear()
 
         parent_record = MagicMock()
@@ -203,6 +198,7 @@ class TestLazyRelationshipComprehensive:
 
         # Create a slow loading function
         load_count = 0
+
         async def slow_load(*args, **kwargs):
             nonlocal load_count
             load_count += 1
@@ -300,7 +296,7 @@ class TestRelationshipManager:
             field_name="company_id",
             relation_model="res.company",
             relation_data=123,
-            is_collection=False
+            is_collection=False,
         )
 
         assert isinstance(relationship, LazyRelationship)
@@ -314,7 +310,7 @@ class TestRelationshipManager:
             field_name="child_ids",
             relation_model="res.partner",
             relation_data=[1, 2, 3],
-            is_collection=True
+            is_collection=True,
         )
 
         assert isinstance(relationship, LazyRelationship)
@@ -343,15 +339,12 @@ class TestRelationshipManager:
         rel2.is_collection = False
         rel2._is_loaded = False
 
-        manager._relationships = {
-            "country_id": rel1,
-            "state_id": rel2
-        }
+        manager._relationships = {"country_id": rel1, "state_id": rel2}
 
         # Mock client response
         client.search_read.return_value = [
             {"id": 1, "name": "Country 1"},
-            {"id": 2, "name": "Country 2"}
+            {"id": 2, "name": "Country 2"},
         ]
 
         # Test prefetching
@@ -384,15 +377,12 @@ class TestRelationshipManager:
         rel2.is_collection = False
         rel2._is_loaded = False
 
-        manager._relationships = {
-            "country_id": rel1,
-            "partner_id": rel2
-        }
+        manager._relationships = {"country_id": rel1, "partner_id": rel2}
 
         # Mock client responses
         client.search_read.side_effect = [
             [{"id": 1, "name": "Country 1"}],
-            [{"id": 2, "name": "Partner 1"}]
+            [{"id": 2, "name": "Partner 1"}],
         ]
 
         # Test prefetching
@@ -435,10 +425,7 @@ class TestRelationshipManager:
         rel2._is_loaded = True
         rel2._loaded_data = {"id": 2}
 
-        manager._relationships = {
-            "company_id": rel1,
-            "partner_id": rel2
-        }
+        manager._relationships = {"company_id": rel1, "partner_id": rel2}
 
         # Test invalidation
         manager.invalidate_all()
@@ -0,0 +1,218 @@
+"""
+Tests for the local SQLite read replica.
+"""
+
+import pytest
+
+from zenoo_rpc.models.common import ResCurrency
+from zenoo_rpc.models.registry import get_registry
+from zenoo_rpc.query.builder import QuerySet
+from zenoo_rpc.sync import LocalReplica, domain_to_sql, order_to_sql
+
+COLUMNS = {
+    "id": "integer",
+    "name": "char",
+    "rate": "float",
+    "active": "boolean",
+    "country_id": "many2one",
+    "tag_ids": "many2many",
+}
+
+FIELD_TYPES = {
+    "name": {"type": "char"},
+    "symbol": {"type": "char"},
+    "rate": {"type": "float"},
+    "active": {"type": "boolean"},
+    "write_date": {"type": "datetime"},
+}
+
+
+class FakeOdoo:
+    """Minimal server for res.currency answering sync and query calls."""
+
+    def __init__(self):
+        self.records = {
+            1: ("EUR", "€", 1.0, True),
+            2: ("USD", "$", 1.08, True),
+            3: ("VND", "₫", 27000.0, True),
+            4: ("DEM", "DM", False, False),
+        }
+        self.search_reads = 0
+
+    def _rows(self, domain, active_test):
+        rows = [
+            {
+                "id": record_id,
+                "name": name,
+                "symbol": symbol,
+                "rate": rate,
+                "active": active,
+                "write_date": "2025-01-01 00:00:00",
+            }
+            for record_id, (name, symbol, rate, active) in self.records.items()
+            if active or not active_test
+        ]
+        for term in domain:
+            if term[0] == "id" and term[1] == ">":
+                rows = [row for row in rows if row["id"] > term[2]]
+        return rows
+
+    async def search_read(
+        self, model, domain=None, fields=None, limit=None, order=None, context=None
+    ):
+        self.search_reads += 1
+        context = context or {}
+        rows = self._rows(domain or [], context.get("active_test", True))
+        if order == "write_date desc":
+            return rows[:1]
+        if any(term[0] == "write_date" for term in domain or [] if len(term) == 3):
+            return []
+        return rows[:limit]
+
+    async def execute_kw(self, model, method, args, kwargs=None, context=None):
+        if method == "fields_get":
+            return FIELD_TYPES
+        if method == "search":
+            return [row["id"] for row in self._rows(args[0], False)]
+        raise AssertionError(f"Unexpected call {method}")
+
+
+@pytest.fixture
+def server():
+    """Create the fake server with fresh field definitions."""
+    get_registry()._field_cache.pop("res.currency", None)
+    yield FakeOdoo()
+    get_registry()._field_cache.pop("res.currency", None)
+
+
+@pytest.fixture
+async def replica(server, tmp_path):
+    """Create a replica of res.currency."""
+    replica = LocalReplica(server, str(tmp_path / "replica.db"), max_staleness=60)
+    replica.register("res.currency")
+    server.replica = replica
+    yield replica
+    await replica.close()
+
+
+class TestDomainToSql:
+    """Test cases for domain_to_sql and order_to_sql."""
+
+    def test_translation(self):
+        """Conditions follow Odoo semantics for False and negations."""
+        assert domain_to_sql([], COLUMNS) == ("1 = 1", [])
+        assert domain_to_sql([("country_id", "=", False)], COLUMNS) == (
+            '"country_id" IS NULL',
+            [],
+        )
+        assert domain_to_sql([("name", "!=", "EUR")], COLUMNS) == (
+            '("name" != ? OR "name" IS NULL)',
+            ["EUR"],
+        )
+        assert domain_to_sql(
+            ["|", ("active", "=", False), ("name", "ilike", "e_r")], COLUMNS
+        ) == (
+            '(("active" = 0 OR "active" IS NULL) OR "name" LIKE ? ESCAPE \'\\\')',
+            ["%e\\_r%"],
+        )
+        assert domain_to_sql([("id", "in", [])], COLUMNS) == ("1 = 0", [])
+        assert domain_to_sql([("country_id", "in", [1, False])], COLUMNS) == (
+            '("country_id" IN (?) OR "country_id" IS NULL)',
+            [1],
+        )
+
+    def test_untranslatable(self):
+        """Unsupported domains are left to the server."""
+        assert domain_to_sql([("tag_ids", "in", [1])], COLUMNS) is None
+        assert domain_to_sql([("country_id.code", "=", "VN")], COLUMNS) is None
+        assert domain_to_sql([("name", "like", "E")], COLUMNS) is None
+        assert domain_to_sql([("name", "ilike", "Đồng")], COLUMNS) is None
+        assert domain_to_sql([("id", "child_of", 1)], COLUMNS) is None
+        assert domain_to_sql(["|", ("name", "=", "EUR")], COLUMNS) is None
+
+    def test_order(self):
+        """Orderings put nulls last ascending and first descending."""
+        assert order_to_sql("rate desc, id", COLUMNS) == (
+            '"rate" IS NULL DESC, "rate" DESC, "id" IS NULL ASC, "id" ASC'
+        )
+        assert order_to_sql("country_id", COLUMNS) is None
+        assert order_to_sql("name collate", COLUMNS) is None
+
+
+class TestLocalReplica:
+    """Test cases for LocalReplica."""
+
+    @pytest.mark.asyncio
+    async def test_queries_are_answered_locally(self, server, replica):
+        """After the first sync, queries do not call the server."""
+        records = await replica.search_read(
+            "res.currency", [("rate", ">", 1)], fields=["name", "active"]
+        )
+        calls = server.search_reads
+
+        assert records == [
+            {"id": 2, "name": "USD", "active": True},
+            {"id": 3, "name": "VND", "active": True},
+        ]
+        assert await replica.search_count("res.currency", []) == 3
+        assert server.search_reads == calls
+
+    @pytest.mark.asyncio
+    async def test_archived_records(self, replica):
+        """Archived records follow the active_test rules of Odoo."""
+        archived = await replica.search_read(
+            "res.currency", [("active", "=", False)], fields=["rate"]
+        )
+        assert archived == [{"id": 4, "rate": False}]
+
+        count = await replica.search_count(
+            "res.currency", [], context={"active_test": False}
+        )
+        assert count == 4
+
+    @pytest.mark.asyncio
+    async def test_staleness(self, server, replica):
+        """Stale models are refreshed before they are queried."""
+        await replica.search_read("res.currency", [])
+        assert replica.refreshes == 1
+
+        replica.mark_stale("res.currency")
+        await replica.search_read("res.currency", [])
+        assert replica.refreshes == 2
+
+        await replica.search_read("res.currency", [])
+        assert replica.refreshes == 2
+
+    @pytest.mark.asyncio
+    async def test_unsupported_queries_miss(self, replica):
+        """Untranslatable queries and contexts return None."""
+        assert (
+            await replica.search_read("res.currency", [("name", "like", "E")]) is None
+        )
+        assert (
+            await replica.search_read("res.currency", [], context={"lang": "fr_FR"})
+            is None
+        )
+        assert await replica.search_read("res.partner", []) is None
+        assert replica.get_stats()["misses"] == 3
+
+
+class TestQuerySetReplica:
+    """Test QuerySet offloading to the replica."""
+
+    @pytest.mark.asyncio
+    async def test_queryset_uses_replica(self, server, replica):
+        """Replicated models are queried locally unless disabled."""
+        server.cache_manager = None
+        queryset = QuerySet(ResCurrency, server)
+
+        eur = await queryset.filter(name="EUR").first()
+        calls = server.search_reads
+        usd = await queryset.filter(name="USD").first()
+
+        assert (eur.name, usd.symbol) == ("EUR", "$")
+        assert server.search_reads == calls
+        assert await queryset.filter(rate__lt=2).count() == 2
+
+        await queryset.using_replica(False).filter(name="USD").all()
+        assert server.search_reads == calls + 1
@@ -0,0 +1,141 @@
+"""
+Tests for select_related server-side field expansion.
+"""
+
+from unittest.mock import AsyncMock
+
+import pytest
+
+from zenoo_rpc.models.common import ResCountry, ResPartner
+from zenoo_rpc.query.builder import QuerySet
+
+
+def make_client(version_info):
+    """Create a mock client reporting the given server version."""
+    client = AsyncMock()
+    client.cache_manager = None
+    client.server_version = {"server_version_info": version_info}
+
+    async def execute_kw(model, method, args, kwargs=None, context=None):
+        if method == "fields_get":
+            return {}
+        if method == "web_search_read":
+            return {
+                "length": 3,
+                "records": [
+                    {
+                        "id": 1,
+                        "name": "Alpha",
+                        "country_id": {"id": 5, "name": "Vietnam", "code": "VN"},
+                    },
+                    {
+                        "id": 2,
+                        "name": "Beta",
+                        "country_id": {"id": 5, "name": "Vietnam", "code": "VN"},
+                    },
+                    {"id": 3, "name": "Gamma", "country_id": False},
+                ],
+            }
+        raise AssertionError(f"Unexpected call {method}")
+
+    async def read(model, ids, fields=None, context=None):
+        assert model == "res.country"
+        return [{"id": i, "name": f"Country {i}", "code": "XX"} for i in ids]
+
+    client.execute_kw.side_effect = execute_kw
+    client.read.side_effect = read
+    client.search_read.return_value = [
+        {"id": 1, "name": "Alpha", "country_id": [5, "Vietnam"]},
+        {"id": 2, "name": "Beta", "country_id": [6, "Laos"]},
+        {"id": 3, "name": "Gamma", "country_id": False},
+    ]
+    return client
+
+
+def method_calls(client, method):
+    """Return execute_kw calls for a given method."""
+    return [c for c in client.execute_kw.call_args_list if c.args[1] == method]
+
+
+class TestSelectRelated:
+    """Test cases for select_related."""
+
+    @pytest.mark.asyncio
+    async def test_specification_single_round_trip(self):
+        """Odoo 17+ expands many2one targets in one web_search_read."""
+        client = make_client([17, 0, 0, "final", 0, ""])
+
+        partners = (
+            await QuerySet(ResPartner, client)
+            .only("name")
+            .select_related("country_id")
+            .all()
+        )
+
+        calls = method_calls(client, "web_search_read")
+        assert len(calls) == 1
+        specification = calls[0].args[3]["specification"]
+        assert set(specification) == {"id", "name", "country_id"}
+        assert {"name", "code"} <= set(specification["country_id"]["fields"])
+        client.search_read.assert_not_called()
+
+        country = await partners[0].country_id
+        assert isinstance(country, ResCountry)
+        assert country.code == "VN"
+        assert (await partners[1].country_id) is country
+        assert (await partners[2].country_id) is None
+        client.read.assert_not_called()
+
+    @pytest.mark.asyncio
+    async def test_specification_merges_paths_with_same_field(self):
+        """Paths through the same field expand it once with all nested fields."""
+        client = make_client([17, 0, 0, "final", 0, ""])
+
+        specification = await (
+            QuerySet(ResPartner, client)
+            .only("name")
+            .select_related("country_id.x_region_id", "country_id.x_zone_id")
+            ._build_specification()
+        )
+
+        country_fields = specification["country_id"]["fields"]
+        assert {"name", "x_region_id", "x_zone_id"} <= set(country_fields)
+
+    @pytest.mark.asyncio
+    async def test_fallback_batched_read_on_older_servers(self):
+        """Older servers use search_read plus one batched read."""
+        client = make_client([16, 0, 0, "final", 0, ""])
+
+        partners = (
+            await QuerySet(ResPartner, client)
+            .only("name")
+            .select_related("country_id")
+            .all()
+        )
+
+        assert method_calls(client, "web_search_read") == []
+        assert "country_id" in client.search_read.call_args.kwargs["fields"]
+        assert client.read.call_count == 1
+        assert client.read.call_args.args[1] == [5, 6]
+
+        client.read.reset_mock()
+        assert (await partners[1].country_id).name == "Country 6"
+        client.read.assert_not_called()
+
+    def test_specification_support_detection(self):
+        """Server versions are parsed including SaaS releases."""
+        assert QuerySet(ResPartner, make_client([17, 0]))._supports_specification()
+        assert QuerySet(
+            ResPartner, make_client(["saas~17", 2])
+        )._supports_specification()
+        assert not QuerySet(ResPartner, make_client([16, 0]))._supports_specification()
+        assert not QuerySet(ResPartner, make_client(None))._supports_specification()
+
+    def test_cache_key_includes_select_related(self):
+        """Expanded and plain queries do not share cache entries."""
+        queryset = QuerySet(ResPartner, make_client([17, 0]))
+
+        assert (
+            queryset._generate_cache_key()
+            != queryset.select_related("country_id")._generate_cache_key()
+        )
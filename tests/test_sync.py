@@ -0,0 +1,241 @@
+"""
+Tests for the incremental change-data-capture sync engine.
+"""
+
+import json
+import sqlite3
+
+import pytest
+
+from zenoo_rpc.models.registry import get_registry
+from zenoo_rpc.sync import (
+    CallbackSink,
+    IdBitmap,
+    JsonSyncStateStore,
+    NdjsonSink,
+    SQLiteSink,
+    SyncEngine,
+)
+
+OPERATORS = {
+    ">": lambda a, b: a is not False and a > b,
+    ">=": lambda a, b: a is not False and a >= b,
+    "=": lambda a, b: a == b,
+}
+
+
+class FakeOdoo:
+    """Minimal in-memory server answering the calls of the sync engine."""
+
+    def __init__(self):
+        self.records = {}
+        self.calls = []
+        self.__dict__["cache_manager"] = None
+
+    def put(self, record_id, name, write_date, parent=False):
+        self.records[record_id] = {
+            "id": record_id,
+            "name": name,
+            "write_date": write_date,
+            "parent_id": parent,
+        }
+
+    def _match(self, record, domain):
+        def evaluate(position):
+            term = domain[position]
+            if term in ("|", "&"):
+                left, position = evaluate(position + 1)
+                right, position = evaluate(position)
+                return (left or right) if term == "|" else (left and right), position
+            field, operator, value = term
+            return OPERATORS[operator](record[field], value), position + 1
+
+        position = 0
+        while position < len(domain):
+            matched, position = evaluate(position)
+            if not matched:
+                return False
+        return True
+
+    async def search_read(self, model, domain, fields, limit, order, context):
+        self.calls.append(domain)
+        records = [r for r in self.records.values() if self._match(r, domain)]
+        keys = [part.split()[0] for part in order.split(",")]
+        reverse = order.endswith("desc")
+        records.sort(key=lambda r: tuple(r[key] for key in keys), reverse=reverse)
+        return [
+            {name: record[name] for name in (fields or record)}
+            for record in records[:limit]
+        ]
+
+    async def execute_kw(self, model, method, args, kwargs=None, context=None):
+        if method == "fields_get":
+            return {
+                "name": {"type": "char"},
+                "write_date": {"type": "datetime"},
+                "parent_id": {"type": "many2one"},
+            }
+        records = sorted(
+            r["id"] for r in self.records.values() if self._match(r, args[0])
+        )
+        return records[: kwargs["limit"]]
+
+
+@pytest.fixture
+def server():
+    """Create a server with three partners."""
+    get_registry()._field_cache.pop("res.partner", None)
+    server = FakeOdoo()
+    server.put(1, "Acme", "2025-01-01 10:00:00")
+    server.put(2, "Bolt", "2025-01-01 10:00:00", [1, "Acme"])
+    server.put(3, "Cogs", "2025-01-02 09:00:00")
+    yield server
+    get_registry()._field_cache.pop("res.partner", None)
+
+
+class Collector:
+    """Collect the changes delivered to a CallbackSink."""
+
+    def __init__(self):
+        self.upserted = []
+        self.deleted = []
+
+    def sink(self):
+        return CallbackSink(
+            lambda model, records: self.upserted.extend(r["id"] for r in records),
+            lambda model, ids: self.deleted.extend(ids),
+        )
+
+
+class TestIdBitmap:
+    """Test cases for IdBitmap."""
+
+    def test_set_operations(self):
+        """Bitmaps support membership, difference and serialization."""
+        known = IdBitmap([1, 2, 3, 700])
+        current = IdBitmap([1, 3, 9])
+
+        assert 700 in known and 4 not in known
+        assert list(known - current) == [2, 700]
+        assert list(known | current) == [1, 2, 3, 9, 700]
+        assert len(known) == 4
+        assert IdBitmap.from_bytes(known.to_bytes()) == known
+
+
+class TestSyncEngine:
+    """Test cases for SyncEngine."""
+
+    @pytest.mark.asyncio
+    async def test_incremental_pulls(self, server):
+        """Runs after the full load only read records after the watermark."""
+        collector = Collector()
+        engine = SyncEngine(server, collector.sink(), page_size=2)
+        engine.track("res.partner", fields=["name"])
+
+        first = (await engine.sync())["res.partner"]
+        assert first.full_load and first.upserted == 3
+        assert sorted(collector.upserted) == [1, 2, 3]
+
+        collector.upserted.clear()
+        server.put(2, "Bolt v2", "2025-01-03 08:00:00")
+        server.put(4, "Dyna", "2025-01-03 08:00:00")
+        server.put(5, "Echo", "2025-01-03 08:00:00")
+
+        second = await engine.sync_model("res.partner")
+        assert not second.full_load
+        assert collector.upserted == [3, 2, 4, 5]
+        assert (second.write_date, second.last_id) == ("2025-01-03 08:00:00", 5)
+
+        collector.upserted.clear()
+        third = await engine.sync_model("res.partner")
+        assert third.upserted == 0
+        assert server.calls[-1][-1] == ("id", ">", 5)
+
+    @pytest.mark.asyncio
+    async def test_deletion_check(self, server):
+        """Ids missing on the server are reported as deleted."""
+        collector = Collector()
+        engine = SyncEngine(server, collector.sink())
+        engine.track("res.partner", fields=["name"], deletion_check_every=2)
+        await engine.sync()
+
+        del server.records[2]
+        first = await engine.sync_model("res.partner")
+        second = await engine.sync_model("res.partner")
+
+        assert not first.deletions_checked
+        assert second.deletions_checked
+        assert collector.deleted == [2]
+
+    @pytest.mark.asyncio
+    async def test_state_survives_restarts(self, server, tmp_path):
+        """Watermarks are persisted by the JSON state store."""
+        state_path = str(tmp_path / "state.json")
+        collector = Collector()
+
+        engine = SyncEngine(server, collector.sink(), JsonSyncStateStore(state_path))
+        await engine.track("res.partner", fields=["name"]).sync()
+
+        collector.upserted.clear()
+        engine = SyncEngine(server, collector.sink(), JsonSyncStateStore(state_path))
+        engine.track("res.partner", fields=["name"])
+        result = await engine.sync_model("res.partner")
+
+        assert not result.full_load
+        assert collector.upserted == [3]
+
+    @pytest.mark.asyncio
+    async def test_untracked_model(self, server):
+        """Syncing an untracked model raises KeyError."""
+        with pytest.raises(KeyError):
+            await SyncEngine(server, Collector().sink()).sync_model("res.partner")
+
+
+class TestSinks:
+    """Test cases for the file and SQLite sinks."""
+
+    @pytest.mark.asyncio
+    async def test_sqlite_sink(self, server, tmp_path):
+        """Records are upserted into a table per model and deleted."""
+        path = str(tmp_path / "mirror.db")
+        sink = SQLiteSink(path)
+        engine = SyncEngine(server, sink)
+        engine.track("res.partner", fields=["name", "parent_id"])
+        await engine.sync()
+
+        server.put(1, "Acme Corp", "2025-01-04 00:00:00")
+        del server.records[3]
+        await engine.sync(check_deletions=True)
+        await sink.close()
+
+        connection = sqlite3.connect(path)
+        rows = connection.execute(
+            "SELECT id, name, parent_id, parent_id_name FROM res_partner ORDER BY id"
+        ).fetchall()
+        connection.close()
+
+        assert rows == [(1, "Acme Corp", None, None), (2, "Bolt", 1, "Acme")]
+
+    @pytest.mark.asyncio
+    async def test_ndjson_sink(self, server, tmp_path):
+        """Changes are appended as upsert and delete events."""
+        engine = SyncEngine(server, NdjsonSink(str(tmp_path)))
+        engine.track("res.partner", fields=["name", "parent_id"])
+        await engine.sync()
+        del server.records[1]
+        await engine.sync(check_deletions=True)
+
+        with open(tmp_path / "res.partner.ndjson") as f:
+            events = [json.loads(line) for line in f]
+
+        assert events[1] == {
+            "op": "upsert",
+            "record": {
+                "id": 2,
+                "write_date": "2025-01-01 10:00:00",
+                "name": "Bolt",
+                "parent_id": 1,
+                "parent_id_name": "Acme",
+            },
+        }
+        assert events[-1] == {"op": "delete", "id": 1}